@@ -0,0 +1,89 @@
+"""
+Benchmarks for writing events to the database.
+
+Each round writes a fresh batch of events, and the sustained rate is reported as
+`events_per_second` in the benchmark's extra info.  Run against a dedicated database,
+e.g. `PREFECT_API_DATABASE_CONNECTION_URL=... python benches bench_events.py`.
+"""
+
+import uuid
+from typing import List
+
+import anyio
+import pendulum
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect.server.database.dependencies import provide_database_interface
+from prefect.server.events.schemas.events import ReceivedEvent
+from prefect.server.events.storage.database import write_events
+from prefect.server.utilities.database import get_dialect
+from prefect.settings import (
+    PREFECT_API_DATABASE_CONNECTION_URL,
+    PREFECT_API_SERVICES_EVENT_PERSISTER_BULK_INSERT,
+    temporary_settings,
+)
+
+ROUNDS = 5
+
+
+def _events(count: int) -> List[ReceivedEvent]:
+    now = pendulum.now("UTC")
+    return [
+        ReceivedEvent(
+            occurred=now,
+            event="prefect.flow-run.Completed",
+            resource={
+                "prefect.resource.id": f"prefect.flow-run.{uuid.uuid4()}",
+                "prefect.resource.name": f"bench-run-{i}",
+            },
+            related=[
+                {
+                    "prefect.resource.id": f"prefect.flow.{uuid.uuid4()}",
+                    "prefect.resource.role": "flow",
+                },
+                {
+                    "prefect.resource.id": f"prefect.deployment.{uuid.uuid4()}",
+                    "prefect.resource.role": "deployment",
+                },
+                {
+                    "prefect.resource.id": "prefect.tag.bench",
+                    "prefect.resource.role": "tag",
+                },
+            ],
+            payload={"intended": {"from": "RUNNING", "to": "COMPLETED"}},
+            id=uuid.uuid4(),
+        )
+        for i in range(count)
+    ]
+
+
+async def _write(events: List[ReceivedEvent]) -> None:
+    db = provide_database_interface()
+    async with db.session_context() as session:
+        await write_events(session=session, events=events)
+        await session.commit()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def database():
+    anyio.run(provide_database_interface().create_db)
+
+
+@pytest.mark.parametrize("bulk_insert", [False, True])
+@pytest.mark.parametrize("batch_size", [100, 1_000, 5_000])
+def bench_write_events(benchmark: BenchmarkFixture, batch_size: int, bulk_insert: bool):
+    dialect = get_dialect(PREFECT_API_DATABASE_CONNECTION_URL.value())
+    if bulk_insert and dialect.name != "postgresql":
+        pytest.skip("Bulk inserts are only used with PostgreSQL")
+
+    with temporary_settings(
+        {PREFECT_API_SERVICES_EVENT_PERSISTER_BULK_INSERT: bulk_insert}
+    ):
+        benchmark.pedantic(
+            anyio.run,
+            setup=lambda: ((_write, _events(batch_size)), {}),
+            rounds=ROUNDS,
+        )
+
+    benchmark.extra_info["events_per_second"] = batch_size / benchmark.stats.stats.mean
@@ -0,0 +1,84 @@
+"""
+Benchmarks for transferring directories of many small files with filesystem blocks.
+
+Remote transfers go to an in-memory filesystem that waits a millisecond for each file,
+standing in for the per-request latency of object storage.
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+from fsspec.implementations.memory import MemoryFileSystem
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect.filesystems import LocalFileSystem, RemoteFileSystem
+from prefect.settings import PREFECT_FILESYSTEM_TRANSFER_WORKERS, temporary_settings
+
+FILES = 500
+LATENCY = 0.001
+
+
+class LatentMemoryFileSystem(MemoryFileSystem):
+    protocol = "latent-memory"
+
+    def put_file(self, *args, **kwargs):
+        time.sleep(LATENCY)
+        return super().put_file(*args, **kwargs)
+
+    def get_file(self, *args, **kwargs):
+        time.sleep(LATENCY)
+        return super().get_file(*args, **kwargs)
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    project = tmp_path / "project"
+    for i in range(FILES):
+        directory = project / f"package-{i % 10}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"module_{i}.py").write_text(f"x = {i}\n")
+    (project / ".prefectignore").write_text("__pycache__/\n*.pyc\n")
+    return project
+
+
+@pytest.mark.parametrize("workers", [1, 16])
+def bench_remote_put_directory(
+    benchmark: BenchmarkFixture, project: Path, workers: int
+):
+    fs = RemoteFileSystem(basepath="latent-memory://bench/put")
+    fs._filesystem = LatentMemoryFileSystem()
+
+    with temporary_settings({PREFECT_FILESYSTEM_TRANSFER_WORKERS: workers}):
+        benchmark(
+            fs.put_directory,
+            local_path=str(project),
+            ignore_file=str(project / ".prefectignore"),
+        )
+
+
+@pytest.mark.parametrize("workers", [1, 16])
+def bench_remote_get_directory(
+    benchmark: BenchmarkFixture, project: Path, tmp_path: Path, workers: int
+):
+    fs = RemoteFileSystem(basepath="latent-memory://bench/get")
+    fs._filesystem = LatentMemoryFileSystem()
+    fs.put_directory(local_path=str(project))
+
+    with temporary_settings({PREFECT_FILESYSTEM_TRANSFER_WORKERS: workers}):
+        benchmark(fs.get_directory, local_path=str(tmp_path / "pulled"))
+
+
+@pytest.mark.parametrize("skip_unchanged", [False, True])
+def bench_local_put_directory(
+    benchmark: BenchmarkFixture, project: Path, tmp_path: Path, skip_unchanged: bool
+):
+    fs = LocalFileSystem(basepath=str(tmp_path))
+
+    benchmark(
+        fs.put_directory,
+        local_path=project,
+        to_path="copy",
+        ignore_file=str(project / ".prefectignore"),
+        skip_unchanged=skip_unchanged,
+    )
@@ -0,0 +1,87 @@
+"""
+Benchmarks for retrieving many persisted results, as when gathering the results of
+many background task runs.
+
+Results are stored on an in-memory filesystem that waits a millisecond for each read,
+standing in for the per-request latency of object storage.
+"""
+
+import asyncio
+import time
+import uuid
+from typing import List
+
+import pytest
+from fsspec.implementations.memory import MemoryFileSystem
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect.filesystems import RemoteFileSystem
+from prefect.results import PersistedResult, prefetch_results
+from prefect.serializers import PickleSerializer
+
+RESULTS = 200
+LATENCY = 0.001
+
+
+class LatentMemoryFileSystem(MemoryFileSystem):
+    protocol = "latent-memory"
+
+    def cat_file(self, *args, **kwargs):
+        time.sleep(LATENCY)
+        return super().cat_file(*args, **kwargs)
+
+    def _open(self, path, mode="rb", *args, **kwargs):
+        if "r" in mode:
+            time.sleep(LATENCY)
+        return super()._open(path, mode, *args, **kwargs)
+
+
+@pytest.fixture
+def storage() -> RemoteFileSystem:
+    storage = RemoteFileSystem(basepath="latent-memory://bench/results")
+    storage._filesystem = LatentMemoryFileSystem()
+    return storage
+
+
+@pytest.fixture
+def results(storage: RemoteFileSystem) -> List[PersistedResult]:
+    # Stand in for a saved block, so that results are stored under relative keys
+    storage_block_id = uuid.uuid4()
+    keys = iter(range(RESULTS))
+    return [
+        PersistedResult.create(
+            {"value": i},
+            storage_block=storage,
+            storage_block_id=storage_block_id,
+            storage_key_fn=lambda: str(next(keys)),
+            serializer=PickleSerializer(),
+        )
+        for i in range(RESULTS)
+    ]
+
+
+def uncached_copies(
+    results: List[PersistedResult], storage: RemoteFileSystem
+) -> List[PersistedResult]:
+    copies = [PersistedResult(**result.model_dump()) for result in results]
+    for copy in copies:
+        copy._storage_block = storage
+    return copies
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def bench_read_results(
+    benchmark: BenchmarkFixture,
+    results: List[PersistedResult],
+    storage: RemoteFileSystem,
+    bulk: bool,
+):
+    async def read():
+        copies = uncached_copies(results, storage)
+        if bulk:
+            await prefetch_results(
+                copies, storage_blocks={results[0].storage_block_id: storage}
+            )
+        return [await copy.get() for copy in copies]
+
+    benchmark(lambda: asyncio.run(read()))
@@ -0,0 +1,46 @@
+"""
+Benchmarks for reading settings in tight loops.
+
+`Setting.value()` reads from the resolved values of the current settings, while
+`Settings.value_of` runs each setting's `value_callback` on every call, as every read
+did before settings were resolved once per `Settings` object.
+"""
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect.settings import (
+    PREFECT_API_DATABASE_CONNECTION_URL,
+    PREFECT_API_URL,
+    PREFECT_HOME,
+    PREFECT_LOGGING_TO_API_BATCH_SIZE,
+    Setting,
+    get_current_settings,
+)
+
+READS = 1_000
+
+SETTINGS = [
+    PREFECT_API_URL,
+    PREFECT_HOME,
+    PREFECT_LOGGING_TO_API_BATCH_SIZE,
+    PREFECT_API_DATABASE_CONNECTION_URL,
+]
+
+
+@pytest.mark.parametrize("setting", SETTINGS, ids=lambda setting: setting.name)
+def bench_setting_value(benchmark: BenchmarkFixture, setting: Setting):
+    def read():
+        for _ in range(READS):
+            setting.value()
+
+    benchmark(read)
+
+
+@pytest.mark.parametrize("setting", SETTINGS, ids=lambda setting: setting.name)
+def bench_setting_value_of_unresolved(benchmark: BenchmarkFixture, setting: Setting):
+    def read():
+        for _ in range(READS):
+            get_current_settings().value_of(setting)
+
+    benchmark(read)
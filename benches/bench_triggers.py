@@ -0,0 +1,92 @@
+"""
+Benchmarks for reordering out-of-order events during trigger evaluation.
+
+Each round evaluates chains of events that follow one another, delivered in a shuffled
+order, so that many events arrive before the event they follow and must wait for it.
+A `follower_buffer_size` of 1 stores nearly every waiting event in the database, while
+the default keeps them in memory.  The sustained rate is reported as
+`events_per_second` in the benchmark's extra info.
+"""
+
+import random
+import uuid
+from datetime import timedelta
+from typing import List
+
+import anyio
+import pendulum
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect.server.database.dependencies import provide_database_interface
+from prefect.server.events import triggers
+from prefect.server.events.schemas.events import ReceivedEvent
+from prefect.settings import PREFECT_EVENTS_FOLLOWER_BUFFER_SIZE, temporary_settings
+
+ROUNDS = 5
+CHAIN_LENGTH = 5
+
+
+def _shuffled_events(count: int, window: int) -> List[ReceivedEvent]:
+    """Chains of flow run state events, shuffled within a sliding window"""
+    now = pendulum.now("UTC")
+    events: List[ReceivedEvent] = []
+    for _ in range(count // CHAIN_LENGTH):
+        resource_id = f"prefect.flow-run.{uuid.uuid4()}"
+        previous = None
+        for i in range(CHAIN_LENGTH):
+            event = ReceivedEvent(
+                occurred=now + timedelta(milliseconds=i),
+                event=f"prefect.flow-run.state-{i}",
+                resource={"prefect.resource.id": resource_id},
+                received=now,
+                id=uuid.uuid4(),
+                follows=previous,
+            )
+            events.append(event)
+            previous = event.id
+
+    shuffler = random.Random(42)
+    for start in range(0, len(events), window):
+        chunk = events[start : start + window]
+        shuffler.shuffle(chunk)
+        events[start : start + window] = chunk
+
+    return events
+
+
+async def _evaluate(events: List[ReceivedEvent]) -> None:
+    shard = triggers.TriggerShard()
+    # as after the first periodic evaluation finds nothing left over from a prior run
+    shard.followers.in_database = False
+
+    with triggers.evaluating_shard(shard):
+        for event in events:
+            try:
+                await triggers.reactive_evaluation(event)
+            except triggers.EventArrivedEarly:
+                pass
+
+
+@pytest.fixture(scope="module", autouse=True)
+def database():
+    anyio.run(provide_database_interface().create_db)
+
+
+@pytest.mark.parametrize("follower_buffer_size", [1, 10_000])
+@pytest.mark.parametrize("window", [10, 100])
+def bench_reorder_shuffled_events(
+    benchmark: BenchmarkFixture, follower_buffer_size: int, window: int
+):
+    count = 1_000
+
+    with temporary_settings(
+        {PREFECT_EVENTS_FOLLOWER_BUFFER_SIZE: follower_buffer_size}
+    ):
+        benchmark.pedantic(
+            anyio.run,
+            setup=lambda: ((_evaluate, _shuffled_events(count, window)), {}),
+            rounds=ROUNDS,
+        )
+
+    benchmark.extra_info["events_per_second"] = count / benchmark.stats.stats.mean
@@ -0,0 +1,99 @@
+"""
+Benchmarks for polling a work pool for scheduled flow runs.
+
+The seeded backlog is large, so these benches should be run against a dedicated
+database, e.g. `PREFECT_API_DATABASE_CONNECTION_URL=... python benches bench_work_pool_polling.py`.
+"""
+
+import random
+import uuid
+
+import anyio
+import pendulum
+import pytest
+import sqlalchemy as sa
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect.server import models, schemas
+from prefect.server.database.dependencies import provide_database_interface
+
+NUM_WORK_QUEUES = 500
+NUM_SCHEDULED_RUNS = 1_000_000
+INSERT_BATCH_SIZE = 10_000
+
+
+async def _seed_work_pool() -> uuid.UUID:
+    db = provide_database_interface()
+    await db.create_db()
+
+    suffix = uuid.uuid4().hex[:8]
+    async with db.session_context(begin_transaction=True) as session:
+        flow = await models.flows.create_flow(
+            session=session, flow=schemas.core.Flow(name=f"bench-polling-{suffix}")
+        )
+        work_pool = await models.workers.create_work_pool(
+            session=session,
+            work_pool=schemas.actions.WorkPoolCreate(name=f"bench-polling-{suffix}"),
+        )
+        work_queues = [
+            await models.workers.create_work_queue(
+                session=session,
+                work_pool_id=work_pool.id,
+                work_queue=schemas.actions.WorkQueueCreate(
+                    name=f"queue-{i}", priority=i + 1
+                ),
+            )
+            for i in range(NUM_WORK_QUEUES)
+        ]
+        flow_id, work_pool_id = flow.id, work_pool.id
+        queues = [(work_queue.id, work_queue.name) for work_queue in work_queues]
+
+    now = pendulum.now("UTC")
+    for start in range(0, NUM_SCHEDULED_RUNS, INSERT_BATCH_SIZE):
+        rows = []
+        for i in range(start, min(start + INSERT_BATCH_SIZE, NUM_SCHEDULED_RUNS)):
+            work_queue_id, work_queue_name = random.choice(queues)
+            scheduled_time = now.add(seconds=random.randint(-3600, 3600))
+            rows.append(
+                dict(
+                    id=uuid.uuid4(),
+                    name=f"bench-run-{i}",
+                    flow_id=flow_id,
+                    state_type=schemas.states.StateType.SCHEDULED,
+                    state_name="Scheduled",
+                    expected_start_time=scheduled_time,
+                    next_scheduled_start_time=scheduled_time,
+                    work_queue_id=work_queue_id,
+                    work_queue_name=work_queue_name,
+                )
+            )
+        async with db.session_context(begin_transaction=True) as session:
+            await session.execute(sa.insert(db.FlowRun), rows)
+
+    return work_pool_id
+
+
+@pytest.fixture(scope="module")
+def seeded_work_pool_id() -> uuid.UUID:
+    return anyio.run(_seed_work_pool)
+
+
+async def _poll(work_pool_id: uuid.UUID, respect_queue_priorities: bool):
+    db = provide_database_interface()
+    async with db.session_context() as session:
+        return await db.queries.get_scheduled_flow_runs_from_work_pool(
+            session=session,
+            work_pool_ids=[work_pool_id],
+            scheduled_before=pendulum.now("UTC"),
+            limit=10,
+            respect_queue_priorities=respect_queue_priorities,
+        )
+
+
+@pytest.mark.parametrize("respect_queue_priorities", [False, True])
+def bench_get_scheduled_flow_runs_from_work_pool(
+    benchmark: BenchmarkFixture,
+    seeded_work_pool_id: uuid.UUID,
+    respect_queue_priorities: bool,
+):
+    benchmark(anyio.run, _poll, seeded_work_pool_id, respect_queue_priorities)
@@ -77,3 +77,97 @@ class Event:
             return True
         finally:
             self._waiters.remove(fut)
+
+
+def _set_result_unless_done(fut: asyncio.Future, result: T) -> None:
+    if not fut.done():
+        fut.set_result(result)
+
+
+class Semaphore:
+    """
+    A thread-safe semaphore that can be acquired from threads and from event loops.
+
+    Sync callers block their thread until a slot is available; async callers wait on
+    their own event loop without blocking it. Waiters are granted slots in the order
+    they started waiting, whichever kind they are.
+    """
+
+    def __init__(self, value: int) -> None:
+        if value < 0:
+            raise ValueError("Semaphore initial value must be >= 0")
+        self._value = value
+        self._waiters = collections.deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> Literal[True]:
+        """
+        Acquire a slot, blocking the current thread until one is available.
+        """
+        with self._lock:
+            if self._value > 0 and not self._waiters:
+                self._value -= 1
+                return True
+
+            waiter = threading.Event()
+            self._waiters.append(waiter)
+
+        # `release()` hands its slot directly to the waiter it wakes
+        waiter.wait()
+        return True
+
+    async def acquire_async(self) -> Literal[True]:
+        """
+        Acquire a slot, waiting without blocking the event loop until one is available.
+        """
+        # As in `Event.wait()`, this lock is only ever held briefly
+        with self._lock:
+            if self._value > 0 and not self._waiters:
+                self._value -= 1
+                return True
+
+            fut = asyncio.get_running_loop().create_future()
+            self._waiters.append(fut)
+
+        try:
+            await fut
+        except asyncio.CancelledError:
+            with self._lock:
+                if fut in self._waiters:
+                    self._waiters.remove(fut)
+                    raise
+            # A slot was handed to this waiter before it was cancelled; pass it on
+            self.release()
+            raise
+        return True
+
+    def release(self) -> None:
+        """
+        Release a slot, handing it to the longest waiting caller if there is one.
+        """
+        with self._lock:
+            if not self._waiters:
+                self._value += 1
+                return
+            waiter = self._waiters.popleft()
+
+        if isinstance(waiter, threading.Event):
+            waiter.set()
+        else:
+            # The `asyncio.Future.set_result` method is not thread-safe and must be
+            # run in the loop that owns the future
+            call_soon_in_loop(waiter._loop, _set_result_unless_done, waiter, True)
+
+    def __enter__(self) -> "Semaphore":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+    async def __aenter__(self) -> "Semaphore":
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.release()
@@ -0,0 +1,187 @@
+"""
+A process-wide cache of the blocks loaded by `Block.load`.
+
+The cache holds validated block instances rather than the block documents read from
+the API, so secret values stay wrapped in their secret types while cached, and each
+load returns a deep copy so that callers never share state with the cache or with each
+other.  Entries expire after `PREFECT_BLOCKS_CACHE_TTL`, and are invalidated early when
+a block document is saved or deleted in this process, or when the API streams a
+`prefect.block-document.*` event for it.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Hashable, Optional, Tuple, Type
+from uuid import UUID
+
+from cachetools import LRUCache
+
+from prefect.logging.loggers import get_logger
+from prefect.settings import PREFECT_API_URL, PREFECT_BLOCKS_CACHE_TTL
+
+if TYPE_CHECKING:
+    from prefect.blocks.core import Block
+    from prefect.client.orchestration import PrefectClient
+    from prefect.events.schemas.events import Event
+
+logger = get_logger("blocks.cache")
+
+# The most blocks that are cached at once
+MAX_CACHED_BLOCKS = 1000
+
+BLOCK_DOCUMENT_EVENT_PREFIX = "prefect.block-document."
+
+
+@dataclass
+class BlockCacheMetrics:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+
+class BlockCache:
+    """
+    Caches loaded blocks by the class they were loaded with, the API they were loaded
+    from and the name or slug they were loaded by.
+    """
+
+    def __init__(self, maxsize: int = MAX_CACHED_BLOCKS):
+        self._entries: LRUCache[Hashable, Tuple[float, "Block"]] = LRUCache(maxsize)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._watching = False
+
+    @property
+    def enabled(self) -> bool:
+        return PREFECT_BLOCKS_CACHE_TTL.value().total_seconds() > 0
+
+    def key(
+        self,
+        cls: Type["Block"],
+        name: str,
+        client: Optional["PrefectClient"] = None,
+    ) -> Hashable:
+        api_url = str(client.api_url) if client else PREFECT_API_URL.value()
+        return (cls, api_url, name)
+
+    def get(
+        self,
+        cls: Type["Block"],
+        name: str,
+        client: Optional["PrefectClient"] = None,
+    ) -> Optional["Block"]:
+        """Returns a copy of the cached block, if there is a current one"""
+        key = self.key(cls, name, client)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+
+            if entry:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+        return entry[1].model_copy(deep=True) if entry else None
+
+    def put(
+        self,
+        cls: Type["Block"],
+        name: str,
+        block: "Block",
+        client: Optional["PrefectClient"] = None,
+    ) -> None:
+        """Caches a copy of the given block"""
+        expires = time.monotonic() + PREFECT_BLOCKS_CACHE_TTL.value().total_seconds()
+        cached = block.model_copy(deep=True)
+        with self._lock:
+            self._entries[self.key(cls, name, client)] = (expires, cached)
+
+        self._start_watching()
+
+    def invalidate(self, block_document_id: Optional[UUID]) -> None:
+        """Forgets every cached block loaded from the given block document"""
+        if block_document_id is None:
+            return
+
+        with self._lock:
+            stale = [
+                key
+                for key, (_, block) in self._entries.items()
+                if block._block_document_id == block_document_id
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+
+    def invalidate_for_event(self, event: "Event") -> None:
+        """Forgets the cached blocks of the block document an event is about"""
+        if not event.event.startswith(BLOCK_DOCUMENT_EVENT_PREFIX):
+            return
+
+        _, _, block_document_id = event.resource.id.rpartition(".")
+        try:
+            self.invalidate(UUID(block_document_id))
+        except ValueError:
+            pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._invalidations = 0
+
+    def metrics(self) -> BlockCacheMetrics:
+        with self._lock:
+            return BlockCacheMetrics(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+            )
+
+    def _start_watching(self) -> None:
+        """
+        Starts following block document events in the background, for APIs that
+        stream events; otherwise, cached blocks are only refreshed as they expire.
+        """
+        with self._lock:
+            if self._watching:
+                return
+            self._watching = True
+
+        if not PREFECT_API_URL.value():
+            return
+
+        threading.Thread(
+            target=self._watch_in_thread, name="BlockCacheWatcher", daemon=True
+        ).start()
+
+    def _watch_in_thread(self) -> None:
+        try:
+            asyncio.run(self._watch())
+        except Exception:
+            logger.debug(
+                "Stopped following block document events; cached blocks will be"
+                " refreshed as they expire",
+                exc_info=True,
+            )
+
+    async def _watch(self) -> None:
+        from prefect.events.clients import get_events_subscriber
+        from prefect.events.filters import EventFilter, EventNameFilter
+
+        filter = EventFilter(
+            event=EventNameFilter(prefix=[BLOCK_DOCUMENT_EVENT_PREFIX])
+        )
+        async with get_events_subscriber(filter=filter) as subscriber:
+            async for event in subscriber:
+                self.invalidate_for_event(event)
+
+
+block_cache = BlockCache()
@@ -43,6 +43,7 @@ from typing_extensions import Literal, ParamSpec, Self, get_args
 
 import prefect
 import prefect.exceptions
+from prefect.blocks.cache import block_cache
 from prefect.client.schemas import (
     DEFAULT_BLOCK_SCHEMA_VERSION,
     BlockDocument,
@@ -815,6 +816,9 @@ class Block(BaseModel, ABC):
         this case, the block attributes will default to `None` and must be set manually
         and saved to a new block document before the block can be used as expected.
 
+        If `PREFECT_BLOCKS_CACHE_TTL` is set, blocks loaded within that period are
+        reused from a process-wide cache instead of being read from the API again.
+
         Args:
             name: The name or slug of the block document. A block document slug is a
                 string with the format <block_type_slug>/<block_document_name>
@@ -874,10 +878,17 @@ class Block(BaseModel, ABC):
             loaded_block.save("my-custom-message", overwrite=True)
             ```
         """
-        block_document, block_document_name = await cls._get_block_document(name)
+        if block_cache.enabled:
+            cached = block_cache.get(cls, name, client)
+            if cached is not None:
+                return cached
+
+        block_document, block_document_name = await cls._get_block_document(
+            name, client=client
+        )
 
         try:
-            return cls._from_block_document(block_document)
+            block = cls._from_block_document(block_document)
         except ValidationError as e:
             if not validate:
                 missing_fields = tuple(err["loc"][0] for err in e.errors())
@@ -899,6 +910,11 @@ class Block(BaseModel, ABC):
                 " validation, try loading again with `validate=False`."
             ) from e
 
+        if block_cache.enabled:
+            block_cache.put(cls, name, block, client)
+
+        return block
+
     @staticmethod
     def is_block_class(block) -> bool:
         return _is_subclass(block, Block)
@@ -1048,6 +1064,7 @@ class Block(BaseModel, ABC):
         # Update metadata on block instance for later use.
         self._block_document_name = block_document.name
         self._block_document_id = block_document.id
+        block_cache.invalidate(self._block_document_id)
         return self._block_document_id
 
     @sync_compatible
@@ -1082,6 +1099,7 @@ class Block(BaseModel, ABC):
         block_document, block_document_name = await cls._get_block_document(name)
 
         await client.delete_block_document(block_document.id)
+        block_cache.invalidate(block_document.id)
 
     def __new__(cls: Type[Self], **kwargs) -> Self:
         """
@@ -1,23 +1,29 @@
-import copy
+import asyncio
+import os
 import sys
 import threading
 import time
 import uuid
+import weakref
 from collections import defaultdict
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from typing import (
     Any,
     AsyncGenerator,
     Awaitable,
     Callable,
     Dict,
+    List,
     MutableMapping,
     Optional,
     Protocol,
     Set,
     Tuple,
     Type,
+    Union,
     runtime_checkable,
 )
 
@@ -39,6 +45,7 @@ from prefect.settings import (
     PREFECT_CLIENT_RETRY_EXTRA_CODES,
     PREFECT_CLIENT_RETRY_JITTER_FACTOR,
 )
+from prefect.utilities.asyncutils import add_event_loop_shutdown_callback
 from prefect.utilities.math import bounded_poisson_interval, clamped_poisson_interval
 
 # Datastores for lifespan management, keys should be a tuple of thread and app
@@ -151,6 +158,320 @@ async def app_lifespan_context(app: ASGIApp) -> AsyncGenerator[None, None]:
                     await context.__aexit__(*exc_info)
 
 
+class GlobalLoopASGITransport(httpx.AsyncBaseTransport):
+    """
+    Wraps an ASGI transport so the application handles requests on the global event
+    loop thread instead of the event loop sending the request.
+
+    Engines block their event loop on synchronous API calls. When an ephemeral
+    application runs on that same loop, a request suspended while holding a database
+    lock can never finish and the blocked call waits on the lock forever. Serving the
+    application from the global loop keeps it responsive while the caller is blocked.
+    """
+
+    def __init__(self, transport: httpx.ASGITransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        from prefect._internal.concurrency.api import from_async
+        from prefect._internal.concurrency.calls import Call
+
+        # The ASGI transport reads the full response body before returning, so the
+        # response can be safely consumed from the calling loop
+        call = from_async.call_soon_in_loop_thread(
+            Call.new(self._transport.handle_async_request, request)
+        )
+        return await asyncio.wrap_future(call.future)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+# Shared transports -------------------------------------------------------------------
+#
+# Every Prefect client talking to the same API over HTTP(S) uses one connection pool
+# per process rather than a pool per client. With HTTP/2 enabled, requests from all
+# clients are multiplexed over a small, bounded number of connections.
+
+
+@dataclass
+class ConnectionPoolMetrics:
+    """
+    A point-in-time view of a shared connection pool.
+
+    Attributes:
+        http2: Whether the pool negotiates HTTP/2 with servers that support it.
+        max_connections: The maximum number of connections the pool may open.
+        connections: The number of connections currently open.
+        idle_connections: The number of open connections with no requests in flight.
+        active_requests: The number of requests currently assigned a connection.
+        queued_requests: The number of requests waiting for a connection.
+        peak_requests: The largest number of concurrent requests seen by the pool.
+        total_requests: The number of requests sent through the pool.
+    """
+
+    http2: bool
+    max_connections: Optional[int]
+    connections: int
+    idle_connections: int
+    active_requests: int
+    queued_requests: int
+    peak_requests: int
+    total_requests: int
+
+    @property
+    def saturated(self) -> bool:
+        """
+        Whether requests are waiting on the pool for a connection.
+        """
+        return self.queued_requests > 0
+
+
+class _SharedTransportBase:
+    """
+    Bookkeeping shared by the sync and async shared transports.
+    """
+
+    def __init__(self, **transport_kwargs: Any):
+        self._transport_kwargs = transport_kwargs
+        self._in_flight = 0
+        self._peak_requests = 0
+        self._total_requests = 0
+        self._lock = threading.Lock()
+
+    def _request_started(self) -> None:
+        with self._lock:
+            self._in_flight += 1
+            self._total_requests += 1
+            self._peak_requests = max(self._peak_requests, self._in_flight)
+
+    def _request_finished(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _pools(self) -> List[Any]:
+        raise NotImplementedError
+
+    def metrics(self) -> ConnectionPoolMetrics:
+        limits: httpx.Limits = self._transport_kwargs["limits"]
+        connections = idle_connections = active_requests = queued_requests = 0
+        for pool in self._pools():
+            # Making liberal use of getattr here to avoid any surprises if the
+            # internals of httpcore change on us
+            pool_connections = getattr(pool, "connections", [])
+            connections += len(pool_connections)
+            idle_connections += sum(
+                1 for connection in pool_connections if connection.is_idle()
+            )
+            for pool_request in getattr(pool, "_requests", []):
+                if getattr(pool_request, "connection", None) is None:
+                    queued_requests += 1
+                else:
+                    active_requests += 1
+
+        return ConnectionPoolMetrics(
+            http2=self._transport_kwargs["http2"],
+            max_connections=limits.max_connections,
+            connections=connections,
+            idle_connections=idle_connections,
+            active_requests=active_requests,
+            queued_requests=queued_requests,
+            peak_requests=self._peak_requests,
+            total_requests=self._total_requests,
+        )
+
+
+class SharedHTTPTransport(_SharedTransportBase, httpx.BaseTransport):
+    """
+    A process-wide transport used by all sync clients with the same connection
+    settings.
+
+    Closing a client does not close the shared transport.
+    """
+
+    def __init__(self, **transport_kwargs: Any):
+        super().__init__(**transport_kwargs)
+        self._transport = httpx.HTTPTransport(**transport_kwargs)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self._request_started()
+        try:
+            return self._transport.handle_request(request)
+        finally:
+            self._request_finished()
+
+    def close(self) -> None:
+        # The transport outlives the clients using it
+        pass
+
+    def _pools(self) -> List[Any]:
+        return [getattr(self._transport, "_pool", None)]
+
+
+class SharedAsyncHTTPTransport(_SharedTransportBase, httpx.AsyncBaseTransport):
+    """
+    A process-wide transport used by all async clients with the same connection
+    settings.
+
+    Connections cannot be used across event loops, so a connection pool is kept for
+    each event loop that sends requests through the transport. A loop's pool is
+    closed when that loop shuts down; see the caveats at
+    `add_event_loop_shutdown_callback`. Closing a client does not close the shared
+    transport.
+    """
+
+    def __init__(self, **transport_kwargs: Any):
+        super().__init__(**transport_kwargs)
+        self._transports: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport
+        ] = weakref.WeakKeyDictionary()
+
+    async def _get_transport(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._transports.get(loop)
+            created = transport is None
+            if created:
+                transport = self._transports[loop] = httpx.AsyncHTTPTransport(
+                    **self._transport_kwargs
+                )
+        if created:
+            await add_event_loop_shutdown_callback(
+                partial(self._close_transport, loop, transport)
+            )
+        return transport
+
+    async def _close_transport(
+        self, loop: asyncio.AbstractEventLoop, transport: httpx.AsyncHTTPTransport
+    ) -> None:
+        with self._lock:
+            if self._transports.get(loop) is transport:
+                del self._transports[loop]
+        await transport.aclose()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        transport = await self._get_transport()
+        self._request_started()
+        try:
+            return await transport.handle_async_request(request)
+        finally:
+            self._request_finished()
+
+    async def aclose(self) -> None:
+        # The transport outlives the clients using it; each loop's pool is closed
+        # when its loop shuts down
+        pass
+
+    def _pools(self) -> List[Any]:
+        with self._lock:
+            transports = list(self._transports.values())
+        return [getattr(transport, "_pool", None) for transport in transports]
+
+
+_SHARED_TRANSPORTS: Dict[Tuple[Any, ...], _SharedTransportBase] = {}
+_SHARED_TRANSPORTS_LOCK = threading.Lock()
+
+
+def get_shared_transport(
+    sync: bool,
+    verify: Any = True,
+    cert: Any = None,
+    http2: bool = False,
+    limits: Optional[httpx.Limits] = None,
+    trust_env: bool = True,
+) -> Union[SharedHTTPTransport, SharedAsyncHTTPTransport]:
+    """
+    Get the process-wide transport for the given connection settings, creating it
+    on first use.
+
+    Shared transports retry failed connection attempts up to 3 times.
+    """
+    limits = limits or httpx.Limits()
+    key = (
+        sync,
+        verify,
+        cert,
+        http2,
+        (limits.max_connections, limits.max_keepalive_connections),
+        limits.keepalive_expiry,
+        trust_env,
+    )
+    with _SHARED_TRANSPORTS_LOCK:
+        transport = _SHARED_TRANSPORTS.get(key)
+        if transport is None:
+            transport_type = SharedHTTPTransport if sync else SharedAsyncHTTPTransport
+            transport = _SHARED_TRANSPORTS[key] = transport_type(
+                verify=verify,
+                cert=cert,
+                http2=http2,
+                limits=limits,
+                trust_env=trust_env,
+                retries=3,
+            )
+    return transport
+
+
+def get_shared_transport_metrics() -> List[ConnectionPoolMetrics]:
+    """
+    Get metrics for each shared transport in this process.
+
+    Useful for detecting pool saturation, e.g. when `queued_requests` is frequently
+    non-zero, `PREFECT_CLIENT_MAX_CONNECTIONS` may be set too low.
+    """
+    with _SHARED_TRANSPORTS_LOCK:
+        transports = list(_SHARED_TRANSPORTS.values())
+    return [transport.metrics() for transport in transports]
+
+
+def _reset_shared_transports() -> None:
+    # Connections cannot be shared with a forked child process
+    global _SHARED_TRANSPORTS_LOCK
+    _SHARED_TRANSPORTS.clear()
+    _SHARED_TRANSPORTS_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_shared_transports)
+
+
+def use_shared_transport(
+    client: Union[httpx.Client, httpx.AsyncClient],
+    url: str,
+    httpx_settings: Dict[str, Any],
+) -> bool:
+    """
+    Replace the client's default transport with the shared transport for its
+    connection settings.
+
+    The transport is only replaced when requests to `url` would use the default
+    transport, so proxies and transports provided by the user are respected.
+
+    Returns:
+        `True` if the client now uses a shared transport.
+    """
+    if httpx_settings.get("transport"):
+        return False
+
+    # Making liberal use of getattr here to avoid any surprises if the internals of
+    # httpx change on us
+    transport_for_url = getattr(client, "_transport_for_url", None)
+    default_transport = getattr(client, "_transport", None)
+    if not callable(transport_for_url) or default_transport is None:
+        return False
+    if transport_for_url(httpx.URL(url)) is not default_transport:
+        return False
+
+    client._transport = get_shared_transport(
+        sync=isinstance(client, httpx.Client),
+        verify=httpx_settings.get("verify", True),
+        cert=httpx_settings.get("cert"),
+        http2=httpx_settings.get("http2", False),
+        limits=httpx_settings.get("limits"),
+        trust_env=httpx_settings.get("trust_env", True),
+    )
+    return True
+
+
 class PrefectResponse(httpx.Response):
     """
     A Prefect wrapper for the `httpx.Response` class.
@@ -175,12 +496,14 @@ class PrefectResponse(httpx.Response):
         """
         Create a `PrefectReponse` from an `httpx.Response`.
 
-        By changing the `__class__` attribute of the Response, we change the method
-        resolution order to look for methods defined in PrefectResponse, while leaving
-        everything else about the original Response instance intact.
+        By creating an instance of PrefectResponse with the attributes of the original
+        Response, we change the method resolution order to look for methods defined in
+        PrefectResponse, while leaving everything else about the original Response
+        instance intact. The attributes are copied directly rather than with
+        `copy.copy`, which detaches the stream of a response that has not been read.
         """
-        new_response = copy.copy(response)
-        new_response.__class__ = cls
+        new_response = cls.__new__(cls)
+        new_response.__dict__.update(response.__dict__)
         return new_response
 
 
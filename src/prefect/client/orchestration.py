@@ -5,6 +5,7 @@ from contextlib import AsyncExitStack
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     Dict,
     Iterable,
     List,
@@ -12,6 +13,7 @@ from typing import (
     Optional,
     Set,
     Tuple,
+    Type,
     TypeVar,
     Union,
     overload,
@@ -131,6 +133,8 @@ from prefect.settings import (
     PREFECT_API_TLS_INSECURE_SKIP_VERIFY,
     PREFECT_API_URL,
     PREFECT_CLIENT_CSRF_SUPPORT_ENABLED,
+    PREFECT_CLIENT_MAX_CONNECTIONS,
+    PREFECT_CLIENT_SHARED_TRANSPORT,
     PREFECT_CLOUD_API_URL,
     PREFECT_UNIT_TEST_MODE,
 )
@@ -146,6 +150,7 @@ from prefect.client.base import (
     PrefectHttpxSyncClient,
     PrefectHttpxSyncEphemeralClient,
     app_lifespan_context,
+    use_shared_transport,
 )
 
 P = ParamSpec("P")
@@ -203,6 +208,16 @@ def get_client(
     except RuntimeError:
         loop = None
 
+    if not sync_client and (
+        async_client_ctx := prefect.context.AsyncClientContext.get()
+    ):
+        if (
+            async_client_ctx._httpx_settings == httpx_settings
+            and loop is not None
+            and loop == async_client_ctx.client._loop
+        ):
+            return async_client_ctx.client
+
     if client_ctx := prefect.context.ClientContext.get():
         if (
             sync_client
@@ -320,8 +335,9 @@ class PrefectClient:
                 httpx.Limits(
                     # We see instability when allowing the client to open many connections at once.
                     # Limiting concurrency results in more stable performance.
-                    max_connections=16,
-                    max_keepalive_connections=8,
+                    max_connections=PREFECT_CLIENT_MAX_CONNECTIONS.value(),
+                    max_keepalive_connections=PREFECT_CLIENT_MAX_CONNECTIONS.value()
+                    // 2,
                     # The Prefect Cloud LB will keep connections alive for 30s.
                     # Only allow the client to keep connections alive for 25s.
                     keepalive_expiry=25,
@@ -399,12 +415,24 @@ class PrefectClient:
         # before instantiation, the transport will not be aware of proxies unless we
         # reproduce all of the logic to make it so.
         #
+        # Requests that do not go through a proxy are sent through the transport
+        # shared by all clients in the process, which also retries 3 times.
+        #
         # Only alter the transport to set our default of 3 retries, don't modify any
         # transport a user may have provided via httpx_settings.
         #
         # Making liberal use of getattr and isinstance checks here to avoid any
         # surprises if the internals of httpx or httpcore change on us
-        if isinstance(api, str) and not httpx_settings.get("transport"):
+        uses_shared_transport = (
+            isinstance(api, str)
+            and PREFECT_CLIENT_SHARED_TRANSPORT.value()
+            and use_shared_transport(self._client, api, httpx_settings)
+        )
+        if (
+            isinstance(api, str)
+            and not httpx_settings.get("transport")
+            and not uses_shared_transport
+        ):
             transport_for_url = getattr(self._client, "_transport_for_url", None)
             if callable(transport_for_url):
                 server_transport = transport_for_url(httpx.URL(api))
@@ -2106,6 +2134,64 @@ class PrefectClient:
         response = await self._client.post("/flow_runs/filter", json=body)
         return pydantic.TypeAdapter(List[FlowRun]).validate_python(response.json())
 
+    async def iterate_flow_runs(
+        self,
+        *,
+        flow_filter: FlowFilter = None,
+        flow_run_filter: FlowRunFilter = None,
+        task_run_filter: TaskRunFilter = None,
+        deployment_filter: DeploymentFilter = None,
+        work_pool_filter: WorkPoolFilter = None,
+        work_queue_filter: WorkQueueFilter = None,
+        sort: FlowRunSort = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[FlowRun]:
+        """
+        Iterate over all flow runs matching the given criteria.
+
+        Flow runs are streamed from the API as they are read, so this is suitable for
+        exporting many more flow runs than fit in a single page. Only sorts by id or
+        by expected start time are supported.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            work_pool_filter: filter criteria for work pools
+            work_queue_filter: filter criteria for work pool queues
+            sort: sort criteria for the flow runs
+            limit: the maximum number of flow runs to yield
+
+        Yields:
+            Flow Run model representations of the flow runs
+        """
+        body = {
+            "flows": flow_filter.model_dump(mode="json") if flow_filter else None,
+            "flow_runs": (
+                flow_run_filter.model_dump(mode="json", exclude_unset=True)
+                if flow_run_filter
+                else None
+            ),
+            "task_runs": (
+                task_run_filter.model_dump(mode="json") if task_run_filter else None
+            ),
+            "deployments": (
+                deployment_filter.model_dump(mode="json") if deployment_filter else None
+            ),
+            "work_pools": (
+                work_pool_filter.model_dump(mode="json") if work_pool_filter else None
+            ),
+            "work_pool_queues": (
+                work_queue_filter.model_dump(mode="json") if work_queue_filter else None
+            ),
+            "limit": limit,
+        }
+        if sort:
+            body["sort"] = sort
+        async for flow_run in self._iterate_ndjson("/flow_runs/export", body, FlowRun):
+            yield flow_run
+
     async def set_flow_run_state(
         self,
         flow_run_id: UUID,
@@ -2304,6 +2390,54 @@ class PrefectClient:
         response = await self._client.post("/task_runs/filter", json=body)
         return pydantic.TypeAdapter(List[TaskRun]).validate_python(response.json())
 
+    async def iterate_task_runs(
+        self,
+        *,
+        flow_filter: FlowFilter = None,
+        flow_run_filter: FlowRunFilter = None,
+        task_run_filter: TaskRunFilter = None,
+        deployment_filter: DeploymentFilter = None,
+        sort: TaskRunSort = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[TaskRun]:
+        """
+        Iterate over all task runs matching the given criteria.
+
+        Task runs are streamed from the API as they are read, so this is suitable for
+        exporting many more task runs than fit in a single page. Only sorts by id or
+        by expected start time are supported.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            sort: sort criteria for the task runs
+            limit: the maximum number of task runs to yield
+
+        Yields:
+            Task Run model representations of the task runs
+        """
+        body = {
+            "flows": flow_filter.model_dump(mode="json") if flow_filter else None,
+            "flow_runs": (
+                flow_run_filter.model_dump(mode="json", exclude_unset=True)
+                if flow_run_filter
+                else None
+            ),
+            "task_runs": (
+                task_run_filter.model_dump(mode="json") if task_run_filter else None
+            ),
+            "deployments": (
+                deployment_filter.model_dump(mode="json") if deployment_filter else None
+            ),
+            "limit": limit,
+        }
+        if sort:
+            body["sort"] = sort
+        async for task_run in self._iterate_ndjson("/task_runs/export", body, TaskRun):
+            yield task_run
+
     async def delete_task_run(self, task_run_id: UUID) -> None:
         """
         Delete a task run by id.
@@ -2545,6 +2679,34 @@ class PrefectClient:
         response = await self._client.post("/logs/filter", json=body)
         return pydantic.TypeAdapter(List[Log]).validate_python(response.json())
 
+    async def iterate_logs(
+        self,
+        log_filter: LogFilter = None,
+        limit: Optional[int] = None,
+        sort: LogSort = LogSort.TIMESTAMP_ASC,
+    ) -> AsyncIterator[Log]:
+        """
+        Iterate over all flow and task run logs matching the filter.
+
+        Logs are streamed from the API as they are read, so this is suitable for
+        exporting many more logs than fit in a single page.
+        """
+        body = {
+            "logs": log_filter.model_dump(mode="json") if log_filter else None,
+            "limit": limit,
+            "sort": sort,
+        }
+        async for log in self._iterate_ndjson("/logs/export", body, Log):
+            yield log
+
+    async def _iterate_ndjson(
+        self, path: str, body: Dict[str, Any], model: Type[pydantic.BaseModel]
+    ) -> AsyncIterator[Any]:
+        async with self._client.stream("POST", path, json=body) as response:
+            async for line in response.aiter_lines():
+                if line:
+                    yield model.model_validate_json(line)
+
     async def send_worker_heartbeat(
         self,
         work_pool_name: str,
@@ -3413,8 +3575,9 @@ class SyncPrefectClient:
                 httpx.Limits(
                     # We see instability when allowing the client to open many connections at once.
                     # Limiting concurrency results in more stable performance.
-                    max_connections=16,
-                    max_keepalive_connections=8,
+                    max_connections=PREFECT_CLIENT_MAX_CONNECTIONS.value(),
+                    max_keepalive_connections=PREFECT_CLIENT_MAX_CONNECTIONS.value()
+                    // 2,
                     # The Prefect Cloud LB will keep connections alive for 30s.
                     # Only allow the client to keep connections alive for 25s.
                     keepalive_expiry=25,
@@ -3480,12 +3643,24 @@ class SyncPrefectClient:
         # before instantiation, the transport will not be aware of proxies unless we
         # reproduce all of the logic to make it so.
         #
+        # Requests that do not go through a proxy are sent through the transport
+        # shared by all clients in the process, which also retries 3 times.
+        #
         # Only alter the transport to set our default of 3 retries, don't modify any
         # transport a user may have provided via httpx_settings.
         #
         # Making liberal use of getattr and isinstance checks here to avoid any
         # surprises if the internals of httpx or httpcore change on us
-        if isinstance(api, str) and not httpx_settings.get("transport"):
+        uses_shared_transport = (
+            isinstance(api, str)
+            and PREFECT_CLIENT_SHARED_TRANSPORT.value()
+            and use_shared_transport(self._client, api, httpx_settings)
+        )
+        if (
+            isinstance(api, str)
+            and not httpx_settings.get("transport")
+            and not uses_shared_transport
+        ):
             transport_for_url = getattr(self._client, "_transport_for_url", None)
             if callable(transport_for_url):
                 server_transport = transport_for_url(httpx.URL(api))
@@ -1,5 +1,6 @@
 import asyncio
-from typing import Any, Dict, Generic, Iterable, Optional, Type, TypeVar
+from collections import deque
+from typing import Any, Deque, Dict, Generic, Iterable, Optional, Type, TypeVar
 
 import orjson
 import websockets
@@ -24,9 +25,11 @@ class Subscription(Generic[S]):
         keys: Iterable[str],
         client_id: Optional[str] = None,
         base_url: Optional[str] = None,
+        prefetch: int = 1,
     ):
         self.model = model
         self.client_id = client_id
+        self.prefetch = prefetch
         base_url = base_url.replace("http", "ws", 1)
         self.subscription_url = f"{base_url}{path}"
 
@@ -37,6 +40,8 @@ class Subscription(Generic[S]):
             subprotocols=["prefect"],
         )
         self._websocket = None
+        self._buffer: Deque[S] = deque()
+        self._unacknowledged = False
 
     def __aiter__(self) -> Self:
         return self
@@ -45,15 +50,35 @@ class Subscription(Generic[S]):
         while True:
             try:
                 await self._ensure_connected()
+
+                # When prefetching, each item is acknowledged when the next one is
+                # requested, once the consumer has taken it on; the server takes back
+                # the items that were not acknowledged when the connection closes
+                if self._unacknowledged:
+                    await self._websocket.send(orjson.dumps({"type": "ack"}).decode())
+                    self._unacknowledged = False
+
+                if self._buffer:
+                    self._unacknowledged = True
+                    return self._buffer.popleft()
+
                 message = await self._websocket.recv()
 
-                await self._websocket.send(orjson.dumps({"type": "ack"}).decode())
+                if self.prefetch == 1:
+                    await self._websocket.send(orjson.dumps({"type": "ack"}).decode())
+                    return self.model.model_validate_json(message)
 
-                return self.model.model_validate_json(message)
+                # When prefetching, the server sends a list of up to `prefetch` items
+                self._buffer.extend(
+                    self.model.model_validate(item) for item in orjson.loads(message)
+                )
             except (
                 ConnectionRefusedError,
                 websockets.exceptions.ConnectionClosedError,
             ):
+                # The server takes back the unacknowledged items of the old connection
+                self._buffer.clear()
+                self._unacknowledged = False
                 self._websocket = None
                 if hasattr(self._connect, "protocol"):
                     await self._connect.__aexit__(None, None, None)
@@ -78,6 +103,8 @@ class Subscription(Generic[S]):
             message = {"type": "subscribe", "keys": self.keys}
             if self.client_id:
                 message.update({"client_id": self.client_id})
+            if self.prefetch > 1:
+                message.update({"prefetch": self.prefetch})
 
             await websocket.send(orjson.dumps(message).decode())
         except (
@@ -42,13 +42,21 @@ def get_or_create_client(
     if client is not None:
         return client, True
     from prefect._internal.concurrency.event_loop import get_running_loop
-    from prefect.context import ClientContext, FlowRunContext, TaskRunContext
-
+    from prefect.context import (
+        AsyncClientContext,
+        ClientContext,
+        FlowRunContext,
+        TaskRunContext,
+    )
+
+    async_client_context = AsyncClientContext.get()
     client_context = ClientContext.get()
     flow_run_context = FlowRunContext.get()
     task_run_context = TaskRunContext.get()
 
-    if client_context and client_context.async_client._loop == get_running_loop():
+    if async_client_context and async_client_context.client._loop == get_running_loop():
+        return async_client_context.client, True
+    elif client_context and client_context.async_client._loop == get_running_loop():
         return client_context.async_client, True
     elif (
         flow_run_context
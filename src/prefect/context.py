@@ -6,15 +6,17 @@ These contexts should never be directly mutated by the user.
 For more user-accessible information about the current run, see [`prefect.runtime`](../runtime/flow_run).
 """
 
+import asyncio
 import os
 import sys
 import warnings
-from contextlib import ExitStack, contextmanager
+from contextlib import ExitStack, asynccontextmanager, contextmanager
 from contextvars import ContextVar, Token
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
     Dict,
     Generator,
     Optional,
@@ -24,6 +26,7 @@ from typing import (
     Union,
 )
 
+import httpx
 import pendulum
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from pydantic_extra_types.pendulum_dt import DateTime
@@ -32,7 +35,13 @@ from typing_extensions import Self
 import prefect.logging
 import prefect.logging.configuration
 import prefect.settings
-from prefect.client.orchestration import PrefectClient, SyncPrefectClient, get_client
+from prefect.client.base import GlobalLoopASGITransport
+from prefect.client.orchestration import (
+    PrefectClient,
+    ServerType,
+    SyncPrefectClient,
+    get_client,
+)
 from prefect.client.schemas import FlowRun, TaskRun
 from prefect.events.worker import EventsWorker
 from prefect.exceptions import MissingContextError
@@ -235,6 +244,67 @@ class ClientContext(ContextModel):
                 yield ctx
 
 
+class AsyncClientContext(ContextModel):
+    """
+    A context for sharing a single async Prefect client across everything running
+    on one event loop.
+
+    Async clients are bound to the event loop they were started on, so unlike the
+    `ClientContext`, this context must be entered from the event loop that will use
+    the client. Runs on that loop that enter `AsyncClientContext.get_or_create` will
+    reuse the same client and its connection pool.
+
+    async with AsyncClientContext.get_or_create() as ctx:
+        c1 = get_client()
+        c2 = get_client()
+        assert c1 is c2
+        assert c1 is ctx.client
+    """
+
+    __var__ = ContextVar("async_client")
+    client: PrefectClient
+    _httpx_settings: Optional[dict[str, Any]] = PrivateAttr(None)
+    _context_stack: int = PrivateAttr(0)
+
+    def __init__(self, httpx_settings: Optional[dict[str, Any]] = None):
+        client = get_client(sync_client=False, httpx_settings=httpx_settings)
+        if client.server_type == ServerType.EPHEMERAL and isinstance(
+            client._client._transport, httpx.ASGITransport
+        ):
+            # The engines sharing this client make synchronous API calls from its
+            # event loop, so the ephemeral application cannot be served from it
+            client._client._transport = GlobalLoopASGITransport(
+                client._client._transport
+            )
+        super().__init__(client=client)
+        self._httpx_settings = httpx_settings
+        self._context_stack = 0
+
+    async def __aenter__(self):
+        self._context_stack += 1
+        if self._context_stack == 1:
+            await self.client.__aenter__()
+            return super().__enter__()
+        else:
+            return self
+
+    async def __aexit__(self, *exc_info):
+        self._context_stack -= 1
+        if self._context_stack == 0:
+            await self.client.__aexit__(*exc_info)
+            return super().__exit__(*exc_info)
+
+    @classmethod
+    @asynccontextmanager
+    async def get_or_create(cls) -> AsyncGenerator["AsyncClientContext", None]:
+        ctx = AsyncClientContext.get()
+        if ctx and ctx.client._loop == asyncio.get_running_loop():
+            yield ctx
+        else:
+            async with AsyncClientContext() as ctx:
+                yield ctx
+
+
 class RunContext(ContextModel):
     """
     The base context for a flow or task run. Data in this context will always be
@@ -11,6 +11,7 @@ Whenever a step is run, the following actions are taken:
 - The step's output is returned and used to resolve inputs for subsequent steps
 """
 
+import importlib
 import os
 import re
 import subprocess
@@ -18,13 +19,15 @@ import sys
 import warnings
 from copy import deepcopy
 from importlib import import_module
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from prefect._internal.compatibility.deprecated import PrefectDeprecationWarning
 from prefect._internal.concurrency.api import Call, from_async
 from prefect._internal.integrations import KNOWN_EXTRAS_FOR_PACKAGES
 from prefect.logging.loggers import get_logger
-from prefect.settings import PREFECT_DEBUG_MODE
+from prefect.settings import PREFECT_DEBUG_MODE, PREFECT_HOME
+from prefect.utilities.asyncutils import run_sync_in_worker_thread
+from prefect.utilities.filesystem import locked
 from prefect.utilities.importtools import import_object
 from prefect.utilities.templating import (
     apply_values,
@@ -62,7 +65,19 @@ def _strip_version(requirement: str) -> str:
     return re.split(r"[<>=!~]", requirement)[0].strip()
 
 
-def _get_function_for_step(
+# Step functions already resolved in this process, by name and requirements
+_STEP_FUNCTIONS: Dict[Tuple[str, Tuple[str, ...]], Callable[..., Any]] = {}
+
+
+def _import_step_function(
+    fully_qualified_name: str, packages: List[str]
+) -> Callable[..., Any]:
+    for package in packages:
+        import_module(_strip_version(package).replace("-", "_"))
+    return import_object(fully_qualified_name)
+
+
+async def _get_function_for_step(
     fully_qualified_name: str, requires: Union[str, List[str], None] = None
 ):
     if not isinstance(requires, list):
@@ -70,11 +85,12 @@ def _get_function_for_step(
     else:
         packages = requires
 
+    key = (fully_qualified_name, tuple(packages))
+    if key in _STEP_FUNCTIONS:
+        return _STEP_FUNCTIONS[key]
+
     try:
-        for package in packages:
-            import_module(_strip_version(package).replace("-", "_"))
-        step_func = import_object(fully_qualified_name)
-        return step_func
+        step_func = _import_step_function(fully_qualified_name, packages)
     except ImportError:
         if requires:
             print(
@@ -84,6 +100,25 @@ def _get_function_for_step(
         else:
             raise
 
+        # Flow runs on the same machine share an environment, so only one may
+        # install packages into it at a time
+        async with locked(PREFECT_HOME.value() / "step-requirements.lock"):
+            # another flow run may have installed them while we waited for the lock
+            importlib.invalidate_caches()
+            try:
+                step_func = _import_step_function(fully_qualified_name, packages)
+            except ImportError:
+                await run_sync_in_worker_thread(
+                    _install_requirements, fully_qualified_name, packages
+                )
+                importlib.invalidate_caches()
+                step_func = import_object(fully_qualified_name)
+
+    _STEP_FUNCTIONS[key] = step_func
+    return step_func
+
+
+def _install_requirements(fully_qualified_name: str, packages: List[str]) -> None:
     try:
         packages = [
             KNOWN_EXTRAS_FOR_PACKAGES.get(package, package)
@@ -95,8 +130,6 @@ def _get_function_for_step(
         get_logger("deployments.steps.core").warning(
             "Unable to install required packages for %s", fully_qualified_name
         )
-    step_func = import_object(fully_qualified_name)
-    return step_func
 
 
 async def run_step(step: Dict, upstream_outputs: Optional[Dict] = None) -> Dict:
@@ -128,7 +161,7 @@ async def run_step(step: Dict, upstream_outputs: Optional[Dict] = None) -> Dict:
     inputs = await resolve_block_document_references(inputs)
     inputs = await resolve_variables(inputs)
     inputs = apply_values(inputs, os.environ)
-    step_func = _get_function_for_step(fqn, requires=keywords.get("requires"))
+    step_func = await _get_function_for_step(fqn, requires=keywords.get("requires"))
     result = await from_async.call_soon_in_new_thread(
         Call.new(step_func, **inputs)
     ).aresult()
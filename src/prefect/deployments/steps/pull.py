@@ -42,6 +42,9 @@ async def git_clone(
     """
     Clones a git repository into the current working directory.
 
+    If `PREFECT_RUNNER_CODE_CACHE_ENABLED` is set, the repository is cloned from a
+    mirror shared by the flow runs on this machine, which only fetches new commits.
+
     Args:
         repository: the URL of the repository to clone
         branch: the branch to clone; if not provided, the default branch will be used
@@ -133,7 +136,9 @@ async def pull_from_remote_storage(url: str, **settings: Any):
     """
     Pulls code from a remote storage location into the current working directory.
 
-    Works with protocols supported by `fsspec`.
+    Works with protocols supported by `fsspec`.  If `PREFECT_RUNNER_CODE_CACHE_ENABLED`
+    is set, only files that have changed since the last pull on this machine are
+    downloaded, and the rest are linked from the local code cache.
 
     Args:
         url (str): the URL of the remote storage location. Should be a valid `fsspec` URL.
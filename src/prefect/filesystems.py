@@ -1,10 +1,16 @@
 import abc
+import datetime
+import os
+import posixpath
+import shutil
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
 
 import anyio
 import fsspec
+import pendulum
 from pydantic import Field, SecretStr, field_validator
 
 from prefect._internal.schemas.validators import (
@@ -12,12 +18,14 @@ from prefect._internal.schemas.validators import (
     validate_basepath,
 )
 from prefect.blocks.core import Block
+from prefect.settings import PREFECT_FILESYSTEM_TRANSFER_WORKERS
 from prefect.utilities.asyncutils import run_sync_in_worker_thread, sync_compatible
-from prefect.utilities.compat import copytree
-from prefect.utilities.filesystem import filter_files
+from prefect.utilities.filesystem import compile_ignore_patterns
 
 from ._internal.compatibility.migration import getattr_migration
 
+T = TypeVar("T")
+
 
 class ReadableFileSystem(Block, abc.ABC):
     _block_schema_capabilities = ["read-path"]
@@ -124,12 +132,16 @@ class LocalFileSystem(WritableFileSystem, WritableDeploymentStorage):
 
     @sync_compatible
     async def get_directory(
-        self, from_path: Optional[str] = None, local_path: Optional[str] = None
+        self,
+        from_path: Optional[str] = None,
+        local_path: Optional[str] = None,
+        skip_unchanged: bool = False,
     ) -> None:
         """
         Copies a directory from one place to another on the local filesystem.
 
         Defaults to copying the entire contents of the block's basepath to the current working directory.
+        If `skip_unchanged` is set, files whose copy has the same size and is no older are not copied again.
         """
         if not from_path:
             from_path = Path(self.basepath).expanduser().resolve()
@@ -149,28 +161,13 @@ class LocalFileSystem(WritableFileSystem, WritableDeploymentStorage):
         # .prefectignore exists in the original location, not the current location which
         # is most likely temporary
         if (from_path / Path(".prefectignore")).exists():
-            ignore_func = await self._get_ignore_func(
-                local_path=from_path, ignore_file=from_path / Path(".prefectignore")
-            )
+            is_ignored = _read_ignore_file(from_path / Path(".prefectignore"))
         else:
-            ignore_func = None
-
-        copytree(from_path, local_path, dirs_exist_ok=True, ignore=ignore_func)
-
-    async def _get_ignore_func(self, local_path: str, ignore_file: str):
-        with open(ignore_file, "r") as f:
-            ignore_patterns = f.readlines()
-        included_files = filter_files(root=local_path, ignore_patterns=ignore_patterns)
-
-        def ignore_func(directory, files):
-            relative_path = Path(directory).relative_to(local_path)
-
-            files_to_ignore = [
-                f for f in files if str(relative_path / f) not in included_files
-            ]
-            return files_to_ignore
+            is_ignored = None
 
-        return ignore_func
+        await run_sync_in_worker_thread(
+            _copy_tree, from_path, local_path, is_ignored, skip_unchanged
+        )
 
     @sync_compatible
     async def put_directory(
@@ -178,12 +175,14 @@ class LocalFileSystem(WritableFileSystem, WritableDeploymentStorage):
         local_path: Optional[str] = None,
         to_path: Optional[str] = None,
         ignore_file: Optional[str] = None,
+        skip_unchanged: bool = False,
     ) -> None:
         """
         Copies a directory from one place to another on the local filesystem.
 
         Defaults to copying the entire contents of the current working directory to the block's basepath.
         An `ignore_file` path may be provided that can include gitignore style expressions for filepaths to ignore.
+        If `skip_unchanged` is set, files whose copy has the same size and is no older are not copied again.
         """
         destination_path = self._resolve_path(to_path, validate=True)
 
@@ -191,20 +190,19 @@ class LocalFileSystem(WritableFileSystem, WritableDeploymentStorage):
             local_path = Path(".").absolute()
 
         if ignore_file:
-            ignore_func = await self._get_ignore_func(
-                local_path=local_path, ignore_file=ignore_file
-            )
+            is_ignored = _read_ignore_file(ignore_file)
         else:
-            ignore_func = None
+            is_ignored = None
 
         if local_path == destination_path:
             pass
         else:
-            copytree(
-                src=local_path,
-                dst=destination_path,
-                ignore=ignore_func,
-                dirs_exist_ok=True,
+            await run_sync_in_worker_thread(
+                _copy_tree,
+                Path(local_path),
+                destination_path,
+                is_ignored,
+                skip_unchanged,
             )
 
     @sync_compatible
@@ -304,12 +302,17 @@ class RemoteFileSystem(WritableFileSystem, WritableDeploymentStorage):
 
     @sync_compatible
     async def get_directory(
-        self, from_path: Optional[str] = None, local_path: Optional[str] = None
+        self,
+        from_path: Optional[str] = None,
+        local_path: Optional[str] = None,
+        skip_unchanged: bool = False,
     ) -> None:
         """
         Downloads a directory from a given remote path to a local directory.
 
         Defaults to downloading the entire contents of the block's basepath to the current working directory.
+        If `skip_unchanged` is set, local files with the same size as the remote file and modified since it
+        are not downloaded again.
         """
         if from_path is None:
             from_path = str(self.basepath)
@@ -323,7 +326,33 @@ class RemoteFileSystem(WritableFileSystem, WritableDeploymentStorage):
         if not from_path.endswith("/"):
             from_path += "/"
 
-        return self.filesystem.get(from_path, local_path, recursive=True)
+        local_path = Path(local_path)
+        root = self.filesystem._strip_protocol(from_path).rstrip("/")
+
+        to_get: List[Tuple[str, str]] = []
+        for path, info in self.filesystem.find(
+            from_path, withdirs=True, detail=True
+        ).items():
+            relative_path = posixpath.relpath(path, root)
+            if relative_path == ".":
+                continue
+
+            target = local_path / relative_path
+            if info.get("type") == "directory":
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+
+            if skip_unchanged and _is_unchanged(info, _local_info(target)):
+                continue
+
+            target.parent.mkdir(parents=True, exist_ok=True)
+            to_get.append((path, str(target)))
+
+        await run_sync_in_worker_thread(
+            _transfer_concurrently,
+            lambda item: self.filesystem.get_file(*item),
+            to_get,
+        )
 
     @sync_compatible
     async def put_directory(
@@ -332,11 +361,16 @@ class RemoteFileSystem(WritableFileSystem, WritableDeploymentStorage):
         to_path: Optional[str] = None,
         ignore_file: Optional[str] = None,
         overwrite: bool = True,
+        skip_unchanged: bool = False,
     ) -> int:
         """
         Uploads a directory from a given local path to a remote directory.
 
         Defaults to uploading the entire contents of the current working directory to the block's basepath.
+        If `skip_unchanged` is set, remote files with the same size as the local file and modified since it
+        are not uploaded again.
+
+        Returns the number of files uploaded.
         """
         if to_path is None:
             to_path = str(self.basepath)
@@ -346,19 +380,21 @@ class RemoteFileSystem(WritableFileSystem, WritableDeploymentStorage):
         if local_path is None:
             local_path = "."
 
-        included_files = None
+        is_ignored = None
         if ignore_file:
-            with open(ignore_file, "r") as f:
-                ignore_patterns = f.readlines()
+            is_ignored = _read_ignore_file(ignore_file)
 
-            included_files = filter_files(
-                local_path, ignore_patterns, include_dirs=True
-            )
+        existing: Dict[str, Dict[str, Any]] = {}
+        if skip_unchanged:
+            try:
+                existing = self.filesystem.find(to_path, detail=True)
+            except FileNotFoundError:
+                pass
 
-        counter = 0
+        to_put: List[Tuple[str, str]] = []
         for f in Path(local_path).rglob("*"):
             relative_path = f.relative_to(local_path)
-            if included_files and str(relative_path) not in included_files:
+            if is_ignored and is_ignored(str(relative_path)):
                 continue
 
             if to_path.endswith("/"):
@@ -367,17 +403,28 @@ class RemoteFileSystem(WritableFileSystem, WritableDeploymentStorage):
                 fpath = to_path + "/" + relative_path.as_posix()
 
             if f.is_dir():
-                pass
-            else:
-                f = f.as_posix()
-                if overwrite:
-                    self.filesystem.put_file(f, fpath, overwrite=True)
-                else:
-                    self.filesystem.put_file(f, fpath)
+                continue
+
+            if skip_unchanged and _is_unchanged(
+                _local_info(f), existing.get(self.filesystem._strip_protocol(fpath))
+            ):
+                continue
+
+            to_put.append((f.as_posix(), fpath))
+
+        if overwrite:
 
-                counter += 1
+            def put(item: Tuple[str, str]) -> None:
+                self.filesystem.put_file(*item, overwrite=True)
 
-        return counter
+        else:
+
+            def put(item: Tuple[str, str]) -> None:
+                self.filesystem.put_file(*item)
+
+        await run_sync_in_worker_thread(_transfer_concurrently, put, to_put)
+
+        return len(to_put)
 
     @sync_compatible
     async def read_path(self, path: str) -> bytes:
@@ -388,6 +435,37 @@ class RemoteFileSystem(WritableFileSystem, WritableDeploymentStorage):
 
         return content
 
+    @sync_compatible
+    async def read_paths(self, paths: List[str]) -> List[bytes]:
+        """
+        Read many files at once.
+
+        Filesystems built on fsspec's async implementation read the files with one
+        batched `cat_ranges` call, which they perform as concurrent requests; other
+        filesystems read them from a pool of threads.
+
+        Args:
+            paths: The paths of the files to read.
+
+        Returns:
+            The content of each file, in the order of `paths`.
+        """
+        resolved = [self._resolve_path(path) for path in paths]
+        if getattr(self.filesystem, "async_impl", False):
+            return await run_sync_in_worker_thread(
+                self.filesystem.cat_ranges, resolved, None, None, on_error="raise"
+            )
+
+        contents: List[bytes] = [b""] * len(resolved)
+
+        def read(index: int) -> None:
+            contents[index] = self.filesystem.cat_file(resolved[index])
+
+        await run_sync_in_worker_thread(
+            _transfer_concurrently, read, range(len(resolved))
+        )
+        return contents
+
     @sync_compatible
     async def write_path(self, path: str, content: bytes) -> str:
         path = self._resolve_path(path)
@@ -517,4 +595,110 @@ class SMB(WritableFileSystem, WritableDeploymentStorage):
         return await self.filesystem.write_path(path=path, content=content)
 
 
+def _read_ignore_file(ignore_file: Union[str, Path]) -> Callable[[str], bool]:
+    with open(ignore_file, "r") as f:
+        return compile_ignore_patterns(f.readlines())
+
+
+def _transfer_concurrently(transfer: Callable[[T], Any], items: Sequence[T]) -> None:
+    """
+    Calls `transfer` with each item from a bounded pool of threads, so that copying many
+    small files is not bound by the latency of each copy.
+    """
+    if not items:
+        return
+
+    workers = min(len(items), PREFECT_FILESYSTEM_TRANSFER_WORKERS.value())
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Consume the results so that the first failure is raised
+        for _ in executor.map(transfer, items):
+            pass
+
+
+def _copy_tree(
+    source: Path,
+    destination: Path,
+    is_ignored: Optional[Callable[[str], bool]],
+    skip_unchanged: bool,
+) -> None:
+    """
+    Copies the contents of a local directory into another, like `shutil.copytree`,
+    skipping ignored paths and, if requested, files that are already up to date.
+    """
+    to_copy: List[Tuple[Path, Path]] = []
+    for directory, dirnames, filenames in os.walk(source, followlinks=True):
+        relative_directory = Path(directory).relative_to(source)
+        if is_ignored:
+            dirnames[:] = [
+                d for d in dirnames if not is_ignored(str(relative_directory / d))
+            ]
+            filenames = [
+                f for f in filenames if not is_ignored(str(relative_directory / f))
+            ]
+
+        target_directory = destination / relative_directory
+        target_directory.mkdir(parents=True, exist_ok=True)
+
+        for filename in filenames:
+            source_file = Path(directory) / filename
+            target_file = target_directory / filename
+            if skip_unchanged and _is_unchanged(
+                _local_info(source_file), _local_info(target_file)
+            ):
+                continue
+            to_copy.append((source_file, target_file))
+
+    _transfer_concurrently(lambda item: shutil.copy2(*item), to_copy)
+
+
+def _local_info(path: Path) -> Optional[Dict[str, Any]]:
+    """The size and modification time of a local file, in the form `fsspec` uses"""
+    try:
+        stats = path.stat()
+    except OSError:
+        return None
+    return {"size": stats.st_size, "mtime": stats.st_mtime}
+
+
+def _modified_time(info: Dict[str, Any]) -> Optional[float]:
+    """
+    Reads the modification time from `fsspec` file details, which each implementation
+    reports under its own key and type.
+    """
+    for key in ("mtime", "LastModified", "last_modified", "updated", "created"):
+        value = info.get(key)
+        if value is None:
+            continue
+        if isinstance(value, datetime.datetime):
+            return value.timestamp()
+        if isinstance(value, (int, float)):
+            return float(value)
+        try:
+            return pendulum.parse(str(value)).timestamp()
+        except Exception:
+            return None
+    return None
+
+
+def _is_unchanged(
+    source: Optional[Dict[str, Any]], destination: Optional[Dict[str, Any]]
+) -> bool:
+    """
+    Whether copying a file can be skipped because the destination is the same size as
+    the source and was modified no earlier than it.
+    """
+    if not source or not destination:
+        return False
+
+    if source.get("size") is None or source.get("size") != destination.get("size"):
+        return False
+
+    source_modified = _modified_time(source)
+    destination_modified = _modified_time(destination)
+    if source_modified is None or destination_modified is None:
+        return False
+
+    return destination_modified >= source_modified
+
+
 __getattr__ = getattr_migration(__name__)
@@ -1,28 +1,52 @@
 import abc
+import asyncio
 import concurrent.futures
 import inspect
+import queue
+import time
 import uuid
 from collections.abc import Iterator
 from functools import partial
-from typing import Any, Generic, List, Optional, Set, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Generic,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 from typing_extensions import TypeVar
 
 from prefect._internal.compatibility.deprecated import deprecated_async_method
+from prefect._internal.concurrency.api import create_call, from_sync
 from prefect.client.orchestration import get_client
+from prefect.client.schemas.filters import TaskRunFilter, TaskRunFilterId
 from prefect.client.schemas.objects import TaskRun
 from prefect.exceptions import ObjectNotFound
 from prefect.logging.loggers import get_logger, get_run_logger
+from prefect.results import PersistedResult, prefetch_results
+from prefect.settings import PREFECT_API_DEFAULT_LIMIT
 from prefect.states import Pending, State
 from prefect.task_runs import TaskRunWaiter
 from prefect.utilities.annotations import quote
-from prefect.utilities.asyncutils import run_coro_as_sync
+from prefect.utilities.asyncutils import run_coro_as_sync, run_sync_in_worker_thread
 from prefect.utilities.collections import StopVisiting, visit_collection
 from prefect.utilities.timeout import timeout as timeout_context
 
 F = TypeVar("F")
 R = TypeVar("R")
 
+ALL_COMPLETED = concurrent.futures.ALL_COMPLETED
+FIRST_COMPLETED = concurrent.futures.FIRST_COMPLETED
+
 logger = get_logger(__name__)
 
 
@@ -69,6 +93,31 @@ class PrefectFuture(abc.ABC, Generic[R]):
               If the task run has not completed after the timeout has elapsed, this method will return.
         """
 
+    async def wait_async(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for the task run to complete without blocking the event loop.
+
+        Futures that cannot be awaited natively are waited on in a worker thread.
+
+        Args:
+            timeout: The maximum number of seconds to wait for the task run to complete.
+              If the task run has not completed after the timeout has elapsed, this method will return.
+        """
+        await run_sync_in_worker_thread(self.wait, timeout=timeout)
+
+    def add_done_callback(self, fn: Callable[["PrefectFuture[R]"], None]) -> None:
+        """
+        Add a callback to be run when the task run completes.
+
+        The callback is called with this future from a background thread, once the
+        future's final state is known.
+
+        Args:
+            fn: The callable to call with this future.
+        """
+        call = from_sync.call_soon_in_loop_thread(create_call(self.wait_async))
+        call.future.add_done_callback(lambda _: fn(self))
+
     @abc.abstractmethod
     def result(
         self,
@@ -121,6 +170,28 @@ class PrefectConcurrentFuture(PrefectWrappedFuture[R, concurrent.futures.Future]
         if isinstance(result, State):
             self._final_state = result
 
+    async def wait_async(self, timeout: Optional[float] = None) -> None:
+        if self._final_state:
+            return
+        done, _ = await asyncio.wait(
+            [asyncio.wrap_future(self._wrapped_future)], timeout=timeout
+        )
+        if not done:
+            return
+        result = done.pop().result()
+        if isinstance(result, State):
+            self._final_state = result
+
+    def add_done_callback(self, fn: Callable[["PrefectFuture[R]"], None]) -> None:
+        def on_done(wrapped_future: concurrent.futures.Future) -> None:
+            if not wrapped_future.cancelled() and not wrapped_future.exception():
+                result = wrapped_future.result()
+                if isinstance(result, State):
+                    self._final_state = result
+            fn(self)
+
+        self._wrapped_future.add_done_callback(on_done)
+
     @deprecated_async_method
     def result(
         self,
@@ -239,6 +310,9 @@ class PrefectDistributedFuture(PrefectFuture[R]):
             return False
         return self.task_run_id == other.task_run_id
 
+    def __hash__(self):
+        return hash(self.task_run_id)
+
 
 class PrefectFutureList(list, Iterator, Generic[F]):
     """
@@ -252,14 +326,188 @@ class PrefectFutureList(list, Iterator, Generic[F]):
         """
         Wait for all futures in the list to complete.
 
+        Args:
+            timeout: The maximum number of seconds to wait for all futures to
+                complete. This method will not raise if the timeout is reached.
+        """
+        _, not_done = wait(self, timeout=timeout)
+        if not_done:
+            logger.debug("Timed out waiting for all futures to complete.")
+
+    def as_completed(
+        self, timeout: Optional[float] = None
+    ) -> Generator[PrefectFuture, None, None]:
+        """
+        Yield the futures in the list as their task runs complete.
+
+        Args:
+            timeout: The maximum number of seconds to wait for all futures to
+                complete.
+
+        Raises:
+            TimeoutError: If the timeout is reached before all futures complete.
+        """
+        return as_completed(self, timeout=timeout)
+
+    def iter_results(
+        self,
+        timeout: Optional[float] = None,
+        raise_on_failure: bool = True,
+    ) -> Generator[Any, None, None]:
+        """
+        Get the results of the task runs associated with the futures in the list, in
+        the order the task runs complete.
+
+        Args:
+            timeout: The maximum number of seconds to wait for all futures to
+                complete.
+            raise_on_failure: If `True`, an exception will be raised if any task run fails.
+
+        Raises:
+            TimeoutError: If the timeout is reached before all futures complete.
+        """
+        for future in as_completed(self, timeout=timeout):
+            yield future.result(raise_on_failure=raise_on_failure)
+
+    def result(
+        self,
+        timeout: Optional[float] = None,
+        raise_on_failure: bool = True,
+    ) -> List:
+        """
+        Get the results of all task runs associated with the futures in the list.
+
+        Persisted results are read from storage in bulk, as by `prefetch_results`.
+
+        Args:
+            timeout: The maximum number of seconds to wait for all futures to
+                complete.
+            raise_on_failure: If `True`, an exception will be raised if any task run fails.
+
+        Returns:
+            A list of results of the task runs.
+
+        Raises:
+            TimeoutError: If the timeout is reached before all futures complete.
+        """
+        _, not_done = wait(self, timeout=timeout)
+        if not_done:
+            raise TimeoutError(
+                f"Timed out waiting for all futures to complete within {timeout} seconds"
+            )
+
+        # Read persisted results in bulk rather than one at a time per future
+        persisted = [
+            future._final_state.data
+            for future in self
+            if future._final_state
+            and isinstance(future._final_state.data, PersistedResult)
+        ]
+        loaded: Dict[int, Any] = {}
+        if len(persisted) > 1:
+            loaded = run_coro_as_sync(prefetch_results(persisted))
+
+        results = []
+        for future in self:
+            state = future._final_state
+            # Results that don't cache their objects in memory are only available
+            # from what was read in bulk
+            if state and state.is_completed() and id(state.data) in loaded:
+                results.append(loaded[id(state.data)])
+            else:
+                results.append(future.result(raise_on_failure=raise_on_failure))
+        return results
+
+
+class PrefectFutureStream(Iterator, Generic[F]):
+    """
+    A stream of Prefect futures, yielded as their task runs complete.
+
+    Futures are drawn from the given iterable only while fewer than `max_in_flight`
+    of them have been drawn and not yet yielded, so an iterable that submits a task
+    run as each future is drawn never has more than `max_in_flight` task runs in
+    flight. The first futures are drawn when the stream is created, and another is
+    drawn each time a completed future is yielded.
+
+    If drawing a future raises, no more futures are drawn, and the error is raised by
+    the next call to `next` instead of the future being yielded; the futures already
+    in flight can still be drawn from the stream afterwards.
+
+    Args:
+        futures: The futures to stream, typically submitted lazily by a generator.
+        max_in_flight: The most futures that are drawn and not yet yielded at once.
+    """
+
+    def __init__(self, futures: Iterable[F], max_in_flight: int):
+        if max_in_flight < 1:
+            raise ValueError("`max_in_flight` must be at least 1")
+
+        self._futures = iter(futures)
+        self._max_in_flight = max_in_flight
+        self._in_flight = 0
+        self._completed: "queue.Queue[F]" = queue.Queue()
+        self._exhausted = False
+        self._error: Optional[Exception] = None
+        self._fill()
+
+        if self._error is not None and not self._in_flight:
+            raise self._error
+
+    @property
+    def consumed(self) -> bool:
+        """Whether every future in the stream has been yielded"""
+        return self._exhausted and not self._in_flight
+
+    def _fill(self) -> None:
+        while not self._exhausted and self._in_flight < self._max_in_flight:
+            try:
+                future = next(self._futures)
+            except StopIteration:
+                self._exhausted = True
+                return
+            except Exception as exc:
+                self._exhausted = True
+                self._error = exc
+                return
+            self._in_flight += 1
+            future.add_done_callback(self._completed.put)
+
+    def __next__(self) -> F:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+        if not self._in_flight:
+            raise StopIteration
+        future = self._completed.get()
+        self._in_flight -= 1
+        self._fill()
+        return future
+
+    def iter_results(self, raise_on_failure: bool = True) -> Iterator:
+        """
+        Get the results of the remaining task runs in the stream as they complete.
+
+        Args:
+            raise_on_failure: If `True`, an exception will be raised if any task run fails.
+
+        Returns:
+            An iterator of the results of the task runs, in the order they complete.
+        """
+        for future in self:
+            yield future.result(raise_on_failure=raise_on_failure)
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for the remaining task runs in the stream to complete.
+
         Args:
             timeout: The maximum number of seconds to wait for all futures to
                 complete. This method will not raise if the timeout is reached.
         """
         try:
             with timeout_context(timeout):
-                for future in self:
-                    future.wait()
+                for _ in self:
+                    pass
         except TimeoutError:
             logger.debug("Timed out waiting for all futures to complete.")
             return
@@ -270,7 +518,7 @@ class PrefectFutureList(list, Iterator, Generic[F]):
         raise_on_failure: bool = True,
     ) -> List:
         """
-        Get the results of all task runs associated with the futures in the list.
+        Get the results of the remaining task runs in the stream.
 
         Args:
             timeout: The maximum number of seconds to wait for all futures to
@@ -278,16 +526,14 @@ class PrefectFutureList(list, Iterator, Generic[F]):
             raise_on_failure: If `True`, an exception will be raised if any task run fails.
 
         Returns:
-            A list of results of the task runs.
+            A list of results of the task runs, in the order they complete.
 
         Raises:
             TimeoutError: If the timeout is reached before all futures complete.
         """
         try:
             with timeout_context(timeout):
-                return [
-                    future.result(raise_on_failure=raise_on_failure) for future in self
-                ]
+                return list(self.iter_results(raise_on_failure=raise_on_failure))
         except TimeoutError as exc:
             # timeout came from inside the task
             if "Scope timed out after {timeout} second(s)." not in str(exc):
@@ -297,6 +543,172 @@ class PrefectFutureList(list, Iterator, Generic[F]):
             ) from exc
 
 
+class DoneAndNotDoneFutures(NamedTuple):
+    """The futures that completed and those that did not, as returned by `wait`"""
+
+    done: Set[PrefectFuture]
+    not_done: Set[PrefectFuture]
+
+
+def _read_task_run_states(task_run_ids: List[uuid.UUID]) -> Dict[uuid.UUID, State]:
+    """
+    Read the states of many task runs, a page of task runs per request.
+    """
+    client = get_client(sync_client=True)
+    page_size = PREFECT_API_DEFAULT_LIMIT.value()
+    states: Dict[uuid.UUID, State] = {}
+    for start in range(0, len(task_run_ids), page_size):
+        page = task_run_ids[start : start + page_size]
+        task_runs = client.read_task_runs(
+            task_run_filter=TaskRunFilter(id=TaskRunFilterId(any_=page)),
+            limit=len(page),
+        )
+        for task_run in task_runs:
+            if task_run.state:
+                states[task_run.id] = task_run.state
+    return states
+
+
+def as_completed(
+    futures: Iterable[PrefectFuture[R]], timeout: Optional[float] = None
+) -> Generator[PrefectFuture[R], None, None]:
+    """
+    Yield futures as their task runs complete.
+
+    Distributed futures share the `TaskRunWaiter`'s event subscription rather than
+    each waiting on its own, and their states are read in bulk: once up front, for
+    task runs that finished before they were waited on, and then for each batch of
+    task runs reported finished together.
+
+    Args:
+        futures: The futures to wait on.
+        timeout: The maximum number of seconds to wait for all futures to complete.
+
+    Raises:
+        TimeoutError: If the timeout is reached before all futures complete.
+
+    Example:
+        ```python
+        from prefect import flow, task
+        from prefect.futures import as_completed
+
+        @task
+        def add_one(x):
+            return x + 1
+
+        @flow
+        def my_flow():
+            futures = [add_one.submit(i) for i in range(10)]
+            for future in as_completed(futures):
+                print(future.result())
+        ```
+    """
+    unique = list({id(future): future for future in futures}.values())
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    # Each completion is queued with whether the future's final state must be read
+    completed: "queue.Queue[Tuple[bool, PrefectFuture[R]]]" = queue.Queue()
+    waiting: List[Tuple[PrefectDistributedFuture[R], Callable[[], None]]] = []
+    for future in unique:
+        if isinstance(future, PrefectDistributedFuture) and not future._final_state:
+            callback = partial(completed.put, (True, future))
+            TaskRunWaiter.add_done_callback(future.task_run_id, callback)
+            waiting.append((future, callback))
+        else:
+            future.add_done_callback(lambda future: completed.put((False, future)))
+
+    try:
+        if waiting:
+            # Catch task runs that finished before their events were listened for
+            states = _read_task_run_states(
+                [future.task_run_id for future, _ in waiting]
+            )
+            for future, _ in waiting:
+                state = states.get(future.task_run_id)
+                if state and state.is_final():
+                    future._final_state = state
+                    completed.put((False, future))
+
+        yielded: Set[int] = set()
+        while len(yielded) < len(unique):
+            try:
+                batch = [
+                    completed.get(
+                        timeout=None
+                        if deadline is None
+                        else max(deadline - time.monotonic(), 0)
+                    )
+                ]
+            except queue.Empty:
+                raise TimeoutError(
+                    f"{len(unique) - len(yielded)} (of {len(unique)}) futures unfinished"
+                ) from None
+            while not completed.empty():
+                batch.append(completed.get_nowait())
+
+            unread = {
+                id(future): future
+                for needs_state, future in batch
+                if needs_state and not future._final_state
+            }
+            if unread:
+                states = _read_task_run_states(
+                    [future.task_run_id for future in unread.values()]
+                )
+                for future in unread.values():
+                    state = states.get(future.task_run_id)
+                    if state and state.is_final():
+                        future._final_state = state
+
+            for _, future in batch:
+                if id(future) not in yielded:
+                    yielded.add(id(future))
+                    yield future
+    finally:
+        for future, callback in waiting:
+            TaskRunWaiter.remove_done_callback(future.task_run_id, callback)
+
+
+def wait(
+    futures: Iterable[PrefectFuture[R]],
+    timeout: Optional[float] = None,
+    return_when: str = ALL_COMPLETED,
+) -> DoneAndNotDoneFutures:
+    """
+    Wait for futures to complete.
+
+    Args:
+        futures: The futures to wait on.
+        timeout: The maximum number of seconds to wait. This function will not raise
+            if the timeout is reached.
+        return_when: `ALL_COMPLETED` to wait for all of the futures, or
+            `FIRST_COMPLETED` to return as soon as any of them completes.
+
+    Returns:
+        A named tuple of the set of futures that completed and the set of those that
+        did not.
+    """
+    if return_when not in (ALL_COMPLETED, FIRST_COMPLETED):
+        raise ValueError(
+            f"`return_when` must be {ALL_COMPLETED!r} or {FIRST_COMPLETED!r}, got"
+            f" {return_when!r}"
+        )
+
+    futures = list(futures)
+    done: Set[PrefectFuture] = set()
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            done.add(future)
+            if return_when == FIRST_COMPLETED:
+                break
+    except TimeoutError:
+        logger.debug("Timed out waiting for futures to complete.")
+
+    return DoneAndNotDoneFutures(
+        done=done, not_done={future for future in futures if future not in done}
+    )
+
+
 def resolve_futures_to_states(
     expr: Union[PrefectFuture, Any],
 ) -> Union[State, Any]:
@@ -18,17 +18,30 @@ class ResultFactoryStore(RecordStore):
         try:
             result = self.read(key)
             result.get(_sync=True)
-            if result.expiration:
-                # if the result has an expiration,
-                # check if it is still in the future
-                exists = result.expiration > pendulum.now("utc")
-            else:
-                exists = True
+            exists = self._is_unexpired(result)
             self.cache = result
             return exists
         except Exception:
             return False
 
+    async def aexists(self, key: str) -> bool:
+        try:
+            result = self.read(key)
+            await result.get()
+            exists = self._is_unexpired(result)
+            self.cache = result
+            return exists
+        except Exception:
+            return False
+
+    @staticmethod
+    def _is_unexpired(result: BaseResult) -> bool:
+        if result.expiration:
+            # if the result has an expiration,
+            # check if it is still in the future
+            return result.expiration > pendulum.now("utc")
+        return True
+
     def read(self, key: str) -> BaseResult:
         if self.cache:
             return self.cache
@@ -51,3 +64,12 @@ class ResultFactoryStore(RecordStore):
         elif isinstance(value, BaseResult):
             return value
         return run_coro_as_sync(self.result_factory.create_result(obj=value, key=key))
+
+    async def awrite(self, key: str, value: Any) -> BaseResult:
+        if isinstance(value, PersistedResult):
+            # if the value is already a persisted result, write it
+            await value.write()
+            return value
+        elif isinstance(value, BaseResult):
+            return value
+        return await self.result_factory.create_result(obj=value, key=key)
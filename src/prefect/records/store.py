@@ -7,3 +7,9 @@ class RecordStore:
 
     def exists(self, key: str) -> bool:
         return False
+
+    async def aexists(self, key: str) -> bool:
+        return self.exists(key=key)
+
+    async def awrite(self, key: str, value: dict):
+        return self.write(key=key, value=value)
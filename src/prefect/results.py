@@ -1,4 +1,5 @@
 import abc
+import asyncio
 import inspect
 import uuid
 from functools import partial
@@ -9,6 +10,8 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    Iterable,
+    List,
     Optional,
     Tuple,
     Type,
@@ -37,10 +40,11 @@ from prefect.settings import (
     PREFECT_LOCAL_STORAGE_PATH,
     PREFECT_RESULTS_DEFAULT_SERIALIZER,
     PREFECT_RESULTS_PERSIST_BY_DEFAULT,
+    PREFECT_RESULTS_READ_CONCURRENCY,
     PREFECT_TASK_SCHEDULING_DEFAULT_STORAGE_BLOCK,
 )
 from prefect.utilities.annotations import NotSet
-from prefect.utilities.asyncutils import sync_compatible
+from prefect.utilities.asyncutils import run_sync_in_worker_thread, sync_compatible
 from prefect.utilities.pydantic import get_dispatch_key, lookup_type, register_base_type
 
 if TYPE_CHECKING:
@@ -428,6 +432,126 @@ class ResultFactory(BaseModel):
         )
         return self.serializer.loads(blob.data)
 
+    @sync_compatible
+    async def read_results(self, results: Iterable["BaseResult[R]"]) -> List[R]:
+        """
+        Retrieve the objects of many results at once.
+
+        Persisted results are read in bulk with `prefetch_results`; results written
+        with this factory's storage block reuse it rather than loading the block
+        again. Results that cannot be read in bulk are retrieved individually, which
+        raises their errors.
+
+        Args:
+            results: The results to retrieve.
+
+        Returns:
+            The object of each result, in the order of `results`.
+        """
+        results = list(results)
+        storage_blocks = {}
+        if self.storage_block_id is not None:
+            storage_blocks[self.storage_block_id] = self.storage_block
+
+        loaded = await prefetch_results(results, storage_blocks=storage_blocks)
+        return [
+            loaded[id(result)] if id(result) in loaded else await result.get()
+            for result in results
+        ]
+
+
+@inject_client
+async def prefetch_results(
+    results: Iterable["BaseResult"],
+    storage_blocks: Optional[Dict[uuid.UUID, WritableFileSystem]] = None,
+    client: "PrefectClient" = None,
+) -> Dict[int, Any]:
+    """
+    Read many persisted results at once, ahead of retrieving them with `get`.
+
+    Results are grouped by storage block so that each block is loaded once. The
+    contents of each group are read with the block's `read_paths` method where it has
+    one, and otherwise with concurrent `read_path` calls, then deserialized in worker
+    threads. At most `PREFECT_RESULTS_READ_CONCURRENCY` results are read or
+    deserialized at once.
+
+    Each object read is cached on its result unless the result was created with
+    in-memory caching disabled. Reading is best-effort: results that cannot be read
+    are skipped, so that `get` reads them individually and raises their errors.
+
+    Args:
+        results: The results to read; results that are not persisted or are already
+            cached are ignored.
+        storage_blocks: Storage blocks that are already loaded, by block document ID.
+
+    Returns:
+        The objects that were read, keyed by the `id` of their result.
+    """
+    groups: Dict[Optional[uuid.UUID], Dict[int, PersistedResult]] = {}
+    for result in results:
+        if isinstance(result, PersistedResult) and not result.has_cached_object():
+            groups.setdefault(result.storage_block_id, {})[id(result)] = result
+
+    semaphore = asyncio.Semaphore(PREFECT_RESULTS_READ_CONCURRENCY.value())
+    loaded: Dict[int, Any] = {}
+
+    async def load(result: PersistedResult, content: Optional[bytes]) -> None:
+        async with semaphore:
+            try:
+                if content is None:
+                    block = result._storage_block
+                    content = await block.read_path(result.storage_key)
+                obj, expiration = await run_sync_in_worker_thread(_load_blob, content)
+            except Exception as exc:
+                logger.debug(
+                    "Failed to read result %r in bulk: %r", result.storage_key, exc
+                )
+                return
+
+        result.expiration = expiration
+        if result._should_cache_object:
+            result._cache_object(
+                obj, storage_block=result._storage_block, serializer=result._serializer
+            )
+        loaded[id(result)] = obj
+
+    storage_blocks = storage_blocks or {}
+    for storage_block_id, group in groups.items():
+        members = list(group.values())
+        try:
+            block = storage_blocks.get(storage_block_id)
+            if block is None:
+                block = await members[0]._get_storage_block(client=client)
+        except Exception as exc:
+            logger.debug("Failed to load result storage block: %r", exc)
+            continue
+
+        for result in members:
+            if result._storage_block is None:
+                result._storage_block = block
+
+        contents: List[Optional[bytes]] = [None] * len(members)
+        read_paths = getattr(block, "read_paths", None)
+        if read_paths is not None:
+            try:
+                contents = await read_paths([result.storage_key for result in members])
+            except Exception as exc:
+                logger.debug(
+                    "Failed to read results in a batch; reading them one at a time: %r",
+                    exc,
+                )
+
+        await asyncio.gather(
+            *(load(result, content) for result, content in zip(members, contents))
+        )
+
+    return loaded
+
+
+def _load_blob(content: bytes) -> Tuple[Any, Optional[DateTime]]:
+    blob = PersistedResultBlob.model_validate_json(content)
+    return blob.load(), blob.expiration
+
 
 @register_base_type
 class BaseResult(BaseModel, abc.ABC, Generic[R]):
@@ -0,0 +1,332 @@
+"""
+A node-local, content-addressed cache of pulled flow code.
+
+Each file that passes through the cache is stored once under the SHA-256 digest of its
+contents, and a manifest for each remote storage location records the digest, size
+and remote fingerprint of every file it contains.  Pulling code from a location that
+has been pulled before only downloads the files whose fingerprint has changed;
+everything else is hard-linked into the destination from the cache.
+
+Files linked from the cache share their contents with it, so cached files are
+read-only: a file in a code directory populated from the cache can be replaced, but not
+edited in place.  Executable files are stored apart from the same contents without
+execute permission, so that both keep their mode when linked.  Linking files and
+evicting them hold a lock on the cache that is shared with the other processes on the
+node, so that files are not evicted while being linked; listing and downloading happen
+outside of it.
+
+Git repositories are cached as shared bare mirrors instead, which are fetched into
+under a lock and cloned locally for each flow run.
+"""
+
+import hashlib
+import json
+import os
+import posixpath
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, TypedDict
+from uuid import uuid4
+
+import fsspec
+from fsspec.utils import tokenize
+
+from prefect.logging.loggers import get_logger
+from prefect.settings import (
+    PREFECT_RUNNER_CODE_CACHE_DOWNLOAD_WORKERS,
+    PREFECT_RUNNER_CODE_CACHE_MAX_SIZE,
+    PREFECT_RUNNER_CODE_CACHE_PATH,
+)
+from prefect.utilities.filesystem import locked_sync
+
+logger = get_logger("runner.code-cache")
+
+# The permissions given to files stored in the cache, which are shared by every code
+# directory they are linked into
+DEFAULT_FILE_MODE = 0o444
+EXECUTABLE_FILE_MODE = 0o555
+
+# The permissions given to files copied out of the cache rather than linked, by the
+# mode of the file in the cache
+COPIED_FILE_MODES = {DEFAULT_FILE_MODE: 0o644, EXECUTABLE_FILE_MODE: 0o755}
+
+
+class ManifestEntry(TypedDict):
+    digest: str
+    size: int
+    fingerprint: str
+    # missing from manifests written before modes were recorded, whose files all
+    # have the default mode
+    mode: int
+
+
+Manifest = Dict[str, ManifestEntry]
+
+
+@dataclass
+class CachedPull:
+    """The outcome of pulling a source through the code cache"""
+
+    downloaded: int = 0
+    linked: int = 0
+    bytes_downloaded: int = 0
+
+
+class CodeCache:
+    """
+    A content-addressed store of code files on the local filesystem.
+
+    Parameters:
+        path: The directory holding the cache; defaults to
+            `PREFECT_RUNNER_CODE_CACHE_PATH`.
+        max_size: The total size in bytes of cached files, beyond which the least
+            recently used are evicted; defaults to `PREFECT_RUNNER_CODE_CACHE_MAX_SIZE`.
+        download_workers: The number of files to download concurrently; defaults to
+            `PREFECT_RUNNER_CODE_CACHE_DOWNLOAD_WORKERS`.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_size: Optional[int] = None,
+        download_workers: Optional[int] = None,
+    ):
+        self.path = Path(path or PREFECT_RUNNER_CODE_CACHE_PATH.value())
+        self.max_size = max_size or PREFECT_RUNNER_CODE_CACHE_MAX_SIZE.value()
+        self.download_workers = (
+            download_workers or PREFECT_RUNNER_CODE_CACHE_DOWNLOAD_WORKERS.value()
+        )
+
+    @property
+    def _objects(self) -> Path:
+        return self.path / "objects"
+
+    @property
+    def _manifests(self) -> Path:
+        return self.path / "manifests"
+
+    @property
+    def _scratch(self) -> Path:
+        return self.path / "tmp"
+
+    @property
+    def _lock(self) -> Path:
+        return self.path / "cache.lock"
+
+    def pull(
+        self,
+        filesystem: fsspec.AbstractFileSystem,
+        remote_path: str,
+        destination: Path,
+        key: Optional[str] = None,
+    ) -> CachedPull:
+        """
+        Pulls the files under `remote_path` on the given filesystem into
+        `destination`, downloading only the files that have changed since this source
+        was last pulled.
+
+        Args:
+            filesystem: The `fsspec` filesystem to pull from
+            remote_path: The directory on the filesystem to pull
+            destination: The local directory to pull the files into
+            key: The name of the source in the cache; defaults to the protocol and
+                path of the remote directory
+        """
+        root = filesystem._strip_protocol(remote_path).rstrip("/")
+        key = key or f"{filesystem.protocol}://{root}"
+        previous = self._read_manifest(key)
+
+        manifest: Manifest = {}
+        remote_files: Dict[str, Tuple[str, str, int]] = {}
+        to_download: List[str] = []
+
+        for path, info in filesystem.find(root, detail=True).items():
+            if info.get("type") == "directory":
+                continue
+
+            relative_path = posixpath.relpath(path, root)
+            fingerprint = tokenize(info)
+            mode = (
+                EXECUTABLE_FILE_MODE
+                if (info.get("mode") or 0) & 0o111
+                else DEFAULT_FILE_MODE
+            )
+            remote_files[relative_path] = (path, fingerprint, mode)
+
+            entry = previous.get(relative_path)
+            if (
+                entry
+                and entry["fingerprint"] == fingerprint
+                and self._has_object(entry)
+            ):
+                manifest[relative_path] = entry
+            else:
+                to_download.append(relative_path)
+
+        result = CachedPull()
+        downloaded = set()
+
+        def download(relative_path: str) -> Tuple[str, ManifestEntry]:
+            path, fingerprint, mode = remote_files[relative_path]
+            return relative_path, self._download(filesystem, path, fingerprint, mode)
+
+        while True:
+            if to_download:
+                self._scratch.mkdir(parents=True, exist_ok=True)
+                with ThreadPoolExecutor(max_workers=self.download_workers) as executor:
+                    for relative_path, entry in executor.map(download, to_download):
+                        manifest[relative_path] = entry
+                        downloaded.add(relative_path)
+                        result.downloaded += 1
+                        result.bytes_downloaded += entry["size"]
+
+            with locked_sync(self._lock):
+                # files may have been evicted since they were listed or downloaded
+                to_download = [
+                    relative_path
+                    for relative_path, entry in manifest.items()
+                    if not self._has_object(entry)
+                ]
+                if not to_download:
+                    self._materialize(manifest, destination)
+                    self._write_manifest(key, manifest)
+                    self._evict()
+                    break
+
+        result.linked = len(manifest) - len(downloaded)
+
+        logger.debug(
+            "Pulled %s: downloaded %s file(s) (%s bytes), linked %s from the cache",
+            key,
+            result.downloaded,
+            result.bytes_downloaded,
+            result.linked,
+        )
+        return result
+
+    def git_mirror(self, url: str) -> Path:
+        """The path of the shared bare mirror of the given git repository"""
+        return self.path / "git" / f"{hashlib.sha256(url.encode()).hexdigest()}.git"
+
+    def evict(self) -> None:
+        """Removes the least recently used files until the cache fits in its size"""
+        with locked_sync(self._lock):
+            self._evict()
+
+    def _evict(self) -> None:
+        if not self._objects.exists():
+            return
+
+        objects = []
+        total = 0
+        for path in self._objects.glob("*/*"):
+            try:
+                stats = path.stat()
+            except FileNotFoundError:
+                continue
+            objects.append((stats.st_mtime, stats.st_size, path))
+            total += stats.st_size
+
+        if total <= self.max_size:
+            return
+
+        for _, size, path in sorted(objects):
+            path.unlink(missing_ok=True)
+            total -= size
+            if total <= self.max_size:
+                break
+
+    def _download(
+        self,
+        filesystem: fsspec.AbstractFileSystem,
+        path: str,
+        fingerprint: str,
+        mode: int,
+    ) -> ManifestEntry:
+        with tempfile.NamedTemporaryFile(dir=self._scratch, delete=False) as f:
+            scratch = Path(f.name)
+        filesystem.get_file(path, str(scratch))
+        return self._add_object(scratch, fingerprint, mode)
+
+    def _add_object(self, scratch: Path, fingerprint: str, mode: int) -> ManifestEntry:
+        """Moves a file from the scratch directory into the store"""
+        sha256 = hashlib.sha256()
+        with open(scratch, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha256.update(chunk)
+
+        entry = ManifestEntry(
+            digest=sha256.hexdigest(),
+            size=scratch.stat().st_size,
+            fingerprint=fingerprint,
+            mode=mode,
+        )
+
+        path = self._object_path(entry)
+        if path.exists():
+            scratch.unlink()
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            scratch.chmod(mode)
+            os.replace(scratch, path)
+
+        return entry
+
+    def _object_path(self, entry: ManifestEntry) -> Path:
+        digest = entry["digest"]
+        if entry.get("mode", DEFAULT_FILE_MODE) == EXECUTABLE_FILE_MODE:
+            digest += ".x"
+        return self._objects / digest[:2] / digest
+
+    def _has_object(self, entry: ManifestEntry) -> bool:
+        try:
+            return self._object_path(entry).stat().st_size == entry["size"]
+        except FileNotFoundError:
+            return False
+
+    def _materialize(self, manifest: Manifest, destination: Path) -> None:
+        for relative_path, entry in manifest.items():
+            source = self._object_path(entry)
+            target = destination / relative_path
+
+            # mark the file as recently used
+            os.utime(source)
+
+            if target.exists() and os.path.samefile(source, target):
+                continue
+
+            target.parent.mkdir(parents=True, exist_ok=True)
+            replacement = target.with_name(f".{target.name}.{uuid4().hex}")
+
+            try:
+                os.link(source, replacement)
+            except OSError:
+                # e.g. the destination is on a different device than the cache
+                shutil.copy2(source, replacement)
+                replacement.chmod(
+                    COPIED_FILE_MODES[entry.get("mode", DEFAULT_FILE_MODE)]
+                )
+
+            os.replace(replacement, target)
+
+    def _manifest_path(self, key: str) -> Path:
+        return self._manifests / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def _read_manifest(self, key: str) -> Manifest:
+        try:
+            with open(self._manifest_path(key)) as f:
+                return json.load(f)["files"]
+        except (FileNotFoundError, ValueError, KeyError):
+            return {}
+
+    def _write_manifest(self, key: str, manifest: Manifest) -> None:
+        self._manifests.mkdir(parents=True, exist_ok=True)
+        path = self._manifest_path(key)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self._manifests, delete=False, suffix=".tmp"
+        ) as f:
+            json.dump({"key": key, "files": manifest}, f)
+        os.replace(f.name, path)
@@ -15,7 +15,10 @@ from prefect.blocks.core import Block, BlockNotSavedError
 from prefect.blocks.system import Secret
 from prefect.filesystems import ReadableDeploymentStorage, WritableDeploymentStorage
 from prefect.logging.loggers import get_logger
+from prefect.runner.code_cache import CodeCache
+from prefect.settings import PREFECT_RUNNER_CODE_CACHE_ENABLED
 from prefect.utilities.collections import visit_collection
+from prefect.utilities.filesystem import locked
 
 
 @runtime_checkable
@@ -231,6 +234,21 @@ class GitRepository:
         """
         Clones the repository into the local destination.
         """
+        if PREFECT_RUNNER_CODE_CACHE_ENABLED.value():
+            existed = self.destination.exists()
+            try:
+                if await self._clone_repo_from_mirror():
+                    return
+            except subprocess.CalledProcessError as exc:
+                self._logger.warning(
+                    "Failed to clone repository %r from its local mirror with exit"
+                    " code %s, cloning it directly instead.",
+                    self._url,
+                    exc.returncode,
+                )
+                if not existed and self.destination.exists():
+                    shutil.rmtree(self.destination)
+
         self._logger.debug("Cloning repository %s", self._url)
 
         repository_url = self._repository_url_with_credentials
@@ -258,6 +276,83 @@ class GitRepository:
                 f" {exc.returncode}."
             ) from exc_chain
 
+    async def _clone_repo_from_mirror(self) -> bool:
+        """
+        Clones the repository from a bare mirror shared by the flow runs on this
+        machine, after fetching any new commits into it.  The local clone hard-links
+        the mirror's objects, so it costs little more than checking out the files.
+
+        Returns False if the branch to clone couldn't be determined.
+        """
+        repository_url = self._repository_url_with_credentials
+        branch = self._branch or await self._get_default_branch()
+        if not branch:
+            return False
+
+        mirror = CodeCache().git_mirror(self._url)
+
+        async with locked(mirror.with_suffix(".lock")):
+            if not (mirror / "HEAD").exists():
+                self._logger.debug("Creating a local mirror of %s", self._url)
+                await run_process(["git", "init", "--bare", str(mirror)])
+
+            # The URL is only given on the command line, so that credentials are not
+            # stored in the shared mirror
+            self._logger.debug("Fetching %s of %s into its mirror", branch, self._url)
+            await run_process(
+                [
+                    "git",
+                    "fetch",
+                    "--force",
+                    repository_url,
+                    f"+{branch}:refs/heads/{branch}",
+                ],
+                cwd=mirror,
+            )
+            await run_process(
+                [
+                    "git",
+                    "clone",
+                    "--local",
+                    "--branch",
+                    branch,
+                    str(mirror),
+                    str(self.destination),
+                ]
+            )
+
+        await run_process(
+            ["git", "remote", "set-url", "origin", repository_url],
+            cwd=self.destination,
+        )
+
+        if self._include_submodules:
+            await run_process(
+                ["git", "submodule", "update", "--init", "--recursive"],
+                cwd=self.destination,
+            )
+
+        return True
+
+    async def _get_default_branch(self) -> Optional[str]:
+        """
+        Returns the name of the branch that the repository's HEAD points to.
+        """
+        result = await run_process(
+            [
+                "git",
+                "ls-remote",
+                "--symref",
+                self._repository_url_with_credentials,
+                "HEAD",
+            ]
+        )
+        for line in (result.stdout or b"").decode().splitlines():
+            if line.startswith("ref: refs/heads/"):
+                return line[len("ref: refs/heads/") :].split()[0]
+
+        return None
+
     def __eq__(self, __value) -> bool:
         if isinstance(__value, GitRepository):
             return (
@@ -437,15 +532,25 @@ class RemoteStorage:
 
         remote_path = str(self._remote_path) + "/"
 
-        try:
-            await from_async.wait_for_call_in_new_thread(
-                create_call(
-                    self._filesystem.get,
-                    remote_path,
-                    str(self.destination),
-                    recursive=True,
-                )
+        if PREFECT_RUNNER_CODE_CACHE_ENABLED.value():
+            # only download what has changed since this node last pulled the code
+            call = create_call(
+                CodeCache().pull,
+                self._filesystem,
+                remote_path,
+                self.destination,
+                key=self._url,
             )
+        else:
+            call = create_call(
+                self._filesystem.get,
+                remote_path,
+                str(self.destination),
+                recursive=True,
+            )
+
+        try:
+            await from_async.wait_for_call_in_new_thread(call)
         except Exception as exc:
             raise RuntimeError(
                 f"Failed to pull contents from remote storage {self._url!r} to"
@@ -5,12 +5,15 @@ Routes for interacting with block objects.
 from typing import List, Optional
 from uuid import UUID
 
+import pendulum
 from fastapi import Body, Depends, HTTPException, Path, Query, status
 
 from prefect.server import models, schemas
 from prefect.server.api import dependencies
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.events.clients import PrefectServerEventsClient
+from prefect.server.models.events import block_document_event
 from prefect.server.utilities.server import PrefectRouter
 
 router = PrefectRouter(prefix="/block_documents", tags=["Block documents"])
@@ -127,6 +130,9 @@ async def delete_block_document(
     db: PrefectDBInterface = Depends(provide_database_interface),
 ):
     async with db.session_context(begin_transaction=True) as session:
+        block_document = await models.block_documents.read_block_document_by_id(
+            session=session, block_document_id=block_document_id
+        )
         result = await models.block_documents.delete_block_document(
             session=session, block_document_id=block_document_id
         )
@@ -135,6 +141,8 @@ async def delete_block_document(
             status.HTTP_404_NOT_FOUND, detail="Block document not found"
         )
 
+    await _emit_block_document_event(block_document, "deleted")
+
 
 @router.patch("/{id:uuid}", status_code=status.HTTP_204_NO_CONTENT)
 async def update_block_document_data(
@@ -161,3 +169,22 @@ async def update_block_document_data(
         raise HTTPException(
             status.HTTP_404_NOT_FOUND, detail="Block document not found"
         )
+
+    async with db.session_context() as session:
+        updated = await models.block_documents.read_block_document_by_id(
+            session=session, block_document_id=block_document_id
+        )
+    await _emit_block_document_event(updated, "updated")
+
+
+async def _emit_block_document_event(
+    block_document: Optional[schemas.core.BlockDocument], change: str
+):
+    """Lets clients that cache block documents know that one has changed"""
+    if not block_document:
+        return
+
+    async with PrefectServerEventsClient() as events:
+        await events.emit(
+            block_document_event(block_document, change, pendulum.now("UTC"))
+        )
@@ -26,6 +26,11 @@ import prefect.server.api.dependencies as dependencies
 import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.logging import get_logger
+from prefect.server.api.pagination import (
+    require_keyset,
+    stream_ndjson_pages,
+    validate_cursor,
+)
 from prefect.server.api.run_history import run_history
 from prefect.server.api.validation import validate_job_variables_for_deployment_flow_run
 from prefect.server.database.dependencies import provide_database_interface
@@ -498,11 +503,19 @@ async def read_flow_runs(
     deployments: Optional[schemas.filters.DeploymentFilter] = None,
     work_pools: Optional[schemas.filters.WorkPoolFilter] = None,
     work_pool_queues: Optional[schemas.filters.WorkQueueFilter] = None,
+    after: Optional[schemas.sorting.KeysetCursor] = Body(
+        None,
+        description=(
+            "Only return flow runs after this position, given as the sort timestamp"
+            " and id of the last flow run of the previous page."
+        ),
+    ),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> List[schemas.responses.FlowRunResponse]:
     """
     Query for flow runs.
     """
+    validate_cursor(sort, after, offset)
     async with db.session_context() as session:
         db_flow_runs = await models.flow_runs.read_flow_runs(
             session=session,
@@ -515,6 +528,7 @@ async def read_flow_runs(
             offset=offset,
             limit=limit,
             sort=sort,
+            after=after,
         )
 
         # Instead of relying on fastapi.encoders.jsonable_encoder to convert the
@@ -530,6 +544,50 @@ async def read_flow_runs(
         return ORJSONResponse(content=encoded)
 
 
+@router.post("/export")
+async def export_flow_runs(
+    sort: schemas.sorting.FlowRunSort = Body(schemas.sorting.FlowRunSort.ID_DESC),
+    limit: Optional[int] = Body(
+        None, ge=1, description="The maximum number of flow runs to export."
+    ),
+    flows: Optional[schemas.filters.FlowFilter] = None,
+    flow_runs: Optional[schemas.filters.FlowRunFilter] = None,
+    task_runs: Optional[schemas.filters.TaskRunFilter] = None,
+    deployments: Optional[schemas.filters.DeploymentFilter] = None,
+    work_pools: Optional[schemas.filters.WorkPoolFilter] = None,
+    work_pool_queues: Optional[schemas.filters.WorkQueueFilter] = None,
+    db: PrefectDBInterface = Depends(provide_database_interface),
+):
+    """
+    Stream all flow runs matching the filters as newline-delimited JSON.
+    """
+    keyset = require_keyset(sort)
+
+    async def read_page(session, after, page_size):
+        return await models.flow_runs.read_flow_runs(
+            session=session,
+            flow_filter=flows,
+            flow_run_filter=flow_runs,
+            task_run_filter=task_runs,
+            deployment_filter=deployments,
+            work_pool_filter=work_pools,
+            work_queue_filter=work_pool_queues,
+            limit=page_size,
+            sort=sort,
+            after=after,
+        )
+
+    return stream_ndjson_pages(
+        db,
+        keyset,
+        read_page,
+        encode=lambda flow_run: schemas.responses.FlowRunResponse.model_validate(
+            flow_run, from_attributes=True
+        ).model_dump_json(),
+        limit=limit,
+    )
+
+
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_flow_run(
     flow_run_id: UUID = Path(..., description="The flow run id", alias="id"),
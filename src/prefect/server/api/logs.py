@@ -2,13 +2,18 @@
 Routes for interacting with log objects.
 """
 
-from typing import List
+from typing import List, Optional
 
 from fastapi import Body, Depends, status
 
 import prefect.server.api.dependencies as dependencies
 import prefect.server.models as models
 import prefect.server.schemas as schemas
+from prefect.server.api.pagination import (
+    require_keyset,
+    stream_ndjson_pages,
+    validate_cursor,
+)
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.utilities.server import PrefectRouter
@@ -33,12 +38,55 @@ async def read_logs(
     offset: int = Body(0, ge=0),
     logs: schemas.filters.LogFilter = None,
     sort: schemas.sorting.LogSort = Body(schemas.sorting.LogSort.TIMESTAMP_ASC),
+    after: Optional[schemas.sorting.KeysetCursor] = Body(
+        None,
+        description=(
+            "Only return logs after this position, given as the timestamp and id of"
+            " the last log of the previous page."
+        ),
+    ),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> List[schemas.core.Log]:
     """
     Query for logs.
     """
+    validate_cursor(sort, after, offset)
     async with db.session_context() as session:
         return await models.logs.read_logs(
-            session=session, log_filter=logs, offset=offset, limit=limit, sort=sort
+            session=session,
+            log_filter=logs,
+            offset=offset,
+            limit=limit,
+            sort=sort,
+            after=after,
         )
+
+
+@router.post("/export")
+async def export_logs(
+    limit: Optional[int] = Body(
+        None, ge=1, description="The maximum number of logs to export."
+    ),
+    logs: schemas.filters.LogFilter = None,
+    sort: schemas.sorting.LogSort = Body(schemas.sorting.LogSort.TIMESTAMP_ASC),
+    db: PrefectDBInterface = Depends(provide_database_interface),
+):
+    """
+    Stream all logs matching the filter as newline-delimited JSON.
+    """
+    keyset = require_keyset(sort)
+
+    async def read_page(session, after, page_size):
+        return await models.logs.read_logs(
+            session=session, log_filter=logs, limit=page_size, sort=sort, after=after
+        )
+
+    return stream_ndjson_pages(
+        db,
+        keyset,
+        read_page,
+        encode=lambda log: schemas.core.Log.model_validate(
+            log, from_attributes=True
+        ).model_dump_json(),
+        limit=limit,
+    )
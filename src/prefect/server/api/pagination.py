@@ -0,0 +1,95 @@
+"""
+Utilities for keyset pagination and for streaming large query results as
+newline-delimited JSON.
+"""
+
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Sequence
+
+from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.schemas.sorting import Keyset, KeysetCursor
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# The number of rows read from the database for each chunk of an export
+EXPORT_PAGE_SIZE = 500
+
+
+def require_keyset(sort: Any) -> Keyset:
+    """
+    Return the keyset for a sort, or raise a 422 if the sort cannot be paginated
+    with a cursor.
+    """
+    keyset = sort.as_keyset()
+    if keyset is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Keyset pagination is not supported when sorting by {sort.value}",
+        )
+    return keyset
+
+
+def validate_cursor(sort: Any, after: Optional[KeysetCursor], offset: int) -> None:
+    """
+    Raise a 422 if a cursor is given with an offset, or with a sort that cannot be
+    paginated with a cursor.
+    """
+    if after is None:
+        return
+    if offset:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="`after` cannot be combined with a non-zero `offset`.",
+        )
+    require_keyset(sort)
+
+
+def stream_ndjson_pages(
+    db: PrefectDBInterface,
+    keyset: Keyset,
+    read_page: Callable[
+        [AsyncSession, Optional[KeysetCursor], int], Awaitable[Sequence[Any]]
+    ],
+    encode: Callable[[Any], str],
+    limit: Optional[int] = None,
+) -> StreamingResponse:
+    """
+    Stream the results of a keyset-paginated query as newline-delimited JSON.
+
+    Each page is read in its own short-lived session, so that a slow consumer never
+    holds a connection or transaction open for the length of the export.
+
+    Args:
+        db: the database interface
+        keyset: the keyset the query is ordered by
+        read_page: reads the page of ORM objects after a cursor, up to a limit
+        encode: encodes one ORM object as a JSON document
+        limit: the maximum number of objects to stream, or `None` for all of them
+    """
+
+    async def lines() -> AsyncIterator[str]:
+        after = None
+        remaining = limit
+        while remaining is None or remaining > 0:
+            page_size = (
+                EXPORT_PAGE_SIZE
+                if remaining is None
+                else min(remaining, EXPORT_PAGE_SIZE)
+            )
+            async with db.session_context() as session:
+                items = await read_page(session, after, page_size)
+                chunk = "".join(f"{encode(item)}\n" for item in items)
+                if items:
+                    after = keyset.cursor_for(items[-1])
+
+            if chunk:
+                yield chunk
+            if len(items) < page_size:
+                return
+            if remaining is not None:
+                remaining -= len(items)
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
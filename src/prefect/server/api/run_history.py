@@ -4,8 +4,10 @@ Utilities for querying flow and task run history.
 
 import datetime
 import json
-from typing import List, Optional
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
 
+import pendulum
 import pydantic
 import sqlalchemy as sa
 from pydantic_extra_types.pendulum_dt import DateTime
@@ -16,6 +18,11 @@ import prefect.server.schemas as schemas
 from prefect.logging import get_logger
 from prefect.server.database.dependencies import db_injector
 from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.models.run_history_rollups import BUCKET_SECONDS
+from prefect.settings import (
+    PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED,
+    PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_LOOP_SECONDS,
+)
 
 logger = get_logger("server.api")
 
@@ -56,6 +63,23 @@ async def run_history(
             f"Unknown run type {run_type!r}. Expected 'flow_run' or 'task_run'."
         )
 
+    if PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED.value():
+        history = await _run_history_from_rollups(
+            session=session,
+            run_type=run_type,
+            history_start=history_start,
+            history_end=history_end,
+            history_interval=history_interval,
+            flows=flows,
+            flow_runs=flow_runs,
+            task_runs=task_runs,
+            deployments=deployments,
+            work_pools=work_pools,
+            work_queues=work_queues,
+        )
+        if history is not None:
+            return history
+
     # create a CTE for timestamp intervals
     intervals = db.make_timestamp_intervals(
         history_start,
@@ -163,3 +187,201 @@ async def run_history(
     return pydantic.TypeAdapter(
         List[schemas.responses.HistoryResponse]
     ).validate_python(records)
+
+
+def _criteria(filter: Optional[pydantic.BaseModel]) -> Dict[str, Any]:
+    """The criteria a filter sets, without their operators"""
+    if filter is None:
+        return {}
+    criteria = filter.model_dump(exclude_none=True)
+    criteria.pop("operator", None)
+    for value in criteria.values():
+        if isinstance(value, dict):
+            value.pop("operator", None)
+    return criteria
+
+
+def _ids_criteria(filter: Optional[pydantic.BaseModel]) -> Optional[List[Any]]:
+    """The ids a flow or deployment filter is limited to, or None if it has other criteria"""
+    criteria = _criteria(filter)
+    if list(criteria) != ["id"] or list(criteria["id"]) != ["any_"]:
+        return None
+    return criteria["id"]["any_"]
+
+
+@db_injector
+async def _run_history_from_rollups(
+    db: PrefectDBInterface,
+    session: sa.orm.Session,
+    run_type: Literal["flow_run", "task_run"],
+    history_start: DateTime,
+    history_end: DateTime,
+    history_interval: datetime.timedelta,
+    flows: Optional[schemas.filters.FlowFilter] = None,
+    flow_runs: Optional[schemas.filters.FlowRunFilter] = None,
+    task_runs: Optional[schemas.filters.TaskRunFilter] = None,
+    deployments: Optional[schemas.filters.DeploymentFilter] = None,
+    work_pools: Optional[schemas.filters.WorkPoolFilter] = None,
+    work_queues: Optional[schemas.filters.WorkQueueFilter] = None,
+) -> Optional[List[schemas.responses.HistoryResponse]]:
+    """
+    Produce a history of runs from the pre-aggregated run history rollups, if the
+    interval lines up with the rollups and the filters can be answered by them.
+    Returns None if the history must be read from the runs instead.
+    """
+    history_start = pendulum.instance(history_start).in_timezone("UTC")
+    history_end = pendulum.instance(history_end).in_timezone("UTC")
+    interval_seconds = history_interval.total_seconds()
+
+    # every rollup must fall entirely within one interval
+    bucket_seconds = next(
+        (
+            seconds
+            for seconds in BUCKET_SECONDS
+            if interval_seconds % seconds == 0
+            and history_start.timestamp() % seconds == 0
+        ),
+        None,
+    )
+    if bucket_seconds is None:
+        return None
+
+    # match the intervals that the database would generate, at most 500 of them
+    intervals = []
+    interval_start = history_start
+    while interval_start < history_end and len(intervals) < 500:
+        intervals.append((interval_start, interval_start + history_interval))
+        interval_start = interval_start + history_interval
+    if not intervals:
+        return []
+    window_end = intervals[-1][1]
+
+    rollups = db.RunHistoryRollup
+    where = [
+        rollups.run_type == run_type,
+        rollups.bucket_seconds == bucket_seconds,
+        rollups.bucket_start >= history_start,
+        rollups.bucket_start < window_end,
+    ]
+
+    if work_pools is not None or work_queues is not None:
+        return None
+
+    if flows is not None:
+        flow_ids = _ids_criteria(flows)
+        if flow_ids is None:
+            return None
+        # flows may have been deleted since the rollups were refreshed
+        where.append(
+            rollups.flow_id.in_(sa.select(db.Flow.id).where(db.Flow.id.in_(flow_ids)))
+        )
+
+    if deployments is not None:
+        deployment_ids = _ids_criteria(deployments)
+        if deployment_ids is None:
+            return None
+        where.append(
+            rollups.deployment_id.in_(
+                sa.select(db.Deployment.id).where(db.Deployment.id.in_(deployment_ids))
+            )
+        )
+
+    if run_type == "flow_run":
+        run_filter, other_filter = flow_runs, task_runs
+    else:
+        run_filter, other_filter = task_runs, flow_runs
+    if other_filter is not None:
+        return None
+
+    criteria = _criteria(run_filter)
+    if set(criteria) - {"state", "expected_start_time"}:
+        return None
+    if len(criteria) > 1 and run_filter.operator != schemas.filters.Operator.and_:
+        return None
+
+    # the window must lie entirely within the expected start time criteria
+    expected_start_time = criteria.get("expected_start_time", {})
+    after, before = (
+        expected_start_time.get("after_"),
+        expected_start_time.get("before_"),
+    )
+    if after is not None and after > history_start:
+        return None
+    if before is not None and before < window_end:
+        return None
+
+    state = criteria.get("state", {})
+    if set(state) - {"type"}:
+        return None
+    state_types = state.get("type", {})
+    if state_types.get("any_") is not None:
+        where.append(rollups.state_type.in_(state_types["any_"]))
+    if state_types.get("not_any_") is not None:
+        where.append(rollups.state_type.not_in(state_types["not_any_"]))
+
+    # only use rollups that the service is keeping up to date
+    watermark = await models.run_history_rollups.read_rollup_watermark(session=session)
+    max_lag = datetime.timedelta(
+        seconds=3 * PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_LOOP_SECONDS.value()
+    )
+    if watermark is None or watermark < pendulum.now("UTC") - max_lag:
+        return None
+
+    result = await session.execute(
+        sa.select(
+            rollups.bucket_start,
+            rollups.state_type,
+            rollups.state_name,
+            sa.func.sum(rollups.count).label("count_runs"),
+            sa.func.sum(rollups.sum_estimated_run_time).label("sum_estimated_run_time"),
+            sa.func.sum(rollups.sum_estimated_lateness).label("sum_estimated_lateness"),
+            sa.func.sum(rollups.count_running).label("count_running"),
+            sa.func.sum(rollups.sum_running_since).label("sum_running_since"),
+            sa.func.sum(rollups.count_late).label("count_late"),
+            sa.func.sum(rollups.sum_late_since).label("sum_late_since"),
+        )
+        .where(*where)
+        .group_by(rollups.bucket_start, rollups.state_type, rollups.state_name)
+    )
+
+    # add the run time and lateness that have grown with the clock
+    now = pendulum.now("UTC").timestamp()
+    states = defaultdict(lambda: defaultdict(lambda: [0, 0.0, 0.0]))
+    for row in result:
+        index = int(
+            (
+                pendulum.instance(row.bucket_start).timestamp()
+                - history_start.timestamp()
+            )
+            // interval_seconds
+        )
+        totals = states[index][(row.state_type, row.state_name)]
+        totals[0] += row.count_runs
+        totals[1] += row.sum_estimated_run_time + max(
+            0.0, row.count_running * now - row.sum_running_since
+        )
+        totals[2] += row.sum_estimated_lateness + max(
+            0.0, row.count_late * now - row.sum_late_since
+        )
+
+    return [
+        schemas.responses.HistoryResponse(
+            interval_start=interval_start,
+            interval_end=interval_end,
+            states=[
+                schemas.responses.HistoryResponseState(
+                    state_type=state_type,
+                    state_name=state_name,
+                    count_runs=count_runs,
+                    sum_estimated_run_time=datetime.timedelta(seconds=run_time),
+                    sum_estimated_lateness=datetime.timedelta(seconds=lateness),
+                )
+                for (state_type, state_name), (
+                    count_runs,
+                    run_time,
+                    lateness,
+                ) in states[index].items()
+            ],
+        )
+        for index, (interval_start, interval_end) in enumerate(intervals)
+    ]
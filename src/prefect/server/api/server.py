@@ -35,7 +35,7 @@ from prefect._internal.compatibility.experimental import enabled_experiments
 from prefect.client.constants import SERVER_API_VERSION
 from prefect.logging import get_logger
 from prefect.server.api.dependencies import EnforceMinimumAPIVersion
-from prefect.server.events import stream
+from prefect.server.events import stream, triggers
 from prefect.server.events.services.actions import Actions
 from prefect.server.events.services.event_persister import EventPersister
 from prefect.server.events.services.triggers import ProactiveTriggers, ReactiveTriggers
@@ -581,6 +581,12 @@ def create_app(
                 services.flow_run_notifications.FlowRunNotifications()
             )
 
+        if prefect.settings.PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED.value():
+            service_instances.append(services.run_history_rollups.RunHistoryRollups())
+
+        if prefect.settings.PREFECT_API_SERVICES_LOG_COMPACTOR_ENABLED.value():
+            service_instances.append(services.log_compactor.LogCompactor())
+
         if prefect.settings.PREFECT_API_SERVICES_FOREMAN_ENABLED.value():
             service_instances.append(services.foreman.Foreman())
 
@@ -588,8 +594,9 @@ def create_app(
             service_instances.append(services.task_scheduling.TaskSchedulingTimeouts())
 
         if prefect.settings.PREFECT_API_SERVICES_TRIGGERS_ENABLED.value():
-            service_instances.append(ReactiveTriggers())
-            service_instances.append(ProactiveTriggers())
+            shard = triggers.configured_shard()
+            service_instances.append(ReactiveTriggers(shard=shard))
+            service_instances.append(ProactiveTriggers(shard=shard))
             service_instances.append(Actions())
 
         if prefect.settings.PREFECT_API_SERVICES_EVENT_PERSISTER_ENABLED:
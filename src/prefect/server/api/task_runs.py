@@ -4,7 +4,7 @@ Routes for interacting with task run objects.
 
 import asyncio
 import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 import pendulum
@@ -24,6 +24,11 @@ import prefect.server.api.dependencies as dependencies
 import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.logging import get_logger
+from prefect.server.api.pagination import (
+    require_keyset,
+    stream_ndjson_pages,
+    validate_cursor,
+)
 from prefect.server.api.run_history import run_history
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
@@ -192,11 +197,19 @@ async def read_task_runs(
     flow_runs: schemas.filters.FlowRunFilter = None,
     task_runs: schemas.filters.TaskRunFilter = None,
     deployments: schemas.filters.DeploymentFilter = None,
+    after: Optional[schemas.sorting.KeysetCursor] = Body(
+        None,
+        description=(
+            "Only return task runs after this position, given as the sort timestamp"
+            " and id of the last task run of the previous page."
+        ),
+    ),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> List[schemas.core.TaskRun]:
     """
     Query for task runs.
     """
+    validate_cursor(sort, after, offset)
     async with db.session_context() as session:
         return await models.task_runs.read_task_runs(
             session=session,
@@ -207,8 +220,49 @@ async def read_task_runs(
             offset=offset,
             limit=limit,
             sort=sort,
+            after=after,
+        )
+
+
+@router.post("/export")
+async def export_task_runs(
+    sort: schemas.sorting.TaskRunSort = Body(schemas.sorting.TaskRunSort.ID_DESC),
+    limit: Optional[int] = Body(
+        None, ge=1, description="The maximum number of task runs to export."
+    ),
+    flows: schemas.filters.FlowFilter = None,
+    flow_runs: schemas.filters.FlowRunFilter = None,
+    task_runs: schemas.filters.TaskRunFilter = None,
+    deployments: schemas.filters.DeploymentFilter = None,
+    db: PrefectDBInterface = Depends(provide_database_interface),
+):
+    """
+    Stream all task runs matching the filters as newline-delimited JSON.
+    """
+    keyset = require_keyset(sort)
+
+    async def read_page(session, after, page_size):
+        return await models.task_runs.read_task_runs(
+            session=session,
+            flow_filter=flows,
+            flow_run_filter=flow_runs,
+            task_run_filter=task_runs,
+            deployment_filter=deployments,
+            limit=page_size,
+            sort=sort,
+            after=after,
         )
 
+    return stream_ndjson_pages(
+        db,
+        keyset,
+        read_page,
+        encode=lambda task_run: schemas.core.TaskRun.model_validate(
+            task_run, from_attributes=True
+        ).model_dump_json(),
+        limit=limit,
+    )
+
 
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_task_run(
@@ -296,6 +350,16 @@ async def scheduled_task_subscription(websocket: WebSocket):
             code=4001, reason="Protocol violation: expected 'keys' in subscribe message"
         )
 
+    # Clients may ask for up to `prefetch` task runs at a time. These are delivered
+    # together as a list, and the client acknowledges each of them, in order, as it
+    # starts running it. Runs that were not acknowledged when the client disconnects
+    # go back to the queue.
+    prefetch = subscription.get("prefetch", 1)
+    if not isinstance(prefetch, int) or prefetch < 1:
+        return await websocket.close(
+            code=4001, reason="Protocol violation: expected a positive 'prefetch'"
+        )
+
     subscribed_queue = MultiQueue(task_keys)
 
     while True:
@@ -306,20 +370,42 @@ async def scheduled_task_subscription(websocket: WebSocket):
                 return
             continue
 
-        try:
-            await websocket.send_json(task_run.model_dump(mode="json"))
-
-            acknowledgement = await websocket.receive_json()
-            ack_type = acknowledgement.get("type")
-            if ack_type != "ack":
-                if ack_type == "quit":
-                    return await websocket.close()
+        task_runs = [task_run]
+        while len(task_runs) < prefetch:
+            try:
+                task_runs.append(subscribed_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
 
-                raise WebSocketDisconnect(
-                    code=4001, reason="Protocol violation: expected 'ack' message"
+        try:
+            if prefetch == 1:
+                await websocket.send_json(task_run.model_dump(mode="json"))
+            else:
+                await websocket.send_json(
+                    [task_run.model_dump(mode="json") for task_run in task_runs]
                 )
 
+            while task_runs:
+                acknowledgement = await websocket.receive_json()
+                ack_type = acknowledgement.get("type")
+                if ack_type != "ack":
+                    if ack_type == "quit":
+                        # quitting acknowledges the run it answers, but not the
+                        # rest of the batch
+                        for task_run in task_runs[1:]:
+                            await TaskQueue.for_key(task_run.task_key).retry(task_run)
+                        return await websocket.close()
+
+                    raise WebSocketDisconnect(
+                        code=4001, reason="Protocol violation: expected 'ack' message"
+                    )
+                task_runs.pop(0)
+
         except subscriptions.NORMAL_DISCONNECT_EXCEPTIONS:
-            # If sending fails or pong fails, put the task back into the retry queue
-            await asyncio.shield(TaskQueue.for_key(task_run.task_key).retry(task_run))
+            # If sending fails or pong fails, put the unacknowledged tasks back into
+            # the retry queue
+            for task_run in task_runs:
+                await asyncio.shield(
+                    TaskQueue.for_key(task_run.task_key).retry(task_run)
+                )
             return
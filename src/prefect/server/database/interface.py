@@ -309,6 +309,16 @@ class PrefectDBInterface(metaclass=DBSingleton):
         """An event resource model"""
         return orm_models.EventResource
 
+    @property
+    def RunHistoryRollup(self):
+        """A pre-aggregated run history model"""
+        return orm_models.RunHistoryRollup
+
+    @property
+    def LogSegment(self):
+        """A compressed log segment model"""
+        return orm_models.LogSegment
+
     @property
     def deployment_unique_upsert_columns(self):
         """Unique columns for upserting a Deployment"""
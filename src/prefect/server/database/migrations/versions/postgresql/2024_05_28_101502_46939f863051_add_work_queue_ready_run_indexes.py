@@ -0,0 +1,50 @@
+"""Add work queue ready-run indexes
+
+Revision ID: 46939f863051
+Revises: 94622c1663e8
+Create Date: 2024-05-28 10:15:02.381744
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "46939f863051"
+down_revision = "94622c1663e8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        # the per-queue ready queue: scheduled runs ordered by their start time, so
+        # that polling a work queue is a range read on this index
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_flow_run__work_queue_id_next_scheduled_start_time_scheduled
+            ON flow_run (work_queue_id, next_scheduled_start_time)
+            WHERE state_type = 'SCHEDULED';
+            """
+        )
+        # active runs per queue, used to compute available concurrency slots
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_flow_run__work_queue_id_active
+            ON flow_run (work_queue_id)
+            WHERE state_type IN ('RUNNING', 'PENDING');
+            """
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            DROP INDEX CONCURRENTLY IF EXISTS ix_flow_run__work_queue_id_active;
+            """
+        )
+        op.execute(
+            """
+            DROP INDEX CONCURRENTLY IF EXISTS ix_flow_run__work_queue_id_next_scheduled_start_time_scheduled;
+            """
+        )
@@ -0,0 +1,102 @@
+"""Partition events and event_resources tables by occurred
+
+Revision ID: a4f5b6c7d8e9
+Revises: 46939f863051
+Create Date: 2024-06-04 12:00:00.000000
+
+"""
+
+import pendulum
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a4f5b6c7d8e9"
+down_revision = "46939f863051"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = {
+    "events": [
+        ("ix_events__event__id", "event, id"),
+        ("ix_events__event_occurred_id", "event, occurred, id"),
+        ("ix_events__event_related_occurred", "event, related, occurred"),
+        ("ix_events__event_resource_id_occurred", "event, resource_id, occurred"),
+        ("ix_events__occurred", "occurred"),
+        ("ix_events__occurred_id", "occurred, id"),
+        ("ix_events__related_resource_ids", "related_resource_ids"),
+        ("ix_events__updated", "updated"),
+    ],
+    "event_resources": [
+        ("ix_event_resources__resource_id__occurred", "resource_id, occurred"),
+        ("ix_event_resources__updated", "updated"),
+    ],
+}
+
+
+def upgrade():
+    # Existing rows stay where they are: the old table becomes the partition for
+    # everything that occurred before the cutover, and is dropped by the event
+    # persister once all of its events are past the retention period.  Anything
+    # recorded after the cutover lands in the default partition until the event
+    # persister creates partitions for the current interval.
+    cutover = pendulum.now("UTC").start_of("hour").add(hours=1).isoformat()
+
+    for table, indexes in INDEXES.items():
+        legacy = f"{table}_legacy"
+
+        op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+        op.execute(f"ALTER TABLE {legacy} RENAME CONSTRAINT pk_{table} TO pk_{legacy}")
+        for name, _ in indexes:
+            op.execute(f"ALTER INDEX {name} RENAME TO {name}_legacy")
+
+        op.execute(
+            f"""
+            CREATE TABLE {table} (
+                LIKE {legacy} INCLUDING DEFAULTS,
+                CONSTRAINT pk_{table} PRIMARY KEY (id, occurred)
+            ) PARTITION BY RANGE (occurred)
+            """
+        )
+        for name, columns in indexes:
+            op.execute(f"CREATE INDEX {name} ON {table} ({columns})")
+
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+        # Events that occurred after the cutover can't stay in the old table
+        op.execute(
+            f"""
+            WITH moved AS (
+                DELETE FROM {legacy} WHERE occurred >= '{cutover}' RETURNING *
+            )
+            INSERT INTO {table} SELECT * FROM moved
+            """
+        )
+
+        # Partitions must include the partition key in their primary key
+        op.execute(f"ALTER TABLE {legacy} DROP CONSTRAINT pk_{legacy}")
+        op.execute(
+            f"ALTER TABLE {legacy} ADD CONSTRAINT pk_{legacy} PRIMARY KEY (id, occurred)"
+        )
+        op.execute(
+            f"""
+            ALTER TABLE {table} ATTACH PARTITION {legacy}
+            FOR VALUES FROM (MINVALUE) TO ('{cutover}')
+            """
+        )
+
+
+def downgrade():
+    for table, indexes in INDEXES.items():
+        unpartitioned = f"{table}_unpartitioned"
+
+        op.execute(f"CREATE TABLE {unpartitioned} (LIKE {table} INCLUDING DEFAULTS)")
+        op.execute(f"INSERT INTO {unpartitioned} SELECT * FROM {table}")
+
+        # dropping the partitioned table drops all of its partitions
+        op.execute(f"DROP TABLE {table}")
+        op.execute(f"ALTER TABLE {unpartitioned} RENAME TO {table}")
+
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT pk_{table} PRIMARY KEY (id)")
+        for name, columns in indexes:
+            op.execute(f"CREATE INDEX {name} ON {table} ({columns})")
@@ -0,0 +1,96 @@
+"""Add run_history_rollup table
+
+Revision ID: b7c8d9e0f1a2
+Revises: a4f5b6c7d8e9
+Create Date: 2024-06-06 09:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "b7c8d9e0f1a2"
+down_revision = "a4f5b6c7d8e9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "run_history_rollup",
+        sa.Column("run_type", sa.String(), nullable=False),
+        sa.Column("bucket_seconds", sa.Integer(), nullable=False),
+        sa.Column(
+            "bucket_start",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column("flow_id", prefect.server.utilities.database.UUID(), nullable=True),
+        sa.Column(
+            "deployment_id", prefect.server.utilities.database.UUID(), nullable=True
+        ),
+        sa.Column(
+            "state_type",
+            # the state_type enum already exists for flow and task runs
+            postgresql.ENUM(name="state_type", create_type=False),
+            nullable=True,
+        ),
+        sa.Column("state_name", sa.String(), nullable=True),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("sum_estimated_run_time", sa.Float(), nullable=False),
+        sa.Column("sum_estimated_lateness", sa.Float(), nullable=False),
+        sa.Column("stale", sa.Boolean(), server_default="0", nullable=False),
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text("(GEN_RANDOM_UUID())"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_run_history_rollup")),
+    )
+    op.create_index(
+        "ix_run_history_rollup__run_type__bucket",
+        "run_history_rollup",
+        ["run_type", "bucket_seconds", "bucket_start"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_run_history_rollup__stale",
+        "run_history_rollup",
+        ["stale"],
+        unique=False,
+        postgresql_where=sa.text("stale"),
+    )
+    op.create_index(
+        op.f("ix_run_history_rollup__updated"),
+        "run_history_rollup",
+        ["updated"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        op.f("ix_run_history_rollup__updated"), table_name="run_history_rollup"
+    )
+    op.drop_index("ix_run_history_rollup__stale", table_name="run_history_rollup")
+    op.drop_index(
+        "ix_run_history_rollup__run_type__bucket", table_name="run_history_rollup"
+    )
+    op.drop_table("run_history_rollup")
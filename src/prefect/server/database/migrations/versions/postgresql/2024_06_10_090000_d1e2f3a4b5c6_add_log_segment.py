@@ -0,0 +1,82 @@
+"""Add log_segment table
+
+Revision ID: d1e2f3a4b5c6
+Revises: b7c8d9e0f1a2
+Create Date: 2024-06-10 09:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "d1e2f3a4b5c6"
+down_revision = "b7c8d9e0f1a2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "log_segment",
+        sa.Column(
+            "flow_run_id", prefect.server.utilities.database.UUID(), nullable=False
+        ),
+        sa.Column(
+            "start_time",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "end_time",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=True),
+        sa.Column("path", sa.String(), nullable=True),
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text("(GEN_RANDOM_UUID())"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_log_segment")),
+    )
+    op.create_index(
+        "ix_log_segment__flow_run_id_start_time",
+        "log_segment",
+        ["flow_run_id", "start_time"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_log_segment__start_time"), "log_segment", ["start_time"], unique=False
+    )
+    op.create_index(
+        op.f("ix_log_segment__end_time"), "log_segment", ["end_time"], unique=False
+    )
+    op.create_index(
+        op.f("ix_log_segment__updated"), "log_segment", ["updated"], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index(op.f("ix_log_segment__updated"), table_name="log_segment")
+    op.drop_index(op.f("ix_log_segment__end_time"), table_name="log_segment")
+    op.drop_index(op.f("ix_log_segment__start_time"), table_name="log_segment")
+    op.drop_index("ix_log_segment__flow_run_id_start_time", table_name="log_segment")
+    op.drop_table("log_segment")
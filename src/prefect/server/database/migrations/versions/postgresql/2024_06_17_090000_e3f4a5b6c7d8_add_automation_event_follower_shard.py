@@ -0,0 +1,52 @@
+"""Add shard to automation_event_follower
+
+Revision ID: e3f4a5b6c7d8
+Revises: d1e2f3a4b5c6
+Create Date: 2024-06-17 09:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e3f4a5b6c7d8"
+down_revision = "d1e2f3a4b5c6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "automation_event_follower",
+        sa.Column("shard", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.drop_constraint(
+        "uq_automation_event_follower__follower_event_id",
+        "automation_event_follower",
+        type_="unique",
+    )
+    op.create_unique_constraint(
+        "uq_automation_event_follower__shard_follower_event_id",
+        "automation_event_follower",
+        ["shard", "follower_event_id"],
+    )
+
+
+def downgrade():
+    # only one shard's record of each follower can be kept
+    op.execute(
+        "DELETE FROM automation_event_follower a USING automation_event_follower b "
+        "WHERE a.follower_event_id = b.follower_event_id AND a.shard > b.shard"
+    )
+    op.drop_constraint(
+        "uq_automation_event_follower__shard_follower_event_id",
+        "automation_event_follower",
+        type_="unique",
+    )
+    op.create_unique_constraint(
+        "uq_automation_event_follower__follower_event_id",
+        "automation_event_follower",
+        ["follower_event_id"],
+    )
+    op.drop_column("automation_event_follower", "shard")
@@ -0,0 +1,41 @@
+"""Add the counts and sums of clock-dependent estimates to run_history_rollup
+
+Revision ID: c6d7e8f9a0b1
+Revises: e3f4a5b6c7d8
+Create Date: 2024-06-19 09:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c6d7e8f9a0b1"
+down_revision = "e3f4a5b6c7d8"
+branch_labels = None
+depends_on = None
+
+COLUMNS = [
+    ("count_running", sa.Integer()),
+    ("sum_running_since", sa.Float()),
+    ("count_late", sa.Integer()),
+    ("sum_late_since", sa.Float()),
+]
+
+
+def upgrade():
+    for name, type_ in COLUMNS:
+        op.add_column(
+            "run_history_rollup",
+            sa.Column(name, type_, server_default="0", nullable=False),
+        )
+
+    # existing rollups froze these estimates when they were computed
+    op.execute("UPDATE run_history_rollup SET stale = true WHERE bucket_seconds = 3600")
+
+
+def downgrade():
+    for name, _ in reversed(COLUMNS):
+        op.drop_column("run_history_rollup", name)
+
+    op.execute("UPDATE run_history_rollup SET stale = true WHERE bucket_seconds = 3600")
@@ -0,0 +1,48 @@
+"""Add work queue ready-run indexes
+
+Revision ID: 55ef02a3d65f
+Revises: 2ac65f1758c2
+Create Date: 2024-05-28 10:17:33.520116
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "55ef02a3d65f"
+down_revision = "2ac65f1758c2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # the per-queue ready queue: scheduled runs ordered by their start time, so
+    # that polling a work queue is a range read on this index
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_flow_run__work_queue_id_next_scheduled_start_time_scheduled
+        ON flow_run (work_queue_id, next_scheduled_start_time)
+        WHERE state_type = 'SCHEDULED';
+        """
+    )
+    # active runs per queue, used to compute available concurrency slots
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_flow_run__work_queue_id_active
+        ON flow_run (work_queue_id)
+        WHERE state_type IN ('RUNNING', 'PENDING');
+        """
+    )
+
+
+def downgrade():
+    op.execute(
+        """
+        DROP INDEX IF EXISTS ix_flow_run__work_queue_id_active;
+        """
+    )
+    op.execute(
+        """
+        DROP INDEX IF EXISTS ix_flow_run__work_queue_id_next_scheduled_start_time_scheduled;
+        """
+    )
@@ -0,0 +1,86 @@
+"""Add log_segment table
+
+Revision ID: e2f3a4b5c6d7
+Revises: c3d4e5f6a7b8
+Create Date: 2024-06-10 09:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+import prefect
+
+# revision identifiers, used by Alembic.
+revision = "e2f3a4b5c6d7"
+down_revision = "c3d4e5f6a7b8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "log_segment",
+        sa.Column(
+            "flow_run_id", prefect.server.utilities.database.UUID(), nullable=False
+        ),
+        sa.Column(
+            "start_time",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column(
+            "end_time",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            nullable=False,
+        ),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=True),
+        sa.Column("path", sa.String(), nullable=True),
+        sa.Column(
+            "id",
+            prefect.server.utilities.database.UUID(),
+            server_default=sa.text(
+                "(\n    (\n        lower(hex(randomblob(4)))\n        || '-'\n        || lower(hex(randomblob(2)))\n        || '-4'\n        || substr(lower(hex(randomblob(2))),2)\n        || '-'\n        || substr('89ab',abs(random()) % 4 + 1, 1)\n        || substr(lower(hex(randomblob(2))),2)\n        || '-'\n        || lower(hex(randomblob(6)))\n    )\n    )"
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "created",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated",
+            prefect.server.utilities.database.Timestamp(timezone=True),
+            server_default=sa.text("(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_log_segment")),
+    )
+    with op.batch_alter_table("log_segment", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_log_segment__flow_run_id_start_time",
+            ["flow_run_id", "start_time"],
+            unique=False,
+        )
+        batch_op.create_index(
+            batch_op.f("ix_log_segment__start_time"), ["start_time"], unique=False
+        )
+        batch_op.create_index(
+            batch_op.f("ix_log_segment__end_time"), ["end_time"], unique=False
+        )
+        batch_op.create_index(
+            batch_op.f("ix_log_segment__updated"), ["updated"], unique=False
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("log_segment", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_log_segment__updated"))
+        batch_op.drop_index(batch_op.f("ix_log_segment__end_time"))
+        batch_op.drop_index(batch_op.f("ix_log_segment__start_time"))
+        batch_op.drop_index("ix_log_segment__flow_run_id_start_time")
+
+    op.drop_table("log_segment")
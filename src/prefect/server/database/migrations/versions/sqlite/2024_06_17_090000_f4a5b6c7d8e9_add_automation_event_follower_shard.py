@@ -0,0 +1,49 @@
+"""Add shard to automation_event_follower
+
+Revision ID: f4a5b6c7d8e9
+Revises: e2f3a4b5c6d7
+Create Date: 2024-06-17 09:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f4a5b6c7d8e9"
+down_revision = "e2f3a4b5c6d7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("automation_event_follower", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("shard", sa.Integer(), server_default="0", nullable=False)
+        )
+        batch_op.drop_constraint(
+            "uq_automation_event_follower__follower_event_id", type_="unique"
+        )
+        batch_op.create_unique_constraint(
+            "uq_automation_event_follower__shard_follower_event_id",
+            ["shard", "follower_event_id"],
+        )
+
+
+def downgrade():
+    # only one shard's record of each follower can be kept
+    op.execute(
+        "DELETE FROM automation_event_follower WHERE EXISTS ("
+        "SELECT 1 FROM automation_event_follower AS b "
+        "WHERE b.follower_event_id = automation_event_follower.follower_event_id "
+        "AND b.shard < automation_event_follower.shard"
+        ")"
+    )
+    with op.batch_alter_table("automation_event_follower", schema=None) as batch_op:
+        batch_op.drop_constraint(
+            "uq_automation_event_follower__shard_follower_event_id", type_="unique"
+        )
+        batch_op.create_unique_constraint(
+            "uq_automation_event_follower__follower_event_id", ["follower_event_id"]
+        )
+        batch_op.drop_column("shard")
@@ -0,0 +1,40 @@
+"""Include occurred in the primary keys of events and event_resources
+
+Revision ID: b5c6d7e8f9a0
+Revises: f4a5b6c7d8e9
+Create Date: 2024-06-18 09:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b5c6d7e8f9a0"
+down_revision = "f4a5b6c7d8e9"
+branch_labels = None
+depends_on = None
+
+
+TABLES = ["events", "event_resources"]
+
+
+def upgrade():
+    # Matches the primary keys of the partitioned tables on PostgreSQL
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_constraint(f"pk_{table}", type_="primary")
+            batch_op.create_primary_key(f"pk_{table}", ["id", "occurred"])
+
+
+def downgrade():
+    for table in TABLES:
+        # only one copy of each event or resource can be kept
+        op.execute(
+            f"DELETE FROM {table} WHERE EXISTS ("
+            f"SELECT 1 FROM {table} AS b "
+            f"WHERE b.id = {table}.id AND b.occurred < {table}.occurred"
+            ")"
+        )
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_constraint(f"pk_{table}", type_="primary")
+            batch_op.create_primary_key(f"pk_{table}", ["id"])
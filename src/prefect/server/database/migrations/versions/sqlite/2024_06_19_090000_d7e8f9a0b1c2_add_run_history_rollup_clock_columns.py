@@ -0,0 +1,42 @@
+"""Add the counts and sums of clock-dependent estimates to run_history_rollup
+
+Revision ID: d7e8f9a0b1c2
+Revises: b5c6d7e8f9a0
+Create Date: 2024-06-19 09:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d7e8f9a0b1c2"
+down_revision = "b5c6d7e8f9a0"
+branch_labels = None
+depends_on = None
+
+COLUMNS = [
+    ("count_running", sa.Integer()),
+    ("sum_running_since", sa.Float()),
+    ("count_late", sa.Integer()),
+    ("sum_late_since", sa.Float()),
+]
+
+
+def upgrade():
+    with op.batch_alter_table("run_history_rollup", schema=None) as batch_op:
+        for name, type_ in COLUMNS:
+            batch_op.add_column(
+                sa.Column(name, type_, server_default="0", nullable=False)
+            )
+
+    # existing rollups froze these estimates when they were computed
+    op.execute("UPDATE run_history_rollup SET stale = 1 WHERE bucket_seconds = 3600")
+
+
+def downgrade():
+    with op.batch_alter_table("run_history_rollup", schema=None) as batch_op:
+        for name, _ in reversed(COLUMNS):
+            batch_op.drop_column(name)
+
+    op.execute("UPDATE run_history_rollup SET stale = 1 WHERE bucket_seconds = 3600")
@@ -658,6 +658,19 @@ class FlowRun(Run):
             "ix_flow_run__state_timestamp",
             "state_timestamp",
         ),
+        sa.Index(
+            "ix_flow_run__work_queue_id_next_scheduled_start_time_scheduled",
+            "work_queue_id",
+            "next_scheduled_start_time",
+            postgresql_where=sa.text("state_type = 'SCHEDULED'"),
+            sqlite_where=sa.text("state_type = 'SCHEDULED'"),
+        ),
+        sa.Index(
+            "ix_flow_run__work_queue_id_active",
+            "work_queue_id",
+            postgresql_where=sa.text("state_type IN ('RUNNING', 'PENDING')"),
+            sqlite_where=sa.text("state_type IN ('RUNNING', 'PENDING')"),
+        ),
     )
 
 
@@ -1414,8 +1427,17 @@ class CompositeTriggerChildFiring(Base):
 
 
 class AutomationEventFollower(Base):
+    __table_args__ = (
+        sa.UniqueConstraint(
+            "shard",
+            "follower_event_id",
+            name="uq_automation_event_follower__shard_follower_event_id",
+        ),
+    )
+
+    shard = sa.Column(sa.Integer, server_default="0", default=0, nullable=False)
     leader_event_id = sa.Column(UUID(), nullable=False, index=True)
-    follower_event_id = sa.Column(UUID(), nullable=False, unique=True)
+    follower_event_id = sa.Column(UUID(), nullable=False)
     received = sa.Column(Timestamp(), nullable=False, index=True)
     follower = sa.Column(Pydantic(ReceivedEvent), nullable=False)
 
@@ -1426,6 +1448,9 @@ class Event(Base):
         return "events"
 
     __table_args__ = (
+        # On PostgreSQL the table is partitioned by `occurred`, so it must be part of
+        # the primary key
+        sa.PrimaryKeyConstraint("id", "occurred"),
         sa.Index("ix_events__related_resource_ids", "related_resource_ids"),
         sa.Index("ix_events__occurred", "occurred"),
         sa.Index("ix_events__event__id", "event", "id"),
@@ -1440,6 +1465,8 @@ class Event(Base):
         sa.Index("ix_events__event_related_occurred", "event", "related", "occurred"),
     )
 
+    # The primary key is declared in `__table_args__`
+    id = sa.Column(UUID(), server_default=GenerateUUID(), default=uuid.uuid4)
     occurred = sa.Column(Timestamp(), nullable=False)
     event = sa.Column(sa.Text(), nullable=False)
     resource_id = sa.Column(sa.Text(), nullable=False)
@@ -1460,6 +1487,9 @@ class EventResource(Base):
         return "event_resources"
 
     __table_args__ = (
+        # On PostgreSQL the table is partitioned by `occurred`, so it must be part of
+        # the primary key
+        sa.PrimaryKeyConstraint("id", "occurred"),
         sa.Index(
             "ix_event_resources__resource_id__occurred",
             "resource_id",
@@ -1467,6 +1497,8 @@ class EventResource(Base):
         ),
     )
 
+    # The primary key is declared in `__table_args__`
+    id = sa.Column(UUID(), server_default=GenerateUUID(), default=uuid.uuid4)
     occurred = sa.Column("occurred", Timestamp(), nullable=False)
     resource_id = sa.Column("resource_id", sa.Text(), nullable=False)
     resource_role = sa.Column("resource_role", sa.Text(), nullable=False)
@@ -1474,6 +1506,70 @@ class EventResource(Base):
     event_id = sa.Column("event_id", UUID(), nullable=False)
 
 
+class RunHistoryRollup(Base):
+    """
+    Pre-aggregated counts and timings of flow or task runs, grouped by the
+    bucket of their expected start time, their flow and deployment, and their
+    state.  Maintained by the run history rollups service.
+    """
+
+    __table_args__ = (
+        sa.Index(
+            "ix_run_history_rollup__run_type__bucket",
+            "run_type",
+            "bucket_seconds",
+            "bucket_start",
+        ),
+        sa.Index(
+            "ix_run_history_rollup__stale",
+            "stale",
+            postgresql_where=sa.text("stale"),
+            sqlite_where=sa.text("stale"),
+        ),
+    )
+
+    run_type = sa.Column(sa.String, nullable=False)
+    bucket_seconds = sa.Column(sa.Integer, nullable=False)
+    bucket_start = sa.Column(Timestamp(), nullable=False)
+    flow_id = sa.Column(UUID(), nullable=True)
+    deployment_id = sa.Column(UUID(), nullable=True)
+    state_type = sa.Column(sa.Enum(schemas.states.StateType, name="state_type"))
+    state_name = sa.Column(sa.String)
+    count = sa.Column(sa.Integer, nullable=False)
+    sum_estimated_run_time = sa.Column(sa.Float, nullable=False)
+    sum_estimated_lateness = sa.Column(sa.Float, nullable=False)
+    # running runs and late runs that haven't started, whose estimates grow with
+    # the clock from the summed epoch times
+    count_running = sa.Column(sa.Integer, server_default="0", nullable=False)
+    sum_running_since = sa.Column(sa.Float, server_default="0", nullable=False)
+    count_late = sa.Column(sa.Integer, server_default="0", nullable=False)
+    sum_late_since = sa.Column(sa.Float, server_default="0", nullable=False)
+    stale = sa.Column(sa.Boolean, server_default="0", default=False, nullable=False)
+
+
+class LogSegment(Base):
+    """
+    A compressed, columnar run of the logs of one flow run, written by the log
+    compactor in place of their rows in the log table.  The compressed logs are
+    stored in `data`, or in the file at `path`.
+    """
+
+    __table_args__ = (
+        sa.Index(
+            "ix_log_segment__flow_run_id_start_time",
+            "flow_run_id",
+            "start_time",
+        ),
+    )
+
+    flow_run_id = sa.Column(UUID(), nullable=False)
+    start_time = sa.Column(Timestamp(), nullable=False, index=True)
+    end_time = sa.Column(Timestamp(), nullable=False, index=True)
+    count = sa.Column(sa.Integer, nullable=False)
+    data = sa.Column(sa.LargeBinary, nullable=True)
+    path = sa.Column(sa.String, nullable=True)
+
+
 # These are temporary until we've migrated all the references to the new,
 # non-ORM names
 
@@ -1514,6 +1610,8 @@ ORMCompositeTriggerChildFiring = CompositeTriggerChildFiring
 ORMAutomationEventFollower = AutomationEventFollower
 ORMEvent = Event
 ORMEventResource = EventResource
+ORMRunHistoryRollup = RunHistoryRollup
+ORMLogSegment = LogSegment
 
 
 class BaseORMConfiguration(ABC):
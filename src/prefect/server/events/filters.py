@@ -1,7 +1,7 @@
 import sys
 from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple, cast
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Tuple, cast
 from uuid import UUID
 
 import pendulum
@@ -99,6 +99,15 @@ class EventDataFilter(PrefectBaseModel, extra="forbid"):
         """Would the given filter exclude this event?"""
         return not self.includes(event)
 
+    def predicates(self) -> List["EventPredicate"]:
+        """The criteria of this filter as predicates over a single event, each paired
+        with a rank of how likely it is to reject an event (lower ranks are more
+        selective), for use by `CompiledEventFilter`."""
+        predicates: List[EventPredicate] = []
+        for filter in self.get_filters():
+            predicates.extend(filter.predicates())
+        return predicates
+
     def build_where_clauses(self) -> Sequence["ColumnExpressionArgument[bool]"]:
         """Convert the criteria to a WHERE clause."""
         clauses: List["ColumnExpressionArgument[bool]"] = []
@@ -128,6 +137,10 @@ class EventOccurredFilter(EventDataFilter):
     def includes(self, event: Event) -> bool:
         return self.since <= event.occurred <= self.until
 
+    def predicates(self) -> List["EventPredicate"]:
+        since, until = self.since, self.until
+        return [(4, lambda event: since <= event.occurred <= until)]
+
     def build_where_clauses(self) -> Sequence["ColumnExpressionArgument[bool]"]:
         filters: List["ColumnExpressionArgument[bool]"] = []
 
@@ -171,6 +184,29 @@ class EventNameFilter(EventDataFilter):
 
         return True
 
+    def predicates(self) -> List["EventPredicate"]:
+        predicates: List[EventPredicate] = []
+
+        if self.name:
+            names = frozenset(self.name)
+            predicates.append((1, lambda event: event.event in names))
+
+        if self.prefix:
+            prefixes = tuple(self.prefix)
+            predicates.append((2, lambda event: event.event.startswith(prefixes)))
+
+        if self.exclude_name:
+            excluded_names = frozenset(self.exclude_name)
+            predicates.append((3, lambda event: event.event not in excluded_names))
+
+        if self.exclude_prefix:
+            excluded_prefixes = tuple(self.exclude_prefix)
+            predicates.append(
+                (3, lambda event: not event.event.startswith(excluded_prefixes))
+            )
+
+        return predicates
+
     def build_where_clauses(self) -> Sequence["ColumnExpressionArgument[bool]"]:
         filters: List["ColumnExpressionArgument[bool]"] = []
 
@@ -263,6 +299,23 @@ class EventResourceFilter(EventDataFilter):
 
         return True
 
+    def predicates(self) -> List["EventPredicate"]:
+        predicates: List[EventPredicate] = []
+
+        if self.id:
+            ids = frozenset(self.id)
+            predicates.append((0, lambda event: event.resource.id in ids))
+
+        if self.id_prefix:
+            prefixes = tuple(self.id_prefix)
+            predicates.append((2, lambda event: event.resource.id.startswith(prefixes)))
+
+        if self.labels:
+            labels = self.labels.compiled()
+            predicates.append((3, lambda event: labels.matches(event.resource)))
+
+        return predicates
+
     def build_where_clauses(self) -> Sequence["ColumnExpressionArgument[bool]"]:
         filters: List["ColumnExpressionArgument[bool]"] = []
 
@@ -475,6 +528,31 @@ class EventAnyResourceFilter(EventDataFilter):
 
         return True
 
+    def predicates(self) -> List["EventPredicate"]:
+        checks: List[Callable[[Resource], bool]] = []
+
+        if self.id:
+            ids = frozenset(self.id)
+            checks.append(lambda resource: resource.id in ids)
+
+        if self.id_prefix:
+            prefixes = tuple(self.id_prefix)
+            checks.append(lambda resource: resource.id.startswith(prefixes))
+
+        if self.labels:
+            checks.append(self.labels.compiled().matches)
+
+        if not checks:
+            return []
+
+        def includes(event: Event) -> bool:
+            return any(
+                all(check(resource) for check in checks)
+                for resource in (event.resource, *event.related)
+            )
+
+        return [(3, includes)]
+
     def build_where_clauses(self) -> Sequence["ColumnExpressionArgument[bool]"]:
         filters: List["ColumnExpressionArgument[bool]"] = []
 
@@ -559,6 +637,12 @@ class EventIDFilter(EventDataFilter):
 
         return True
 
+    def predicates(self) -> List["EventPredicate"]:
+        if not self.id:
+            return []
+        ids = frozenset(self.id)
+        return [(0, lambda event: event.id in ids)]
+
     def build_where_clauses(self) -> Sequence["ColumnExpressionArgument[bool]"]:
         filters: List["ColumnExpressionArgument[bool]"] = []
 
@@ -605,6 +689,10 @@ class EventFilter(EventDataFilter):
         self._top_level_filter = self
         return super().build_where_clauses()
 
+    def compile(self) -> "CompiledEventFilter":
+        """Compiles this filter for evaluating many events in memory"""
+        return CompiledEventFilter(self)
+
     def _scoped_event_resources(self) -> Select:
         """Returns an event_resources query that is scoped to this filter's scope by occurred."""
         query = sa.select(orm_models.EventResource.event_id).where(
@@ -624,3 +712,46 @@ class EventFilter(EventDataFilter):
             return len(self.id.id)
 
         return sys.maxsize
+
+
+EventPredicate = Tuple[int, Callable[[Event], bool]]
+
+
+class CompiledEventFilter:
+    """
+    An `EventFilter` compiled to a list of predicates for evaluating events in memory,
+    as an alternative to `EventFilter.includes` when the same filter is tested
+    against many events.
+
+    Predicates are ordered from the most to the least selective, so that events are
+    rejected by the cheapest, most discriminating criteria first.  The filter captures
+    the criteria as they were when compiled, so it should be compiled again if the
+    `EventFilter` changes.
+    """
+
+    def __init__(self, filter: EventFilter):
+        ranked = sorted(filter.predicates(), key=lambda predicate: predicate[0])
+        self._predicates = [predicate for _, predicate in ranked]
+
+    def includes(self, event: Event) -> bool:
+        """Does the given event match the criteria of this filter?"""
+        for predicate in self._predicates:
+            if not predicate(event):
+                return False
+        return True
+
+    def excludes(self, event: Event) -> bool:
+        """Would the given filter exclude this event?"""
+        return not self.includes(event)
+
+    def filter(self, events: Sequence[Event]) -> List[Event]:
+        """Returns the events matching this filter, in their original order.
+
+        Each predicate is applied to the whole batch in turn, narrowing the
+        candidates before the next, less selective predicate is evaluated."""
+        candidates = list(events)
+        for predicate in self._predicates:
+            if not candidates:
+                break
+            candidates = [event for event in candidates if predicate(event)]
+        return candidates
@@ -343,10 +343,12 @@ class EventTrigger(ResourceTrigger):
         return data
 
     def covers(self, event: ReceivedEvent):
-        if not self.covers_resources(event.resource, event.related):
+        # the event name is checked first, as it is cheaper and more selective than
+        # the resource labels
+        if not self.event_pattern.match(event.event):
             return False
 
-        if not self.event_pattern.match(event.event):
+        if not self.covers_resources(event.resource, event.related):
             return False
 
         return True
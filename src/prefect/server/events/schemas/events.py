@@ -1,7 +1,11 @@
 import copy
+import re
+import sys
 from collections import defaultdict
+from functools import lru_cache
 from typing import (
     Any,
+    Callable,
     Dict,
     Iterable,
     List,
@@ -18,6 +22,7 @@ from pydantic import (
     AnyHttpUrl,
     ConfigDict,
     Field,
+    PrivateAttr,
     RootModel,
     field_validator,
     model_validator,
@@ -225,7 +230,91 @@ def matches(expected: str, value: Optional[str]) -> bool:
     return match if positive else not match
 
 
+def _glob_pattern(values: Sequence[str]) -> "re.Pattern[str]":
+    """Translates expected values, which may end with a wildcard, into one regular
+    expression to be tested with `fullmatch`"""
+    return re.compile(
+        "|".join(
+            re.escape(value[:-1]) + ".*" if value.endswith("*") else re.escape(value)
+            for value in values
+        ),
+        re.DOTALL,
+    )
+
+
+@lru_cache(maxsize=4096)
+def compile_matches(expected: Tuple[str, ...]) -> Callable[[Optional[str]], bool]:
+    """Compiles a predicate equivalent to `any(matches(e, value) for e in expected)`.
+
+    Predicates are cached by their expected values, so that the many triggers and
+    subscriptions which expect the same values share one compiled predicate."""
+    positive = [value for value in expected if not value.startswith("!")]
+    negative = [value[1:] for value in expected if value.startswith("!")]
+
+    exact = frozenset(value for value in positive if not value.endswith("*"))
+    pattern = (
+        _glob_pattern(positive)
+        if any(value.endswith("*") for value in positive)
+        else None
+    )
+    negative_patterns = [_glob_pattern([value]) for value in negative]
+
+    def predicate(value: Optional[str]) -> bool:
+        if value is None:
+            return False
+        if value in exact:
+            return True
+        if pattern is not None and pattern.fullmatch(value):
+            return True
+        return any(not negated.fullmatch(value) for negated in negative_patterns)
+
+    return predicate
+
+
+def _selectivity(label: str, expected: Sequence[str]) -> Tuple[int, int]:
+    """Orders label checks so that those likely to reject a resource come first:
+    exact values before wildcards before negations, and resource IDs first"""
+    if any(value.startswith("!") for value in expected):
+        kind = 2
+    elif any(value.endswith("*") for value in expected):
+        kind = 1
+    else:
+        kind = 0
+    return kind, 0 if label == "prefect.resource.id" else 1
+
+
+class CompiledResourceSpecification:
+    """A `ResourceSpecification` compiled to one predicate per label, ordered by how
+    likely each is to reject a resource"""
+
+    def __init__(self, specification: "ResourceSpecification"):
+        labels = sorted(specification.items(), key=lambda item: _selectivity(*item))
+        self.checks: List[Tuple[str, Callable[[Optional[str]], bool]]] = [
+            (sys.intern(label), compile_matches(tuple(expected)))
+            for label, expected in labels
+        ]
+
+    def matches(self, resource: Resource) -> bool:
+        labels = resource.root
+        for label, predicate in self.checks:
+            if not predicate(labels.get(label)):
+                return False
+        return True
+
+    def includes(self, candidates: Iterable[Resource]) -> bool:
+        if not self.checks:
+            return True
+        return any(self.matches(candidate) for candidate in candidates)
+
+
 class ResourceSpecification(RootModel[Dict[str, Union[str, List[str]]]]):
+    _compiled: Optional[CompiledResourceSpecification] = PrivateAttr(None)
+
+    def compiled(self) -> CompiledResourceSpecification:
+        if self._compiled is None:
+            self._compiled = CompiledResourceSpecification(self)
+        return self._compiled
+
     def matches_every_resource(self) -> bool:
         return len(self.root) == 0
 
@@ -240,19 +329,10 @@ class ResourceSpecification(RootModel[Dict[str, Union[str, List[str]]]]):
         return False
 
     def includes(self, candidates: Iterable[Resource]) -> bool:
-        if self.matches_every_resource():
-            return True
-        for candidate in candidates:
-            if self.matches(candidate):
-                return True
-        return False
+        return self.compiled().includes(candidates)
 
     def matches(self, resource: Resource) -> bool:
-        for label, expected in self.items():
-            value = resource.get(label)
-            if not any(matches(candidate, value) for candidate in expected):
-                return False
-        return True
+        return self.compiled().matches(resource)
 
     def items(self) -> Iterable[Tuple[str, List[str]]]:
         return [
@@ -275,6 +355,7 @@ class ResourceSpecification(RootModel[Dict[str, Union[str, List[str]]]]):
         self, key: str, default: Optional[Union[str, List[str]]] = None
     ) -> Optional[List[str]]:
         value = self.root.pop(key, default)
+        self._compiled = None
         if not value:
             return []
         if not isinstance(value, list):
@@ -4,21 +4,34 @@ storage as fast as it can.  Never gets tired.
 """
 
 import asyncio
+import time
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import timedelta
 from typing import AsyncGenerator, List, Optional
 
 import pendulum
-import sqlalchemy as sa
 
 from prefect.logging import get_logger
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.events.schemas.events import ReceivedEvent
-from prefect.server.events.storage.database import write_events
+from prefect.server.events.storage.database import (
+    create_event_partitions,
+    delete_old_events,
+    drop_expired_event_partitions,
+    write_events,
+)
+from prefect.server.utilities.database import get_dialect
 from prefect.server.utilities.messaging import Message, MessageHandler, create_consumer
 from prefect.settings import (
+    PREFECT_API_DATABASE_CONNECTION_URL,
     PREFECT_API_SERVICES_EVENT_PERSISTER_BATCH_SIZE,
     PREFECT_API_SERVICES_EVENT_PERSISTER_FLUSH_INTERVAL,
+    PREFECT_API_SERVICES_EVENT_PERSISTER_MAX_BATCH_SIZE,
+    PREFECT_API_SERVICES_EVENT_PERSISTER_MAX_QUEUE_SIZE,
+    PREFECT_API_SERVICES_EVENT_PERSISTER_MAX_RETRIES,
+    PREFECT_API_SERVICES_EVENT_PERSISTER_TARGET_FLUSH_LATENCY,
+    PREFECT_EVENTS_RETENTION_BATCH_SIZE,
     PREFECT_EVENTS_RETENTION_PERIOD,
 )
 
@@ -34,6 +47,7 @@ class EventPersister:
 
     def __init__(self):
         self._started_event: Optional[asyncio.Event] = None
+        self.metrics = EventPersisterMetrics()
 
     @property
     def started_event(self) -> asyncio.Event:
@@ -54,6 +68,13 @@ class EventPersister:
             flush_every=timedelta(
                 seconds=PREFECT_API_SERVICES_EVENT_PERSISTER_FLUSH_INTERVAL.value()
             ),
+            max_batch_size=PREFECT_API_SERVICES_EVENT_PERSISTER_MAX_BATCH_SIZE.value(),
+            target_flush_latency=timedelta(
+                seconds=PREFECT_API_SERVICES_EVENT_PERSISTER_TARGET_FLUSH_LATENCY.value()
+            ),
+            max_queue_size=PREFECT_API_SERVICES_EVENT_PERSISTER_MAX_QUEUE_SIZE.value(),
+            max_retries=PREFECT_API_SERVICES_EVENT_PERSISTER_MAX_RETRIES.value(),
+            metrics=self.metrics,
         ) as handler:
             self.consumer_task = asyncio.create_task(self.consumer.run(handler))
             logger.debug("Event persister started")
@@ -78,52 +99,205 @@ class EventPersister:
         logger.debug("Event persister stopped")
 
 
+@dataclass
+class EventPersisterMetrics:
+    """
+    Queue depth, flush latency and failure counts for an event persister handler.
+
+    Latencies are measured in seconds for each batch written to the database.
+    """
+
+    queue_depth: int = 0
+    max_queue_size: int = 0
+    batches: int = 0
+    persisted: int = 0
+    retries: int = 0
+    # events that could not be written on their own, and were dropped
+    failed_rows: int = 0
+    last_flush_latency: float = 0.0
+    max_flush_latency: float = 0.0
+    total_flush_latency: float = 0.0
+
+    @property
+    def mean_flush_latency(self) -> float:
+        return self.total_flush_latency / self.batches if self.batches else 0.0
+
+    def record_flush(self, batch_size: int, elapsed: float) -> None:
+        self.batches += 1
+        self.persisted += batch_size
+        self.last_flush_latency = elapsed
+        self.max_flush_latency = max(self.max_flush_latency, elapsed)
+        self.total_flush_latency += elapsed
+
+
+class AdaptiveBatchSize:
+    """
+    Adapts the number of events written per batch to how long batches take to write.
+
+    The batch size doubles after a full batch is written in under half of the target
+    latency, and halves after a batch takes longer than the target or fails.
+    """
+
+    def __init__(self, minimum: int, maximum: int, target_latency: timedelta):
+        self.minimum = minimum
+        self.maximum = max(minimum, maximum)
+        self.target_latency = target_latency.total_seconds()
+        self.size = minimum
+
+    def record(self, batch_size: int, elapsed: float) -> None:
+        if elapsed > self.target_latency:
+            self.shrink()
+        elif batch_size >= self.size and elapsed < self.target_latency / 2:
+            self.size = min(self.maximum, self.size * 2)
+
+    def shrink(self) -> None:
+        self.size = max(self.minimum, self.size // 2)
+
+
 @asynccontextmanager
 async def create_handler(
     batch_size: int = 20,
     flush_every: timedelta = timedelta(seconds=5),
     trim_every: timedelta = timedelta(minutes=15),
+    max_batch_size: Optional[int] = None,
+    target_flush_latency: timedelta = timedelta(seconds=1),
+    max_queue_size: int = 10_000,
+    max_retries: int = 5,
+    retry_delay: timedelta = timedelta(seconds=0.1),
+    metrics: Optional[EventPersisterMetrics] = None,
 ) -> AsyncGenerator[MessageHandler, None]:
     """
     Set up a message handler that will accumulate and send events to
     the database every `batch_size` messages, or every `flush_every` interval to flush
     any remaining messages
+
+    When `max_batch_size` is given, the batch size adapts between `batch_size` and
+    `max_batch_size`, aiming for each batch to be written within
+    `target_flush_latency`.
+
+    At most `max_queue_size` events are held in memory.  When the queue is full, the
+    handler waits for room before returning, which holds back the messaging consumer
+    until the database catches up.  Each batch is written in its own transaction and
+    retried up to `max_retries` times, waiting `retry_delay` before the first retry
+    and doubling the wait up to `flush_every`.  A batch that still fails is split in
+    half and each half is written and retried once, down to single events, which are
+    logged and dropped if they still can't be written.
     """
     db = provide_database_interface()
+    partitioned = (
+        get_dialect(PREFECT_API_DATABASE_CONNECTION_URL.value()).name == "postgresql"
+    )
+
+    queue: asyncio.Queue[ReceivedEvent] = asyncio.Queue(maxsize=max_queue_size)
 
-    queue: asyncio.Queue[ReceivedEvent] = asyncio.Queue()
+    flush_lock = asyncio.Lock()
+
+    if metrics is None:
+        metrics = EventPersisterMetrics()
+    metrics.max_queue_size = max_queue_size
+
+    batch_sizer = AdaptiveBatchSize(
+        minimum=batch_size,
+        maximum=max_batch_size or batch_size,
+        target_latency=target_flush_latency,
+    )
+
+    def update_queue_depth() -> None:
+        metrics.queue_depth = queue.qsize()
+
+    async def write_with_retries(batch: List[ReceivedEvent], retries: int) -> bool:
+        delay = retry_delay.total_seconds()
+        for attempt in range(retries + 1):
+            if attempt:
+                metrics.retries += 1
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, flush_every.total_seconds())
+
+            started = time.monotonic()
+            try:
+                async with db.session_context() as session:
+                    await write_events(session=session, events=batch)
+                    await session.commit()
+            except Exception:
+                logger.debug(
+                    "Error persisting %s events (attempt %s of %s)",
+                    len(batch),
+                    attempt + 1,
+                    retries + 1,
+                    exc_info=True,
+                )
+                batch_sizer.shrink()
+            else:
+                elapsed = time.monotonic() - started
+                batch_sizer.record(len(batch), elapsed)
+                metrics.record_flush(len(batch), elapsed)
+                return True
+
+        return False
+
+    async def write_batch(batch: List[ReceivedEvent], retries: int) -> None:
+        if await write_with_retries(batch, retries):
+            return
+
+        if len(batch) == 1:
+            metrics.failed_rows += 1
+            logger.error(
+                "Dropping event %s (%s), which could not be persisted.",
+                batch[0].id,
+                batch[0].event,
+            )
+            return
+
+        # A single bad event fails its whole batch, so the halves are written
+        # separately to drop only the events that can't be written
+        middle = len(batch) // 2
+        await write_batch(batch[:middle], retries=1)
+        await write_batch(batch[middle:], retries=1)
 
     async def flush() -> None:
-        logger.debug(f"Persisting {queue.qsize()} events...")
+        async with flush_lock:
+            logger.debug(f"Persisting {queue.qsize()} events...")
 
-        batch: List[ReceivedEvent] = []
+            while queue.qsize():
+                batch = [
+                    queue.get_nowait()
+                    for _ in range(min(batch_sizer.size, queue.qsize()))
+                ]
+                update_queue_depth()
 
-        while queue.qsize() > 0:
-            batch.append(await queue.get())
+                await write_batch(batch, retries=max_retries)
 
-        try:
-            async with db.session_context() as session:
-                await write_events(session=session, events=batch)
-                await session.commit()
-                logger.debug("Finished persisting events.")
-        except Exception:
-            logger.debug("Error flushing events, restoring to queue", exc_info=True)
-            for event in batch:
-                queue.put_nowait(event)
+            update_queue_depth()
+            logger.debug("Finished persisting events.")
 
     async def trim() -> None:
         older_than = pendulum.now("UTC") - PREFECT_EVENTS_RETENTION_PERIOD.value()
+        delete_batch_size = PREFECT_EVENTS_RETENTION_BATCH_SIZE.value()
 
         try:
-            async with db.session_context() as session:
-                result = await session.execute(
-                    sa.delete(db.Event).where(db.Event.occurred < older_than)
-                )
-                await session.commit()
-                if result.rowcount:
-                    logger.debug(
-                        "Trimmed %s events older than %s.", result.rowcount, older_than
+            if partitioned:
+                async with db.session_context(begin_transaction=True) as session:
+                    dropped = await drop_expired_event_partitions(session, older_than)
+                    created = await create_event_partitions(session)
+                if dropped:
+                    logger.debug("Dropped expired event partitions: %s", dropped)
+                if created:
+                    logger.debug("Created event partitions: %s", created)
+
+            # Anything that can't be dropped with its partition is deleted in
+            # bounded chunks, so no single statement holds locks for long
+            trimmed = 0
+            while True:
+                async with db.session_context(begin_transaction=True) as session:
+                    deleted = await delete_old_events(
+                        session, older_than, delete_batch_size
                     )
+                trimmed += deleted["events"]
+                if all(count < delete_batch_size for count in deleted.values()):
+                    break
+
+            if trimmed:
+                logger.debug("Trimmed %s events older than %s.", trimmed, older_than)
         except Exception:
             logger.exception("Error trimming events", exc_info=True)
 
@@ -139,8 +313,8 @@ async def create_handler(
     async def trim_periodically():
         try:
             while True:
-                await asyncio.sleep(trim_every.total_seconds())
                 await trim()
+                await asyncio.sleep(trim_every.total_seconds())
         except asyncio.CancelledError:
             return
 
@@ -149,9 +323,12 @@ async def create_handler(
             return
 
         event = ReceivedEvent.model_validate_json(message.data)
+        # waits while the queue is full, so the consumer takes no more messages
+        # until events have been written
         await queue.put(event)
+        update_queue_depth()
 
-        if queue.qsize() >= batch_size:
+        if metrics.queue_depth >= batch_sizer.size:
             await flush()
 
     periodic_flush = asyncio.create_task(flush_periodically())
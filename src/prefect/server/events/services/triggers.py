@@ -17,11 +17,18 @@ class ReactiveTriggers:
 
     consumer_task: Optional[asyncio.Task] = None
 
+    def __init__(self, shard: Optional[triggers.TriggerShard] = None):
+        self.shard = shard
+        if shard and shard.count > 1:
+            self.name = f"ReactiveTriggers-{shard.index}"
+
     async def start(self):
         assert self.consumer_task is None, "Reactive triggers already started"
-        self.consumer = create_consumer("events")
+        # each shard needs every event, so each consumes them as its own group
+        index = self.shard.index if self.shard else 0
+        self.consumer = create_consumer("events", name=f"reactive-triggers-{index}")
 
-        async with triggers.consumer() as handler:
+        async with triggers.consumer(shard=self.shard) as handler:
             self.consumer_task = asyncio.create_task(self.consumer.run(handler))
             logger.debug("Reactive triggers started")
 
@@ -43,7 +50,12 @@ class ReactiveTriggers:
 
 
 class ProactiveTriggers(LoopService):
-    def __init__(self, loop_seconds: Optional[float] = None, **kwargs):
+    def __init__(
+        self,
+        loop_seconds: Optional[float] = None,
+        shard: Optional[triggers.TriggerShard] = None,
+        **kwargs,
+    ):
         super().__init__(
             loop_seconds=(
                 loop_seconds
@@ -51,6 +63,10 @@ class ProactiveTriggers(LoopService):
             ),
             **kwargs,
         )
+        self.shard = shard
+        if shard and shard.count > 1:
+            self.name = f"ProactiveTriggers-{shard.index}"
 
     async def run_once(self):
-        await triggers.evaluate_proactive_triggers()
+        with triggers.evaluating_shard(self.shard or triggers.current_shard()):
+            await triggers.evaluate_proactive_triggers()
@@ -1,7 +1,22 @@
-from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Sequence, Tuple
+import re
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
+import orjson
+import pendulum
 import pydantic
 import sqlalchemy as sa
+from pydantic_core import to_jsonable_python
+from pydantic_extra_types.pendulum_dt import DateTime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
@@ -10,15 +25,24 @@ from prefect.server.database.dependencies import db_injector, provide_database_i
 from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.events.counting import Countable, TimeUnit
 from prefect.server.events.filters import EventFilter, EventOrder
-from prefect.server.events.schemas.events import EventCount, ReceivedEvent
+from prefect.server.events.schemas.events import (
+    EventCount,
+    ReceivedEvent,
+    RelatedResource,
+)
 from prefect.server.events.storage import (
     INTERACTIVE_PAGE_SIZE,
     from_page_token,
     process_time_based_counts,
     to_page_token,
 )
-from prefect.server.utilities.database import get_dialect
-from prefect.settings import PREFECT_API_DATABASE_CONNECTION_URL
+from prefect.server.utilities.database import UUID, Timestamp, get_dialect
+from prefect.settings import (
+    PREFECT_API_DATABASE_CONNECTION_URL,
+    PREFECT_API_SERVICES_EVENT_PERSISTER_BULK_INSERT,
+    PREFECT_EVENTS_PARTITION_INTERVAL,
+    PREFECT_EVENTS_PARTITIONS_AHEAD,
+)
 
 if TYPE_CHECKING:
     from prefect.server.database.orm_models import ORMEvent
@@ -180,6 +204,8 @@ async def read_events(
         # Order by the occurred timestamp
         select_events_query = select_events_query.order_by(order(db.Event.occurred))
 
+    # The filter always bounds `occurred`, so on PostgreSQL only the partitions
+    # covering the requested time range are scanned
     if limit is not None:
         limit = max(0, min(limit, events_filter.logical_limit))
         select_events_query = select_events_query.limit(limit=limit)
@@ -203,7 +229,10 @@ async def write_events(session: AsyncSession, events: List[ReceivedEvent]) -> No
     if events:
         dialect = get_dialect(PREFECT_API_DATABASE_CONNECTION_URL.value())
         if dialect.name == "postgresql":
-            await _write_postgres_events(session, events)
+            if PREFECT_API_SERVICES_EVENT_PERSISTER_BULK_INSERT.value():
+                await _copy_postgres_events(session, events)
+            else:
+                await _write_postgres_events(session, events)
         else:
             await _write_sqlite_events(session, events)
 
@@ -216,32 +245,39 @@ async def _write_sqlite_events(
     Write events to the SQLite database.
 
     SQLite does not support the `RETURNING` clause with SQLAlchemy < 2, so we need to
-    check for existing events before inserting them.
+    check for existing events before inserting them.  Rows are inserted with
+    `executemany`, so unlike a multi-row `VALUES` clause, a batch isn't limited by
+    the number of query parameters SQLite allows in one statement.
 
     Args:
         session: a SQLite events session
         events: the events to insert
     """
-    for batch in _in_safe_batches(events):
-        event_ids = {event.id for event in batch}
+    events_by_id = {event.id: event for event in events}
+
+    event_ids = list(events_by_id)
+    max_ids = get_max_query_parameters()
+    for i in range(0, len(event_ids), max_ids):
         result = await session.scalars(
-            sa.select(db.Event.id).where(db.Event.id.in_(event_ids))
+            sa.select(db.Event.id).where(db.Event.id.in_(event_ids[i : i + max_ids]))
         )
-        existing_event_ids = list(result.all())
-        events_to_insert = [
-            event for event in batch if event.id not in existing_event_ids
-        ]
-        event_rows = [event.as_database_row() for event in events_to_insert]
-        await session.execute(db.insert(db.Event).values(event_rows))
+        for existing_event_id in result.all():
+            events_by_id.pop(existing_event_id, None)
 
-        resource_rows: List[Dict[str, Any]] = []
-        for event in events_to_insert:
-            resource_rows.extend(event.as_database_resource_rows())
+    if not events_by_id:
+        return
 
-        if not resource_rows:
-            continue
+    events_to_insert = list(events_by_id.values())
+    await session.execute(
+        sa.insert(db.Event), [event.as_database_row() for event in events_to_insert]
+    )
 
-        await session.execute(db.insert(db.EventResource).values(resource_rows))
+    resource_rows: List[Dict[str, Any]] = []
+    for event in events_to_insert:
+        resource_rows.extend(event.as_database_resource_rows())
+
+    if resource_rows:
+        await session.execute(sa.insert(db.EventResource), resource_rows)
 
 
 @db_injector
@@ -280,6 +316,133 @@ async def _write_postgres_events(
         await session.execute(db.insert(db.EventResource).values(resource_rows))
 
 
+EVENT_COPY_COLUMNS = [
+    "id",
+    "occurred",
+    "event",
+    "resource_id",
+    "resource",
+    "related_resource_ids",
+    "related",
+    "payload",
+    "received",
+    "recorded",
+    "follows",
+]
+
+EVENT_RESOURCE_COPY_COLUMNS = [
+    "occurred",
+    "resource_id",
+    "resource_role",
+    "resource",
+    "event_id",
+]
+
+
+def _json(value: Any) -> str:
+    # Like the JSON column type, this stores `NaN` and infinities as `null`
+    return orjson.dumps(value, default=to_jsonable_python).decode()
+
+
+def _event_copy_record(event: ReceivedEvent, recorded: DateTime) -> Tuple[Any, ...]:
+    related = [resource.root for resource in event.related]
+    return (
+        event.id,
+        event.occurred,
+        event.event,
+        event.resource.id,
+        _json(event.resource.root),
+        _json([resource.id for resource in event.related]),
+        _json(related),
+        _json(event.payload),
+        event.received,
+        recorded,
+        event.follows,
+    )
+
+
+def _event_resource_copy_records(event: ReceivedEvent) -> List[Tuple[Any, ...]]:
+    records = []
+    for resource in [event.resource, *event.related]:
+        labels = {
+            label: value
+            for label, value in resource.root.items()
+            if label not in ("prefect.resource.id", "prefect.resource.role")
+        }
+        records.append(
+            (
+                event.occurred,
+                resource.id,
+                resource.role if isinstance(resource, RelatedResource) else "",
+                _json(labels),
+                event.id,
+            )
+        )
+    return records
+
+
+async def _copy_postgres_events(
+    session: AsyncSession, events: List[ReceivedEvent]
+) -> None:
+    """
+    Write events to the Postgres database with binary `COPY`.
+
+    Events are copied into a temporary staging table and merged into `events`,
+    skipping duplicates, and the resources of the newly inserted events are copied
+    directly into `event_resources`.  A batch of any size takes the same handful of
+    statements, with no limit on the number of query parameters.
+
+    Args:
+        session: a Postgres events session
+        events: the events to insert
+    """
+    # duplicates within a batch would otherwise have their resources copied twice
+    events = list({event.id: event for event in events}.values())
+
+    await session.execute(
+        sa.text(
+            "CREATE TEMPORARY TABLE IF NOT EXISTS events_staging "
+            "(LIKE events INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+        )
+    )
+
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    copier = raw_connection.driver_connection
+
+    recorded = pendulum.now("UTC")
+    await copier.copy_records_to_table(
+        "events_staging",
+        records=[_event_copy_record(event, recorded) for event in events],
+        columns=EVENT_COPY_COLUMNS,
+    )
+
+    columns = ", ".join(EVENT_COPY_COLUMNS)
+    result = await session.scalars(
+        sa.text(
+            f"INSERT INTO events ({columns}) "
+            f"SELECT {columns} FROM events_staging "
+            "ON CONFLICT DO NOTHING RETURNING id"
+        )
+    )
+    inserted_event_ids = set(result.all())
+
+    resource_records: List[Tuple[Any, ...]] = []
+    for event in events:
+        # resources of duplicate events were written with the original event
+        if event.id in inserted_event_ids:
+            resource_records.extend(_event_resource_copy_records(event))
+
+    if resource_records:
+        await copier.copy_records_to_table(
+            "event_resources",
+            records=resource_records,
+            columns=EVENT_RESOURCE_COPY_COLUMNS,
+        )
+
+    await session.execute(sa.text("TRUNCATE events_staging"))
+
+
 def get_max_query_parameters() -> int:
     dialect = get_dialect(PREFECT_API_DATABASE_CONNECTION_URL.value())
     if dialect.name == "postgresql":
@@ -321,3 +484,263 @@ def _in_safe_batches(
 
     if batch:
         yield batch
+
+
+# Retention ----------------------------------------------------------------------------
+#
+# On PostgreSQL, the `events` and `event_resources` tables are partitioned by range of
+# `occurred`, one partition per day or hour.  Partitions are created ahead of time and
+# dropped wholesale once everything in them is past the retention period, so trimming
+# old events never has to delete rows from a busy table.  Events that fall outside of
+# the partitions (far in the future, or written before a partition was created) are
+# stored in a default partition, which is trimmed like an unpartitioned table.  SQLite
+# doesn't support partitioning, so old events are deleted in bounded chunks instead.
+
+PARTITIONED_TABLES = ("events", "event_resources")
+
+_PARTITION_BOUNDS = re.compile(
+    r"FOR VALUES FROM \((?P<lower>.+)\) TO \((?P<upper>.+)\)"
+)
+
+
+class Partition(NamedTuple):
+    name: str
+    lower: Optional[DateTime]
+    upper: Optional[DateTime]
+
+    @property
+    def is_default(self) -> bool:
+        return self.lower is None and self.upper is None
+
+    def overlaps(self, lower: DateTime, upper: DateTime) -> bool:
+        if self.is_default:
+            return False
+        return (self.lower is None or self.lower < upper) and (
+            self.upper is None or lower < self.upper
+        )
+
+
+def _parse_partition_bound(bound: str) -> Optional[DateTime]:
+    if bound in ("MINVALUE", "MAXVALUE"):
+        return None
+    return pendulum.parse(bound.strip("'"))
+
+
+def partition_name(table: str, start: DateTime, interval: str) -> str:
+    """The name of the partition of `table` for the interval starting at `start`"""
+    return f"{table}_p{start.strftime('%Y%m%d' if interval == 'day' else '%Y%m%d%H')}"
+
+
+async def read_partitions(session: AsyncSession, table: str) -> List[Partition]:
+    """
+    Read the partitions of one of the events tables.
+
+    Args:
+        session: a PostgreSQL database session
+        table: the name of the partitioned table
+
+    Returns:
+        The partitions of the table, with `None` for unbounded ends.  The default
+        partition has neither end bounded.
+    """
+    result = await session.execute(
+        sa.text(
+            """
+            SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = :table AND pg_table_is_visible(parent.oid)
+            """
+        ),
+        {"table": table},
+    )
+
+    partitions: List[Partition] = []
+    for name, bound in result.all():
+        if match := _PARTITION_BOUNDS.match(bound):
+            lower = _parse_partition_bound(match.group("lower"))
+            upper = _parse_partition_bound(match.group("upper"))
+            partitions.append(Partition(name, lower, upper))
+        else:
+            partitions.append(Partition(name, None, None))
+    return partitions
+
+
+async def create_event_partitions(
+    session: AsyncSession, now: Optional[DateTime] = None
+) -> List[str]:
+    """
+    Create partitions of the events tables for the current interval and the
+    following `PREFECT_EVENTS_PARTITIONS_AHEAD` intervals.
+
+    Intervals already covered by a partition are skipped, and intervals partially
+    covered by partitions from a different `PREFECT_EVENTS_PARTITION_INTERVAL` are
+    filled in by the hour.  Any events in the default partition that belong to a new
+    partition are moved into it.
+
+    Args:
+        session: a PostgreSQL database session
+        now: the current time
+
+    Returns:
+        The names of the partitions created.
+    """
+    interval = PREFECT_EVENTS_PARTITION_INTERVAL.value()
+    start = (now or pendulum.now("UTC")).in_tz("UTC").start_of(interval)
+    step = pendulum.duration(**{f"{interval}s": 1})
+
+    created: List[str] = []
+    for table in PARTITIONED_TABLES:
+        partitions = await read_partitions(session, table)
+
+        spans: List[Tuple[DateTime, DateTime, str]] = []
+        for i in range(PREFECT_EVENTS_PARTITIONS_AHEAD.value() + 1):
+            lower = start + step * i
+            upper = lower + step
+            if not any(p.overlaps(lower, upper) for p in partitions):
+                spans.append((lower, upper, interval))
+                continue
+
+            hour = pendulum.duration(hours=1)
+            while lower < upper:
+                if not any(p.overlaps(lower, lower + hour) for p in partitions):
+                    spans.append((lower, lower + hour, "hour"))
+                lower += hour
+
+        for lower, upper, span_interval in spans:
+            name = partition_name(table, lower, span_interval)
+            if await _create_partition(session, table, name, lower, upper):
+                created.append(name)
+
+    return created
+
+
+# The errors raised when another server creates or attaches the same partition first
+_CONCURRENTLY_CREATED_SQLSTATES = {
+    "23505",  # unique_violation, from racing CREATE TABLEs of the same name
+    "42P07",  # duplicate_table
+    "42809",  # wrong_object_type, when the table "is already a partition"
+    "42P17",  # invalid_object_definition, when the partition would overlap another
+}
+
+
+async def _create_partition(
+    session: AsyncSession, table: str, name: str, lower: DateTime, upper: DateTime
+) -> bool:
+    """
+    Create and attach a partition, returning whether it was attached.
+
+    Other server processes may be creating the same partitions, so a partition that
+    can't be attached because another process got there first is skipped.  Any other
+    failure is logged as a warning and the partition is retried on the next pass.
+    """
+    try:
+        async with session.begin_nested():
+            await _fill_and_attach_partition(session, table, name, lower, upper)
+    except sa.exc.DBAPIError as exc:
+        if getattr(exc.orig, "sqlstate", None) in _CONCURRENTLY_CREATED_SQLSTATES:
+            logger.debug(
+                "Skipping partition %s, which was created by another server: %s",
+                name,
+                exc,
+            )
+        else:
+            logger.warning(
+                "Failed to create partition %s of %s", name, table, exc_info=True
+            )
+        return False
+    return True
+
+
+async def _fill_and_attach_partition(
+    session: AsyncSession, table: str, name: str, lower: DateTime, upper: DateTime
+) -> None:
+    # The new partition is filled from the default partition before it is attached,
+    # because a partition can't be attached while the default holds rows for it
+    await session.execute(
+        sa.text(f"CREATE TABLE IF NOT EXISTS {name} (LIKE {table} INCLUDING DEFAULTS)")
+    )
+    await session.execute(
+        sa.text(
+            f"""
+            WITH moved AS (
+                DELETE FROM {table}_default
+                WHERE occurred >= :lower AND occurred < :upper
+                RETURNING *
+            )
+            INSERT INTO {name} SELECT * FROM moved
+            """
+        ),
+        {"lower": lower, "upper": upper},
+    )
+    await session.execute(
+        sa.text(
+            f"ALTER TABLE {table} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+    )
+
+
+async def drop_expired_event_partitions(
+    session: AsyncSession, older_than: DateTime
+) -> List[str]:
+    """
+    Drop the partitions of the events tables that only hold events that occurred
+    before `older_than`.
+
+    Args:
+        session: a PostgreSQL database session
+        older_than: the oldest events to keep
+
+    Returns:
+        The names of the partitions dropped.
+    """
+    dropped: List[str] = []
+    for table in PARTITIONED_TABLES:
+        for partition in await read_partitions(session, table):
+            if partition.upper is not None and partition.upper <= older_than:
+                # another server process may have dropped it already
+                await session.execute(sa.text(f"DROP TABLE IF EXISTS {partition.name}"))
+                dropped.append(partition.name)
+    return dropped
+
+
+async def delete_old_events(
+    session: AsyncSession, older_than: DateTime, limit: int
+) -> Dict[str, int]:
+    """
+    Delete up to `limit` events, and their resources, that occurred before
+    `older_than`.
+
+    On PostgreSQL, only events in the default partition are deleted; all others
+    are removed when their partition is dropped.
+
+    Args:
+        session: a database session
+        older_than: the oldest events to keep
+        limit: the maximum number of rows to delete from each table
+
+    Returns:
+        The number of rows deleted from each table.
+    """
+    dialect = get_dialect(PREFECT_API_DATABASE_CONNECTION_URL.value())
+    suffix = "_default" if dialect.name == "postgresql" else ""
+
+    deleted: Dict[str, int] = {}
+    for name in PARTITIONED_TABLES:
+        table = sa.table(
+            f"{name}{suffix}",
+            sa.column("id", UUID()),
+            sa.column("occurred", Timestamp()),
+        )
+        oldest = (
+            sa.select(table.c.id)
+            .where(table.c.occurred < older_than)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        result = await session.execute(sa.delete(table).where(table.c.id.in_(oldest)))
+        deleted[name] = result.rowcount
+
+    return deleted
@@ -4,14 +4,14 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator, AsyncIterable, Dict, Optional, Set
 
 from prefect.logging import get_logger
-from prefect.server.events.filters import EventFilter
+from prefect.server.events.filters import CompiledEventFilter, EventFilter
 from prefect.server.events.schemas.events import ReceivedEvent
 from prefect.server.utilities import messaging
 
 logger = get_logger(__name__)
 
 subscribers: Set["Queue[ReceivedEvent]"] = set()
-filters: Dict["Queue[ReceivedEvent]", EventFilter] = {}
+filters: Dict["Queue[ReceivedEvent]", CompiledEventFilter] = {}
 
 # The maximum number of message that can be waiting for one subscriber, after which
 # new messages will be dropped
@@ -25,7 +25,7 @@ async def subscribed(
     queue: "Queue[ReceivedEvent]" = Queue(maxsize=SUBSCRIPTION_BACKLOG)
 
     subscribers.add(queue)
-    filters[queue] = filter
+    filters[queue] = filter.compile()
 
     try:
         yield queue
@@ -4,16 +4,22 @@ to act on them based on the automations that users have set up.
 """
 
 import asyncio
-from contextlib import AsyncExitStack, asynccontextmanager
+import heapq
+import itertools
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from datetime import timedelta
 from typing import (
     TYPE_CHECKING,
     AsyncGenerator,
     Collection,
     Dict,
+    Generator,
     List,
     MutableMapping,
     Optional,
+    Sequence,
+    Set,
     Tuple,
 )
 from uuid import UUID
@@ -51,8 +57,19 @@ from prefect.server.events.schemas.automations import (
     TriggerState,
 )
 from prefect.server.events.schemas.events import ReceivedEvent
-from prefect.server.utilities.messaging import Message, MessageHandler
-from prefect.settings import PREFECT_EVENTS_EXPIRED_BUCKET_BUFFER
+from prefect.server.utilities.messaging import (
+    Message,
+    MessageHandler,
+    broker_delivers_across_processes,
+)
+from prefect.settings import (
+    PREFECT_API_SERVICES_TRIGGERS_SHARD,
+    PREFECT_API_SERVICES_TRIGGERS_SHARDS,
+    PREFECT_EVENTS_EXPIRED_BUCKET_BUFFER,
+    PREFECT_EVENTS_FOLLOWER_BUFFER_SIZE,
+    PREFECT_MESSAGING_BROKER,
+)
+from prefect.utilities.collections import batched_iterable
 
 if TYPE_CHECKING:
     from prefect.server.database.orm_models import ORMAutomationBucket
@@ -66,6 +83,9 @@ TriggerID: TypeAlias = UUID
 
 AUTOMATION_BUCKET_BATCH_SIZE = 500
 
+# The most proactive triggers whose buckets are evaluated together
+PROACTIVE_EVALUATION_BATCH_SIZE = 100
+
 MAX_DEPTH_OF_PRECEDING_EVENT = 20
 
 
@@ -340,21 +360,9 @@ async def act(firing: Firing):
             await publisher.publish_data(action.model_dump_json().encode(), {})
 
 
-__events_clock_lock: Optional[asyncio.Lock] = None
-_events_clock: Optional[float] = None
-_events_clock_updated: Optional[float] = None
-
-
-def _events_clock_lock() -> asyncio.Lock:
-    global __events_clock_lock
-    if __events_clock_lock is None:
-        __events_clock_lock = asyncio.Lock()
-    return __events_clock_lock
-
-
 async def update_events_clock(event: ReceivedEvent):
-    global _events_clock, _events_clock_updated
-    async with _events_clock_lock():
+    shard = current_shard()
+    async with shard.events_clock_lock:
         # we want the offset to be negative to represent that we are always
         # processing events behind realtime...
         now = pendulum.now("UTC").float_timestamp
@@ -366,38 +374,37 @@ async def update_events_clock(event: ReceivedEvent):
         if offset > 0.0:
             event_timestamp = now
 
-        if not _events_clock or event_timestamp >= _events_clock:
-            _events_clock = event_timestamp
+        if not shard.events_clock or event_timestamp >= shard.events_clock:
+            shard.events_clock = event_timestamp
 
-        _events_clock_updated = now
+        shard.events_clock_updated = now
 
 
 async def get_events_clock() -> Optional[float]:
-    global _events_clock
-    return _events_clock
+    return current_shard().events_clock
 
 
 async def get_events_clock_offset() -> float:
     """Calculate the current clock offset.  This takes into account both the `occurred`
     of the last event, as well as the time we _saw_ the last event.  This helps to
     ensure that in low volume environments, we don't end up getting huge offsets."""
-    global _events_clock, _events_clock_updated
+    shard = current_shard()
 
-    async with _events_clock_lock():
-        if _events_clock is None or _events_clock_updated is None:
+    async with shard.events_clock_lock:
+        if shard.events_clock is None or shard.events_clock_updated is None:
             return 0.0
 
         now: float = pendulum.now("UTC").float_timestamp
-        offset = (_events_clock - now) + (now - _events_clock_updated)
+        offset = (shard.events_clock - now) + (now - shard.events_clock_updated)
 
     return offset
 
 
 async def reset_events_clock():
-    global _events_clock, _events_clock_updated
-    async with _events_clock_lock():
-        _events_clock = None
-        _events_clock_updated = None
+    shard = current_shard()
+    async with shard.events_clock_lock:
+        shard.events_clock = None
+        shard.events_clock_updated = None
 
 
 async def reactive_evaluation(event: ReceivedEvent, depth: int = 0):
@@ -522,6 +529,9 @@ async def periodic_evaluation(now: DateTime):
         await reactive_evaluation(event)
 
     async with automations_session() as session:
+        if current_shard().count > 1:
+            await reconcile_automations(session)
+
         await sweep_closed_buckets(
             session,
             as_of - PREFECT_EVENTS_EXPIRED_BUCKET_BUFFER.value(),
@@ -544,68 +554,309 @@ async def evaluate_periodically(periodic_granularity: timedelta):
             await asyncio.sleep(periodic_granularity.total_seconds())
 
 
-# The currently loaded automations for this shard, organized both by ID and by
-# account and workspace
-automations_by_id: Dict[UUID, Automation] = {}
-triggers: Dict[TriggerID, EventTrigger] = {}
-next_proactive_runs: Dict[TriggerID, DateTime] = {}
+# How long we'll retain preceding events (to aid with ordering)
+PRECEDING_EVENT_LOOKBACK = timedelta(minutes=15)
+
+# How long we'll retain events we've processed (to prevent re-processing an event)
+PROCESSED_EVENT_LOOKBACK = timedelta(minutes=30)
+
+SEEN_EXPIRATION = max(PRECEDING_EVENT_LOOKBACK, PROCESSED_EVENT_LOOKBACK)
+
+
+def shard_for(automation_id: UUID, shard_count: int) -> int:
+    """The index of the shard that evaluates the given automation"""
+    return automation_id.int % shard_count
+
+
+class FollowerBuffer:
+    """
+    An in-memory reordering buffer for the events of one shard that arrived before the
+    event they follow.
+
+    The buffer holds up to `capacity` events (by default,
+    `PREFECT_EVENTS_FOLLOWER_BUFFER_SIZE`); followers that don't fit are stored in the
+    database instead.  `in_database` notes whether the database may be holding
+    followers for this shard, so that it is only consulted when there may be something
+    to find there.
+    """
+
+    def __init__(self, capacity: Optional[int] = None):
+        self._capacity = capacity
+        self._followers: Dict[UUID, ReceivedEvent] = {}
+        self._by_leader: Dict[UUID, Set[UUID]] = {}
+
+        # Until we've looked, assume followers may have been stored by an earlier run
+        self.in_database = True
+        self.spills = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity or PREFECT_EVENTS_FOLLOWER_BUFFER_SIZE.value()
+
+    def __len__(self) -> int:
+        return len(self._followers)
+
+    def __contains__(self, event_id: UUID) -> bool:
+        return event_id in self._followers
+
+    def add(self, event: ReceivedEvent) -> bool:
+        """Buffers the event, returning False if there is no room for it"""
+        assert event.follows
+
+        if event.id not in self._followers and len(self) >= self.capacity:
+            return False
+
+        self._followers[event.id] = event
+        self._by_leader.setdefault(event.follows, set()).add(event.id)
+        return True
+
+    def remove(self, event: ReceivedEvent) -> None:
+        if not self._followers.pop(event.id, None):
+            return
+
+        assert event.follows
+        followers = self._by_leader.get(event.follows)
+        if followers is not None:
+            followers.discard(event.id)
+            if not followers:
+                del self._by_leader[event.follows]
+
+    def followers_of(self, leader_id: UUID) -> List[ReceivedEvent]:
+        return [self._followers[id] for id in self._by_leader.get(leader_id, ())]
+
+    def pop_received_before(self, earlier: DateTime) -> List[ReceivedEvent]:
+        """Removes and returns the followers that were received before the given time"""
+        lost = [event for event in self._followers.values() if event.received < earlier]
+        for event in lost:
+            self.remove(event)
+        return lost
+
+    def drain(self) -> List[ReceivedEvent]:
+        """Removes and returns all of the buffered followers"""
+        followers = list(self._followers.values())
+        self.clear()
+        return followers
+
+    def clear(self) -> None:
+        self._followers.clear()
+        self._by_leader.clear()
+
+
+class TriggerShard:
+    """
+    The in-memory state of one shard of trigger evaluation: its loaded automations,
+    its events clock, the events it has seen and the events waiting on them.
+
+    When trigger evaluation is split into `count` shards, each server process runs one
+    shard, which loads only the automations assigned to it by `shard_for`, consumes
+    every event from the event bus, and evaluates the events against its own
+    automations.
+    """
+
+    def __init__(self, index: int = 0, count: int = 1):
+        if not 0 <= index < count:
+            raise ValueError(f"Shard {index} is out of range for {count} shard(s)")
+
+        self.index = index
+        self.count = count
+
+        # The currently loaded automations for this shard, organized by ID
+        self.automations_by_id: Dict[UUID, Automation] = {}
+        self.triggers: Dict[TriggerID, EventTrigger] = {}
+        self.next_proactive_runs: Dict[TriggerID, DateTime] = {}
+
+        # The last seen `updated` timestamp of every automation this shard owns,
+        # whether or not it is loaded, for reconciling with the database
+        self.automation_versions: Dict[UUID, Optional[DateTime]] = {}
+
+        self.events_clock: Optional[float] = None
+        self.events_clock_updated: Optional[float] = None
+
+        self.seen_events: MutableMapping[UUID, bool] = TTLCache(
+            maxsize=10000, ttl=SEEN_EXPIRATION.total_seconds()
+        )
+        self.followers = FollowerBuffer()
+
+        # A heap of (timestamp, sequence, trigger ID) for the next proactive evaluation
+        # of each proactive trigger.  Rescheduling a trigger leaves its old entry in
+        # the heap, which is skipped once its sequence is no longer current.
+        self._proactive_schedule: List[Tuple[float, int, TriggerID]] = []
+        self._proactive_sequences: Dict[TriggerID, int] = {}
+        self._sequence = itertools.count()
+
+        self._events_clock_lock: Optional[asyncio.Lock] = None
+        self._automations_lock: Optional[asyncio.Lock] = None
+
+    def __repr__(self) -> str:
+        return f"TriggerShard({self.index}, {self.count})"
+
+    def owns(self, automation_id: UUID) -> bool:
+        return shard_for(automation_id, self.count) == self.index
+
+    def schedule_proactive(
+        self, trigger_id: TriggerID, at: Optional[DateTime] = None
+    ) -> None:
+        """Schedules the next proactive evaluation of a trigger, by default as soon as
+        possible"""
+        sequence = next(self._sequence)
+        self._proactive_sequences[trigger_id] = sequence
+        timestamp = at.float_timestamp if at else float("-inf")
+        heapq.heappush(self._proactive_schedule, (timestamp, sequence, trigger_id))
+
+    def unschedule_proactive(self, trigger_id: TriggerID) -> None:
+        self._proactive_sequences.pop(trigger_id, None)
+
+    def due_proactive_triggers(self, now: DateTime) -> List[EventTrigger]:
+        """Removes and returns the proactive triggers that are due for evaluation,
+        touching only the heap entries that are due"""
+        due: List[EventTrigger] = []
+        schedule = self._proactive_schedule
+        while schedule and schedule[0][0] <= now.float_timestamp:
+            _, sequence, trigger_id = heapq.heappop(schedule)
+            if self._proactive_sequences.get(trigger_id) != sequence:
+                continue
+            del self._proactive_sequences[trigger_id]
+            if trigger := self.triggers.get(trigger_id):
+                due.append(trigger)
+        return due
+
+    def clear_proactive_schedule(self) -> None:
+        self._proactive_schedule.clear()
+        self._proactive_sequences.clear()
+
+    @property
+    def events_clock_lock(self) -> asyncio.Lock:
+        if self._events_clock_lock is None:
+            self._events_clock_lock = asyncio.Lock()
+        return self._events_clock_lock
+
+    @property
+    def automations_lock(self) -> asyncio.Lock:
+        """This lock governs any changes to the set of loaded automations; any routine
+        that will add/remove automations must be holding this lock when it does so.
+        It's best to use the methods below to access the loaded set of automations."""
+        if self._automations_lock is None:
+            self._automations_lock = asyncio.Lock()
+        return self._automations_lock
+
+
+# When trigger evaluation isn't sharded, everything happens on this one shard
+_default_shard = TriggerShard()
+
+_current_shard: ContextVar[TriggerShard] = ContextVar(
+    "current_trigger_shard", default=_default_shard
+)
+
+# The shard with a running consumer in this process, if any
+_running_shard: Optional[TriggerShard] = None
+
+# The loaded automations of the default shard
+automations_by_id = _default_shard.automations_by_id
+triggers = _default_shard.triggers
+next_proactive_runs = _default_shard.next_proactive_runs
+
+
+def current_shard() -> TriggerShard:
+    """The shard that evaluations in the current context apply to"""
+    return _current_shard.get()
+
+
+@contextmanager
+def evaluating_shard(shard: TriggerShard) -> Generator[TriggerShard, None, None]:
+    """Makes the given shard the current shard within the context"""
+    token = _current_shard.set(shard)
+    try:
+        yield shard
+    finally:
+        _current_shard.reset(token)
+
 
-# This lock governs any changes to the set of loaded automations; any routine that will
-# add/remove automations must be holding this lock when it does so.  It's best to use
-# the methods below to access the loaded set of automations.
-__automations_lock: Optional[asyncio.Lock] = None
+def configured_shard() -> TriggerShard:
+    """The shard this process should run, according to
+    `PREFECT_API_SERVICES_TRIGGERS_SHARDS` and `PREFECT_API_SERVICES_TRIGGERS_SHARD`"""
+    count = PREFECT_API_SERVICES_TRIGGERS_SHARDS.value()
+    index = PREFECT_API_SERVICES_TRIGGERS_SHARD.value()
 
+    if count == 1 and index in (None, 0):
+        return _default_shard
 
-def _automations_lock() -> asyncio.Lock:
-    global __automations_lock
-    if __automations_lock is None:
-        __automations_lock = asyncio.Lock()
-    return __automations_lock
+    if index is None:
+        raise ValueError(
+            f"Trigger evaluation is split into {count} shards, so "
+            "PREFECT_API_SERVICES_TRIGGERS_SHARD must choose the one shard that this "
+            "server runs."
+        )
+
+    if not broker_delivers_across_processes():
+        raise ValueError(
+            "Sharded trigger evaluation requires a messaging broker that delivers "
+            "every event to each named consumer group in every process, but "
+            f"{PREFECT_MESSAGING_BROKER.value()!r} does not."
+        )
+
+    return TriggerShard(index, count)
 
 
 def find_interested_triggers(event: ReceivedEvent) -> Collection[EventTrigger]:
-    candidates = triggers.values()
+    candidates = current_shard().triggers.values()
     return [trigger for trigger in candidates if trigger.covers(event)]
 
 
 def load_automation(automation: Optional[Automation]):
-    """Loads the given automation into memory so that it is available for evaluations"""
+    """Loads the given automation into memory so that it is available for evaluations,
+    if it belongs to the current shard"""
     if not automation:
         return
 
+    shard = current_shard()
+    if not shard.owns(automation.id):
+        return
+
     event_triggers = automation.triggers_of_type(EventTrigger)
 
     if not automation.enabled or not event_triggers:
         forget_automation(automation.id)
-        return
+    else:
+        shard.automations_by_id[automation.id] = automation
 
-    automations_by_id[automation.id] = automation
+        for trigger in event_triggers:
+            shard.triggers[trigger.id] = trigger
+            shard.next_proactive_runs.pop(trigger.id, None)
+            if trigger.posture == Posture.Proactive:
+                shard.schedule_proactive(trigger.id)
+            else:
+                shard.unschedule_proactive(trigger.id)
 
-    for trigger in event_triggers:
-        triggers[trigger.id] = trigger
-        next_proactive_runs.pop(trigger.id, None)
+    shard.automation_versions[automation.id] = automation.updated
 
 
 def forget_automation(automation_id: UUID):
     """Unloads the given automation from memory"""
-    if automation := automations_by_id.pop(automation_id, None):
+    shard = current_shard()
+    shard.automation_versions.pop(automation_id, None)
+    if automation := shard.automations_by_id.pop(automation_id, None):
         for trigger in automation.triggers():
-            triggers.pop(trigger.id, None)
-            next_proactive_runs.pop(trigger.id, None)
+            shard.triggers.pop(trigger.id, None)
+            shard.next_proactive_runs.pop(trigger.id, None)
+            shard.unschedule_proactive(trigger.id)
 
 
 async def automation_changed(
     automation_id: UUID,
     event: Literal["automation__created", "automation__updated", "automation__deleted"],
 ):
-    async with _automations_lock():
-        if event in ("automation__deleted", "automation__updated"):
+    automation: Optional[Automation] = None
+    if event in ("automation__created", "automation__updated"):
+        async with automations_session() as session:
+            automation = await read_automation(session, automation_id)
+
+    # this only reaches the shard running in this process; shards in other processes
+    # pick up the change when they reconcile their automations with the database
+    shard = _running_shard or current_shard()
+    with evaluating_shard(shard):
+        async with shard.automations_lock:
             forget_automation(automation_id)
-
-        if event in ("automation__created", "automation__updated"):
-            async with automations_session() as session:
-                automation = await read_automation(session, automation_id)
-                load_automation(automation)
+            load_automation(automation)
 
 
 @db_injector
@@ -619,10 +870,66 @@ async def load_automations(db: PrefectDBInterface, session: AsyncSession):
     for automation in result.scalars().all():
         load_automation(Automation.model_validate(automation, from_attributes=True))
 
+    shard = current_shard()
+    logger.debug(
+        "Loaded %s automations with %s triggers for shard %s of %s",
+        len(shard.automations_by_id),
+        len(shard.triggers),
+        shard.index,
+        shard.count,
+    )
+
+
+@db_injector
+async def reconcile_automations(db: PrefectDBInterface, session: AsyncSession):
+    """Reloads the current shard's automations that were created, updated, or deleted
+    since they were loaded, including changes made through other servers"""
+    shard = current_shard()
+
+    result = await session.execute(sa.select(db.Automation.id, db.Automation.updated))
+    stored = {
+        automation_id: updated
+        for automation_id, updated in result.all()
+        if shard.owns(automation_id)
+    }
+
+    changed = [
+        automation_id
+        for automation_id, updated in stored.items()
+        if automation_id not in shard.automation_versions
+        or shard.automation_versions[automation_id] != updated
+    ]
+    deleted = [
+        automation_id
+        for automation_id in shard.automation_versions
+        if automation_id not in stored
+    ]
+    if not changed and not deleted:
+        return
+
+    result = await session.execute(
+        sa.select(db.Automation).where(db.Automation.id.in_(changed))
+    )
+    automations = {
+        automation.id: Automation.model_validate(automation, from_attributes=True)
+        for automation in result.scalars().all()
+    }
+
     logger.debug(
-        "Loaded %s automations with %s triggers", len(automations_by_id), len(triggers)
+        "Reconciling %s changed and %s deleted automations for shard %s of %s",
+        len(changed),
+        len(deleted),
+        shard.index,
+        shard.count,
     )
 
+    async with shard.automations_lock:
+        for automation_id in deleted:
+            forget_automation(automation_id)
+        for automation_id in changed:
+            forget_automation(automation_id)
+            load_automation(automations.get(automation_id))
+
 
 @db_injector
 async def remove_buckets_exceeding_threshold(
@@ -639,6 +946,69 @@ async def remove_buckets_exceeding_threshold(
     )
 
 
+@db_injector
+async def remove_buckets_exceeding_thresholds(
+    db: PrefectDBInterface, session: AsyncSession, triggers: Sequence[EventTrigger]
+):
+    """Deletes the buckets of the given triggers where the count has already exceeded
+    each trigger's threshold, in one statement"""
+    await session.execute(
+        sa.delete(db.AutomationBucket).where(
+            sa.or_(
+                *(
+                    sa.and_(
+                        db.AutomationBucket.automation_id == trigger.automation.id,
+                        db.AutomationBucket.trigger_id == trigger.id,
+                        db.AutomationBucket.count >= trigger.threshold,
+                    )
+                    for trigger in triggers
+                )
+            )
+        )
+    )
+
+
+@db_injector
+async def read_buckets_for_triggers(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    triggers: Sequence[Trigger],
+    batch_size: int = AUTOMATION_BUCKET_BATCH_SIZE,
+) -> AsyncGenerator["ORMAutomationBucket", None]:
+    """Yields the buckets of all of the given triggers in batches, reading each batch
+    for every trigger in one query."""
+    offset = 0
+    trigger_ids = [trigger.id for trigger in triggers]
+    automation_ids = list({trigger.automation.id for trigger in triggers})
+
+    while True:
+        query = (
+            sa.select(db.AutomationBucket)
+            .where(
+                db.AutomationBucket.automation_id.in_(automation_ids),
+                db.AutomationBucket.trigger_id.in_(trigger_ids),
+            )
+            .order_by(
+                db.AutomationBucket.start,
+                db.AutomationBucket.trigger_id,
+                db.AutomationBucket.id,
+            )
+            .limit(batch_size)
+            .offset(offset)
+        )
+
+        result = await session.execute(query)
+        buckets = result.scalars().all()
+
+        if not buckets:
+            break
+
+        for bucket in buckets:
+            yield bucket
+
+        offset += batch_size
+
+
 @db_injector
 async def read_buckets_for_automation(
     db: PrefectDBInterface,
@@ -878,13 +1248,6 @@ async def sweep_closed_buckets(
     )
 
 
-# How long we'll retain preceding events (to aid with ordering)
-PRECEDING_EVENT_LOOKBACK = timedelta(minutes=15)
-
-# How long we'll retain events we've processed (to prevent re-processing an event)
-PROCESSED_EVENT_LOOKBACK = timedelta(minutes=30)
-
-
 class EventArrivedEarly(Exception):
     def __init__(self, event: ReceivedEvent):
         self.event = event
@@ -895,20 +1258,12 @@ class MaxDepthExceeded(Exception):
         self.event = event
 
 
-SEEN_EXPIRATION = max(PRECEDING_EVENT_LOOKBACK, PROCESSED_EVENT_LOOKBACK)
-
-
-_seen_events: MutableMapping[UUID, bool] = TTLCache(
-    maxsize=10000, ttl=SEEN_EXPIRATION.total_seconds()
-)
-
-
 async def event_has_been_seen(id: UUID) -> bool:
-    return _seen_events.get(id, False)
+    return current_shard().seen_events.get(id, False)
 
 
 async def record_event_as_seen(event: ReceivedEvent) -> None:
-    _seen_events[event.id] = True
+    current_shard().seen_events[event.id] = True
 
 
 @asynccontextmanager
@@ -978,31 +1333,73 @@ async def with_preceding_event_confirmed(event: ReceivedEvent, depth: int = 0):
         await forget_follower(event)
 
 
-@db_injector
-async def record_follower(db: PrefectDBInterface, event: ReceivedEvent):
-    """Remember that this event is waiting on another event to arrive"""
+async def record_follower(event: ReceivedEvent):
+    """Remember that this event is waiting on another event to arrive, in memory if
+    there is room in the shard's buffer, or in the database otherwise"""
     assert event.follows
 
+    buffer = current_shard().followers
+    if buffer.add(event):
+        return
+
+    buffer.in_database = True
+    buffer.spills += 1
+    await persist_followers([event])
+
+
+@db_injector
+async def persist_followers(db: PrefectDBInterface, followers: List[ReceivedEvent]):
+    """Stores followers of the current shard in the database"""
+    if not followers:
+        return
+
+    shard = current_shard().index
+
     async with db.session_context(begin_transaction=True) as session:
         await session.execute(
-            sa.insert(db.AutomationEventFollower).values(
-                leader_event_id=event.follows,
-                follower_event_id=event.id,
-                received=event.received,
-                follower=event,
+            db.insert(db.AutomationEventFollower)
+            .values(
+                [
+                    {
+                        "shard": shard,
+                        "leader_event_id": event.follows,
+                        "follower_event_id": event.id,
+                        "received": event.received,
+                        "follower": event,
+                    }
+                    for event in followers
+                ]
             )
+            .on_conflict_do_nothing()
         )
 
 
+async def flush_followers() -> None:
+    """Moves any followers buffered in memory for the current shard into the database,
+    so that they survive a shutdown"""
+    buffer = current_shard().followers
+    followers = buffer.drain()
+    if followers:
+        buffer.in_database = True
+        await persist_followers(followers)
+
+
 @db_injector
 async def forget_follower(db: PrefectDBInterface, follower: ReceivedEvent):
     """Forget that this event is waiting on another event to arrive"""
     assert follower.follows
 
+    shard = current_shard()
+    shard.followers.remove(follower)
+
+    if not shard.followers.in_database:
+        return
+
     async with db.session_context(begin_transaction=True) as session:
         await session.execute(
             sa.delete(db.AutomationEventFollower).where(
-                db.AutomationEventFollower.follower_event_id == follower.id
+                db.AutomationEventFollower.shard == shard.index,
+                db.AutomationEventFollower.follower_event_id == follower.id,
             )
         )
 
@@ -1012,57 +1409,104 @@ async def get_followers(
     db: PrefectDBInterface, leader: ReceivedEvent
 ) -> List[ReceivedEvent]:
     """Returns events that were waiting on this leader event to arrive"""
-    async with db.session_context() as session:
-        query = sa.select(db.AutomationEventFollower.follower).where(
-            db.AutomationEventFollower.leader_event_id == leader.id
-        )
-        result = await session.execute(query)
-        followers = result.scalars().all()
-        return sorted(followers, key=lambda e: e.occurred)
+    shard = current_shard()
+    followers = {event.id: event for event in shard.followers.followers_of(leader.id)}
+
+    if shard.followers.in_database:
+        async with db.session_context() as session:
+            query = sa.select(db.AutomationEventFollower.follower).where(
+                db.AutomationEventFollower.shard == shard.index,
+                db.AutomationEventFollower.leader_event_id == leader.id,
+            )
+            result = await session.execute(query)
+            for event in result.scalars().all():
+                followers.setdefault(event.id, event)
+
+    return sorted(followers.values(), key=lambda e: e.occurred)
 
 
 @db_injector
 async def get_lost_followers(db: PrefectDBInterface) -> List[ReceivedEvent]:
     """Returns events that were waiting on a leader event that never arrived"""
     earlier = pendulum.now("UTC") - PRECEDING_EVENT_LOOKBACK
+    shard = current_shard()
+    buffer = shard.followers
 
-    async with db.session_context(begin_transaction=True) as session:
-        query = sa.select(db.AutomationEventFollower.follower).where(
-            db.AutomationEventFollower.received < earlier
-        )
-        result = await session.execute(query)
-        followers = result.scalars().all()
+    followers = {event.id: event for event in buffer.pop_received_before(earlier)}
 
-        # forget these followers, since they are never going to see their leader event
+    if buffer.in_database:
+        spills = buffer.spills
 
-        await session.execute(
-            sa.delete(db.AutomationEventFollower).where(
-                db.AutomationEventFollower.received < earlier
+        async with db.session_context(begin_transaction=True) as session:
+            query = sa.select(db.AutomationEventFollower.follower).where(
+                db.AutomationEventFollower.shard == shard.index,
+                db.AutomationEventFollower.received < earlier,
+            )
+            result = await session.execute(query)
+            for event in result.scalars().all():
+                followers.setdefault(event.id, event)
+
+            # forget these followers, since they are never going to see their leader
+            # event
+            await session.execute(
+                sa.delete(db.AutomationEventFollower).where(
+                    db.AutomationEventFollower.shard == shard.index,
+                    db.AutomationEventFollower.received < earlier,
+                )
+            )
+
+            remaining = await session.execute(
+                sa.select(db.AutomationEventFollower.follower_event_id)
+                .where(db.AutomationEventFollower.shard == shard.index)
+                .limit(1)
             )
-        )
 
-        return sorted(followers, key=lambda e: e.occurred)
+            # Stop consulting the database once it is holding nothing for this shard,
+            # unless another follower overflowed into it in the meantime
+            if remaining.first() is None and buffer.spills == spills:
+                buffer.in_database = False
+
+    return sorted(followers.values(), key=lambda e: e.occurred)
 
 
 async def reset():
     """Resets the in-memory state of the service"""
-    reset_events_clock()
-    automations_by_id.clear()
-    triggers.clear()
-    next_proactive_runs.clear()
+    shard = current_shard()
+    await reset_events_clock()
+    shard.automations_by_id.clear()
+    shard.triggers.clear()
+    shard.next_proactive_runs.clear()
+    shard.automation_versions.clear()
+    shard.clear_proactive_schedule()
+    shard.seen_events.clear()
+    shard.followers.clear()
+    shard.followers.in_database = True
 
 
 @asynccontextmanager
 async def consumer(
     periodic_granularity: timedelta = timedelta(seconds=5),
+    shard: Optional[TriggerShard] = None,
 ) -> AsyncGenerator[MessageHandler, None]:
     """The `triggers.consumer` processes all Events arriving on the event bus to
     determine if they meet the automation criteria, queuing up a corresponding
-    `TriggeredAction` for the `actions` service if the automation criteria is met."""
-    async with automations_session() as session:
-        await load_automations(session)
+    `TriggeredAction` for the `actions` service if the automation criteria is met.
 
-    proactive_task = asyncio.create_task(evaluate_periodically(periodic_granularity))
+    Only the automations of the given shard (or the current shard) are loaded and
+    evaluated."""
+    shard = shard or current_shard()
+
+    with evaluating_shard(shard):
+        async with automations_session() as session:
+            await load_automations(session)
+
+        # the periodic task inherits the shard from this context
+        proactive_task = asyncio.create_task(
+            evaluate_periodically(periodic_granularity)
+        )
+
+    global _running_shard
+    _running_shard = shard
 
     async def message_handler(message: Message):
         if not message.data:
@@ -1087,92 +1531,169 @@ async def consumer(
             )
             return
 
-        if await event_has_been_seen(event_id):
-            return
+        with evaluating_shard(shard):
+            if await event_has_been_seen(event_id):
+                return
 
-        event = ReceivedEvent.model_validate_json(message.data)
+            event = ReceivedEvent.model_validate_json(message.data)
 
-        try:
-            await reactive_evaluation(event)
-        except EventArrivedEarly:
-            pass  # it's fine to ACK this message, since it is safe in the DB
+            try:
+                await reactive_evaluation(event)
+            except EventArrivedEarly:
+                # it's fine to ACK this message, since it is held in the shard's
+                # follower buffer, which is saved to the DB on overflow or shutdown
+                pass
 
     try:
-        logger.debug("Starting reactive evaluation task")
+        logger.debug("Starting reactive evaluation task for %r", shard)
         yield message_handler
     finally:
         proactive_task.cancel()
+        if _running_shard is shard:
+            _running_shard = None
+
+        with evaluating_shard(shard):
+            await flush_followers()
 
 
 async def proactive_evaluation(trigger: EventTrigger, as_of: DateTime) -> DateTime:
     """The core proactive evaluation operation for a single Automation"""
-    assert isinstance(trigger, EventTrigger), repr(trigger)
-    automation = trigger.automation
+    run_again_at = await proactive_evaluations([trigger], as_of)
+    if trigger.id not in run_again_at:
+        raise RuntimeError(
+            f"Automation {trigger.automation.id} trigger {trigger.id} could not be "
+            "evaluated proactively"
+        )
+    return run_again_at[trigger.id]
+
+
+async def proactive_evaluations(
+    triggers: Sequence[EventTrigger], as_of: DateTime
+) -> Dict[TriggerID, DateTime]:
+    """Proactively evaluates the given triggers together, reading the buckets of all of
+    them at once, and returns when each should run again.
+
+    Evaluating a bucket may fire its trigger's actions, which can't be taken back, so
+    each evaluation is made in a savepoint and kept even if others fail.  Triggers
+    that could not be evaluated are left out of the result.  If an error is raised,
+    no buckets were evaluated."""
+    for trigger in triggers:
+        assert isinstance(trigger, EventTrigger), repr(trigger)
 
     offset = await get_events_clock_offset()
     as_of += timedelta(seconds=offset)
 
-    logger.debug(
-        "Evaluating automation %s trigger %s proactively as of %s (offset %ss)",
-        automation.id,
-        trigger.id,
-        as_of,
-        offset,
-    )
+    for trigger in triggers:
+        logger.debug(
+            "Evaluating automation %s trigger %s proactively as of %s (offset %ss)",
+            trigger.automation.id,
+            trigger.id,
+            as_of,
+            offset,
+        )
 
     # By default, the next run will come after the full trigger window, but it
     # may be sooner based on the state of the buckets
-    run_again_at = as_of + trigger.within
+    run_again_at = {trigger.id: as_of + trigger.within for trigger in triggers}
+    triggers_by_id = {trigger.id: trigger for trigger in triggers}
 
     async with automations_session() as session:
         try:
-            if not trigger.for_each:
-                await ensure_bucket(
-                    session,
-                    trigger,
-                    bucketing_key=tuple(),
-                    start=as_of,
-                    end=as_of + trigger.within,
-                    last_event=None,
-                )
+            for trigger in triggers:
+                if not trigger.for_each:
+                    await ensure_bucket(
+                        session,
+                        trigger,
+                        bucketing_key=tuple(),
+                        start=as_of,
+                        end=as_of + trigger.within,
+                        last_event=None,
+                    )
 
             # preemptively delete buckets where possible without
             # evaluating them in memory
-            await remove_buckets_exceeding_threshold(session, trigger)
+            await remove_buckets_exceeding_thresholds(session, triggers)
+        except Exception:
+            await session.rollback()
+            raise
 
-            async for bucket in read_buckets_for_automation(session, trigger):
-                next_bucket = await evaluate(
-                    session, trigger, bucket, as_of, triggering_event=None
-                )
-                if next_bucket and as_of < next_bucket.end < run_again_at:
-                    run_again_at = pendulum.instance(next_bucket.end)
+        evaluated: Set[TriggerID] = set()
+        failed: Set[TriggerID] = set()
+        try:
+            async for bucket in read_buckets_for_triggers(session, triggers):
+                trigger = triggers_by_id[bucket.trigger_id]
+                if trigger.id in failed:
+                    continue
 
-            return run_again_at
-        finally:
-            await session.commit()
+                evaluated.add(trigger.id)
+                try:
+                    async with session.begin_nested():
+                        next_bucket = await evaluate(
+                            session, trigger, bucket, as_of, triggering_event=None
+                        )
+                except Exception:
+                    logger.exception(
+                        "Error evaluating automation %s trigger %s proactively",
+                        trigger.automation.id,
+                        trigger.id,
+                    )
+                    failed.add(trigger.id)
+                    continue
+
+                if next_bucket and as_of < next_bucket.end < run_again_at[trigger.id]:
+                    run_again_at[trigger.id] = pendulum.instance(next_bucket.end)
+        except Exception:
+            # the remaining buckets could not be read; keep the evaluations so far
+            logger.exception("Error reading buckets for proactive evaluation")
+            failed.update(set(triggers_by_id) - evaluated)
+
+        await session.commit()
+
+    return {
+        trigger_id: when
+        for trigger_id, when in run_again_at.items()
+        if trigger_id not in failed
+    }
 
 
 async def evaluate_proactive_triggers():
-    for trigger in triggers.values():
-        if trigger.posture != Posture.Proactive:
-            continue
+    shard = current_shard()
+    now = pendulum.now("UTC")
 
-        next_run = next_proactive_runs.get(trigger.id, pendulum.now("UTC"))
-        if next_run > pendulum.now("UTC"):
-            continue
+    due = shard.due_proactive_triggers(now)
 
+    run_again_at: Dict[TriggerID, DateTime] = {}
+    for batch in batched_iterable(due, PROACTIVE_EVALUATION_BATCH_SIZE):
         try:
-            run_again_at = await proactive_evaluation(trigger, pendulum.now("UTC"))
-            logger.debug(
-                "Automation %s trigger %s will run again at %s",
-                trigger.automation.id,
-                trigger.id,
-                run_again_at,
-            )
-            next_proactive_runs[trigger.id] = run_again_at
+            run_again_at.update(await proactive_evaluations(batch, now))
         except Exception:
-            logger.exception(
-                "Error evaluating automation %s trigger %s proactively",
-                trigger.automation.id,
-                trigger.id,
-            )
+            # nothing in the batch was evaluated, so evaluate each trigger on its own,
+            # so that one failing trigger doesn't hold back the rest
+            for trigger in batch:
+                try:
+                    run_again_at[trigger.id] = await proactive_evaluation(trigger, now)
+                except Exception:
+                    logger.exception(
+                        "Error evaluating automation %s trigger %s proactively",
+                        trigger.automation.id,
+                        trigger.id,
+                    )
+
+    for trigger in due:
+        if shard.triggers.get(trigger.id) is not trigger:
+            # the trigger was forgotten or reloaded while it was being evaluated
+            continue
+
+        if trigger.id not in run_again_at:
+            # try again on the next loop
+            shard.schedule_proactive(trigger.id)
+            continue
+
+        logger.debug(
+            "Automation %s trigger %s will run again at %s",
+            trigger.automation.id,
+            trigger.id,
+            run_again_at[trigger.id],
+        )
+        shard.next_proactive_runs[trigger.id] = run_again_at[trigger.id]
+        shard.schedule_proactive(trigger.id, run_again_at[trigger.id])
@@ -15,7 +15,9 @@ from . import (
     flow_run_states,
     flow_runs,
     flows,
+    log_segments,
     logs,
+    run_history_rollups,
     saved_searches,
     task_run_states,
     task_runs,
@@ -43,6 +43,10 @@ async def _delete_scheduled_runs(
         deployment_id: the deployment for which we should delete runs.
         auto_scheduled_only: if True, only delete auto scheduled runs. Defaults to `False`.
     """
+    await models.run_history_rollups.mark_run_history_rollups_stale(
+        session=session, deployment_id=deployment_id
+    )
+
     delete_query = sa.delete(orm_models.FlowRun).where(
         orm_models.FlowRun.deployment_id == deployment_id,
         orm_models.FlowRun.state_type == schemas.states.StateType.SCHEDULED.value,
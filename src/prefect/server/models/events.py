@@ -391,6 +391,36 @@ async def work_queue_status_event(
     )
 
 
+def block_document_event(
+    block_document: "schemas.core.BlockDocument",
+    change: str,
+    occurred: pendulum.DateTime,
+) -> Event:
+    """An event announcing that a block document was `updated` or `deleted`"""
+    resource = {"prefect.resource.id": f"prefect.block-document.{block_document.id}"}
+    if block_document.name:
+        resource["prefect.resource.name"] = block_document.name
+
+    related: RelatedResourceList = []
+    if block_document.block_type:
+        related.append(
+            {
+                "prefect.resource.id": (
+                    f"prefect.block-type.{block_document.block_type.slug}"
+                ),
+                "prefect.resource.role": "block-type",
+            }
+        )
+
+    return Event(
+        occurred=occurred,
+        event=f"prefect.block-document.{change}",
+        resource=resource,
+        related=related,
+        id=uuid4(),
+    )
+
+
 async def work_pool_status_event(
     event_id: UUID,
     occurred: pendulum.DateTime,
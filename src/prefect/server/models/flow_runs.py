@@ -256,6 +256,7 @@ async def read_flow_runs(
     offset: Optional[int] = None,
     limit: Optional[int] = None,
     sort: schemas.sorting.FlowRunSort = schemas.sorting.FlowRunSort.ID_DESC,
+    after: Optional[schemas.sorting.KeysetCursor] = None,
 ) -> Sequence[orm_models.FlowRun]:
     """
     Read flow runs.
@@ -270,13 +271,15 @@ async def read_flow_runs(
         offset: Query offset
         limit: Query limit
         sort: Query sort
+        after: only select flow runs that sort after this cursor
 
     Returns:
         List[orm_models.FlowRun]: flow runs
     """
+    order_by, after_filter = schemas.sorting.as_sql_keyset_sort(sort, after)
     query = (
         select(orm_models.FlowRun)
-        .order_by(sort.as_sql_sort())
+        .order_by(*order_by)
         .options(
             selectinload(orm_models.FlowRun.work_queue).selectinload(
                 orm_models.WorkQueue.work_pool
@@ -287,6 +290,9 @@ async def read_flow_runs(
     if columns:
         query = query.options(load_only(*columns))
 
+    if after_filter is not None:
+        query = query.where(after_filter)
+
     query = await _apply_flow_run_filters(
         query,
         flow_filter=flow_filter,
@@ -417,6 +423,9 @@ async def delete_flow_run(session: AsyncSession, flow_run_id: UUID) -> bool:
     Returns:
         bool: whether or not the flow run was deleted
     """
+    await models.run_history_rollups.mark_run_history_rollups_stale(
+        session=session, flow_run_id=flow_run_id
+    )
 
     result = await session.execute(
         delete(orm_models.FlowRun).where(orm_models.FlowRun.id == flow_run_id)
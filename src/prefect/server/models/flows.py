@@ -11,6 +11,7 @@ from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Select
 
+import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.server.database import orm_models
 from prefect.server.database.dependencies import db_injector
@@ -273,6 +274,9 @@ async def delete_flow(session: AsyncSession, flow_id: UUID) -> bool:
     Returns:
         bool: whether or not the flow was deleted
     """
+    await models.run_history_rollups.mark_run_history_rollups_stale(
+        session=session, flow_id=flow_id
+    )
 
     result = await session.execute(
         delete(orm_models.Flow).where(orm_models.Flow.id == flow_id)
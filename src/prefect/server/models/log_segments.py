@@ -0,0 +1,451 @@
+"""
+Functions for compacting logs into compressed segments and reading them back.
+Intended for internal use by the Prefect REST API.
+
+Logs older than the compaction threshold are moved out of the log table into
+segments, each holding a run of logs from one flow run.  A segment stores its logs
+column by column, with repeated logger names and task run ids stored once, and is
+compressed with zlib.  Segments are stored in the database, or as files in a local
+directory when a storage path is configured.  `models.logs.read_logs` merges the
+logs of any segments that match its filter with the rows still in the log table,
+unless no segments have ever been written.
+"""
+
+import datetime
+import itertools
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from uuid import UUID, uuid4
+
+import anyio
+import orjson
+import pendulum
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import prefect.server.schemas as schemas
+from prefect.server.database import orm_models
+from prefect.server.database.dependencies import db_injector
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.settings import PREFECT_API_SERVICES_LOG_COMPACTOR_ENABLED
+from prefect.utilities.collections import batched_iterable
+
+SEGMENT_FORMAT_VERSION = 1
+
+# the most flow runs whose logs are compacted in one pass
+MAX_FLOW_RUNS_PER_COMPACTION = 100
+
+# the most compacted logs deleted from the log table in one statement
+DELETE_BATCH_SIZE = 1_000
+
+# Whether any segments have been written, as far as this process knows; checked
+# against the database at most once unless this process compacts logs itself
+_segments_written: Optional[bool] = None
+
+
+def _to_microseconds(value: datetime.datetime) -> int:
+    delta = value - pendulum.DateTime(1970, 1, 1, tzinfo=pendulum.UTC)
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _from_microseconds(value: int) -> pendulum.DateTime:
+    seconds, microseconds = divmod(value, 1_000_000)
+    return pendulum.from_timestamp(seconds, tz="UTC").add(microseconds=microseconds)
+
+
+def _deltas(values: List[int]) -> List[int]:
+    return [values[0], *(b - a for a, b in zip(values, values[1:]))] if values else []
+
+
+def encode_segment(logs: Sequence[orm_models.Log]) -> bytes:
+    """
+    Encode the logs of one flow run, in timestamp order, as a compressed segment.
+    """
+    names: Dict[str, int] = {}
+    task_run_ids: Dict[Optional[UUID], int] = {}
+    columns = {
+        "version": SEGMENT_FORMAT_VERSION,
+        "id": [log.id.hex for log in logs],
+        # timestamps are stored as the difference from the previous log, which are
+        # small and repetitive and so compress well
+        "timestamp": _deltas([_to_microseconds(log.timestamp) for log in logs]),
+        "created": _deltas([_to_microseconds(log.created) for log in logs]),
+        "level": [log.level for log in logs],
+        "name": [names.setdefault(log.name, len(names)) for log in logs],
+        "task_run_id": [
+            task_run_ids.setdefault(log.task_run_id, len(task_run_ids)) for log in logs
+        ],
+        "message": [log.message for log in logs],
+        "names": list(names),
+        "task_run_ids": [
+            task_run_id.hex if task_run_id else None for task_run_id in task_run_ids
+        ],
+    }
+    return zlib.compress(orjson.dumps(columns))
+
+
+def decode_segment(data: bytes, flow_run_id: UUID) -> List[orm_models.Log]:
+    """
+    Decode a compressed segment into transient log ORM objects.
+    """
+    columns: Dict[str, Any] = orjson.loads(zlib.decompress(data))
+    if columns["version"] != SEGMENT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported log segment version {columns['version']!r}")
+
+    names = columns["names"]
+    task_run_ids = [UUID(hex) if hex else None for hex in columns["task_run_ids"]]
+    logs = []
+    for id, timestamp, created, level, name, task_run_id, message in zip(
+        columns["id"],
+        itertools.accumulate(columns["timestamp"]),
+        itertools.accumulate(columns["created"]),
+        columns["level"],
+        columns["name"],
+        columns["task_run_id"],
+        columns["message"],
+    ):
+        created = _from_microseconds(created)
+        logs.append(
+            orm_models.Log(
+                id=UUID(id),
+                created=created,
+                updated=created,
+                name=names[name],
+                level=level,
+                flow_run_id=flow_run_id,
+                task_run_id=task_run_ids[task_run_id],
+                message=message,
+                timestamp=_from_microseconds(timestamp),
+            )
+        )
+    return logs
+
+
+def _segment_file(storage_path: Path, segment_id: UUID) -> Path:
+    return storage_path / f"{segment_id}.log.z"
+
+
+def _unlink(path: str) -> None:
+    Path(path).unlink(missing_ok=True)
+
+
+def _after_transaction(
+    session: AsyncSession,
+    committed: Optional[Callable[[], None]] = None,
+    rolled_back: Optional[Callable[[], None]] = None,
+) -> None:
+    """
+    Call `committed` or `rolled_back` once, when the session's transaction ends, so
+    that segment files only change along with the rows that refer to them.
+    """
+    ended = False
+
+    def listener(callback: Optional[Callable[[], None]]):
+        def on_end(session, *args):
+            nonlocal ended
+            if not ended:
+                ended = True
+                if callback is not None:
+                    callback()
+
+        return on_end
+
+    sync_session = session.sync_session
+    sa.event.listen(sync_session, "after_commit", listener(committed), once=True)
+    sa.event.listen(sync_session, "after_rollback", listener(rolled_back), once=True)
+
+
+@db_injector
+async def read_compactable_flow_run_ids(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    before: datetime.datetime,
+    limit: int = MAX_FLOW_RUNS_PER_COMPACTION,
+) -> List[UUID]:
+    """
+    Read the ids of flow runs with logs older than `before` in the log table.
+    """
+    result = await session.execute(
+        sa.select(db.Log.flow_run_id)
+        .where(db.Log.timestamp < before)
+        .distinct()
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+@db_injector
+async def compact_flow_run_logs(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    flow_run_id: UUID,
+    before: datetime.datetime,
+    max_logs: int,
+    storage_path: Optional[Path] = None,
+) -> int:
+    """
+    Move the oldest logs of a flow run from before `before` out of the log table and
+    into a new segment.
+
+    Args:
+        session: a database session
+        flow_run_id: the flow run whose logs to compact
+        before: only compact logs with a timestamp before this time
+        max_logs: the most logs to write to the segment
+        storage_path: a directory to write the segment to, instead of the database
+
+    Returns:
+        int: the number of logs compacted
+    """
+    result = await session.execute(
+        sa.select(db.Log)
+        .where(db.Log.flow_run_id == flow_run_id, db.Log.timestamp < before)
+        .order_by(db.Log.timestamp, db.Log.id)
+        .limit(max_logs)
+    )
+    logs = result.scalars().all()
+    if not logs:
+        return 0
+
+    segment = db.LogSegment(
+        id=uuid4(),
+        flow_run_id=flow_run_id,
+        start_time=logs[0].timestamp,
+        end_time=logs[-1].timestamp,
+        count=len(logs),
+    )
+    data = encode_segment(logs)
+    if storage_path is not None:
+        path = _segment_file(storage_path, segment.id)
+        # the file is written before the segment is committed, so remove it if the
+        # segment never is
+        _after_transaction(session, rolled_back=lambda: _unlink(str(path)))
+        await anyio.Path(storage_path).mkdir(parents=True, exist_ok=True)
+        await anyio.Path(path).write_bytes(data)
+        segment.path = str(path)
+    else:
+        segment.data = data
+    session.add(segment)
+
+    global _segments_written
+    _segments_written = True
+
+    for batch in batched_iterable([log.id for log in logs], DELETE_BATCH_SIZE):
+        await session.execute(
+            sa.delete(db.Log)
+            .where(db.Log.id.in_(batch))
+            .execution_options(synchronize_session=False)
+        )
+    return len(logs)
+
+
+@db_injector
+async def delete_expired_log_segments(
+    db: PrefectDBInterface, session: AsyncSession, before: datetime.datetime
+) -> int:
+    """
+    Delete the segments whose logs all have timestamps before `before`, along with
+    the files of any segments stored on the filesystem once the deletion commits.
+
+    Returns:
+        int: the number of segments deleted
+    """
+    result = await session.execute(
+        sa.delete(db.LogSegment)
+        .where(db.LogSegment.end_time < before)
+        .returning(db.LogSegment.path)
+    )
+    paths = result.scalars().all()
+
+    def delete_files():
+        for path in paths:
+            if path:
+                _unlink(path)
+
+    _after_transaction(session, committed=delete_files)
+    return len(paths)
+
+
+def _log_matches(log_filter: Optional[schemas.filters.LogFilter], log) -> bool:
+    """
+    Evaluate a log filter against a decoded log, mirroring `LogFilter.as_sql_filter`.
+    """
+    if log_filter is None:
+        return True
+
+    criteria = []
+    if log_filter.level is not None:
+        ge, le = log_filter.level.ge_, log_filter.level.le_
+        criteria.append(
+            (ge is None or log.level >= ge) and (le is None or log.level <= le)
+        )
+    if log_filter.timestamp is not None:
+        before, after = log_filter.timestamp.before_, log_filter.timestamp.after_
+        criteria.append(
+            (before is None or log.timestamp <= before)
+            and (after is None or log.timestamp >= after)
+        )
+    if log_filter.flow_run_id is not None and log_filter.flow_run_id.any_ is not None:
+        criteria.append(log.flow_run_id in log_filter.flow_run_id.any_)
+    if log_filter.task_run_id is not None and log_filter.task_run_id.any_ is not None:
+        criteria.append(log.task_run_id in log_filter.task_run_id.any_)
+
+    if not criteria:
+        return True
+    if log_filter.operator == schemas.filters.Operator.and_:
+        return all(criteria)
+    return any(criteria)
+
+
+def _segment_prefilter(db: PrefectDBInterface, log_filter) -> List:
+    """
+    The conditions a segment must meet to hold any logs matching the filter.
+    """
+    conditions = []
+    if log_filter is not None and log_filter.operator == schemas.filters.Operator.and_:
+        if log_filter.flow_run_id is not None and log_filter.flow_run_id.any_:
+            conditions.append(
+                db.LogSegment.flow_run_id.in_(log_filter.flow_run_id.any_)
+            )
+        if log_filter.timestamp is not None:
+            if log_filter.timestamp.before_ is not None:
+                conditions.append(
+                    db.LogSegment.start_time <= log_filter.timestamp.before_
+                )
+            if log_filter.timestamp.after_ is not None:
+                conditions.append(db.LogSegment.end_time >= log_filter.timestamp.after_)
+    return conditions
+
+
+@db_injector
+async def may_have_log_segments(db: PrefectDBInterface, session: AsyncSession) -> bool:
+    """
+    Whether there may be segments to read logs from.
+
+    While the log compactor is enabled, new segments may be written at any time.
+    Otherwise, segments are only left over from when it was enabled, so whether any
+    exist is only checked once.
+    """
+    global _segments_written
+    if _segments_written or PREFECT_API_SERVICES_LOG_COMPACTOR_ENABLED.value():
+        return True
+
+    if _segments_written is None:
+        result = await session.execute(sa.select(db.LogSegment.id).limit(1))
+        _segments_written = result.first() is not None
+    return _segments_written
+
+
+@db_injector
+async def read_log_segments(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    log_filter: Optional[schemas.filters.LogFilter],
+    sort: schemas.sorting.LogSort,
+    after: Optional[schemas.sorting.KeysetCursor] = None,
+) -> List[sa.Row]:
+    """
+    Read the bounds of the segments that may hold logs matching the filter, in the
+    order their logs are needed by `sort`. The segment data is read separately.
+    """
+    conditions = _segment_prefilter(db, log_filter)
+    descending = sort.as_keyset().descending
+    if after is not None and after.timestamp is not None:
+        if descending:
+            conditions.append(db.LogSegment.start_time <= after.timestamp)
+        else:
+            conditions.append(db.LogSegment.end_time >= after.timestamp)
+
+    result = await session.execute(
+        sa.select(
+            db.LogSegment.id,
+            db.LogSegment.flow_run_id,
+            db.LogSegment.start_time,
+            db.LogSegment.end_time,
+            db.LogSegment.path,
+        )
+        .where(*conditions)
+        .order_by(
+            db.LogSegment.end_time.desc()
+            if descending
+            else db.LogSegment.start_time.asc()
+        )
+    )
+    return list(result.all())
+
+
+@db_injector
+async def read_segment_logs(
+    db: PrefectDBInterface, session: AsyncSession, segment: sa.Row
+) -> List[orm_models.Log]:
+    """
+    Read and decode the logs of a segment, from the database or the filesystem.
+
+    A segment whose file is missing has been deleted since it was read, and is
+    treated as empty.
+    """
+    if segment.path:
+        try:
+            data = await anyio.Path(segment.path).read_bytes()
+        except FileNotFoundError:
+            return []
+    else:
+        data = await session.scalar(
+            sa.select(db.LogSegment.data).where(db.LogSegment.id == segment.id)
+        )
+    return decode_segment(data, segment.flow_run_id)
+
+
+async def merge_segment_logs(
+    session: AsyncSession,
+    logs: Sequence[orm_models.Log],
+    segments: Sequence[sa.Row],
+    log_filter: Optional[schemas.filters.LogFilter],
+    sort: schemas.sorting.LogSort,
+    offset: Optional[int] = None,
+    limit: Optional[int] = None,
+    after: Optional[schemas.sorting.KeysetCursor] = None,
+) -> List[orm_models.Log]:
+    """
+    Merge the logs read from the log table with the matching logs of the given
+    segments, and apply the offset and limit to the merged logs.
+
+    `logs` must hold at least the first `offset + limit` matching rows of the log
+    table.  Segments are decoded in the order their logs are needed, and only until
+    the remaining segments can no longer contribute to the requested page.
+    """
+    descending = sort.as_keyset().descending
+    needed = None if limit is None else (offset or 0) + limit
+
+    def key(log):
+        return (log.timestamp, log.id)
+
+    def is_after_cursor(log) -> bool:
+        if after is None:
+            return True
+        position = (after.timestamp, after.id)
+        return key(log) < position if descending else key(log) > position
+
+    merged = list(logs)
+    for segment in segments:
+        if needed is not None and len(merged) >= needed:
+            merged.sort(key=key, reverse=descending)
+            del merged[needed:]
+            boundary = merged[-1].timestamp
+            if (
+                segment.end_time < boundary
+                if descending
+                else segment.start_time > boundary
+            ):
+                break
+
+        merged.extend(
+            log
+            for log in await read_segment_logs(session=session, segment=segment)
+            if _log_matches(log_filter, log) and is_after_cursor(log)
+        )
+
+    merged.sort(key=key, reverse=descending)
+    start = offset or 0
+    return merged[start : None if limit is None else start + limit]
@@ -8,6 +8,7 @@ from typing import List, Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.logging import get_logger
 from prefect.server.database import orm_models
@@ -66,6 +67,7 @@ async def read_logs(
     offset: Optional[int] = None,
     limit: Optional[int] = None,
     sort: schemas.sorting.LogSort = schemas.sorting.LogSort.TIMESTAMP_ASC,
+    after: Optional[schemas.sorting.KeysetCursor] = None,
 ):
     """
     Read logs.
@@ -77,16 +79,41 @@ async def read_logs(
         offset: Query offset
         limit: Query limit
         sort: Query sort
+        after: only select logs that sort after this cursor
 
     Returns:
         List[orm_models.Log]: the matching logs
     """
-    query = (
-        select(orm_models.Log).order_by(sort.as_sql_sort()).offset(offset).limit(limit)
-    )
+    order_by, after_filter = schemas.sorting.as_sql_keyset_sort(sort, after)
+    query = select(orm_models.Log).order_by(*order_by)
+
+    if after_filter is not None:
+        query = query.where(after_filter)
 
     if log_filter:
         query = query.where(log_filter.as_sql_filter())
 
+    segments = []
+    if await models.log_segments.may_have_log_segments(session=session):
+        segments = await models.log_segments.read_log_segments(
+            session=session, log_filter=log_filter, sort=sort, after=after
+        )
+    if not segments:
+        result = await session.execute(query.offset(offset).limit(limit))
+        return result.scalars().unique().all()
+
+    # Compacted logs are merged with the rows of the log table, so read enough rows
+    # to fill the requested page on their own
+    if limit is not None:
+        query = query.limit((offset or 0) + limit)
     result = await session.execute(query)
-    return result.scalars().unique().all()
+    return await models.log_segments.merge_segment_logs(
+        session=session,
+        logs=result.scalars().unique().all(),
+        segments=segments,
+        log_filter=log_filter,
+        sort=sort,
+        offset=offset,
+        limit=limit,
+        after=after,
+    )
@@ -0,0 +1,439 @@
+"""
+Functions for maintaining pre-aggregated run history.
+Intended for internal use by the Prefect REST API.
+
+Flow and task runs are counted per minute, hour, and day of their expected start
+time, per flow, deployment, and state.  Minute rollups are recomputed from the run
+tables one hour at a time; hour rollups are derived from minute rollups and day
+rollups from hour rollups.  Each refresh recomputes the hours of every run updated
+since the previous refresh, the hours the clock has passed since then, and any
+hours marked stale by deletions.
+
+The estimated run time of running runs and the lateness of runs that haven't
+started grow with the clock, so rollups store the count of those runs and the sum
+of the times they have been growing from, and readers add the time elapsed since.
+"""
+
+import datetime
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+
+import pendulum
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import prefect.server.models as models
+import prefect.server.schemas as schemas
+from prefect.server.database.dependencies import db_injector
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.utilities.database import date_diff, time_bucket
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# the bucket sizes that are maintained, largest first
+BUCKET_SECONDS = (DAY, HOUR, MINUTE)
+
+RUN_TYPES = ("flow_run", "task_run")
+
+WATERMARK_KEY = "run_history_rollups"
+
+# Runs are found by their `updated` time, which is set when the transaction that
+# writes them starts rather than when it commits, so each refresh looks back a bit
+# before the previous one to catch writes that were still in flight.
+WATERMARK_OVERLAP = datetime.timedelta(minutes=1)
+
+# the most hours of runs to recompute in one statement
+MAX_HOURS_PER_REFRESH = 24
+
+
+def _runs(db: PrefectDBInterface, run_type: str):
+    """
+    Returns the run model for the given run type, the clause to select its runs
+    from, and the flow and deployment ids to attribute its runs to.
+    """
+    if run_type == "flow_run":
+        return db.FlowRun, db.FlowRun, db.FlowRun.flow_id, db.FlowRun.deployment_id
+    elif run_type == "task_run":
+        # task runs are attributed to the flow and deployment of their flow run
+        return (
+            db.TaskRun,
+            sa.join(
+                db.TaskRun,
+                db.FlowRun,
+                db.FlowRun.id == db.TaskRun.flow_run_id,
+                isouter=True,
+            ),
+            db.FlowRun.flow_id,
+            db.FlowRun.deployment_id,
+        )
+    else:
+        raise ValueError(
+            f"Unknown run type {run_type!r}. Expected 'flow_run' or 'task_run'."
+        )
+
+
+def _epoch(expression) -> sa.ColumnElement:
+    return sa.extract("epoch", expression)
+
+
+def _count_and_sum_since(condition, since) -> List[sa.ColumnElement]:
+    """
+    Count the runs matching a condition, and sum the epoch times from which their
+    estimates grow with the clock.
+    """
+    return [
+        sa.func.sum(sa.case((condition, 1), else_=0)),
+        sa.func.sum(sa.case((condition, _epoch(since)), else_=0)),
+    ]
+
+
+@db_injector
+async def read_rollup_watermark(
+    db: PrefectDBInterface, session: AsyncSession
+) -> Optional[pendulum.DateTime]:
+    """
+    Read the time of the last completed refresh, if any.
+
+    This reads the configuration table directly rather than through the
+    configuration cache, since the watermark is written by the rollups service,
+    which may run in a different process.
+    """
+    result = await session.execute(
+        sa.select(db.Configuration.value).where(db.Configuration.key == WATERMARK_KEY)
+    )
+    value = result.scalar()
+    if not value or not value.get("watermark"):
+        return None
+    return pendulum.parse(value["watermark"])
+
+
+async def write_rollup_watermark(
+    session: AsyncSession, watermark: datetime.datetime
+) -> None:
+    """Record the time of a completed refresh."""
+    await models.configuration.write_configuration(
+        session=session,
+        configuration=schemas.core.Configuration(
+            key=WATERMARK_KEY,
+            value={"watermark": pendulum.instance(watermark).isoformat()},
+        ),
+    )
+
+
+@db_injector
+async def read_dirty_hours(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    since: Optional[datetime.datetime],
+) -> List[pendulum.DateTime]:
+    """
+    Find the hours that need to be recomputed: those with runs updated since the
+    given time (or all runs, if no time is given), those with runs expected to
+    start between then and now, which may have become late, and those with
+    rollups marked stale.
+
+    Args:
+        session: a database session
+        since: the watermark of the previous refresh
+
+    Returns:
+        List[DateTime]: the start of each hour, in order
+    """
+    hours = set()
+    now = pendulum.now("UTC")
+
+    for run_type in RUN_TYPES:
+        run_model, _, _, _ = _runs(db, run_type)
+        if since is None:
+            criteria = [run_model.expected_start_time.is_not(None)]
+        else:
+            # each criterion is queried on its own so that it can use its index
+            criteria = [
+                run_model.updated >= since - WATERMARK_OVERLAP,
+                run_model.expected_start_time.between(since - WATERMARK_OVERLAP, now),
+            ]
+        for criterion in criteria:
+            result = await session.execute(
+                sa.select(
+                    sa.distinct(time_bucket(run_model.expected_start_time, HOUR))
+                ).where(criterion, run_model.expected_start_time.is_not(None))
+            )
+            hours.update(result.scalars())
+
+    result = await session.execute(
+        sa.select(sa.distinct(db.RunHistoryRollup.bucket_start)).where(
+            db.RunHistoryRollup.stale.is_(True),
+            db.RunHistoryRollup.bucket_seconds == HOUR,
+        )
+    )
+    hours.update(result.scalars())
+
+    return sorted(pendulum.instance(hour) for hour in hours)
+
+
+def hour_ranges(
+    hours: Iterable[datetime.datetime],
+) -> List[Tuple[pendulum.DateTime, pendulum.DateTime]]:
+    """
+    Merge hours into contiguous ranges of at most `MAX_HOURS_PER_REFRESH` hours.
+    """
+    ranges: List[Tuple[pendulum.DateTime, pendulum.DateTime]] = []
+    for hour in sorted(pendulum.instance(hour) for hour in hours):
+        if ranges:
+            start, end = ranges[-1]
+            if end == hour and (end - start).in_hours() < MAX_HOURS_PER_REFRESH:
+                ranges[-1] = (start, hour.add(hours=1))
+                continue
+        ranges.append((hour, hour.add(hours=1)))
+    return ranges
+
+
+def _rollup_columns(db: PrefectDBInterface) -> List[sa.Column]:
+    return [
+        db.RunHistoryRollup.run_type,
+        db.RunHistoryRollup.bucket_seconds,
+        db.RunHistoryRollup.bucket_start,
+        db.RunHistoryRollup.flow_id,
+        db.RunHistoryRollup.deployment_id,
+        db.RunHistoryRollup.state_type,
+        db.RunHistoryRollup.state_name,
+        db.RunHistoryRollup.count,
+        db.RunHistoryRollup.sum_estimated_run_time,
+        db.RunHistoryRollup.sum_estimated_lateness,
+        db.RunHistoryRollup.count_running,
+        db.RunHistoryRollup.sum_running_since,
+        db.RunHistoryRollup.count_late,
+        db.RunHistoryRollup.sum_late_since,
+    ]
+
+
+async def _derive_rollups(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    bucket_seconds: int,
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> None:
+    """Derive rollups of the given size from the finer-grained rollups in a range."""
+    source = db.RunHistoryRollup
+    bucket = time_bucket(source.bucket_start, bucket_seconds)
+    await session.execute(
+        sa.insert(db.RunHistoryRollup).from_select(
+            _rollup_columns(db),
+            sa.select(
+                source.run_type,
+                sa.literal(bucket_seconds),
+                bucket,
+                source.flow_id,
+                source.deployment_id,
+                source.state_type,
+                source.state_name,
+                sa.func.sum(source.count),
+                sa.func.sum(source.sum_estimated_run_time),
+                sa.func.sum(source.sum_estimated_lateness),
+                sa.func.sum(source.count_running),
+                sa.func.sum(source.sum_running_since),
+                sa.func.sum(source.count_late),
+                sa.func.sum(source.sum_late_since),
+            )
+            .where(
+                source.bucket_seconds == _finer(bucket_seconds),
+                source.bucket_start >= start,
+                source.bucket_start < end,
+            )
+            .group_by(
+                source.run_type,
+                bucket,
+                source.flow_id,
+                source.deployment_id,
+                source.state_type,
+                source.state_name,
+            ),
+            # let the database generate ids and timestamps for each row
+            include_defaults=False,
+        )
+    )
+
+
+def _finer(bucket_seconds: int) -> int:
+    return BUCKET_SECONDS[BUCKET_SECONDS.index(bucket_seconds) + 1]
+
+
+async def _delete_rollups(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    bucket_seconds: Iterable[int],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> None:
+    await session.execute(
+        sa.delete(db.RunHistoryRollup).where(
+            db.RunHistoryRollup.run_type.in_(RUN_TYPES),
+            db.RunHistoryRollup.bucket_seconds.in_(list(bucket_seconds)),
+            db.RunHistoryRollup.bucket_start >= start,
+            db.RunHistoryRollup.bucket_start < end,
+        )
+    )
+
+
+@db_injector
+async def refresh_run_history_rollups(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> None:
+    """
+    Recompute the rollups for runs expected to start in the given range of whole
+    hours, and the day rollups for the days that contain it.
+
+    Runs that haven't started are counted as late once they were expected to
+    start by the time of the refresh; later refreshes count the rest as the clock
+    passes their hours.
+
+    Args:
+        session: a database session
+        start: the start of the first hour to recompute
+        end: the end of the last hour to recompute
+    """
+    await _delete_rollups(db, session, (MINUTE, HOUR), start, end)
+    now = pendulum.now("UTC")
+
+    for run_type in RUN_TYPES:
+        run_model, runs, flow_id, deployment_id = _runs(db, run_type)
+        minute = time_bucket(run_model.expected_start_time, MINUTE)
+        running = run_model.state_type == schemas.states.StateType.RUNNING
+        late = sa.and_(
+            run_model.start_time.is_(None),
+            run_model.state_type.not_in(schemas.states.TERMINAL_STATES),
+            run_model.expected_start_time < now,
+        )
+        await session.execute(
+            sa.insert(db.RunHistoryRollup).from_select(
+                _rollup_columns(db),
+                sa.select(
+                    sa.literal(run_type),
+                    sa.literal(MINUTE),
+                    minute,
+                    flow_id,
+                    deployment_id,
+                    run_model.state_type,
+                    run_model.state_name,
+                    sa.func.count(run_model.id),
+                    # these are the parts of the run history query's estimates
+                    # that don't change with the clock
+                    sa.func.sum(db.greatest(0, _epoch(run_model.total_run_time))),
+                    sa.func.sum(
+                        sa.case(
+                            (
+                                run_model.start_time > run_model.expected_start_time,
+                                _epoch(
+                                    date_diff(
+                                        run_model.start_time,
+                                        run_model.expected_start_time,
+                                    )
+                                ),
+                            ),
+                            else_=0,
+                        )
+                    ),
+                    *_count_and_sum_since(running, run_model.state_timestamp),
+                    *_count_and_sum_since(late, run_model.expected_start_time),
+                )
+                .select_from(runs)
+                .where(
+                    run_model.expected_start_time >= start,
+                    run_model.expected_start_time < end,
+                )
+                .group_by(
+                    minute,
+                    flow_id,
+                    deployment_id,
+                    run_model.state_type,
+                    run_model.state_name,
+                ),
+                include_defaults=False,
+            )
+        )
+
+    await _derive_rollups(db, session, HOUR, start, end)
+
+    day_start = pendulum.instance(start).in_timezone("UTC").start_of("day")
+    day_end = pendulum.instance(end).in_timezone("UTC").subtract(microseconds=1)
+    day_end = day_end.start_of("day").add(days=1)
+    await _delete_rollups(db, session, (DAY,), day_start, day_end)
+    await _derive_rollups(db, session, DAY, day_start, day_end)
+
+
+@db_injector
+async def mark_run_history_rollups_stale(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    flow_id: Optional[UUID] = None,
+    flow_run_id: Optional[UUID] = None,
+    task_run_id: Optional[UUID] = None,
+    deployment_id: Optional[UUID] = None,
+) -> None:
+    """
+    Mark the rollups that count runs about to be deleted, so that the next refresh
+    recomputes them.  Deleted runs can't be found by their `updated` time.
+
+    Args:
+        session: a database session
+        flow_id: the runs of this flow are being deleted
+        flow_run_id: this flow run and its task runs are being deleted
+        task_run_id: this task run is being deleted
+        deployment_id: scheduled runs of this deployment are being deleted
+    """
+    rollups = db.RunHistoryRollup
+    criteria = []
+
+    if flow_id is not None:
+        criteria.append(rollups.flow_id == flow_id)
+
+    if deployment_id is not None:
+        criteria.append(
+            sa.and_(
+                rollups.run_type == "flow_run",
+                rollups.deployment_id == deployment_id,
+                rollups.state_type == schemas.states.StateType.SCHEDULED,
+            )
+        )
+
+    hours = []
+    if flow_run_id is not None:
+        hours.append(
+            sa.select(time_bucket(db.FlowRun.expected_start_time, HOUR)).where(
+                db.FlowRun.id == flow_run_id
+            )
+        )
+        hours.append(
+            sa.select(time_bucket(db.TaskRun.expected_start_time, HOUR)).where(
+                db.TaskRun.flow_run_id == flow_run_id
+            )
+        )
+    if task_run_id is not None:
+        hours.append(
+            sa.select(time_bucket(db.TaskRun.expected_start_time, HOUR)).where(
+                db.TaskRun.id == task_run_id
+            )
+        )
+    if hours:
+        criteria.append(
+            rollups.bucket_start.in_(hours[0] if len(hours) == 1 else sa.union(*hours))
+        )
+
+    if not criteria:
+        return
+
+    await session.execute(
+        sa.update(rollups)
+        .where(
+            rollups.run_type.in_(RUN_TYPES),
+            rollups.bucket_seconds == HOUR,
+            sa.or_(*criteria),
+        )
+        .values(stale=True)
+    )
@@ -250,6 +250,7 @@ async def read_task_runs(
     offset: Optional[int] = None,
     limit: Optional[int] = None,
     sort: schemas.sorting.TaskRunSort = schemas.sorting.TaskRunSort.ID_DESC,
+    after: Optional[schemas.sorting.KeysetCursor] = None,
 ):
     """
     Read task runs.
@@ -263,12 +264,16 @@ async def read_task_runs(
         offset: Query offset
         limit: Query limit
         sort: Query sort
+        after: only select task runs that sort after this cursor
 
     Returns:
         List[orm_models.TaskRun]: the task runs
     """
+    order_by, after_filter = schemas.sorting.as_sql_keyset_sort(sort, after)
+    query = select(orm_models.TaskRun).order_by(*order_by)
 
-    query = select(orm_models.TaskRun).order_by(sort.as_sql_sort())
+    if after_filter is not None:
+        query = query.where(after_filter)
 
     query = await _apply_task_run_filters(
         query,
@@ -381,6 +386,9 @@ async def delete_task_run(session: AsyncSession, task_run_id: UUID) -> bool:
     Returns:
         bool: whether or not the task run was deleted
     """
+    await models.run_history_rollups.mark_run_history_rollups_stale(
+        session=session, task_run_id=task_run_id
+    )
 
     result = await session.execute(
         delete(orm_models.TaskRun).where(orm_models.TaskRun.id == task_run_id)
@@ -2,11 +2,15 @@
 Schemas for sorting Prefect REST API objects.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, List, NamedTuple, Optional, Tuple, Union
+from uuid import UUID
 
 import sqlalchemy as sa
+from pydantic import Field
+from pydantic_extra_types.pendulum_dt import DateTime
 
 from prefect.server.database import orm_models
+from prefect.server.utilities.schemas.bases import PrefectBaseModel
 from prefect.utilities.collections import AutoEnum
 
 if TYPE_CHECKING:
@@ -17,6 +21,106 @@ if TYPE_CHECKING:
 #       present in the schemas module
 
 
+class KeysetCursor(PrefectBaseModel):
+    """
+    The position of the last item of a page, used to read the page after it without
+    an offset.
+    """
+
+    timestamp: Optional[DateTime] = Field(
+        default=None,
+        description=(
+            "The sort timestamp of the last item read, if the sort has one. A null"
+            " timestamp marks a position among items with no timestamp."
+        ),
+    )
+    id: UUID = Field(default=..., description="The id of the last item read.")
+
+
+class Keyset(NamedTuple):
+    """
+    A total order over (timestamp, id) that can be resumed from a `KeysetCursor`.
+
+    Items with a null timestamp sort last when ascending and first when descending.
+    """
+
+    timestamp: Optional["ColumnElement"]
+    id: "ColumnElement"
+    descending: bool
+    nullable: bool = False
+
+    def order_by(self) -> List["ColumnElement"]:
+        """Return the expressions used to order a keyset query"""
+        if self.timestamp is None:
+            return [self.id.desc() if self.descending else self.id.asc()]
+        if self.descending:
+            timestamp = self.timestamp.desc()
+            if self.nullable:
+                timestamp = timestamp.nulls_first()
+            return [timestamp, self.id.desc()]
+        timestamp = self.timestamp.asc()
+        if self.nullable:
+            timestamp = timestamp.nulls_last()
+        return [timestamp, self.id.asc()]
+
+    def after(self, cursor: KeysetCursor) -> "ColumnElement":
+        """Return a filter for the items that sort after the given cursor"""
+        if self.timestamp is None:
+            return self.id < cursor.id if self.descending else self.id > cursor.id
+
+        if cursor.timestamp is None:
+            if self.descending:
+                # null timestamps come first, so every timestamped item follows
+                return sa.or_(
+                    sa.and_(self.timestamp.is_(None), self.id < cursor.id),
+                    self.timestamp.is_not(None),
+                )
+            return sa.and_(self.timestamp.is_(None), self.id > cursor.id)
+
+        key = sa.tuple_(self.timestamp, self.id)
+        position = sa.tuple_(
+            sa.literal(cursor.timestamp, type_=self.timestamp.type),
+            sa.literal(cursor.id, type_=self.id.type),
+        )
+        if self.descending:
+            return key < position
+        if self.nullable:
+            return sa.or_(key > position, self.timestamp.is_(None))
+        return key > position
+
+    def cursor_for(self, item: Any) -> KeysetCursor:
+        """Return the cursor positioned at the given ORM object"""
+        return KeysetCursor(
+            timestamp=(
+                getattr(item, self.timestamp.key)
+                if self.timestamp is not None
+                else None
+            ),
+            id=item.id,
+        )
+
+
+def as_sql_keyset_sort(
+    sort: Union["FlowRunSort", "TaskRunSort", "LogSort"],
+    after: Optional[KeysetCursor] = None,
+) -> Tuple[List["ColumnElement"], Optional["ColumnElement"]]:
+    """
+    Return the expressions used to order a query by `sort`, and a filter for the
+    items after `after` if a cursor is given.
+
+    Sorts with a keyset are always ordered by it, so that the first page of a keyset
+    pagination is consistent with the pages read after it.
+    """
+    keyset = sort.as_keyset()
+    if keyset is None:
+        if after is not None:
+            raise ValueError(
+                f"Keyset pagination is not supported when sorting by {sort.value}"
+            )
+        return [sort.as_sql_sort()], None
+    return keyset.order_by(), keyset.after(after) if after is not None else None
+
+
 class FlowRunSort(AutoEnum):
     """Defines flow run sorting options."""
 
@@ -51,6 +155,25 @@ class FlowRunSort(AutoEnum):
         }
         return sort_mapping[self.value]
 
+    def as_keyset(self) -> Optional[Keyset]:
+        """Return the keyset used to paginate flow runs in this order, if any"""
+        expected_start_time = orm_models.FlowRun.expected_start_time
+        return {
+            "ID_DESC": Keyset(None, orm_models.FlowRun.id, descending=True),
+            "EXPECTED_START_TIME_ASC": Keyset(
+                expected_start_time,
+                orm_models.FlowRun.id,
+                descending=False,
+                nullable=True,
+            ),
+            "EXPECTED_START_TIME_DESC": Keyset(
+                expected_start_time,
+                orm_models.FlowRun.id,
+                descending=True,
+                nullable=True,
+            ),
+        }.get(self.value)
+
 
 class TaskRunSort(AutoEnum):
     """Defines task run sorting options."""
@@ -76,6 +199,25 @@ class TaskRunSort(AutoEnum):
         }
         return sort_mapping[self.value]
 
+    def as_keyset(self) -> Optional[Keyset]:
+        """Return the keyset used to paginate task runs in this order, if any"""
+        expected_start_time = orm_models.TaskRun.expected_start_time
+        return {
+            "ID_DESC": Keyset(None, orm_models.TaskRun.id, descending=True),
+            "EXPECTED_START_TIME_ASC": Keyset(
+                expected_start_time,
+                orm_models.TaskRun.id,
+                descending=False,
+                nullable=True,
+            ),
+            "EXPECTED_START_TIME_DESC": Keyset(
+                expected_start_time,
+                orm_models.TaskRun.id,
+                descending=True,
+                nullable=True,
+            ),
+        }.get(self.value)
+
 
 class LogSort(AutoEnum):
     """Defines log sorting options."""
@@ -91,6 +233,14 @@ class LogSort(AutoEnum):
         }
         return sort_mapping[self.value]
 
+    def as_keyset(self) -> Keyset:
+        """Return the keyset used to paginate logs in this order"""
+        return Keyset(
+            orm_models.Log.timestamp,
+            orm_models.Log.id,
+            descending=self.value == "TIMESTAMP_DESC",
+        )
+
 
 class FlowSort(AutoEnum):
     """Defines flow sorting options."""
@@ -2,7 +2,9 @@ import prefect.server.services.cancellation_cleanup
 import prefect.server.services.flow_run_notifications
 import prefect.server.services.foreman
 import prefect.server.services.late_runs
+import prefect.server.services.log_compactor
 import prefect.server.services.pause_expirations
+import prefect.server.services.run_history_rollups
 import prefect.server.services.scheduler
 import prefect.server.services.telemetry
 import prefect.server.services.task_scheduling
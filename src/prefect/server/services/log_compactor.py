@@ -0,0 +1,89 @@
+"""
+The LogCompactor service. Responsible for moving old logs out of the log table and
+into compressed segments, and for deleting segments past their retention period.
+"""
+
+import asyncio
+from typing import Optional
+
+import pendulum
+
+import prefect.server.models as models
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.services.loop_service import LoopService
+from prefect.settings import (
+    PREFECT_API_SERVICES_LOG_COMPACTOR_COMPACT_AFTER,
+    PREFECT_API_SERVICES_LOG_COMPACTOR_LOOP_SECONDS,
+    PREFECT_API_SERVICES_LOG_COMPACTOR_RETENTION_PERIOD,
+    PREFECT_API_SERVICES_LOG_COMPACTOR_SEGMENT_SIZE,
+    PREFECT_API_SERVICES_LOG_COMPACTOR_STORAGE_PATH,
+)
+
+
+class LogCompactor(LoopService):
+    """
+    A loop service that compacts the logs of each flow run older than
+    `PREFECT_API_SERVICES_LOG_COMPACTOR_COMPACT_AFTER` into compressed segments.
+    """
+
+    def __init__(self, loop_seconds: Optional[float] = None, **kwargs):
+        super().__init__(
+            loop_seconds=loop_seconds
+            or PREFECT_API_SERVICES_LOG_COMPACTOR_LOOP_SECONDS.value(),
+            **kwargs,
+        )
+        self.compact_after = PREFECT_API_SERVICES_LOG_COMPACTOR_COMPACT_AFTER.value()
+        self.segment_size = PREFECT_API_SERVICES_LOG_COMPACTOR_SEGMENT_SIZE.value()
+        self.storage_path = PREFECT_API_SERVICES_LOG_COMPACTOR_STORAGE_PATH.value()
+        self.retention_period = (
+            PREFECT_API_SERVICES_LOG_COMPACTOR_RETENTION_PERIOD.value()
+        )
+
+    @inject_db
+    async def run_once(self, db: PrefectDBInterface):
+        """
+        Compact logs by:
+
+        - Finding flow runs with logs older than the compaction threshold
+        - Moving those logs into segments, one flow run and segment per transaction
+        - Deleting segments whose logs are all older than the retention period
+        """
+        before = pendulum.now("UTC") - self.compact_after
+
+        async with db.session_context() as session:
+            flow_run_ids = await models.log_segments.read_compactable_flow_run_ids(
+                session=session, before=before
+            )
+
+        compacted = 0
+        for flow_run_id in flow_run_ids:
+            while True:
+                async with db.session_context(begin_transaction=True) as session:
+                    count = await models.log_segments.compact_flow_run_logs(
+                        session=session,
+                        flow_run_id=flow_run_id,
+                        before=before,
+                        max_logs=self.segment_size,
+                        storage_path=self.storage_path,
+                    )
+                compacted += count
+                if count < self.segment_size:
+                    break
+
+        self.logger.info(
+            f"Compacted {compacted} log(s) from {len(flow_run_ids)} flow run(s)."
+        )
+
+        if self.retention_period is not None:
+            async with db.session_context(begin_transaction=True) as session:
+                deleted = await models.log_segments.delete_expired_log_segments(
+                    session=session,
+                    before=pendulum.now("UTC") - self.retention_period,
+                )
+            if deleted:
+                self.logger.info(f"Deleted {deleted} expired log segment(s).")
+
+
+if __name__ == "__main__":
+    asyncio.run(LogCompactor(handle_signals=True).start())
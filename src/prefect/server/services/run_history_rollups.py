@@ -0,0 +1,68 @@
+"""
+The RunHistoryRollups service. Responsible for keeping the pre-aggregated run
+history used by the run history endpoints up to date.
+"""
+
+import asyncio
+from typing import Optional
+
+import pendulum
+
+import prefect.server.models as models
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.services.loop_service import LoopService
+from prefect.settings import PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_LOOP_SECONDS
+
+
+class RunHistoryRollups(LoopService):
+    """
+    A loop service that recomputes the per-minute, hour, and day run history
+    rollups for every hour with runs that changed since its last loop.
+
+    The first loop backfills the rollups for all existing runs.
+    """
+
+    def __init__(self, loop_seconds: Optional[float] = None, **kwargs):
+        super().__init__(
+            loop_seconds=loop_seconds
+            or PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_LOOP_SECONDS.value(),
+            **kwargs,
+        )
+
+    @inject_db
+    async def run_once(self, db: PrefectDBInterface):
+        """
+        Refresh the rollups by:
+
+        - Finding the hours with runs updated since the last refresh, runs whose
+          estimates change over time, or rollups marked stale by deletions
+        - Recomputing the rollups of those hours, a range of hours at a time
+        - Recording the start of this refresh as the new watermark
+        """
+        watermark = pendulum.now("UTC")
+
+        async with db.session_context() as session:
+            since = await models.run_history_rollups.read_rollup_watermark(
+                session=session
+            )
+            hours = await models.run_history_rollups.read_dirty_hours(
+                session=session, since=since
+            )
+
+        for start, end in models.run_history_rollups.hour_ranges(hours):
+            async with db.session_context(begin_transaction=True) as session:
+                await models.run_history_rollups.refresh_run_history_rollups(
+                    session=session, start=start, end=end
+                )
+
+        async with db.session_context(begin_transaction=True) as session:
+            await models.run_history_rollups.write_rollup_watermark(
+                session=session, watermark=watermark
+            )
+
+        self.logger.info(f"Refreshed run history rollups for {len(hours)} hour(s).")
+
+
+if __name__ == "__main__":
+    asyncio.run(RunHistoryRollups(handle_signals=True).start())
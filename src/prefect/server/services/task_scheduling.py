@@ -6,6 +6,7 @@ import asyncio
 from typing import Optional
 
 import pendulum
+import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import prefect.server.models as models
@@ -22,6 +23,8 @@ from prefect.settings import PREFECT_TASK_SCHEDULING_PENDING_TASK_TIMEOUT
 class TaskSchedulingTimeouts(LoopService):
     _first_run: bool
 
+    restore_batch_size: int = 500
+
     def __init__(self, loop_seconds: Optional[float] = None, **kwargs):
         self._first_run = True
         super().__init__(
@@ -40,34 +43,49 @@ class TaskSchedulingTimeouts(LoopService):
 
         async with db.session_context(begin_transaction=True) as session:
             if self._first_run:
-                await self.restore_scheduled_tasks_if_necessary(session)
+                await self.restore_scheduled_tasks_if_necessary(session, db)
                 self._first_run = False
 
             await self.reschedule_pending_runs(session)
 
-    async def restore_scheduled_tasks_if_necessary(self, session: AsyncSession):
+    async def restore_scheduled_tasks_if_necessary(
+        self, session: AsyncSession, db: PrefectDBInterface
+    ):
         """
         Restores scheduled task runs from the database to the in-memory queues.
-        """
-        task_runs = await models.task_runs.read_task_runs(
-            session=session,
-            task_run_filter=filters.TaskRunFilter(
-                flow_run_id=filters.TaskRunFilterFlowRunId(is_null_=True),
-                state=filters.TaskRunFilterState(
-                    type=filters.TaskRunFilterStateType(
-                        any_=[states.StateType.SCHEDULED]
-                    )
-                ),
-            ),
-        )
 
-        for task_run_model in task_runs:
-            task_run: schemas.core.TaskRun = schemas.core.TaskRun.model_validate(
-                task_run_model
+        Task runs are read in pages of `restore_batch_size`, keyed by ID, so the
+        scheduled backlog is never loaded all at once. Task runs that do not fit in
+        the in-memory queues are spilled to disk.
+        """
+        restored = 0
+        last_id = None
+        while True:
+            query = (
+                sa.select(db.TaskRun)
+                .where(
+                    db.TaskRun.flow_run_id.is_(None),
+                    db.TaskRun.state_type == states.StateType.SCHEDULED,
+                )
+                .order_by(db.TaskRun.id)
+                .limit(self.restore_batch_size)
             )
-            await TaskQueue.for_key(task_run.task_key).retry(task_run)
-
-        self.logger.info("Restored %s scheduled task runs", len(task_runs))
+            if last_id is not None:
+                query = query.where(db.TaskRun.id > last_id)
+
+            task_runs = (await session.execute(query)).scalars().unique().all()
+            for task_run_model in task_runs:
+                task_run: schemas.core.TaskRun = schemas.core.TaskRun.model_validate(
+                    task_run_model
+                )
+                await TaskQueue.for_key(task_run.task_key).retry(task_run)
+
+            restored += len(task_runs)
+            if len(task_runs) < self.restore_batch_size:
+                break
+            last_id = task_runs[-1].id
+
+        self.logger.info("Restored %s scheduled task runs", restored)
 
     async def reschedule_pending_runs(self, session: AsyncSession):
         """
@@ -1,9 +1,23 @@
 """
 Implements an in-memory task queue for delivering background task runs to TaskWorkers.
+
+When spilling is enabled and a queue is full, further task runs are spilled to an
+append-only file on local disk and read back into memory, in order, as the queue
+drains. Spill files are written and read in a worker thread. Task runs are always
+persisted in the database, so spill files are only kept for the life of the server
+process; the spill directories of server processes that have exited are removed.
 """
 
 import asyncio
-from typing import Dict, List, Optional, Tuple
+import atexit
+import json
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Dict, List, NamedTuple, Optional, Tuple
+from uuid import uuid4
 
 from typing_extensions import Self
 
@@ -11,7 +25,212 @@ import prefect.server.schemas as schemas
 from prefect.settings import (
     PREFECT_TASK_SCHEDULING_MAX_RETRY_QUEUE_SIZE,
     PREFECT_TASK_SCHEDULING_MAX_SCHEDULED_QUEUE_SIZE,
+    PREFECT_TASK_SCHEDULING_SPILL_PATH,
+    PREFECT_TASK_SCHEDULING_SPILL_TO_DISK,
 )
+from prefect.utilities.asyncutils import run_sync_in_worker_thread
+from prefect.utilities.filesystem import _try_lock, _unlock
+
+SPILL_LOCK_FILE = ".lock"
+
+# The lock files held on this process's spill directories, by directory
+_spill_directory_locks: Dict[Path, IO] = {}
+_spill_directory_locks_lock = threading.Lock()
+
+
+def _prepare_spill_directory(directory: Path) -> None:
+    """
+    Creates a spill directory for this process, holding a lock on it for the life of
+    the process, and removes the spill directories of processes that have exited.
+    """
+    with _spill_directory_locks_lock:
+        if directory in _spill_directory_locks:
+            directory.mkdir(parents=True, exist_ok=True)
+            return
+
+        for lock_path in directory.parent.glob(f"*/{SPILL_LOCK_FILE}"):
+            try:
+                with open(lock_path, "a") as f:
+                    if not _try_lock(f):
+                        # the process that owns this directory is still running
+                        continue
+                    _unlock(f)
+            except OSError:
+                continue
+            shutil.rmtree(lock_path.parent, ignore_errors=True)
+
+        directory.mkdir(parents=True, exist_ok=True)
+        lock = open(directory / SPILL_LOCK_FILE, "a")
+        _try_lock(lock)
+        _spill_directory_locks[directory] = lock
+        atexit.register(_remove_spill_directory, directory)
+
+
+def _remove_spill_directory(directory: Path) -> None:
+    with _spill_directory_locks_lock:
+        lock = _spill_directory_locks.pop(directory, None)
+        if lock is not None:
+            _unlock(lock)
+            lock.close()
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+class QueuedTaskRun(NamedTuple):
+    task_run: schemas.core.TaskRun
+    enqueued_at: float
+
+
+@dataclass
+class TaskQueueMetrics:
+    """
+    Depth and wait-time metrics for the task queue of a single task key.
+
+    Wait times are measured in seconds from when a task run was enqueued.
+    """
+
+    task_key: str
+    scheduled: int
+    retries: int
+    spilled: int
+    delivered: int
+    oldest_wait: float
+    mean_wait: float
+    max_wait: float
+
+
+class SpillFile:
+    """
+    An append-only file of queued task runs that did not fit in memory.
+
+    The file is removed once every task run written to it has been read back. Its
+    methods perform blocking file I/O, so they are called from a worker thread.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.depth = 0
+        self._writer: Optional[IO[bytes]] = None
+        self._reader: Optional[IO[bytes]] = None
+
+    def append(self, queued: QueuedTaskRun) -> None:
+        if self._writer is None:
+            _prepare_spill_directory(self.path.parent)
+            self._writer = self.path.open("ab")
+        record = {
+            "task_run": queued.task_run.model_dump(mode="json"),
+            "enqueued_at": queued.enqueued_at,
+        }
+        self._writer.write(json.dumps(record).encode() + b"\n")
+        self.depth += 1
+
+    def read(self, count: int) -> List[QueuedTaskRun]:
+        if not self.depth:
+            return []
+
+        assert self._writer is not None
+        self._writer.flush()
+        if self._reader is None:
+            self._reader = self.path.open("rb")
+
+        queued = []
+        for _ in range(min(count, self.depth)):
+            record = json.loads(self._reader.readline())
+            queued.append(
+                QueuedTaskRun(
+                    task_run=schemas.core.TaskRun.model_validate(record["task_run"]),
+                    enqueued_at=record["enqueued_at"],
+                )
+            )
+        self.depth -= len(queued)
+
+        if not self.depth:
+            self.clear()
+
+        return queued
+
+    def clear(self) -> None:
+        for handle in (self._writer, self._reader):
+            if handle is not None:
+                handle.close()
+        self._writer = self._reader = None
+        self.depth = 0
+        self.path.unlink(missing_ok=True)
+
+
+class SpillingQueue(asyncio.Queue):
+    """
+    An `asyncio.Queue` of queued task runs that spills to disk instead of blocking
+    when it is full.
+
+    Items are only spilled while the queue is full and are read back in the
+    background as soon as there is room, so the spill file is always behind
+    everything in memory.
+    """
+
+    def __init__(self, maxsize: int, spill_path: Optional[Path] = None):
+        super().__init__(maxsize=maxsize)
+        self._spill = SpillFile(spill_path) if spill_path else None
+        # Serializes spill file I/O, which keeps puts in order with reads
+        self._spill_lock = asyncio.Lock()
+        self._refill_task: Optional[asyncio.Task] = None
+
+    @property
+    def spilled(self) -> int:
+        return self._spill.depth if self._spill else 0
+
+    def depth(self) -> int:
+        return self.qsize() + self.spilled
+
+    def oldest(self) -> Optional[QueuedTaskRun]:
+        return self._queue[0] if self._queue else None
+
+    async def put(self, item: QueuedTaskRun) -> None:
+        if self._spill is None:
+            return await super().put(item)
+
+        async with self._spill_lock:
+            if self._spill.depth or self.full():
+                await run_sync_in_worker_thread(self._spill.append, item)
+            else:
+                super().put_nowait(item)
+
+    def get_nowait(self) -> QueuedTaskRun:
+        item = super().get_nowait()
+        self._start_refill()
+        return item
+
+    async def get_ready(self) -> QueuedTaskRun:
+        """
+        Gets an item without waiting for new ones to be put, first waiting for
+        spilled items to be read back if there are none in memory.
+        """
+        if self.empty() and (refill := self._start_refill()):
+            await asyncio.shield(refill)
+        return self.get_nowait()
+
+    def _start_refill(self) -> Optional[asyncio.Task]:
+        if self._refill_task is None and self.spilled:
+            self._refill_task = asyncio.get_running_loop().create_task(self._refill())
+        return self._refill_task
+
+    async def _refill(self) -> None:
+        try:
+            async with self._spill_lock:
+                while self._spill.depth and not self.full():
+                    spilled = await run_sync_in_worker_thread(
+                        self._spill.read, self.maxsize - self.qsize()
+                    )
+                    for item in spilled:
+                        super().put_nowait(item)
+        finally:
+            self._refill_task = None
+
+    def clear(self) -> None:
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+            self._refill_task = None
+        if self._spill is not None:
+            self._spill.clear()
 
 
 class TaskQueue:
@@ -24,9 +243,11 @@ class TaskQueue:
 
     _queue_size_configs: Dict[str, Tuple[int, int]] = {}
 
+    _spill_directory: Optional[Path] = None
+
     task_key: str
-    _scheduled_queue: asyncio.Queue
-    _retry_queue: asyncio.Queue
+    _scheduled_queue: SpillingQueue
+    _retry_queue: SpillingQueue
 
     @classmethod
     async def enqueue(cls, task_run: schemas.core.TaskRun) -> None:
@@ -52,36 +273,95 @@ class TaskQueue:
             cls._task_queues[task_key] = cls(task_key, *sizes)
         return cls._task_queues[task_key]
 
+    @classmethod
+    def all_metrics(cls) -> Dict[str, TaskQueueMetrics]:
+        """Reports the metrics of every task queue, by task key"""
+        return {
+            task_key: queue.metrics() for task_key, queue in cls._task_queues.items()
+        }
+
     @classmethod
     def reset(cls) -> None:
         """A unit testing utility to reset the state of the task queues subsystem"""
+        for queue in cls._task_queues.values():
+            queue._scheduled_queue.clear()
+            queue._retry_queue.clear()
         cls._task_queues.clear()
         cls._scheduled_tasks_already_restored = False
+        if cls._spill_directory is not None:
+            _remove_spill_directory(cls._spill_directory)
+            cls._spill_directory = None
+
+    @classmethod
+    def _spill_path(cls, name: str) -> Optional[Path]:
+        if not PREFECT_TASK_SCHEDULING_SPILL_TO_DISK:
+            return None
+
+        if cls._spill_directory is None:
+            # Each server process spills to a directory of its own, which is created
+            # with its first spill file
+            cls._spill_directory = (
+                PREFECT_TASK_SCHEDULING_SPILL_PATH.value() / uuid4().hex
+            )
+
+        return cls._spill_directory / f"{uuid4().hex}-{name}.jsonl"
 
     def __init__(self, task_key: str, scheduled_queue_size: int, retry_queue_size: int):
         self.task_key = task_key
-        self._scheduled_queue = asyncio.Queue(maxsize=scheduled_queue_size)
-        self._retry_queue = asyncio.Queue(maxsize=retry_queue_size)
+        self._scheduled_queue = SpillingQueue(
+            maxsize=scheduled_queue_size, spill_path=self._spill_path("scheduled")
+        )
+        self._retry_queue = SpillingQueue(
+            maxsize=retry_queue_size, spill_path=self._spill_path("retry")
+        )
+        self._delivered = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _deliver(self, queued: QueuedTaskRun) -> schemas.core.TaskRun:
+        wait = time.monotonic() - queued.enqueued_at
+        self._delivered += 1
+        self._total_wait += wait
+        self._max_wait = max(self._max_wait, wait)
+        return queued.task_run
 
     async def get(self) -> schemas.core.TaskRun:
         # First, check if there's anything in the retry queue
         try:
-            return self._retry_queue.get_nowait()
+            return self._deliver(await self._retry_queue.get_ready())
         except asyncio.QueueEmpty:
-            return await self._scheduled_queue.get()
+            return self._deliver(await self._scheduled_queue.get())
 
     def get_nowait(self) -> schemas.core.TaskRun:
         # First, check if there's anything in the retry queue
         try:
-            return self._retry_queue.get_nowait()
+            return self._deliver(self._retry_queue.get_nowait())
         except asyncio.QueueEmpty:
-            return self._scheduled_queue.get_nowait()
+            return self._deliver(self._scheduled_queue.get_nowait())
 
     async def put(self, task_run: schemas.core.TaskRun) -> None:
-        await self._scheduled_queue.put(task_run)
+        await self._scheduled_queue.put(QueuedTaskRun(task_run, time.monotonic()))
 
     async def retry(self, task_run: schemas.core.TaskRun) -> None:
-        await self._retry_queue.put(task_run)
+        await self._retry_queue.put(QueuedTaskRun(task_run, time.monotonic()))
+
+    def metrics(self) -> TaskQueueMetrics:
+        now = time.monotonic()
+        oldest = [
+            queued.enqueued_at
+            for queued in (self._retry_queue.oldest(), self._scheduled_queue.oldest())
+            if queued
+        ]
+        return TaskQueueMetrics(
+            task_key=self.task_key,
+            scheduled=self._scheduled_queue.depth(),
+            retries=self._retry_queue.depth(),
+            spilled=self._scheduled_queue.spilled + self._retry_queue.spilled,
+            delivered=self._delivered,
+            oldest_wait=now - min(oldest) if oldest else 0.0,
+            mean_wait=self._total_wait / self._delivered if self._delivered else 0.0,
+            max_wait=self._max_wait,
+        )
 
 
 class MultiQueue:
@@ -95,9 +375,16 @@ class MultiQueue:
     async def get(self) -> schemas.core.TaskRun:
         """Gets the next task_run from any of the given queues"""
         while True:
-            for queue in self._queues:
-                try:
-                    return queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    continue
-            await asyncio.sleep(0.01)
+            try:
+                return self.get_nowait()
+            except asyncio.QueueEmpty:
+                await asyncio.sleep(0.01)
+
+    def get_nowait(self) -> schemas.core.TaskRun:
+        """Gets the next task_run from any of the given queues without waiting"""
+        for queue in self._queues:
+            try:
+                return queue.get_nowait()
+            except asyncio.QueueEmpty:
+                continue
+        raise asyncio.QueueEmpty()
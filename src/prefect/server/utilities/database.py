@@ -427,6 +427,49 @@ def _date_diff_sqlite(element, compiler, **kwargs):
     )
 
 
+class time_bucket(FunctionElement):
+    """
+    Platform-independent truncation of a timestamp to the start of the bucket that
+    contains it, for buckets of a whole number of seconds counted from the epoch.
+    """
+
+    type = Timestamp()
+    name = "time_bucket"
+    # see https://docs.sqlalchemy.org/en/14/core/compiler.html#enabling-caching-support-for-custom-constructs
+    inherit_cache = False
+
+    def __init__(self, dt, seconds: int):
+        self.dt = dt
+        self.seconds = int(seconds)
+        super().__init__()
+
+
+@compiles(time_bucket, "postgresql")
+@compiles(time_bucket)
+def _time_bucket_postgresql(element, compiler, **kwargs):
+    seconds = sa.literal_column(str(element.seconds))
+    return compiler.process(
+        sa.func.to_timestamp(
+            sa.func.floor(sa.extract("epoch", element.dt) / seconds) * seconds
+        )
+    )
+
+
+@compiles(time_bucket, "sqlite")
+def _time_bucket_sqlite(element, compiler, **kwargs):
+    seconds = sa.literal_column(str(element.seconds))
+    return compiler.process(
+        sa.func.strftime(
+            "%Y-%m-%d %H:%M:%S.000000",
+            # integer division truncates to the start of the bucket; this avoids
+            # FLOOR, which SQLAlchemy provides as a Python function that fails on NULL
+            sa.cast(sa.func.strftime("%s", element.dt), sa.Integer).op("/")(seconds)
+            * seconds,
+            "unixepoch",
+        )
+    )
+
+
 class json_contains(FunctionElement):
     """
     Platform independent json_contains operator, tests if the
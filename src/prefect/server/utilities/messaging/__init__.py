@@ -153,6 +153,18 @@ class BrokerModule(Protocol):
     break_topic: Callable[[], AsyncContextManager[None]]
 
 
+def broker_delivers_across_processes() -> bool:
+    """
+    Whether the configured broker delivers the messages of a topic to consumers in
+    every process, whichever process published them.  A broker module declares this
+    with a module-level `DELIVERS_ACROSS_PROCESSES = True`, and must then deliver
+    every message to each differently `name`d group of consumers, sharing the
+    messages among the consumers with the same name.
+    """
+    module = importlib.import_module(PREFECT_MESSAGING_BROKER.value())
+    return getattr(module, "DELIVERS_ACROSS_PROCESSES", False)
+
+
 def create_publisher(
     topic: str, cache: Optional[Cache] = None, deduplicate_by: Optional[str] = None
 ) -> Publisher:
@@ -182,14 +194,17 @@ async def ephemeral_subscription(topic: str) -> AsyncGenerator[Dict[str, Any], N
         yield consumer_create_kwargs
 
 
-def create_consumer(topic: str, **kwargs) -> Consumer:
+def create_consumer(topic: str, name: Optional[str] = None, **kwargs) -> Consumer:
     """
     Creates a new consumer with the applications default settings.
     Args:
         topic: the topic to consume from
+        name: the consumer group to join, for brokers that deliver across processes
     Returns:
         a new Consumer instance
     """
     module = importlib.import_module(PREFECT_MESSAGING_BROKER.value())
     assert isinstance(module, BrokerModule)
+    if name is not None:
+        kwargs["name"] = name
     return module.Consumer(topic, **kwargs)
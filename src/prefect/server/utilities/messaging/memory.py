@@ -24,6 +24,9 @@ from prefect.server.utilities.messaging import Publisher as _Publisher
 
 logger = get_logger(__name__)
 
+# Messages are only delivered to the consumers in the process that published them
+DELIVERS_ACROSS_PROCESSES = False
+
 
 @dataclass
 class MemoryMessage:
@@ -184,7 +187,15 @@ class Publisher(_Publisher):
 
 
 class Consumer(_Consumer):
-    def __init__(self, topic: str, subscription: Optional[Subscription] = None):
+    def __init__(
+        self,
+        topic: str,
+        subscription: Optional[Subscription] = None,
+        name: Optional[str] = None,
+    ):
+        # every consumer has its own subscription in this process, so the name of
+        # its group only identifies it
+        self.name = name
         self.topic = Topic.by_name(topic)
         if not subscription:
             subscription = self.topic.subscribe()
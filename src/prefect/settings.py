@@ -40,15 +40,18 @@ dependent on the value of other settings or perform other dynamic effects.
 
 """
 
+import copy
 import logging
 import os
 import re
 import string
 import warnings
+import weakref
 from contextlib import contextmanager
 from datetime import timedelta
 from pathlib import Path
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
@@ -86,6 +89,9 @@ from prefect.exceptions import MissingProfileError
 from prefect.utilities.names import OBFUSCATED_PREFIX, obfuscate
 from prefect.utilities.pydantic import add_cloudpickle_reduction
 
+if TYPE_CHECKING:
+    from prefect.context import SettingsContext
+
 T = TypeVar("T")
 
 
@@ -164,6 +170,14 @@ class Setting(Generic[T]):
         PREFECT_API_URL.value_from(get_default_settings())
         ```
         """
+        if (
+            not bypass_callback
+            and not self.deprecated
+            and self.deprecated_renamed_from is None
+        ):
+            # Settings without deprecation handling are resolved once per `Settings`
+            return getattr(settings.resolved, self.name)
+
         value = settings.value_of(self, bypass_callback=bypass_callback)
 
         if not bypass_callback and self.deprecated and self.deprecated_when(value):
@@ -614,6 +628,22 @@ If the API does not support HTTP/2, this will have no effect and connections wil
 made via HTTP/1.1.
 """
 
+PREFECT_CLIENT_SHARED_TRANSPORT = Setting(bool, default=True)
+"""
+If true, all clients in a process connecting to the same API share one connection pool
+instead of each opening their own.
+
+With HTTP/2, requests from all clients are multiplexed over the shared connections.
+"""
+
+PREFECT_CLIENT_MAX_CONNECTIONS = Setting(int, default=16)
+"""
+The maximum number of connections a client connection pool may open to the API. When
+`PREFECT_CLIENT_SHARED_TRANSPORT` is enabled, sync clients share one pool for the
+whole process, while async clients share one pool per event loop, since connections
+cannot be used across event loops. Each of these pools may open this many connections.
+"""
+
 
 PREFECT_CLIENT_MAX_RETRIES = Setting(int, default=5)
 """
@@ -726,6 +756,12 @@ The default setting for persisting results when not otherwise specified. If enab
 flow and task results will be persisted unless they opt out.
 """
 
+PREFECT_RESULTS_READ_CONCURRENCY = Setting(int, default=16, gt=0)
+"""
+The number of persisted results that are read and deserialized concurrently when
+many results are retrieved at once, as by `PrefectFutureList.result`.
+"""
+
 PREFECT_TASKS_REFRESH_CACHE = Setting(
     bool,
     default=False,
@@ -735,6 +771,14 @@ If `True`, enables a refresh of cached results: re-executing the
 task will refresh the cached results. Defaults to `False`.
 """
 
+PREFECT_BLOCKS_CACHE_TTL = Setting(timedelta, default=timedelta(seconds=0))
+"""
+How long `Block.load` may reuse a block document it has already loaded in this process
+before reading it from the API again.  Cached blocks are also invalidated when they are
+saved or deleted in this process, and when the API streams events for changes to block
+documents.  Defaults to zero, which disables the cache.
+"""
+
 PREFECT_TASK_DEFAULT_RETRIES = Setting(int, default=0)
 """
 This value sets the default number of retries for all tasks.
@@ -774,6 +818,13 @@ PREFECT_LOCAL_STORAGE_PATH = Setting(
 )
 """The path to a block storage directory to store things in."""
 
+PREFECT_FILESYSTEM_TRANSFER_WORKERS = Setting(int, default=16, gt=0)
+"""
+The number of files that `LocalFileSystem` and `RemoteFileSystem` blocks copy
+concurrently when getting or putting a directory, or read concurrently when reading
+many paths at once.
+"""
+
 PREFECT_MEMO_STORE_PATH = Setting(
     Path,
     default=Path("${PREFECT_HOME}") / "memo_store.toml",
@@ -1112,6 +1163,49 @@ have exceeded their scheduled start time by this many seconds. Defaults
 to `5` seconds.
 """
 
+PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_LOOP_SECONDS = Setting(
+    float,
+    default=30,
+)
+"""The run history rollups service will recompute the rollups of recently
+updated runs this often. Run history read from rollups may lag behind by about
+this long. Defaults to `30`.
+"""
+
+PREFECT_API_SERVICES_LOG_COMPACTOR_LOOP_SECONDS = Setting(
+    float,
+    default=60,
+)
+"""The log compactor service will look for logs to compact this often.
+Defaults to `60`.
+"""
+
+PREFECT_API_SERVICES_LOG_COMPACTOR_COMPACT_AFTER = Setting(
+    timedelta,
+    default=timedelta(minutes=60),
+)
+"""The log compactor service will compact logs once their timestamp is older than
+this. Defaults to 60 minutes.
+"""
+
+PREFECT_API_SERVICES_LOG_COMPACTOR_SEGMENT_SIZE = Setting(int, default=10_000, gt=0)
+"""The most logs the log compactor service will write to a single segment.
+Defaults to `10000`.
+"""
+
+PREFECT_API_SERVICES_LOG_COMPACTOR_STORAGE_PATH = Setting(Optional[Path], default=None)
+"""A local directory the log compactor service will write compacted log segments
+to. If not set, segments are stored in the database. Defaults to `None`.
+"""
+
+PREFECT_API_SERVICES_LOG_COMPACTOR_RETENTION_PERIOD = Setting(
+    Optional[timedelta], default=None
+)
+"""The log compactor service will delete compacted log segments once all of
+their logs are older than this. If not set, segments are kept indefinitely.
+Defaults to `None`.
+"""
+
 PREFECT_API_SERVICES_PAUSE_EXPIRATIONS_LOOP_SECONDS = Setting(
     float,
     default=5,
@@ -1266,6 +1360,25 @@ If disabled, you will need to run this service separately to have runs past thei
 scheduled start time marked as late.
 """
 
+PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED = Setting(
+    bool,
+    default=False,
+)
+"""Whether or not to start the run history rollups service in the server
+application, and to answer run history queries from its rollups when their
+interval allows it. Defaults to `False`.
+"""
+
+PREFECT_API_SERVICES_LOG_COMPACTOR_ENABLED = Setting(
+    bool,
+    default=False,
+)
+"""Whether or not to start the log compactor service in the server application.
+Logs that have already been compacted are read regardless. While it is disabled,
+the server only checks for compacted logs once, so it should be enabled for every
+server process that reads logs while the compactor runs. Defaults to `False`.
+"""
+
 PREFECT_API_SERVICES_FLOW_RUN_NOTIFICATIONS_ENABLED = Setting(
     bool,
     default=True,
@@ -1357,6 +1470,36 @@ PREFECT_RUNNER_SERVER_ENABLE = Setting(bool, default=False)
 Whether or not to enable the runner's webserver.
 """
 
+PREFECT_RUNNER_CODE_CACHE_ENABLED = Setting(bool, default=False)
+"""
+Whether or not to keep a local, content-addressed cache of the flow code pulled from
+remote storage, so that files which have not changed are linked from the cache rather
+than downloaded again for each flow run on this machine.  Git repositories are kept as
+shared mirrors in the cache, which flow runs clone locally.
+"""
+
+PREFECT_RUNNER_CODE_CACHE_PATH = Setting(
+    Path,
+    default=Path("${PREFECT_HOME}") / "code-cache",
+    value_callback=template_with_settings(PREFECT_HOME),
+)
+"""
+The path to the local cache of pulled flow code.
+"""
+
+PREFECT_RUNNER_CODE_CACHE_MAX_SIZE = Setting(int, default=5 * 1024**3, gt=0)
+"""
+The maximum size, in bytes, of the files in the local code cache.  When the cache grows
+beyond this, the least recently used files are evicted.  Mirrors of git repositories are
+not included.
+"""
+
+PREFECT_RUNNER_CODE_CACHE_DOWNLOAD_WORKERS = Setting(int, default=8, gt=0)
+"""
+The number of files to download concurrently when pulling code into the local code
+cache.
+"""
+
 PREFECT_DEPLOYMENT_SCHEDULE_MAX_SCHEDULED_RUNS = Setting(int, default=50)
 """
 The maximum number of scheduled runs to create for a deployment.
@@ -1427,6 +1570,22 @@ PREFECT_TASK_SCHEDULING_MAX_RETRY_QUEUE_SIZE = Setting(
 The maximum number of retries to queue for submission.
 """
 
+PREFECT_TASK_SCHEDULING_SPILL_TO_DISK = Setting(bool, default=False)
+"""
+Whether task runs should be spilled to local disk when a task queue is full, rather
+than making the server wait for room in the queue. Defaults to `False`.
+"""
+
+PREFECT_TASK_SCHEDULING_SPILL_PATH = Setting(
+    Path,
+    default=Path("${PREFECT_HOME}") / "task-queues",
+    value_callback=template_with_settings(PREFECT_HOME),
+)
+"""
+The directory task queues spill task runs to when they are full. Each server process
+spills to a directory of its own within it, which is removed when the process exits.
+"""
+
 PREFECT_TASK_SCHEDULING_PENDING_TASK_TIMEOUT = Setting(
     timedelta,
     default=timedelta(0),
@@ -1532,6 +1691,24 @@ PREFECT_API_SERVICES_TRIGGERS_ENABLED = Setting(bool, default=True)
 Whether or not to start the triggers service in the server application.
 """
 
+PREFECT_API_SERVICES_TRIGGERS_SHARDS = Setting(int, default=1, gt=0)
+"""
+The number of shards to split trigger evaluation into.  Each automation is evaluated by
+exactly one shard, and each shard consumes every event as its own consumer group, so
+more than one shard requires a messaging broker that delivers every event to each
+consumer group in every process, declared by the broker module's
+`DELIVERS_ACROSS_PROCESSES`.
+Automation changes reach the shards in other processes within the triggers service's
+periodic evaluation interval.
+"""
+
+PREFECT_API_SERVICES_TRIGGERS_SHARD = Setting(Optional[int], default=None, ge=0)
+"""
+The shard of trigger evaluation to run in this server, less than
+`PREFECT_API_SERVICES_TRIGGERS_SHARDS`.  Run one server per shard to spread trigger
+evaluation across processes.  Required when there is more than one shard.
+"""
+
 PREFECT_EVENTS_EXPIRED_BUCKET_BUFFER = Setting(timedelta, default=timedelta(seconds=60))
 """
 The amount of time to retain expired automation buckets
@@ -1542,6 +1719,13 @@ PREFECT_EVENTS_PROACTIVE_GRANULARITY = Setting(timedelta, default=timedelta(seco
 How frequently proactive automations are evaluated
 """
 
+PREFECT_EVENTS_FOLLOWER_BUFFER_SIZE = Setting(int, default=10_000, gt=0)
+"""
+The maximum number of out-of-order events each shard of trigger evaluation holds in
+memory while they wait for the event they follow.  Events beyond this are stored in
+the database until their preceding event arrives.
+"""
+
 PREFECT_API_SERVICES_EVENT_PERSISTER_ENABLED = Setting(bool, default=True)
 """
 Whether or not to start the event persister service in the server application.
@@ -1557,11 +1741,67 @@ PREFECT_API_SERVICES_EVENT_PERSISTER_FLUSH_INTERVAL = Setting(float, default=5,
 The maximum number of seconds between flushes of the event persister.
 """
 
+PREFECT_API_SERVICES_EVENT_PERSISTER_MAX_BATCH_SIZE = Setting(int, default=1_000, gt=0)
+"""
+The largest batch the event persister will grow to while it keeps up with incoming
+events. Starting from `PREFECT_API_SERVICES_EVENT_PERSISTER_BATCH_SIZE`, the batch size
+is doubled after fast flushes and halved after slow ones.
+"""
+
+PREFECT_API_SERVICES_EVENT_PERSISTER_TARGET_FLUSH_LATENCY = Setting(
+    float, default=1.0, gt=0.0
+)
+"""
+The number of seconds the event persister aims to spend writing each batch when
+adapting its batch size.
+"""
+
+PREFECT_API_SERVICES_EVENT_PERSISTER_MAX_QUEUE_SIZE = Setting(int, default=10_000, gt=0)
+"""
+The most events the event persister will hold in memory while waiting to write them.
+When the queue is full, the event persister stops consuming messages until the
+database catches up.
+"""
+
+PREFECT_API_SERVICES_EVENT_PERSISTER_MAX_RETRIES = Setting(int, default=5, ge=0)
+"""
+The number of times the event persister will retry writing a batch of events, with
+exponential backoff, before splitting it to find and drop any events that can't be
+written.
+"""
+
+PREFECT_API_SERVICES_EVENT_PERSISTER_BULK_INSERT = Setting(bool, default=False)
+"""
+Whether to write events to PostgreSQL with a binary `COPY` into a staging table,
+rather than with `INSERT` statements. Has no effect on SQLite.
+"""
+
 PREFECT_EVENTS_RETENTION_PERIOD = Setting(timedelta, default=timedelta(days=7))
 """
 The amount of time to retain events in the database.
 """
 
+PREFECT_EVENTS_PARTITION_INTERVAL = Setting(
+    Literal["day", "hour"],
+    default="day",
+)
+"""
+The span of time covered by each partition of the events tables. On PostgreSQL,
+events are stored in time-based partitions that are dropped wholesale once every
+event in them is older than `PREFECT_EVENTS_RETENTION_PERIOD`.
+"""
+
+PREFECT_EVENTS_PARTITIONS_AHEAD = Setting(int, default=3, gt=0)
+"""
+The number of events table partitions to create ahead of the current time.
+"""
+
+PREFECT_EVENTS_RETENTION_BATCH_SIZE = Setting(int, default=10_000, gt=0)
+"""
+The maximum number of events deleted in one statement when trimming events that
+can't be dropped with their partition, such as all events on SQLite.
+"""
+
 PREFECT_API_EVENTS_STREAM_OUT_ENABLED = Setting(bool, default=True)
 """
 Whether or not to allow streaming events out of via websockets.
@@ -1619,6 +1859,58 @@ SettingsFieldsMixin: Type[BaseSettings] = create_model(
 )
 
 
+_RESOLVED_SETTINGS: Dict[int, "ResolvedSettings"] = {}
+
+
+class ResolvedSettings:
+    """
+    A read-only view of the values of a `Settings` object after their `value_callback`.
+
+    Each value is resolved on first access and stored as an attribute, so reading it
+    again is a plain attribute lookup. Lists, sets and dictionaries are kept aside
+    instead, and each read returns a copy of them, so that callers can't change the
+    snapshot or the settings it came from. `Settings` objects are frozen, so a value
+    only changes between resolutions if its callback inspects the outside world; the
+    default database location, for example, is chosen once per `Settings` object.
+
+    Example:
+    ```python
+    from prefect.settings import get_current_settings
+    get_current_settings().resolved.PREFECT_HOME  # PosixPath('/home/me/.prefect')
+    ```
+    """
+
+    def __init__(self, settings: "Settings") -> None:
+        # A weak reference, so that settings objects can be freed along with their
+        # resolved values
+        object.__setattr__(self, "_settings", weakref.ref(settings))
+        object.__setattr__(self, "_mutable", {})
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for mutable values and values that have not been resolved yet
+        mutable: Dict[str, Any] = self.__dict__["_mutable"]
+        if name in mutable:
+            return copy.copy(mutable[name])
+
+        setting = SETTING_VARIABLES.get(name)
+        if setting is None:
+            raise AttributeError(f"{name!r} is not a Prefect setting.")
+
+        value = self._settings().value_of(setting)
+        if isinstance(value, (list, set, dict)):
+            mutable[name] = value
+            return copy.copy(value)
+
+        object.__setattr__(self, name, value)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Resolved settings are read-only.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Resolved settings are read-only.")
+
+
 # Defining a class after this that inherits the dynamic class rather than setting
 # __base__ to the following class ensures that mkdocstrings properly generates
 # reference documentation. It does not support module-level variables, even if they are
@@ -1644,6 +1936,20 @@ class Settings(SettingsFieldsMixin):
     ```
     """
 
+    @property
+    def resolved(self) -> ResolvedSettings:
+        """
+        The values of these settings after their `value_callback`, resolved once.
+        """
+        # Kept outside of the model so that it doesn't take part in comparisons
+        # or copies; private attributes would also be slower to read
+        try:
+            return _RESOLVED_SETTINGS[id(self)]
+        except KeyError:
+            resolved = _RESOLVED_SETTINGS[id(self)] = ResolvedSettings(self)
+            weakref.finalize(self, _RESOLVED_SETTINGS.pop, id(self), None)
+            return resolved
+
     def value_of(self, setting: Setting[T], bypass_callback: bool = False) -> T:
         """
         Retrieve a setting's value.
@@ -1787,6 +2093,7 @@ class Settings(SettingsFieldsMixin):
 
 _DEFAULTS_CACHE: Optional[Settings] = None
 _FROM_ENV_CACHE: Dict[int, Settings] = {}
+_SETTINGS_CONTEXT: Optional[Type["SettingsContext"]] = None
 
 
 def get_current_settings() -> Settings:
@@ -1794,9 +2101,16 @@ def get_current_settings() -> Settings:
     Returns a settings object populated with values from the current settings context
     or, if no settings context is active, the environment.
     """
-    from prefect.context import SettingsContext
+    global _SETTINGS_CONTEXT
+
+    if _SETTINGS_CONTEXT is None:
+        # Imported on first use, and kept for later ones, since the context module
+        # imports this one
+        from prefect.context import SettingsContext
+
+        _SETTINGS_CONTEXT = SettingsContext
 
-    settings_context = SettingsContext.get()
+    settings_context = _SETTINGS_CONTEXT.get()
     if settings_context is not None:
         return settings_context.settings
 
@@ -1,7 +1,7 @@
 import inspect
 import logging
 import time
-from contextlib import ExitStack, contextmanager
+from contextlib import ExitStack, asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
 from textwrap import dedent
 from typing import (
@@ -13,6 +13,7 @@ from typing import (
     Generator,
     Generic,
     Iterable,
+    List,
     Literal,
     Optional,
     Sequence,
@@ -28,10 +29,11 @@ import pendulum
 from typing_extensions import ParamSpec
 
 from prefect import Task
-from prefect.client.orchestration import SyncPrefectClient
+from prefect.client.orchestration import PrefectClient, SyncPrefectClient
 from prefect.client.schemas import TaskRun
 from prefect.client.schemas.objects import State, TaskRunInput
 from prefect.context import (
+    AsyncClientContext,
     ClientContext,
     FlowRunContext,
     TaskRunContext,
@@ -64,14 +66,15 @@ from prefect.states import (
     return_value_to_state,
 )
 from prefect.transactions import Transaction, transaction
-from prefect.utilities.annotations import NotSet
+from prefect.utilities.annotations import NotSet, quote
 from prefect.utilities.asyncutils import run_coro_as_sync
 from prefect.utilities.callables import call_with_parameters, parameters_to_args_kwargs
-from prefect.utilities.collections import visit_collection
+from prefect.utilities.collections import StopVisiting, visit_collection
 from prefect.utilities.engine import (
     _get_hook_name,
     emit_task_run_state_change_event,
     link_state_to_result,
+    propose_state,
     propose_state_sync,
     resolve_to_final_result,
 )
@@ -87,7 +90,7 @@ class TaskRunTimeoutError(TimeoutError):
 
 
 @dataclass
-class TaskRunEngine(Generic[P, R]):
+class BaseTaskRunEngine(Generic[P, R]):
     task: Union[Task[P, R], Task[P, Coroutine[Any, Any, R]]]
     logger: logging.Logger = field(default_factory=lambda: get_logger("engine"))
     parameters: Optional[Dict[str, Any]] = None
@@ -101,7 +104,6 @@ class TaskRunEngine(Generic[P, R]):
     _raised: Union[Exception, Type[NotSet]] = NotSet
     _initial_run_context: Optional[TaskRunContext] = None
     _is_started: bool = False
-    _client: Optional[SyncPrefectClient] = None
     _task_name_set: bool = False
     _last_event: Optional[Event] = None
 
@@ -109,12 +111,6 @@ class TaskRunEngine(Generic[P, R]):
         if self.parameters is None:
             self.parameters = {}
 
-    @property
-    def client(self) -> SyncPrefectClient:
-        if not self._is_started or self._client is None:
-            raise RuntimeError("Engine has not started.")
-        return self._client
-
     @property
     def state(self) -> State:
         if not self.task_run:
@@ -146,41 +142,6 @@ class TaskRunEngine(Generic[P, R]):
             )
             return False
 
-    def call_hooks(self, state: State = None) -> Iterable[Callable]:
-        if state is None:
-            state = self.state
-        task = self.task
-        task_run = self.task_run
-
-        if not task_run:
-            raise ValueError("Task run is not set")
-
-        if state.is_failed() and task.on_failure_hooks:
-            hooks = task.on_failure_hooks
-        elif state.is_completed() and task.on_completion_hooks:
-            hooks = task.on_completion_hooks
-        else:
-            hooks = None
-
-        for hook in hooks or []:
-            hook_name = _get_hook_name(hook)
-
-            try:
-                self.logger.info(
-                    f"Running hook {hook_name!r} in response to entering state"
-                    f" {state.name!r}"
-                )
-                result = hook(task, task_run, state)
-                if inspect.isawaitable(result):
-                    run_coro_as_sync(result)
-            except Exception:
-                self.logger.error(
-                    f"An error was encountered while running hook {hook_name!r}",
-                    exc_info=True,
-                )
-            else:
-                self.logger.info(f"Hook {hook_name!r} finished running successfully")
-
     def compute_transaction_key(self) -> str:
         key = None
         if self.task.cache_policy:
@@ -201,7 +162,7 @@ class TaskRunEngine(Generic[P, R]):
             key = _format_user_supplied_storage_key(self.task.result_storage_key)
         return key
 
-    def _resolve_parameters(self):
+    def _resolve_parameters(self, result_by_state: Optional[Dict[State, Any]] = None):
         if not self.parameters:
             return {}
 
@@ -214,7 +175,7 @@ class TaskRunEngine(Generic[P, R]):
                     return_data=True,
                     max_depth=-1,
                     remove_annotations=True,
-                    context={},
+                    context={"result_by_state": result_by_state or {}},
                 )
             except UpstreamTaskError:
                 raise
@@ -227,7 +188,9 @@ class TaskRunEngine(Generic[P, R]):
 
         self.parameters = resolved_parameters
 
-    def _wait_for_dependencies(self):
+    def _wait_for_dependencies(
+        self, result_by_state: Optional[Dict[State, Any]] = None
+    ):
         if not self.wait_for:
             return
 
@@ -237,8 +200,117 @@ class TaskRunEngine(Generic[P, R]):
             return_data=False,
             max_depth=-1,
             remove_annotations=True,
-            context={"current_task_run": self.task_run, "current_task": self.task},
+            context={
+                "current_task_run": self.task_run,
+                "current_task": self.task,
+                "result_by_state": result_by_state or {},
+            },
+        )
+
+    def is_running(self) -> bool:
+        """Whether or not the engine is currently running a task."""
+        if (task_run := getattr(self, "task_run", None)) is None:
+            return False
+        return task_run.state.is_running() or task_run.state.is_scheduled()
+
+    def _log_finished_state(self):
+        # If debugging, use the more complete `repr` than the usual `str` description
+        display_state = repr(self.state) if PREFECT_DEBUG_MODE else str(self.state)
+        level = logging.INFO if self.state.is_completed() else logging.ERROR
+        msg = f"Finished in state {display_state}"
+        if self.state.is_pending():
+            msg += (
+                "\nPlease wait for all submitted tasks to complete"
+                " before exiting your flow by calling `.wait()` on the "
+                "`PrefectFuture` returned from your `.submit()` calls."
+            )
+            msg += dedent(
+                """
+
+                Example:
+
+                from prefect import flow, task
+
+                @task
+                def say_hello(name):
+                    print f"Hello, {name}!"
+
+                @flow
+                def example_flow():
+                    future = say_hello.submit(name="Marvin)
+                    future.wait()
+
+                example_flow()
+                          """
+            )
+        self.logger.log(
+            level=level,
+            msg=msg,
+        )
+
+    @contextmanager
+    def transaction_context(self) -> Generator[Transaction, None, None]:
+        result_factory = getattr(TaskRunContext.get(), "result_factory", None)
+
+        # refresh cache setting is now repurposes as overwrite transaction record
+        overwrite = (
+            self.task.refresh_cache
+            if self.task.refresh_cache is not None
+            else PREFECT_TASKS_REFRESH_CACHE.value()
         )
+        with transaction(
+            key=self.compute_transaction_key(),
+            store=ResultFactoryStore(result_factory=result_factory),
+            overwrite=overwrite,
+            logger=self.logger,
+        ) as txn:
+            yield txn
+
+
+@dataclass
+class TaskRunEngine(BaseTaskRunEngine[P, R]):
+    _client: Optional[SyncPrefectClient] = None
+
+    @property
+    def client(self) -> SyncPrefectClient:
+        if not self._is_started or self._client is None:
+            raise RuntimeError("Engine has not started.")
+        return self._client
+
+    def call_hooks(self, state: State = None) -> Iterable[Callable]:
+        if state is None:
+            state = self.state
+        task = self.task
+        task_run = self.task_run
+
+        if not task_run:
+            raise ValueError("Task run is not set")
+
+        if state.is_failed() and task.on_failure_hooks:
+            hooks = task.on_failure_hooks
+        elif state.is_completed() and task.on_completion_hooks:
+            hooks = task.on_completion_hooks
+        else:
+            hooks = None
+
+        for hook in hooks or []:
+            hook_name = _get_hook_name(hook)
+
+            try:
+                self.logger.info(
+                    f"Running hook {hook_name!r} in response to entering state"
+                    f" {state.name!r}"
+                )
+                result = hook(task, task_run, state)
+                if inspect.isawaitable(result):
+                    run_coro_as_sync(result)
+            except Exception:
+                self.logger.error(
+                    f"An error was encountered while running hook {hook_name!r}",
+                    exc_info=True,
+                )
+            else:
+                self.logger.info(f"Hook {hook_name!r} finished running successfully")
 
     def begin_run(self):
         try:
@@ -545,51 +617,10 @@ class TaskRunEngine(Generic[P, R]):
                     self.handle_crash(exc)
                     raise
                 finally:
-                    # If debugging, use the more complete `repr` than the usual `str` description
-                    display_state = (
-                        repr(self.state) if PREFECT_DEBUG_MODE else str(self.state)
-                    )
-                    level = logging.INFO if self.state.is_completed() else logging.ERROR
-                    msg = f"Finished in state {display_state}"
-                    if self.state.is_pending():
-                        msg += (
-                            "\nPlease wait for all submitted tasks to complete"
-                            " before exiting your flow by calling `.wait()` on the "
-                            "`PrefectFuture` returned from your `.submit()` calls."
-                        )
-                        msg += dedent(
-                            """
-
-                            Example:
-
-                            from prefect import flow, task
-
-                            @task
-                            def say_hello(name):
-                                print f"Hello, {name}!"
-
-                            @flow
-                            def example_flow():
-                                future = say_hello.submit(name="Marvin)
-                                future.wait()
-
-                            example_flow()
-                                      """
-                        )
-                    self.logger.log(
-                        level=level,
-                        msg=msg,
-                    )
-
+                    self._log_finished_state()
                     self._is_started = False
                     self._client = None
 
-    def is_running(self) -> bool:
-        """Whether or not the engine is currently running a task."""
-        if (task_run := getattr(self, "task_run", None)) is None:
-            return False
-        return task_run.state.is_running() or task_run.state.is_scheduled()
-
     async def wait_until_ready(self):
         """Waits until the scheduled time (if its the future), then enters Running."""
         if scheduled_time := self.state.state_details.scheduled_time:
@@ -619,24 +650,6 @@ class TaskRunEngine(Generic[P, R]):
             finally:
                 self.call_hooks()
 
-    @contextmanager
-    def transaction_context(self) -> Generator[Transaction, None, None]:
-        result_factory = getattr(TaskRunContext.get(), "result_factory", None)
-
-        # refresh cache setting is now repurposes as overwrite transaction record
-        overwrite = (
-            self.task.refresh_cache
-            if self.task.refresh_cache is not None
-            else PREFECT_TASKS_REFRESH_CACHE.value()
-        )
-        with transaction(
-            key=self.compute_transaction_key(),
-            store=ResultFactoryStore(result_factory=result_factory),
-            overwrite=overwrite,
-            logger=self.logger,
-        ) as txn:
-            yield txn
-
     @contextmanager
     def run_context(self):
         timeout_context = timeout_async if self.task.isasync else timeout
@@ -684,82 +697,564 @@ class TaskRunEngine(Generic[P, R]):
             return result
 
 
-def run_task_sync(
-    task: Task[P, R],
-    task_run_id: Optional[UUID] = None,
-    task_run: Optional[TaskRun] = None,
-    parameters: Optional[Dict[str, Any]] = None,
-    wait_for: Optional[Iterable[PrefectFuture]] = None,
-    return_type: Literal["state", "result"] = "result",
-    dependencies: Optional[Dict[str, Set[TaskRunInput]]] = None,
-    context: Optional[Dict[str, Any]] = None,
-) -> Union[R, State, None]:
-    engine = TaskRunEngine[P, R](
-        task=task,
-        parameters=parameters,
-        task_run=task_run,
-        wait_for=wait_for,
-        context=context,
-    )
+@dataclass
+class AsyncTaskRunEngine(BaseTaskRunEngine[P, R]):
+    """
+    A task run engine for async tasks.
 
-    with engine.start(task_run_id=task_run_id, dependencies=dependencies):
-        while engine.is_running():
-            run_coro_as_sync(engine.wait_until_ready())
-            with engine.run_context(), engine.transaction_context() as txn:
-                engine.call_task_fn(txn)
+    All orchestration calls are made with the async `PrefectClient` of the current
+    event loop, so many async task runs can execute concurrently on a single loop
+    without a thread per task run.
+    """
 
-    return engine.state if return_type == "state" else engine.result()
+    _client: Optional[PrefectClient] = None
 
+    @property
+    def client(self) -> PrefectClient:
+        if not self._is_started or self._client is None:
+            raise RuntimeError("Engine has not started.")
+        return self._client
 
-async def run_task_async(
-    task: Task[P, R],
-    task_run_id: Optional[UUID] = None,
-    task_run: Optional[TaskRun] = None,
-    parameters: Optional[Dict[str, Any]] = None,
-    wait_for: Optional[Iterable[PrefectFuture]] = None,
-    return_type: Literal["state", "result"] = "result",
-    dependencies: Optional[Dict[str, Set[TaskRunInput]]] = None,
-    context: Optional[Dict[str, Any]] = None,
-) -> Union[R, State, None]:
-    engine = TaskRunEngine[P, R](
-        task=task,
-        parameters=parameters,
-        task_run=task_run,
-        wait_for=wait_for,
-        context=context,
-    )
+    async def call_hooks(self, state: State = None) -> None:
+        if state is None:
+            state = self.state
+        task = self.task
+        task_run = self.task_run
 
-    with engine.start(task_run_id=task_run_id, dependencies=dependencies):
-        while engine.is_running():
-            await engine.wait_until_ready()
-            with engine.run_context(), engine.transaction_context() as txn:
-                await engine.call_task_fn(txn)
+        if not task_run:
+            raise ValueError("Task run is not set")
 
-    return engine.state if return_type == "state" else engine.result()
+        if state.is_failed() and task.on_failure_hooks:
+            hooks = task.on_failure_hooks
+        elif state.is_completed() and task.on_completion_hooks:
+            hooks = task.on_completion_hooks
+        else:
+            hooks = None
 
+        for hook in hooks or []:
+            hook_name = _get_hook_name(hook)
 
-def run_generator_task_sync(
-    task: Task[P, R],
-    task_run_id: Optional[UUID] = None,
-    task_run: Optional[TaskRun] = None,
-    parameters: Optional[Dict[str, Any]] = None,
-    wait_for: Optional[Iterable[PrefectFuture]] = None,
-    return_type: Literal["state", "result"] = "result",
-    dependencies: Optional[Dict[str, Set[TaskRunInput]]] = None,
-    context: Optional[Dict[str, Any]] = None,
-) -> Generator[R, None, None]:
-    if return_type != "result":
-        raise ValueError("The return_type for a generator task must be 'result'")
+            try:
+                self.logger.info(
+                    f"Running hook {hook_name!r} in response to entering state"
+                    f" {state.name!r}"
+                )
+                result = hook(task, task_run, state)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                self.logger.error(
+                    f"An error was encountered while running hook {hook_name!r}",
+                    exc_info=True,
+                )
+            else:
+                self.logger.info(f"Hook {hook_name!r} finished running successfully")
 
-    engine = TaskRunEngine[P, R](
-        task=task,
-        parameters=parameters,
-        task_run=task_run,
-        wait_for=wait_for,
-        context=context,
-    )
+    async def _fetch_upstream_results(self) -> Dict[State, Any]:
+        """
+        Wait for any futures in the parameters or `wait_for` and fetch the results of
+        the upstream states without blocking the event loop, since their task runs may
+        be scheduled on this same loop.
+        """
+        futures: List[PrefectFuture] = []
+        states: List[State] = []
 
-    with engine.start(task_run_id=task_run_id, dependencies=dependencies):
+        def collect_futures_and_states(expr, context):
+            # Expressions inside quotes should not be traversed
+            if isinstance(context.get("annotation"), quote):
+                raise StopVisiting()
+
+            if isinstance(expr, PrefectFuture):
+                futures.append(expr)
+            elif isinstance(expr, State):
+                states.append(expr)
+            return expr
+
+        visit_collection(
+            [self.parameters, self.wait_for],
+            visit_fn=collect_futures_and_states,
+            return_data=False,
+            max_depth=-1,
+            context={},
+        )
+
+        for future in futures:
+            await future.wait_async()
+            states.append(future.state)
+
+        result_by_state = {}
+        for state in states:
+            # only completed and failed upstreams are resolved to their results
+            if state in result_by_state or not (
+                state.is_completed() or state.is_failed()
+            ):
+                continue
+            result = state.result(raise_on_failure=False, fetch=True)
+            if inspect.isawaitable(result):
+                result = await result
+            result_by_state[state] = result
+        return result_by_state
+
+    async def begin_run(self):
+        try:
+            result_by_state = await self._fetch_upstream_results()
+            self._resolve_parameters(result_by_state)
+            self._wait_for_dependencies(result_by_state)
+        except UpstreamTaskError as upstream_exc:
+            state = await self.set_state(
+                Pending(
+                    name="NotReady",
+                    message=str(upstream_exc),
+                ),
+                # if orchestrating a run already in a pending state, force orchestration to
+                # update the state name
+                force=self.state.is_pending(),
+            )
+            return
+
+        new_state = Running()
+        state = await self.set_state(new_state)
+
+        # TODO: this is temporary until the API stops rejecting state transitions
+        # and the client / transaction store becomes the source of truth
+        # this is a bandaid caused by the API storing a Completed state with a bad
+        # result reference that no longer exists
+        if state.is_completed():
+            try:
+                await state.result(retry_result_failure=False)
+            except Exception:
+                state = await self.set_state(new_state, force=True)
+
+        BACKOFF_MAX = 10
+        backoff_count = 0
+
+        # TODO: Could this listen for state change events instead of polling?
+        while state.is_pending() or state.is_paused():
+            if backoff_count < BACKOFF_MAX:
+                backoff_count += 1
+            interval = clamped_poisson_interval(
+                average_interval=backoff_count, clamping_factor=0.3
+            )
+            await anyio.sleep(interval)
+            state = await self.set_state(new_state)
+
+    async def set_state(self, state: State, force: bool = False) -> State:
+        last_state = self.state
+        if not self.task_run:
+            raise ValueError("Task run is not set")
+        try:
+            new_state = await propose_state(
+                self.client, state, task_run_id=self.task_run.id, force=force
+            )
+        except Pause as exc:
+            # We shouldn't get a pause signal without a state, but if this happens,
+            # just use a Paused state to assume an in-process pause.
+            new_state = exc.state if exc.state else Paused()
+            if new_state.state_details.pause_reschedule:
+                # If we're being asked to pause and reschedule, we should exit the
+                # task and expect to be resumed later.
+                raise
+
+        # currently this is a hack to keep a reference to the state object
+        # that has an in-memory result attached to it; using the API state
+
+        # could result in losing that reference
+        self.task_run.state = new_state
+        # emit a state change event
+        self._last_event = emit_task_run_state_change_event(
+            task_run=self.task_run,
+            initial_state=last_state,
+            validated_state=self.task_run.state,
+            follows=self._last_event,
+        )
+        return new_state
+
+    async def result(self, raise_on_failure: bool = True) -> "Union[R, State, None]":
+        if self._return_value is not NotSet:
+            # if the return value is a BaseResult, we need to fetch it
+            if isinstance(self._return_value, BaseResult):
+                return await self._return_value.get()
+
+            # otherwise, return the value as is
+            return self._return_value
+
+        if self._raised is not NotSet:
+            # if the task raised an exception, raise it
+            if raise_on_failure:
+                raise self._raised
+
+            # otherwise, return the exception
+            return self._raised
+
+    async def handle_success(self, result: R, transaction: Transaction) -> R:
+        result_factory = getattr(TaskRunContext.get(), "result_factory", None)
+        if result_factory is None:
+            raise ValueError("Result factory is not set")
+
+        if self.task.cache_expiration is not None:
+            expiration = pendulum.now("utc") + self.task.cache_expiration
+        else:
+            expiration = None
+
+        terminal_state = await return_value_to_state(
+            result,
+            result_factory=result_factory,
+            key=transaction.key,
+            expiration=expiration,
+            # defer persistence to transaction commit
+            defer_persistence=True,
+        )
+        transaction.stage(
+            terminal_state.data,
+            on_rollback_hooks=self.task.on_rollback_hooks,
+            on_commit_hooks=self.task.on_commit_hooks,
+        )
+        if transaction.is_committed():
+            terminal_state.name = "Cached"
+        await self.set_state(terminal_state)
+        self._return_value = result
+        return result
+
+    async def handle_retry(self, exc: Exception) -> bool:
+        """Handle any task run retries.
+
+        - If the task has retries left, and the retry condition is met, set the task to retrying and return True.
+          - If the task has a retry delay, place in AwaitingRetry state with a delayed scheduled time.
+        - If the task has no retries left, or the retry condition is not met, return False.
+        """
+        if self.retries < self.task.retries and self.can_retry:
+            if self.task.retry_delay_seconds:
+                delay = (
+                    self.task.retry_delay_seconds[
+                        min(self.retries, len(self.task.retry_delay_seconds) - 1)
+                    ]  # repeat final delay value if attempts exceed specified delays
+                    if isinstance(self.task.retry_delay_seconds, Sequence)
+                    else self.task.retry_delay_seconds
+                )
+                new_state = AwaitingRetry(
+                    scheduled_time=pendulum.now("utc").add(seconds=delay)
+                )
+            else:
+                delay = None
+                new_state = Retrying()
+
+            self.logger.info(
+                "Task run failed with exception: %r - " "Retry %s/%s will start %s",
+                exc,
+                self.retries + 1,
+                self.task.retries,
+                str(delay) + " second(s) from now" if delay else "immediately",
+            )
+
+            await self.set_state(new_state, force=True)
+            self.retries = self.retries + 1
+            return True
+        elif self.retries >= self.task.retries:
+            self.logger.error(
+                "Task run failed with exception: %r - Retries are exhausted",
+                exc,
+                exc_info=True,
+            )
+            return False
+
+        return False
+
+    async def handle_exception(self, exc: Exception) -> None:
+        # If the task fails, and we have retries left, set the task to retrying.
+        if not await self.handle_retry(exc):
+            # If the task has no retries left, or the retry condition is not met, set the task to failed.
+            context = TaskRunContext.get()
+            state = await exception_to_failed_state(
+                exc,
+                message="Task run encountered an exception",
+                result_factory=getattr(context, "result_factory", None),
+            )
+            await self.set_state(state)
+            self._raised = exc
+
+    async def handle_timeout(self, exc: TimeoutError) -> None:
+        if not await self.handle_retry(exc):
+            if isinstance(exc, TaskRunTimeoutError):
+                message = f"Task run exceeded timeout of {self.task.timeout_seconds} second(s)"
+            else:
+                message = f"Task run failed due to timeout: {exc!r}"
+            self.logger.error(message)
+            state = Failed(
+                data=exc,
+                message=message,
+                name="TimedOut",
+            )
+            await self.set_state(state)
+            self._raised = exc
+
+    async def handle_crash(self, exc: BaseException) -> None:
+        state = await exception_to_crashed_state(exc)
+        self.logger.error(f"Crash detected! {state.message}")
+        self.logger.debug("Crash details:", exc_info=exc)
+        await self.set_state(state, force=True)
+        self._raised = exc
+
+    @asynccontextmanager
+    async def setup_run_context(self, client: Optional[PrefectClient] = None):
+        from prefect.utilities.engine import (
+            _resolve_custom_task_run_name,
+            should_log_prints,
+        )
+
+        if client is None:
+            client = self.client
+        if not self.task_run:
+            raise ValueError("Task run is not set")
+
+        self.task_run = await client.read_task_run(self.task_run.id)
+        with ExitStack() as stack:
+            if log_prints := should_log_prints(self.task):
+                stack.enter_context(patch_print())
+            stack.enter_context(
+                TaskRunContext(
+                    task=self.task,
+                    log_prints=log_prints,
+                    task_run=self.task_run,
+                    parameters=self.parameters,
+                    result_factory=await ResultFactory.from_task(self.task),  # type: ignore
+                    client=client,
+                )
+            )
+            # set the logger to the task run logger
+            self.logger = task_run_logger(task_run=self.task_run, task=self.task)  # type: ignore
+
+            # update the task run name if necessary
+            if not self._task_name_set and self.task.task_run_name:
+                task_run_name = _resolve_custom_task_run_name(
+                    task=self.task, parameters=self.parameters
+                )
+                await self.client.set_task_run_name(
+                    task_run_id=self.task_run.id, name=task_run_name
+                )
+                self.logger.extra["task_run_name"] = task_run_name
+                self.logger.debug(
+                    f"Renamed task run {self.task_run.name!r} to {task_run_name!r}"
+                )
+                self.task_run.name = task_run_name
+                self._task_name_set = True
+            yield
+
+    @asynccontextmanager
+    async def initialize_run(
+        self,
+        task_run_id: Optional[UUID] = None,
+        dependencies: Optional[Dict[str, Set[TaskRunInput]]] = None,
+    ) -> AsyncGenerator["AsyncTaskRunEngine", Any]:
+        """
+        Enters an async client context and creates a task run if needed.
+        """
+        with hydrated_context(self.context):
+            async with AsyncClientContext.get_or_create() as client_ctx:
+                self._client = client_ctx.client
+                self._is_started = True
+                try:
+                    if not self.task_run:
+                        self.task_run = await self.task.create_run(
+                            id=task_run_id,
+                            parameters=self.parameters,
+                            flow_run_context=FlowRunContext.get(),
+                            parent_task_run_context=TaskRunContext.get(),
+                            wait_for=self.wait_for,
+                            extra_task_inputs=dependencies,
+                            client=self.client,
+                        )
+                    # Emit an event to capture that the task run was in the `PENDING` state.
+                    self._last_event = emit_task_run_state_change_event(
+                        task_run=self.task_run,
+                        initial_state=None,
+                        validated_state=self.task_run.state,
+                    )
+
+                    async with self.setup_run_context():
+                        # setup_run_context might update the task run name, so log creation here
+                        self.logger.info(
+                            f"Created task run {self.task_run.name!r} for task {self.task.name!r}"
+                        )
+                        yield self
+
+                except Exception:
+                    # regular exceptions are caught and re-raised to the user
+                    raise
+                except (Pause, Abort) as exc:
+                    # Do not capture internal signals as crashes
+                    if isinstance(exc, Abort):
+                        self.logger.error("Task run was aborted: %s", exc)
+                    raise
+                except GeneratorExit:
+                    # Do not capture generator exits as crashes
+                    raise
+                except BaseException as exc:
+                    # BaseExceptions are caught and handled as crashes
+                    await self.handle_crash(exc)
+                    raise
+                finally:
+                    self._log_finished_state()
+                    self._is_started = False
+                    self._client = None
+
+    async def wait_until_ready(self):
+        """Waits until the scheduled time (if its the future), then enters Running."""
+        if scheduled_time := self.state.state_details.scheduled_time:
+            sleep_time = (scheduled_time - pendulum.now("utc")).total_seconds()
+            await anyio.sleep(sleep_time if sleep_time > 0 else 0)
+            await self.set_state(
+                Retrying() if self.state.name == "AwaitingRetry" else Running(),
+                force=True,
+            )
+
+    @asynccontextmanager
+    async def transaction_context(self) -> AsyncGenerator[Transaction, None]:
+        result_factory = getattr(TaskRunContext.get(), "result_factory", None)
+
+        # refresh cache setting is now repurposes as overwrite transaction record
+        overwrite = (
+            self.task.refresh_cache
+            if self.task.refresh_cache is not None
+            else PREFECT_TASKS_REFRESH_CACHE.value()
+        )
+        # the transaction reads and commits its record without blocking the event loop
+        async with Transaction(
+            key=self.compute_transaction_key(),
+            store=ResultFactoryStore(result_factory=result_factory),
+            overwrite=overwrite,
+            logger=self.logger,
+        ) as txn:
+            yield txn
+
+    # --------------------------
+    #
+    # The following methods compose the main task run loop
+    #
+    # --------------------------
+
+    @asynccontextmanager
+    async def start(
+        self,
+        task_run_id: Optional[UUID] = None,
+        dependencies: Optional[Dict[str, Set[TaskRunInput]]] = None,
+    ) -> AsyncGenerator[None, None]:
+        async with self.initialize_run(
+            task_run_id=task_run_id, dependencies=dependencies
+        ):
+            await self.begin_run()
+            try:
+                yield
+            finally:
+                await self.call_hooks()
+
+    @asynccontextmanager
+    async def run_context(self):
+        # reenter the run context to ensure it is up to date for every run
+        async with self.setup_run_context():
+            try:
+                with timeout_async(
+                    seconds=self.task.timeout_seconds,
+                    timeout_exc_type=TaskRunTimeoutError,
+                ):
+                    self.logger.debug(
+                        f"Executing task {self.task.name!r} for task run {self.task_run.name!r}..."
+                    )
+                    yield self
+            except TimeoutError as exc:
+                await self.handle_timeout(exc)
+            except Exception as exc:
+                await self.handle_exception(exc)
+
+    async def call_task_fn(self, transaction: Transaction) -> R:
+        """
+        Convenience method to call the task function and handle its result.
+        """
+        parameters = self.parameters or {}
+        if transaction.is_committed():
+            result = transaction.read()
+        else:
+            result = await call_with_parameters(self.task.fn, parameters)
+        await self.handle_success(result, transaction=transaction)
+        return result
+
+
+def run_task_sync(
+    task: Task[P, R],
+    task_run_id: Optional[UUID] = None,
+    task_run: Optional[TaskRun] = None,
+    parameters: Optional[Dict[str, Any]] = None,
+    wait_for: Optional[Iterable[PrefectFuture]] = None,
+    return_type: Literal["state", "result"] = "result",
+    dependencies: Optional[Dict[str, Set[TaskRunInput]]] = None,
+    context: Optional[Dict[str, Any]] = None,
+) -> Union[R, State, None]:
+    engine = TaskRunEngine[P, R](
+        task=task,
+        parameters=parameters,
+        task_run=task_run,
+        wait_for=wait_for,
+        context=context,
+    )
+
+    with engine.start(task_run_id=task_run_id, dependencies=dependencies):
+        while engine.is_running():
+            run_coro_as_sync(engine.wait_until_ready())
+            with engine.run_context(), engine.transaction_context() as txn:
+                engine.call_task_fn(txn)
+
+    return engine.state if return_type == "state" else engine.result()
+
+
+async def run_task_async(
+    task: Task[P, R],
+    task_run_id: Optional[UUID] = None,
+    task_run: Optional[TaskRun] = None,
+    parameters: Optional[Dict[str, Any]] = None,
+    wait_for: Optional[Iterable[PrefectFuture]] = None,
+    return_type: Literal["state", "result"] = "result",
+    dependencies: Optional[Dict[str, Set[TaskRunInput]]] = None,
+    context: Optional[Dict[str, Any]] = None,
+) -> Union[R, State, None]:
+    engine = AsyncTaskRunEngine[P, R](
+        task=task,
+        parameters=parameters,
+        task_run=task_run,
+        wait_for=wait_for,
+        context=context,
+    )
+
+    async with engine.start(task_run_id=task_run_id, dependencies=dependencies):
+        while engine.is_running():
+            await engine.wait_until_ready()
+            async with engine.run_context():
+                async with engine.transaction_context() as txn:
+                    await engine.call_task_fn(txn)
+
+    return engine.state if return_type == "state" else await engine.result()
+
+
+def run_generator_task_sync(
+    task: Task[P, R],
+    task_run_id: Optional[UUID] = None,
+    task_run: Optional[TaskRun] = None,
+    parameters: Optional[Dict[str, Any]] = None,
+    wait_for: Optional[Iterable[PrefectFuture]] = None,
+    return_type: Literal["state", "result"] = "result",
+    dependencies: Optional[Dict[str, Set[TaskRunInput]]] = None,
+    context: Optional[Dict[str, Any]] = None,
+) -> Generator[R, None, None]:
+    if return_type != "result":
+        raise ValueError("The return_type for a generator task must be 'result'")
+
+    engine = TaskRunEngine[P, R](
+        task=task,
+        parameters=parameters,
+        task_run=task_run,
+        wait_for=wait_for,
+        context=context,
+    )
+
+    with engine.start(task_run_id=task_run_id, dependencies=dependencies):
         while engine.is_running():
             run_coro_as_sync(engine.wait_until_ready())
             with engine.run_context(), engine.transaction_context() as txn:
@@ -805,7 +1300,7 @@ async def run_generator_task_async(
 ) -> AsyncGenerator[R, None]:
     if return_type != "result":
         raise ValueError("The return_type for a generator task must be 'result'")
-    engine = TaskRunEngine[P, R](
+    engine = AsyncTaskRunEngine[P, R](
         task=task,
         parameters=parameters,
         task_run=task_run,
@@ -813,40 +1308,41 @@ async def run_generator_task_async(
         context=context,
     )
 
-    with engine.start(task_run_id=task_run_id, dependencies=dependencies):
+    async with engine.start(task_run_id=task_run_id, dependencies=dependencies):
         while engine.is_running():
             await engine.wait_until_ready()
-            with engine.run_context(), engine.transaction_context() as txn:
-                # TODO: generators should default to commit_mode=OFF
-                # because they are dynamic by definition
-                # for now we just prevent this branch explicitly
-                if False and txn.is_committed():
-                    txn.read()
-                else:
-                    call_args, call_kwargs = parameters_to_args_kwargs(
-                        task.fn, engine.parameters or {}
-                    )
-                    gen = task.fn(*call_args, **call_kwargs)
-                    try:
-                        while True:
-                            # can't use anext in Python < 3.10
-                            gen_result = await gen.__anext__()
-                            # link the current state to the result for dependency tracking
-                            #
-                            # TODO: this could grow the task_run_result
-                            # dictionary in an unbounded way, so finding a
-                            # way to periodically clean it up (using
-                            # weakrefs or similar) would be good
-                            link_state_to_result(engine.state, gen_result)
-                            yield gen_result
-                    except (StopAsyncIteration, GeneratorExit) as exc:
-                        engine.handle_success(None, transaction=txn)
-                        if isinstance(exc, GeneratorExit):
-                            gen.throw(exc)
+            async with engine.run_context():
+                async with engine.transaction_context() as txn:
+                    # TODO: generators should default to commit_mode=OFF
+                    # because they are dynamic by definition
+                    # for now we just prevent this branch explicitly
+                    if False and txn.is_committed():
+                        txn.read()
+                    else:
+                        call_args, call_kwargs = parameters_to_args_kwargs(
+                            task.fn, engine.parameters or {}
+                        )
+                        gen = task.fn(*call_args, **call_kwargs)
+                        try:
+                            while True:
+                                # can't use anext in Python < 3.10
+                                gen_result = await gen.__anext__()
+                                # link the current state to the result for dependency tracking
+                                #
+                                # TODO: this could grow the task_run_result
+                                # dictionary in an unbounded way, so finding a
+                                # way to periodically clean it up (using
+                                # weakrefs or similar) would be good
+                                link_state_to_result(engine.state, gen_result)
+                                yield gen_result
+                        except (StopAsyncIteration, GeneratorExit) as exc:
+                            await engine.handle_success(None, transaction=txn)
+                            if isinstance(exc, GeneratorExit):
+                                gen.throw(exc)
 
     # async generators can't return, but we can raise failures here
     if engine.state.is_failed():
-        engine.result()
+        await engine.result()
 
 
 def run_task(
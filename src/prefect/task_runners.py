@@ -1,34 +1,52 @@
 import abc
 import asyncio
+import concurrent.futures
 import sys
+import threading
 import uuid
+import weakref
 from concurrent.futures import ThreadPoolExecutor
 from contextvars import copy_context
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterable,
+    Callable,
     Coroutine,
     Dict,
     Generic,
     Iterable,
-    List,
+    Iterator,
     Optional,
+    Sequence,
     Set,
+    Sized,
+    Tuple,
     overload,
 )
 
 from typing_extensions import ParamSpec, Self, TypeVar
 
-from prefect.client.schemas.objects import TaskRunInput
+from prefect._internal.concurrency.calls import Call
+from prefect._internal.concurrency.primitives import Semaphore
+from prefect._internal.concurrency.threads import EventLoopThread
+from prefect.client.schemas.objects import State, TaskRunInput
 from prefect.exceptions import MappingLengthMismatch, MappingMissingIterable
 from prefect.futures import (
     PrefectConcurrentFuture,
     PrefectDistributedFuture,
     PrefectFuture,
     PrefectFutureList,
+    PrefectFutureStream,
 )
 from prefect.logging.loggers import get_logger, get_run_logger
-from prefect.utilities.annotations import allow_failure, quote, unmapped
+from prefect.utilities.annotations import (
+    BaseAnnotation,
+    allow_failure,
+    quote,
+    unmapped,
+)
+from prefect.utilities.asyncutils import run_coro_as_sync
 from prefect.utilities.callables import (
     collapse_variadic_parameters,
     explode_variadic_parameter,
@@ -37,6 +55,7 @@ from prefect.utilities.callables import (
 from prefect.utilities.collections import isiterable
 
 if TYPE_CHECKING:
+    from prefect.context import AsyncClientContext
     from prefect.tasks import Task
 
 P = ParamSpec("P")
@@ -45,6 +64,202 @@ R = TypeVar("R")
 F = TypeVar("F", bound=PrefectFuture, default=PrefectConcurrentFuture)
 
 
+class MappingPlan:
+    """
+    The parameters for each run of a mapped task.
+
+    The task's signature is inspected once, when the plan is built: default values,
+    annotations on static parameters and variadic keyword arguments are resolved up
+    front, so that the parameters for each run only combine that run's elements of
+    the iterable parameters with the shared static parameters. Iterating over the plan
+    produces each run's parameters as they are needed.
+
+    When `stream` is set, iterable parameters are not read up front: generators,
+    iterators and async iterables are consumed one element per run as the plan is
+    iterated, and the plan has no length unless every iterable parameter is sized.
+    Iterables of different lengths are then only detected once the shortest of them
+    is exhausted.
+
+    Args:
+        fn: The function of the task being mapped.
+        parameters: The resolved parameters passed to `map`.
+        stream: Whether to consume iterable parameters lazily.
+    """
+
+    def __init__(
+        self, fn: Callable[..., Any], parameters: Dict[str, Any], stream: bool = False
+    ):
+        # Ensure that any parameters in kwargs are expanded before this check
+        parameters = explode_variadic_parameter(fn, parameters)
+
+        iterable_parameters: Dict[str, Iterable[Any]] = {}
+        static_parameters: Dict[str, Any] = {}
+        annotated_parameters: Dict[str, BaseAnnotation] = {}
+        for key, val in parameters.items():
+            if isinstance(val, (allow_failure, quote)):
+                # Unwrap annotated parameters to determine if they are iterable
+                annotated_parameters[key] = val
+                val = val.unwrap()
+
+            if isinstance(val, unmapped):
+                static_parameters[key] = val.value
+            elif stream and isinstance(val, AsyncIterable):
+                iterable_parameters[key] = _iterate_async(val)
+            elif isiterable(val):
+                # Sized iterables are mapped over in place rather than copied
+                if isinstance(val, Sized) or stream:
+                    iterable_parameters[key] = val
+                else:
+                    iterable_parameters[key] = list(val)
+            else:
+                static_parameters[key] = val
+
+        if not len(iterable_parameters):
+            raise MappingMissingIterable(
+                "No iterable parameters were received. Parameters for map must "
+                f"include at least one iterable. Parameters: {parameters}"
+            )
+
+        iterable_parameter_lengths = {
+            key: len(val)
+            for key, val in iterable_parameters.items()
+            if isinstance(val, Sized)
+        }
+        lengths = set(iterable_parameter_lengths.values())
+        if len(lengths) > 1:
+            raise MappingLengthMismatch(
+                "Received iterable parameters with different lengths. Parameters for map"
+                f" must all be the same length. Got lengths: {iterable_parameter_lengths}"
+            )
+
+        self.length: Optional[int] = None
+        if len(iterable_parameter_lengths) == len(iterable_parameters):
+            self.length = lengths.pop()
+
+        # Add default values for parameters; these are skipped earlier since they should
+        # not be mapped over
+        for key, value in get_parameter_defaults(fn).items():
+            if key not in iterable_parameters:
+                static_parameters.setdefault(key, value)
+
+        # Annotations on static parameters are applied once, while those on iterable
+        # parameters are re-applied to each element
+        for key, annotation in annotated_parameters.items():
+            if key in static_parameters:
+                static_parameters[key] = annotation.rewrap(static_parameters[key])
+
+        self._keys = tuple(iterable_parameters)
+        self._iterables = tuple(iterable_parameters.values())
+        self._annotations = tuple(
+            (key, annotation)
+            for key, annotation in annotated_parameters.items()
+            if key in iterable_parameters
+        )
+
+        # Parameters that are not in the signature are collapsed into the variadic
+        # keyword argument; the same keys are collapsed for every run, so they are
+        # found once with placeholder values
+        collapsed = collapse_variadic_parameters(
+            fn, dict.fromkeys([*self._keys, *static_parameters])
+        )
+        self._variadic_key: Optional[str] = None
+        self._variadic_keys: Set[str] = set()
+        for key, value in collapsed.items():
+            if isinstance(value, dict):
+                self._variadic_key = key
+                self._variadic_keys = set(value)
+
+        self._static = {
+            key: value
+            for key, value in static_parameters.items()
+            if key not in self._variadic_keys
+        }
+        self._static_variadic = {
+            key: value
+            for key, value in static_parameters.items()
+            if key in self._variadic_keys
+        }
+        self._iterable_variadic_keys = [
+            key for key in self._keys if key in self._variadic_keys
+        ]
+
+    def __len__(self) -> int:
+        if self.length is None:
+            raise TypeError("The length of a streaming mapping plan is unknown")
+        return self.length
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        keys = self._keys
+        static = self._static
+        if self.length is None:
+            elements = _zip_equal(keys, self._iterables)
+        else:
+            elements = zip(*self._iterables)
+
+        for values in elements:
+            call_parameters = dict(zip(keys, values))
+            call_parameters.update(static)
+
+            for key, annotation in self._annotations:
+                call_parameters[key] = annotation.rewrap(call_parameters[key])
+
+            if self._variadic_key:
+                variadic = dict(self._static_variadic)
+                for key in self._iterable_variadic_keys:
+                    variadic[key] = call_parameters.pop(key)
+                call_parameters[self._variadic_key] = variadic
+
+            yield call_parameters
+
+
+def _zip_equal(
+    keys: Sequence[str], iterables: Sequence[Iterable[Any]]
+) -> Iterator[Tuple[Any, ...]]:
+    """
+    Zips iterables of unknown lengths, raising once some of them are exhausted
+    before the others.
+    """
+    iterators = [iter(iterable) for iterable in iterables]
+    while True:
+        values = []
+        exhausted = []
+        for key, iterator in zip(keys, iterators):
+            try:
+                values.append(next(iterator))
+            except StopIteration:
+                exhausted.append(key)
+
+        if len(exhausted) == len(keys):
+            return
+        if exhausted:
+            raise MappingLengthMismatch(
+                "Received iterable parameters with different lengths. Parameters for map"
+                f" must all be the same length. Parameters {exhausted} were exhausted"
+                " before the others."
+            )
+        yield tuple(values)
+
+
+def _iterate_async(iterable: AsyncIterable[T]) -> Iterator[T]:
+    """
+    Iterates over an async iterable from synchronous code, reading each element as it
+    is needed.
+    """
+    iterator = iterable.__aiter__()
+
+    async def next_element() -> Tuple[bool, Optional[T]]:
+        try:
+            return True, await iterator.__anext__()
+        except StopAsyncIteration:
+            return False, None
+
+    while True:
+        found, element = run_coro_as_sync(next_element())
+        if not found:
+            return
+        yield element
+
+
 class TaskRunner(abc.ABC, Generic[F]):
     """
     Abstract base class for task runners.
@@ -60,6 +275,9 @@ class TaskRunner(abc.ABC, Generic[F]):
     def __init__(self):
         self.logger = get_logger(f"task_runner.{self.name}")
         self._started = False
+        # The streams returned by `map_stream` while started, which need this task
+        # runner to submit their remaining tasks
+        self._streams: Optional["weakref.WeakSet[PrefectFutureStream]"] = None
 
     @property
     def name(self):
@@ -111,6 +329,53 @@ class TaskRunner(abc.ABC, Generic[F]):
             An iterable of future objects that can be used to wait for the tasks to
             complete and retrieve the results.
         """
+        return PrefectFutureList(self._submit_mapped(task, parameters, wait_for))
+
+    def map_stream(
+        self,
+        task: "Task",
+        parameters: Dict[str, Any],
+        max_in_flight: int,
+        wait_for: Optional[Iterable[PrefectFuture]] = None,
+    ) -> PrefectFutureStream[F]:
+        """
+        Submit multiple tasks to the task run engine, reading iterable parameters as
+        the tasks are submitted.
+
+        Iterable parameters may be generators, iterators or async iterables of unknown
+        length. At most `max_in_flight` tasks are submitted ahead of the futures
+        yielded by the returned stream; the next task is submitted as each completed
+        future is yielded, so the stream must be consumed before the task runner
+        exits.
+
+        Args:
+            task: The task to submit.
+            parameters: The parameters to use when running the task.
+            max_in_flight: The most tasks to submit ahead of the consumer.
+            wait_for: A list of futures that the task depends on.
+
+        Returns:
+            A stream of future objects, yielded as the tasks complete.
+        """
+        stream = PrefectFutureStream(
+            self._submit_mapped(task, parameters, wait_for, stream=True),
+            max_in_flight=max_in_flight,
+        )
+        if self._streams is not None:
+            self._streams.add(stream)
+        return stream
+
+    def _submit_mapped(
+        self,
+        task: "Task",
+        parameters: Dict[str, Any],
+        wait_for: Optional[Iterable[PrefectFuture]] = None,
+        stream: bool = False,
+    ) -> Iterator[F]:
+        """
+        Resolve the parameters of a mapped task and return an iterator that submits
+        a run of the task as each future is drawn from it.
+        """
         if not self._started:
             raise RuntimeError(
                 "The task runner must be started before submitting work."
@@ -133,74 +398,17 @@ class TaskRunner(abc.ABC, Generic[F]):
         # will also be tracked.
         parameters = resolve_inputs_sync(parameters, max_depth=0)
 
-        # Ensure that any parameters in kwargs are expanded before this check
-        parameters = explode_variadic_parameter(task.fn, parameters)
-
-        iterable_parameters = {}
-        static_parameters = {}
-        annotated_parameters = {}
-        for key, val in parameters.items():
-            if isinstance(val, (allow_failure, quote)):
-                # Unwrap annotated parameters to determine if they are iterable
-                annotated_parameters[key] = val
-                val = val.unwrap()
-
-            if isinstance(val, unmapped):
-                static_parameters[key] = val.value
-            elif isiterable(val):
-                iterable_parameters[key] = list(val)
-            else:
-                static_parameters[key] = val
-
-        if not len(iterable_parameters):
-            raise MappingMissingIterable(
-                "No iterable parameters were received. Parameters for map must "
-                f"include at least one iterable. Parameters: {parameters}"
-            )
+        plan = MappingPlan(task.fn, parameters, stream=stream)
 
-        iterable_parameter_lengths = {
-            key: len(val) for key, val in iterable_parameters.items()
-        }
-        lengths = set(iterable_parameter_lengths.values())
-        if len(lengths) > 1:
-            raise MappingLengthMismatch(
-                "Received iterable parameters with different lengths. Parameters for map"
-                f" must all be the same length. Got lengths: {iterable_parameter_lengths}"
-            )
-
-        map_length = list(lengths)[0]
-
-        futures: List[PrefectFuture] = []
-        for i in range(map_length):
-            call_parameters = {
-                key: value[i] for key, value in iterable_parameters.items()
-            }
-            call_parameters.update(
-                {key: value for key, value in static_parameters.items()}
-            )
-
-            # Add default values for parameters; these are skipped earlier since they should
-            # not be mapped over
-            for key, value in get_parameter_defaults(task.fn).items():
-                call_parameters.setdefault(key, value)
-
-            # Re-apply annotations to each key again
-            for key, annotation in annotated_parameters.items():
-                call_parameters[key] = annotation.rewrap(call_parameters[key])
-
-            # Collapse any previously exploded kwargs
-            call_parameters = collapse_variadic_parameters(task.fn, call_parameters)
-
-            futures.append(
-                self.submit(
-                    task=task,
-                    parameters=call_parameters,
-                    wait_for=wait_for,
-                    dependencies=task_inputs,
-                )
+        return (
+            self.submit(
+                task=task,
+                parameters=call_parameters,
+                wait_for=wait_for,
+                dependencies=task_inputs,
             )
-
-        return PrefectFutureList(futures)
+            for call_parameters in plan
+        )
 
     def __enter__(self):
         if self._started:
@@ -208,18 +416,47 @@ class TaskRunner(abc.ABC, Generic[F]):
 
         self.logger.debug("Starting task runner")
         self._started = True
+        self._streams = weakref.WeakSet()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         self.logger.debug("Stopping task runner")
         self._started = False
 
+        unconsumed = [stream for stream in self._streams or () if not stream.consumed]
+        self._streams = None
+        if unconsumed and exc_type is None:
+            self.logger.warning(
+                "The task runner stopped before %s stream(s) of mapped task runs were"
+                " consumed; the task runs that were not yet submitted will fail to"
+                " submit. Consume the results of `map` with `max_in_flight` before"
+                " the flow returns.",
+                len(unconsumed),
+            )
+
 
 class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture]):
+    """
+    A task runner that runs sync tasks in a pool of threads.
+
+    Async tasks are run concurrently on a single event loop thread owned by the task
+    runner and share one async client, so they do not each occupy a thread. Sync and
+    async tasks share one limit: at most `max_workers` task runs execute at once.
+
+    Since async tasks share an event loop, an async task should not block on the
+    result of another async task submitted from outside of it; await its
+    `wait_async` method instead.
+    """
+
     def __init__(self, max_workers: Optional[int] = None):
         super().__init__()
         self._executor: Optional[ThreadPoolExecutor] = None
         self._max_workers = sys.maxsize if max_workers is None else max_workers
+        self._loop_thread: Optional[EventLoopThread] = None
+        self._loop_thread_lock: Optional[threading.Lock] = None
+        self._async_client_context: Optional["AsyncClientContext"] = None
+        self._limiter: Optional[Semaphore] = None
+        self._async_futures: Set[concurrent.futures.Future] = set()
 
     def duplicate(self) -> "ThreadPoolTaskRunner":
         return type(self)(max_workers=self._max_workers)
@@ -280,11 +517,25 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture]):
         else:
             self.logger.info(f"Submitting task {task.name} to thread pool executor...")
 
-        if task.isasync:
-            # TODO: Explore possibly using a long-lived thread with an event loop
-            # for better performance
+        if task.isasync and not self._in_loop_thread():
+            call = Call.new(
+                self._run_async_task,
+                task=task,
+                task_run_id=task_run_id,
+                parameters=parameters,
+                wait_for=wait_for,
+                dependencies=dependencies,
+            )
+            future = self._get_loop_thread().submit(call).future
+            self._async_futures.add(future)
+            future.add_done_callback(self._async_futures.discard)
+        elif task.isasync:
+            # Async tasks submitted from an async task on the event loop thread get an
+            # event loop of their own so the submitting task can block on their result
+            # without deadlocking the shared loop
             future = self._executor.submit(
                 context.run,
+                self._run_in_thread,
                 asyncio.run,
                 run_task_async(
                     task=task,
@@ -298,6 +549,7 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture]):
         else:
             future = self._executor.submit(
                 context.run,
+                self._run_in_thread,
                 run_task_sync,
                 task=task,
                 task_run_id=task_run_id,
@@ -337,15 +589,68 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture]):
     ):
         return super().map(task, parameters, wait_for)
 
+    def _in_loop_thread(self) -> bool:
+        return (
+            self._loop_thread is not None
+            and threading.current_thread() is self._loop_thread.thread
+        )
+
+    def _get_loop_thread(self) -> EventLoopThread:
+        """
+        Get the event loop thread used to run async tasks, starting it and its
+        shared client on first use.
+        """
+        with self._loop_thread_lock:
+            if self._loop_thread is None:
+                self._loop_thread = EventLoopThread(
+                    name="ThreadPoolTaskRunnerEventLoop", daemon=True
+                )
+                self._loop_thread.start()
+                self._loop_thread.submit(Call.new(self._start_async_client)).result()
+        return self._loop_thread
+
+    async def _start_async_client(self):
+        from prefect.context import AsyncClientContext
+
+        self._async_client_context = AsyncClientContext()
+        await self._async_client_context.client.__aenter__()
+
+    async def _stop_async_client(self):
+        if self._async_client_context is not None:
+            await self._async_client_context.client.__aexit__(None, None, None)
+            self._async_client_context = None
+
+    def _run_in_thread(
+        self, fn: Callable[..., State], *args: Any, **kwargs: Any
+    ) -> State:
+        with self._limiter:
+            return fn(*args, **kwargs)
+
+    async def _run_async_task(self, task: "Task", **kwargs: Any) -> State:
+        from prefect.task_engine import run_task_async
+
+        async with self._limiter:
+            # each task run enters its own copy of the context so the shared client
+            # can be found without the runs sharing a context token
+            with self._async_client_context.model_copy():
+                return await run_task_async(task=task, return_type="state", **kwargs)
+
     def __enter__(self):
         super().__enter__()
         self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        self._loop_thread_lock = threading.Lock()
+        self._limiter = Semaphore(self._max_workers)
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         if self._executor is not None:
             self._executor.shutdown()
             self._executor = None
+        if self._loop_thread is not None:
+            concurrent.futures.wait(list(self._async_futures))
+            self._loop_thread.submit(Call.new(self._stop_async_client)).result()
+            self._loop_thread.shutdown()
+            self._loop_thread = None
         super().__exit__(exc_type, exc_value, traceback)
 
     def __eq__(self, value: object) -> bool:
@@ -2,7 +2,7 @@ import asyncio
 import atexit
 import threading
 import uuid
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional
 
 import anyio
 from cachetools import TTLCache
@@ -74,6 +74,7 @@ class TaskRunWaiter:
             maxsize=10000, ttl=600
         )
         self._completion_events: Dict[uuid.UUID, asyncio.Event] = {}
+        self._completion_callbacks: Dict[uuid.UUID, List[Callable[[], None]]] = {}
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._observed_completed_task_runs_lock = threading.Lock()
         self._completion_events_lock = threading.Lock()
@@ -135,6 +136,10 @@ class TaskRunWaiter:
                         # so the waiter can wake up the waiting coroutine
                         if task_run_id in self._completion_events:
                             self._completion_events[task_run_id].set()
+                        callbacks = self._completion_callbacks.pop(task_run_id, [])
+
+                    for callback in callbacks:
+                        callback()
                 except Exception as exc:
                     self.logger.error(f"Error processing event: {exc}")
 
@@ -195,6 +200,57 @@ class TaskRunWaiter:
                 # Remove the event from the cache after it has been waited on
                 instance._completion_events.pop(task_run_id, None)
 
+    @classmethod
+    def add_done_callback(cls, task_run_id: uuid.UUID, callback: Callable[[], None]):
+        """
+        Call a function once a task run finishes.
+
+        The callback is called right away if the task run has already been seen to
+        finish, and otherwise from the global loop thread when its event arrives, so
+        it should return quickly. Many callbacks can share the service's single
+        websocket connection, unlike waiting on each task run in its own coroutine.
+
+        Args:
+            task_run_id: The ID of the task run to wait for.
+            callback: The function to call, with no arguments.
+        """
+        instance = cls.instance()
+        with instance._observed_completed_task_runs_lock:
+            if task_run_id in instance._observed_completed_task_runs:
+                callback()
+                return
+
+        with instance._completion_events_lock:
+            instance._completion_callbacks.setdefault(task_run_id, []).append(callback)
+
+        # The task run may have finished while the callback was being added; if the
+        # callback is still registered, the consumer has not called it and won't
+        with instance._observed_completed_task_runs_lock:
+            finished = task_run_id in instance._observed_completed_task_runs
+        if finished and instance._discard_callback(task_run_id, callback):
+            callback()
+
+    @classmethod
+    def remove_done_callback(
+        cls, task_run_id: uuid.UUID, callback: Callable[[], None]
+    ) -> None:
+        """
+        Remove a callback added with `add_done_callback` that has not been called.
+        """
+        cls.instance()._discard_callback(task_run_id, callback)
+
+    def _discard_callback(
+        self, task_run_id: uuid.UUID, callback: Callable[[], None]
+    ) -> bool:
+        with self._completion_events_lock:
+            callbacks = self._completion_callbacks.get(task_run_id, [])
+            if callback not in callbacks:
+                return False
+            callbacks.remove(callback)
+            if not callbacks:
+                self._completion_callbacks.pop(task_run_id, None)
+            return True
+
     @classmethod
     def instance(cls):
         """
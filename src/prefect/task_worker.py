@@ -7,7 +7,7 @@ import sys
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import AsyncExitStack
 from contextvars import copy_context
-from typing import Optional
+from typing import Any, Dict, Optional
 from uuid import UUID
 
 import anyio
@@ -72,12 +72,20 @@ class TaskWorker:
             when a scheduled task run is found.
         - limit: The maximum number of tasks that can be run concurrently. Defaults to 10.
             Pass `None` to remove the limit.
+        - prefetch: The number of scheduled task runs to request from the server at
+            once. Defaults to 1. Prefetching only overlaps receiving a task run and
+            loading its parameters with waiting for capacity to run it: runs are
+            still started one at a time as capacity frees up, so it helps little
+            unless the worker is at its `limit`. Each prefetched run is acknowledged
+            when the worker starts it, and the server takes back the runs that were
+            not started when the worker disconnects.
     """
 
     def __init__(
         self,
         *tasks: Task,
         limit: Optional[int] = 10,
+        prefetch: int = 1,
     ):
         self.tasks = []
         for t in tasks:
@@ -105,6 +113,10 @@ class TaskWorker:
         self._runs_task_group: anyio.abc.TaskGroup = anyio.create_task_group()
         self._executor = ThreadPoolExecutor(max_workers=limit if limit else None)
         self._limiter = anyio.CapacityLimiter(limit) if limit else None
+        self.prefetch = prefetch
+
+        self._result_factories: Dict[str, ResultFactory] = {}
+        self._parameter_reads: Dict[UUID, asyncio.Future] = {}
 
         self.in_flight_task_runs: dict[str, dict[UUID, pendulum.DateTime]] = {
             task_key: {} for task_key in self.task_keys
@@ -223,14 +235,41 @@ class TaskWorker:
             keys=self.task_keys,
             client_id=self.client_id,
             base_url=base_url,
+            prefetch=self.prefetch,
         ):
             logger.info(f"Received task run: {task_run.id} - {task_run.name}")
 
+            # Start reading parameters while waiting for capacity to run the task
+            self._start_reading_parameters(task_run)
+
             token_acquired = await self._acquire_token(task_run.id)
             if token_acquired:
                 self._runs_task_group.start_soon(
                     self._safe_submit_scheduled_task_run, task_run
                 )
+            elif read := self._parameter_reads.pop(task_run.id, None):
+                read.cancel()
+
+    def _get_task(self, task_run: TaskRun) -> Optional[Task]:
+        return next((t for t in self.tasks if t.task_key == task_run.task_key), None)
+
+    def _start_reading_parameters(self, task_run: TaskRun) -> None:
+        task = self._get_task(task_run)
+        if task and should_try_to_read_parameters(task, task_run):
+            self._parameter_reads[task_run.id] = asyncio.ensure_future(
+                self._read_parameters(task, task_run)
+            )
+
+    async def _read_parameters(self, task: Task, task_run: TaskRun) -> Dict[str, Any]:
+        if task.task_key not in self._result_factories:
+            task.persist_result = True
+            self._result_factories[
+                task.task_key
+            ] = await ResultFactory.from_autonomous_task(task)
+        factory = self._result_factories[task.task_key]
+        return await factory.read_parameters(
+            task_run.state.state_details.task_parameters_id
+        )
 
     async def _safe_submit_scheduled_task_run(self, task_run: TaskRun):
         self.in_flight_task_runs[task_run.task_key][task_run.id] = pendulum.now()
@@ -251,7 +290,7 @@ class TaskWorker:
             f"Found task run: {task_run.name!r} in state: {task_run.state.name!r}"
         )
 
-        task = next((t for t in self.tasks if t.task_key == task_run.task_key), None)
+        task = self._get_task(task_run)
 
         if not task:
             if PREFECT_TASK_SCHEDULING_DELETE_FAILED_SUBMISSIONS:
@@ -269,11 +308,9 @@ class TaskWorker:
         wait_for = []
         run_context = None
         if should_try_to_read_parameters(task, task_run):
-            parameters_id = task_run.state.state_details.task_parameters_id
-            task.persist_result = True
-            factory = await ResultFactory.from_autonomous_task(task)
+            read = self._parameter_reads.pop(task_run.id, None)
             try:
-                run_data = await factory.read_parameters(parameters_id)
+                run_data = await (read or self._read_parameters(task, task_run))
                 parameters = run_data.get("parameters", {})
                 wait_for = run_data.get("wait_for", [])
                 run_context = run_data.get("context", None)
@@ -376,6 +413,9 @@ class TaskWorker:
     async def __aexit__(self, *exc_info):
         logger.debug("Stopping task worker...")
         self._started_at = None
+        for read in self._parameter_reads.values():
+            read.cancel()
+        self._parameter_reads.clear()
         await self._exit_stack.__aexit__(*exc_info)
 
 
@@ -404,7 +444,10 @@ def create_status_server(task_worker: TaskWorker) -> FastAPI:
 
 @sync_compatible
 async def serve(
-    *tasks: Task, limit: Optional[int] = 10, status_server_port: Optional[int] = None
+    *tasks: Task,
+    limit: Optional[int] = 10,
+    status_server_port: Optional[int] = None,
+    prefetch: int = 1,
 ):
     """Serve the provided tasks so that their runs may be submitted to and executed.
     in the engine. Tasks do not need to be within a flow run context to be submitted.
@@ -418,6 +461,9 @@ async def serve(
         - status_server_port: An optional port on which to start an HTTP server
             exposing status information about the task worker. If not provided, no
             status server will run.
+        - prefetch: The number of scheduled task runs to request from the server at
+            once, which only overlaps receiving runs with waiting for capacity to run
+            them. Defaults to 1.
 
     Example:
         ```python
@@ -437,7 +483,7 @@ async def serve(
             serve(say, yell)
         ```
     """
-    task_worker = TaskWorker(*tasks, limit=limit)
+    task_worker = TaskWorker(*tasks, limit=limit, prefetch=prefetch)
 
     status_server_task = None
     if status_server_port is not None:
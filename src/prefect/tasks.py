@@ -46,7 +46,12 @@ from prefect.context import (
     TaskRunContext,
     serialize_context,
 )
-from prefect.futures import PrefectDistributedFuture, PrefectFuture, PrefectFutureList
+from prefect.futures import (
+    PrefectDistributedFuture,
+    PrefectFuture,
+    PrefectFutureList,
+    PrefectFutureStream,
+)
 from prefect.logging.loggers import get_logger
 from prefect.results import ResultFactory, ResultSerializer, ResultStorage
 from prefect.settings import (
@@ -1065,6 +1070,7 @@ class Task(Generic[P, R]):
         return_state: bool = False,
         wait_for: Optional[Iterable[PrefectFuture]] = None,
         deferred: bool = False,
+        max_in_flight: Optional[int] = None,
         **kwargs: Any,
     ):
         """
@@ -1090,11 +1096,18 @@ class Task(Generic[P, R]):
                 of each task run.
             wait_for: Upstream task futures to wait for before starting the
                 task
+            deferred: Whether to submit the task runs for deferred execution
+                by task workers
+            max_in_flight: If set, stream the mapped task runs: iterables are
+                read as the task runs are submitted, so they may be generators
+                or async iterables of unknown length, and at most this many task
+                runs are submitted ahead of the futures consumed from the result
             **kwargs: Keyword iterable arguments to run the task with
 
         Returns:
             A list of futures allowing asynchronous access to the state of the
-            tasks
+            tasks, or, if `max_in_flight` is set, a `PrefectFutureStream` that
+            yields the futures as their task runs complete
 
         Examples:
 
@@ -1177,9 +1190,19 @@ class Task(Generic[P, R]):
             >>>
             >>> my_flow()
             [[11, 21], [12, 22], [13, 23]]
+
+            Stream over a generator with at most 10 task runs in flight
+            >>> def read_records():
+            >>>     with open("records.csv") as f:
+            >>>         yield from f
+            >>>
+            >>> @flow
+            >>> def my_flow():
+            >>>     for result in my_task.map(read_records(), max_in_flight=10).iter_results():
+            >>>         print(result)
         """
 
-        from prefect.task_runners import TaskRunner
+        from prefect.task_runners import MappingPlan, TaskRunner
         from prefect.utilities.visualization import (
             VisualizationUnsupportedError,
             get_task_viz_tracker,
@@ -1196,7 +1219,15 @@ class Task(Generic[P, R]):
                 "`task.map()` is not currently supported by `flow.visualize()`"
             )
 
-        if deferred:
+        if deferred and max_in_flight is not None:
+            futures = PrefectFutureStream(
+                (
+                    self.apply_async(kwargs=call_parameters, wait_for=wait_for)
+                    for call_parameters in MappingPlan(self.fn, parameters, stream=True)
+                ),
+                max_in_flight=max_in_flight,
+            )
+        elif deferred:
             parameters_list = expand_mapping_parameters(self.fn, parameters)
             futures = [
                 self.apply_async(kwargs=parameters, wait_for=wait_for)
@@ -1204,7 +1235,12 @@ class Task(Generic[P, R]):
             ]
         elif task_runner := getattr(flow_run_context, "task_runner", None):
             assert isinstance(task_runner, TaskRunner)
-            futures = task_runner.map(self, parameters, wait_for)
+            if max_in_flight is not None:
+                futures = task_runner.map_stream(
+                    self, parameters, max_in_flight, wait_for
+                )
+            else:
+                futures = task_runner.map(self, parameters, wait_for)
         else:
             raise RuntimeError(
                 "Unable to determine task runner to use for mapped task runs. If"
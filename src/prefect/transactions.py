@@ -83,22 +83,7 @@ class Transaction(ContextModel):
         return self.state == TransactionState.ACTIVE
 
     def __enter__(self):
-        if self._token is not None:
-            raise RuntimeError(
-                "Context already entered. Context enter calls cannot be nested."
-            )
-        # set default commit behavior
-        if self.commit_mode is None:
-            parent = get_transaction()
-
-            # either inherit from parent or set a default of eager
-            if parent:
-                self.commit_mode = parent.commit_mode
-            else:
-                self.commit_mode = CommitMode.LAZY
-
-        # this needs to go before begin, which could set the state to committed
-        self.state = TransactionState.ACTIVE
+        self._prepare_enter()
         self.begin()
         self._token = self.__var__.set(self)
         return self
@@ -132,6 +117,62 @@ class Transaction(ContextModel):
 
         self.reset()
 
+    async def __aenter__(self):
+        """
+        Enter the transaction, reading from the store without blocking the event loop.
+        """
+        self._prepare_enter()
+        await self.abegin()
+        self._token = self.__var__.set(self)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """
+        Exit the transaction, writing to the store without blocking the event loop.
+        """
+        exc_type, exc_val, _ = exc_info
+        if not self._token:
+            raise RuntimeError(
+                "Asymmetric use of context. Context exit called without an enter."
+            )
+        if exc_type:
+            self.rollback()
+            self.reset()
+            raise exc_val
+
+        if self.commit_mode == CommitMode.EAGER:
+            await self.acommit()
+
+        # if parent, let them take responsibility
+        if self.get_parent():
+            self.reset()
+            return
+
+        if self.commit_mode == CommitMode.OFF:
+            self.rollback()
+        elif self.commit_mode == CommitMode.LAZY:
+            await self.acommit()
+
+        self.reset()
+
+    def _prepare_enter(self) -> None:
+        if self._token is not None:
+            raise RuntimeError(
+                "Context already entered. Context enter calls cannot be nested."
+            )
+        # set default commit behavior
+        if self.commit_mode is None:
+            parent = get_transaction()
+
+            # either inherit from parent or set a default of eager
+            if parent:
+                self.commit_mode = parent.commit_mode
+            else:
+                self.commit_mode = CommitMode.LAZY
+
+        # this needs to go before begin, which could set the state to committed
+        self.state = TransactionState.ACTIVE
+
     def begin(self):
         # currently we only support READ_COMMITTED isolation
         # i.e., no locking behavior
@@ -143,6 +184,15 @@ class Transaction(ContextModel):
         ):
             self.state = TransactionState.COMMITTED
 
+    async def abegin(self):
+        if (
+            not self.overwrite
+            and self.store
+            and self.key
+            and await self.store.aexists(key=self.key)
+        ):
+            self.state = TransactionState.COMMITTED
+
     def read(self) -> BaseResult:
         if self.store and self.key:
             return self.store.read(key=self.key)
@@ -194,22 +244,48 @@ class Transaction(ContextModel):
             self.state = TransactionState.COMMITTED
             return True
         except Exception:
-            if self.logger:
-                if hook_name:
-                    msg = (
-                        f"An error was encountered while running commit hook {hook_name!r}",
-                    )
-                else:
-                    msg = (
-                        f"An error was encountered while committing transaction {self.key!r}",
-                    )
-                self.logger.exception(
-                    msg,
-                    exc_info=True,
-                )
+            self._log_commit_failure(hook_name)
             self.rollback()
             return False
 
+    async def acommit(self) -> bool:
+        if self.state in [TransactionState.ROLLED_BACK, TransactionState.COMMITTED]:
+            return False
+
+        try:
+            hook_name = None
+
+            for child in self.children:
+                await child.acommit()
+
+            for hook in self.on_commit_hooks:
+                hook_name = _get_hook_name(hook)
+                hook(self)
+
+            if self.store and self.key:
+                await self.store.awrite(key=self.key, value=self._staged_value)
+            self.state = TransactionState.COMMITTED
+            return True
+        except Exception:
+            self._log_commit_failure(hook_name)
+            self.rollback()
+            return False
+
+    def _log_commit_failure(self, hook_name: Optional[str]) -> None:
+        if self.logger:
+            if hook_name:
+                msg = (
+                    f"An error was encountered while running commit hook {hook_name!r}",
+                )
+            else:
+                msg = (
+                    f"An error was encountered while committing transaction {self.key!r}",
+                )
+            self.logger.exception(
+                msg,
+                exc_info=True,
+            )
+
     def stage(
         self,
         value: BaseResult,
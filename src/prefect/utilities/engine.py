@@ -778,6 +778,9 @@ def resolve_to_final_result(expr, context):
     """
     Resolve any `PrefectFuture`, or `State` types nested in parameters into
     data. Designed to be use with `visit_collection`.
+
+    Results that have already been fetched can be provided in the context as a
+    `result_by_state` mapping so they are not fetched again.
     """
     state = None
 
@@ -821,6 +824,10 @@ def resolve_to_final_result(expr, context):
             " 'COMPLETED' state."
         )
 
+    result_by_state = context.get("result_by_state")
+    if result_by_state and state in result_by_state:
+        return result_by_state[state]
+
     _result = state.result(raise_on_failure=False, fetch=True)
     if inspect.isawaitable(_result):
         _result = run_coro_as_sync(_result)
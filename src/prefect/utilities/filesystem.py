@@ -4,11 +4,14 @@ Utilities for working with file systems
 
 import os
 import pathlib
+import sys
 import threading
-from contextlib import contextmanager
+import time
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path, PureWindowsPath
-from typing import Optional, Union
+from typing import IO, AsyncGenerator, Callable, Generator, Optional, Union
 
+import anyio
 import fsspec
 import pathspec
 from fsspec.core import OpenFile
@@ -51,6 +54,21 @@ def filter_files(
     return included_files
 
 
+def compile_ignore_patterns(
+    ignore_patterns: Optional[list] = None,
+) -> Callable[[Union[str, Path]], bool]:
+    """
+    Compiles a list of file patterns to ignore, matching the specification of
+    [.gitignore files](https://git-scm.com/docs/gitignore), into a function that
+    returns whether a path relative to the root directory should be ignored.
+
+    Unlike `filter_files`, the patterns are compiled once and checked path by path,
+    so the directory tree does not need to be walked up front.
+    """
+    spec = pathspec.PathSpec.from_lines("gitwildmatch", ignore_patterns or [])
+    return spec.match_file
+
+
 chdir_lock = threading.Lock()
 
 
@@ -144,3 +162,68 @@ def get_open_file_limit() -> int:
         # depending on what went wrong. Return a safe default if we
         # can't get the limit from the OS.
         return 200
+
+
+# How often to check whether a lock held by another process has been released
+LOCK_POLL_INTERVAL = 0.1
+
+
+@asynccontextmanager
+async def locked(path: Path) -> AsyncGenerator[None, None]:
+    """
+    Holds an exclusive lock on the given file, which is shared with other processes
+    on this machine, for the duration of the context.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        while not _try_lock(f):
+            await anyio.sleep(LOCK_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            _unlock(f)
+
+
+@contextmanager
+def locked_sync(path: Path) -> Generator[None, None, None]:
+    """
+    Like `locked`, for synchronous code, blocking the calling thread until the lock is
+    acquired.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        while not _try_lock(f):
+            time.sleep(LOCK_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            _unlock(f)
+
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _try_lock(f: IO) -> bool:
+        try:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def _unlock(f: IO) -> None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _try_lock(f: IO) -> bool:
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+
+    def _unlock(f: IO) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -1,6 +1,11 @@
+import asyncio
+import threading
+import time
+
 import anyio
+import pytest
 
-from prefect._internal.concurrency.primitives import Event
+from prefect._internal.concurrency.primitives import Event, Semaphore
 
 
 def test_event_set_in_sync_context_before_wait():
@@ -163,3 +168,66 @@ async def test_event_is_set():
     assert not event.is_set()
     event.set()
     assert event.is_set()
+
+
+def test_semaphore_rejects_negative_value():
+    with pytest.raises(ValueError):
+        Semaphore(-1)
+
+
+def test_semaphore_limits_threads_and_event_loops_together():
+    semaphore = Semaphore(2)
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def enter():
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+
+    def exit():
+        nonlocal running
+        with lock:
+            running -= 1
+
+    def in_thread():
+        with semaphore:
+            enter()
+            time.sleep(0.05)
+            exit()
+
+    async def in_loop():
+        async def run():
+            async with semaphore:
+                enter()
+                await asyncio.sleep(0.05)
+                exit()
+
+        await asyncio.gather(*[run() for _ in range(3)])
+
+    threads = [threading.Thread(target=in_thread) for _ in range(3)]
+    threads.append(threading.Thread(target=asyncio.run, args=(in_loop(),)))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert max_running == 2
+    assert semaphore._value == 2
+
+
+async def test_semaphore_cancelled_waiter_does_not_take_slot():
+    semaphore = Semaphore(1)
+    await semaphore.acquire_async()
+
+    waiter = asyncio.ensure_future(semaphore.acquire_async())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    semaphore.release()
+    with anyio.fail_after(1):
+        await semaphore.acquire_async()
@@ -0,0 +1,144 @@
+import time
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from pydantic import SecretStr
+
+from prefect.blocks.cache import block_cache
+from prefect.blocks.core import Block
+from prefect.client.orchestration import get_client
+from prefect.events.schemas.events import Event
+from prefect.settings import PREFECT_BLOCKS_CACHE_TTL, temporary_settings
+
+
+class CachedThing(Block):
+    value: int
+    password: SecretStr
+
+
+@pytest.fixture(autouse=True)
+def cache():
+    # don't follow events from the test API in the background
+    block_cache._watching = True
+    block_cache.clear()
+    with temporary_settings({PREFECT_BLOCKS_CACHE_TTL: timedelta(minutes=1)}):
+        yield block_cache
+    block_cache.clear()
+
+
+@pytest.fixture
+async def saved_block() -> CachedThing:
+    block = CachedThing(value=1, password="hunter2")
+    await block.save(f"cached-{uuid4()}")
+    return block
+
+
+async def test_loads_are_cached(cache, saved_block: CachedThing):
+    first = await CachedThing.load(saved_block._block_document_name)
+    second = await CachedThing.load(saved_block._block_document_name)
+
+    assert first == second
+    assert second.password.get_secret_value() == "hunter2"
+    assert second._block_document_id == saved_block._block_document_id
+
+    metrics = cache.metrics()
+    assert (metrics.hits, metrics.misses, metrics.size) == (1, 1, 1)
+
+
+async def test_cached_blocks_are_copies(saved_block: CachedThing):
+    first = await CachedThing.load(saved_block._block_document_name)
+    first.value = 100
+
+    second = await CachedThing.load(saved_block._block_document_name)
+    assert second.value == 1
+    assert second is not first
+
+
+async def test_loads_from_other_apis_are_cached_separately(
+    cache, saved_block: CachedThing
+):
+    name = saved_block._block_document_name
+    async with get_client() as client:
+        block_document = await client.read_block_document_by_name(
+            name=name, block_type_slug=CachedThing.get_block_type_slug()
+        )
+
+    other_client = MagicMock(api_url="http://elsewhere/api/")
+    other_client.read_block_document_by_name = AsyncMock(
+        return_value=block_document.model_copy(
+            update={"data": {**block_document.data, "value": 2}}
+        )
+    )
+
+    assert (await CachedThing.load(name)).value == 1
+    assert (await CachedThing.load(name, client=other_client)).value == 2
+    assert (await CachedThing.load(name, client=other_client)).value == 2
+    assert (await CachedThing.load(name)).value == 1
+
+    metrics = cache.metrics()
+    assert (metrics.hits, metrics.misses, metrics.size) == (2, 2, 2)
+
+
+async def test_cache_is_disabled_without_a_ttl(cache, saved_block: CachedThing):
+    with temporary_settings({PREFECT_BLOCKS_CACHE_TTL: timedelta(0)}):
+        await CachedThing.load(saved_block._block_document_name)
+        await CachedThing.load(saved_block._block_document_name)
+
+    assert cache.metrics().size == 0
+
+
+async def test_cached_blocks_expire(cache, saved_block: CachedThing):
+    with temporary_settings({PREFECT_BLOCKS_CACHE_TTL: timedelta(milliseconds=50)}):
+        await CachedThing.load(saved_block._block_document_name)
+        time.sleep(0.1)
+        await CachedThing.load(saved_block._block_document_name)
+
+    assert cache.metrics().misses == 2
+
+
+async def test_saving_a_block_invalidates_it(cache, saved_block: CachedThing):
+    name = saved_block._block_document_name
+    loaded = await CachedThing.load(name)
+
+    loaded.value = 2
+    await loaded.save(name, overwrite=True)
+
+    assert (await CachedThing.load(name)).value == 2
+    assert cache.metrics().invalidations == 1
+
+
+async def test_deleting_a_block_invalidates_it(cache, saved_block: CachedThing):
+    name = saved_block._block_document_name
+    await CachedThing.load(name)
+
+    await CachedThing.delete(name)
+
+    with pytest.raises(ValueError, match="Unable to find block document"):
+        await CachedThing.load(name)
+
+
+async def test_block_document_events_invalidate_blocks(cache, saved_block: CachedThing):
+    await CachedThing.load(saved_block._block_document_name)
+
+    cache.invalidate_for_event(
+        Event(
+            event="prefect.flow-run.Completed",
+            resource={"prefect.resource.id": f"prefect.flow-run.{uuid4()}"},
+        )
+    )
+    assert cache.metrics().size == 1
+
+    cache.invalidate_for_event(
+        Event(
+            event="prefect.block-document.updated",
+            resource={
+                "prefect.resource.id": (
+                    f"prefect.block-document.{saved_block._block_document_id}"
+                )
+            },
+        )
+    )
+    assert cache.metrics().size == 0
+    assert cache.metrics().invalidations == 1
@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from typing import Any, AsyncGenerator, Dict, List, Tuple
@@ -11,7 +12,16 @@ from starlette import status
 import prefect
 import prefect.client
 import prefect.client.constants
-from prefect.client.base import PrefectHttpxAsyncClient, PrefectResponse
+from prefect.client.base import (
+    PrefectHttpxAsyncClient,
+    PrefectHttpxSyncClient,
+    PrefectResponse,
+    SharedAsyncHTTPTransport,
+    SharedHTTPTransport,
+    get_shared_transport,
+    get_shared_transport_metrics,
+    use_shared_transport,
+)
 from prefect.client.schemas.objects import CsrfToken
 from prefect.exceptions import PrefectHTTPStatusError
 from prefect.settings import (
@@ -739,3 +749,99 @@ class TestUserAgent:
         assert isinstance(request, httpx.Request)
 
         assert request.headers["User-Agent"] == "prefect/42.43.44 (API 45.46.47)"
+
+
+class TestSharedTransport:
+    def test_shared_transport_is_reused_for_matching_settings(self):
+        limits = httpx.Limits(max_connections=3)
+        transport = get_shared_transport(sync=False, http2=True, limits=limits)
+
+        assert isinstance(transport, SharedAsyncHTTPTransport)
+        assert (
+            get_shared_transport(
+                sync=False, http2=True, limits=httpx.Limits(max_connections=3)
+            )
+            is transport
+        )
+        assert get_shared_transport(sync=False, http2=False, limits=limits) is not (
+            transport
+        )
+        assert isinstance(
+            get_shared_transport(sync=True, http2=True, limits=limits),
+            SharedHTTPTransport,
+        )
+
+    def test_clients_share_transport(self):
+        settings = {"base_url": "https://127.0.0.1:4242/api", "http2": True}
+        first = PrefectHttpxSyncClient(**settings)
+        second = PrefectHttpxSyncClient(**settings)
+
+        assert use_shared_transport(first, "https://127.0.0.1:4242/api", settings)
+        assert use_shared_transport(second, "https://127.0.0.1:4242/api", settings)
+        assert first._transport is second._transport
+
+    def test_closing_client_does_not_close_shared_transport(self):
+        settings = {"base_url": "https://127.0.0.1:4242/api"}
+        client = PrefectHttpxSyncClient(**settings)
+        assert use_shared_transport(client, "https://127.0.0.1:4242/api", settings)
+
+        with mock.patch.object(client._transport._transport, "close") as close:
+            client.close()
+
+        close.assert_not_called()
+
+    def test_user_transport_is_not_replaced(self):
+        transport = httpx.HTTPTransport()
+        settings = {"base_url": "https://127.0.0.1:4242/api", "transport": transport}
+        client = PrefectHttpxSyncClient(**settings)
+
+        assert not use_shared_transport(client, "https://127.0.0.1:4242/api", settings)
+        assert client._transport is transport
+
+    async def test_shared_transport_metrics(self, hosted_api_server: str):
+        settings = {"base_url": hosted_api_server}
+        async with PrefectHttpxAsyncClient(**settings) as client:
+            assert use_shared_transport(client, hosted_api_server, settings)
+            for _ in range(3):
+                response = await client.get("/health")
+                assert response.status_code == 200
+
+            transport = client._transport
+
+        metrics = transport.metrics()
+        assert metrics.total_requests == 3
+        assert metrics.peak_requests == 1
+        assert metrics.max_connections == httpx.Limits().max_connections
+        assert metrics.connections == 1
+        assert metrics.idle_connections == 1
+        assert metrics.queued_requests == 0
+        assert not metrics.saturated
+
+        assert metrics in get_shared_transport_metrics()
+
+    def test_event_loop_pool_is_closed_when_loop_shuts_down(self):
+        transport = SharedAsyncHTTPTransport(
+            verify=True, cert=None, http2=False, limits=httpx.Limits(), trust_env=True
+        )
+        closed = []
+
+        async def handle_async_request(self, request):
+            return httpx.Response(200, request=request)
+
+        async def aclose(self):
+            closed.append(self)
+
+        async def send():
+            await transport.handle_async_request(
+                httpx.Request("GET", "https://127.0.0.1:4242/api/health")
+            )
+            return transport._pools()
+
+        with mock.patch.object(
+            httpx.AsyncHTTPTransport, "handle_async_request", handle_async_request
+        ), mock.patch.object(httpx.AsyncHTTPTransport, "aclose", aclose):
+            pools = asyncio.run(send())
+
+        assert len(pools) == 1
+        assert len(closed) == 1
+        assert transport._pools() == []
@@ -23,6 +23,7 @@ import prefect.context
 import prefect.exceptions
 import prefect.server.api
 from prefect import flow, tags
+from prefect.client.base import SharedAsyncHTTPTransport
 from prefect.client.constants import SERVER_API_VERSION
 from prefect.client.orchestration import (
     PrefectClient,
@@ -76,6 +77,7 @@ from prefect.settings import (
     PREFECT_API_TLS_INSECURE_SKIP_VERIFY,
     PREFECT_API_URL,
     PREFECT_CLIENT_CSRF_SUPPORT_ENABLED,
+    PREFECT_CLIENT_SHARED_TRANSPORT,
     PREFECT_CLOUD_API_URL,
     PREFECT_UNIT_TEST_MODE,
     temporary_settings,
@@ -114,12 +116,24 @@ class TestClientProxyAwareness:
         with temporary_settings(updates={PREFECT_API_URL: api_url}):
             yield httpx.URL(api_url)
 
+    def test_unproxied_remote_client_uses_shared_transport(
+        self, remote_https_api: httpx.URL
+    ):
+        httpx_client = get_client()._client
+        assert isinstance(httpx_client, httpx.AsyncClient)
+
+        transport_for_api = httpx_client._transport_for_url(remote_https_api)
+        assert isinstance(transport_for_api, SharedAsyncHTTPTransport)
+        assert transport_for_api is get_client()._client._transport
+        assert transport_for_api._transport_kwargs["retries"] == 3
+
     def test_unproxied_remote_client_will_retry(self, remote_https_api: httpx.URL):
         """The original issue here was that we were overriding the `transport` in
         order to set the retries to 3; this is what circumvented the proxy support.
         This test (and those below) should confirm that we are setting the retries on
         the transport's pool in all cases."""
-        httpx_client = get_client()._client
+        with temporary_settings(updates={PREFECT_CLIENT_SHARED_TRANSPORT: False}):
+            httpx_client = get_client()._client
         assert isinstance(httpx_client, httpx.AsyncClient)
 
         transport_for_api = httpx_client._transport_for_url(remote_https_api)
@@ -926,6 +940,43 @@ async def test_read_flow_runs_with_filtering(prefect_client):
     assert {flow_run.id for flow_run in flow_runs} == {fr_id_4, fr_id_5}
 
 
+async def test_iterate_flow_runs(prefect_client, monkeypatch):
+    monkeypatch.setattr("prefect.server.api.pagination.EXPORT_PAGE_SIZE", 2)
+
+    @flow
+    def foo():
+        pass
+
+    @flow
+    def bar():
+        pass
+
+    flow_run_ids = {(await prefect_client.create_flow_run(foo)).id for _ in range(5)}
+    await prefect_client.create_flow_run(bar)
+
+    flow_runs = [
+        flow_run
+        async for flow_run in prefect_client.iterate_flow_runs(
+            flow_filter=FlowFilter(name=dict(any_=["foo"]))
+        )
+    ]
+    assert all(isinstance(flow_run, client_schemas.FlowRun) for flow_run in flow_runs)
+    assert [flow_run.id for flow_run in flow_runs] == sorted(
+        flow_run_ids, key=str, reverse=True
+    )
+
+    limited = [flow_run async for flow_run in prefect_client.iterate_flow_runs(limit=3)]
+    assert len(limited) == 3
+
+
+async def test_iterate_flow_runs_with_unsupported_sort(prefect_client):
+    with pytest.raises(prefect.exceptions.PrefectHTTPStatusError, match="422"):
+        async for _ in prefect_client.iterate_flow_runs(
+            sort=client_schemas.sorting.FlowRunSort.NAME_ASC
+        ):
+            pass
+
+
 async def test_read_flows_without_filter(prefect_client):
     @flow
     def foo():
@@ -1115,6 +1166,36 @@ async def test_create_then_read_task_run(prefect_client):
     assert lookup == task_run
 
 
+async def test_iterate_task_runs(prefect_client):
+    @flow
+    def foo():
+        pass
+
+    @task
+    def bar():
+        pass
+
+    flow_run = await prefect_client.create_flow_run(foo)
+    task_runs = [
+        await prefect_client.create_task_run(
+            bar, flow_run_id=flow_run.id, dynamic_key=str(i)
+        )
+        for i in range(3)
+    ]
+
+    iterated = [
+        task_run
+        async for task_run in prefect_client.iterate_task_runs(
+            flow_run_filter=FlowRunFilter(id=dict(any_=[flow_run.id])),
+            sort=client_schemas.sorting.TaskRunSort.EXPECTED_START_TIME_ASC,
+        )
+    ]
+    assert all(isinstance(task_run, TaskRun) for task_run in iterated)
+    assert {task_run.id for task_run in iterated} == {
+        task_run.id for task_run in task_runs
+    }
+
+
 async def test_delete_task_run(prefect_client):
     @task
     def bar():
@@ -1331,6 +1412,30 @@ async def test_read_filtered_logs(session, prefect_client, deployment):
         assert log.flow_run_id not in flow_runs[3:]
 
 
+async def test_iterate_logs(prefect_client):
+    flow_run_id = uuid4()
+    now = DateTime.now("UTC")
+    logs = [
+        LogCreate(
+            name="prefect.flow_runs",
+            level=20,
+            message=f"Log {i}",
+            timestamp=now.add(seconds=i),
+            flow_run_id=flow_run_id if i % 2 else uuid4(),
+        )
+        for i in range(6)
+    ]
+    await prefect_client.create_logs(logs)
+
+    logs = [
+        log
+        async for log in prefect_client.iterate_logs(
+            log_filter=LogFilter(flow_run_id=LogFilterFlowRunId(any_=[flow_run_id]))
+        )
+    ]
+    assert [log.message for log in logs] == ["Log 1", "Log 3", "Log 5"]
+
+
 async def test_prefect_api_tls_insecure_skip_verify_setting_set_to_true(monkeypatch):
     with temporary_settings(updates={PREFECT_API_TLS_INSECURE_SKIP_VERIFY: True}):
         mock = Mock()
@@ -0,0 +1,54 @@
+from typing import Any, Dict, List
+
+import orjson
+
+from prefect._internal.schemas.bases import IDBaseModel
+from prefect.client.subscriptions import Subscription
+
+
+class Thing(IDBaseModel):
+    name: str
+
+
+class FakeWebsocket:
+    def __init__(self, messages: List[Any]):
+        self.messages = [orjson.dumps(message).decode() for message in messages]
+        self.sent: List[Dict[str, Any]] = []
+
+    async def recv(self) -> str:
+        return self.messages.pop(0)
+
+    async def send(self, message: str) -> None:
+        self.sent.append(orjson.loads(message))
+
+
+def subscription(prefetch: int, websocket: FakeWebsocket) -> Subscription[Thing]:
+    subscription = Subscription(
+        Thing, "/things", ["thing"], base_url="http://localhost", prefetch=prefetch
+    )
+    subscription._websocket = websocket
+    return subscription
+
+
+async def test_items_are_acknowledged_when_received():
+    websocket = FakeWebsocket([{"name": "a"}, {"name": "b"}])
+    things = subscription(1, websocket)
+
+    assert (await things.__anext__()).name == "a"
+    assert websocket.sent == [{"type": "ack"}]
+
+
+async def test_prefetched_items_are_acknowledged_as_the_next_is_requested():
+    websocket = FakeWebsocket(
+        [[{"name": "a"}, {"name": "b"}], [{"name": "c"}]],
+    )
+    things = subscription(2, websocket)
+
+    assert (await things.__anext__()).name == "a"
+    assert websocket.sent == []
+
+    assert (await things.__anext__()).name == "b"
+    assert websocket.sent == [{"type": "ack"}]
+
+    assert (await things.__anext__()).name == "c"
+    assert websocket.sent == [{"type": "ack"}] * 2
@@ -14,8 +14,13 @@ from prefect.blocks.core import Block
 from prefect.blocks.system import Secret
 from prefect.client.orchestration import PrefectClient
 from prefect.deployments.steps import run_step
-from prefect.deployments.steps.core import StepExecutionError, run_steps
+from prefect.deployments.steps.core import (
+    _STEP_FUNCTIONS,
+    StepExecutionError,
+    run_steps,
+)
 from prefect.deployments.steps.utility import run_shell_script
+from prefect.settings import PREFECT_HOME
 from prefect.testing.utilities import AsyncMock, MagicMock
 from prefect.utilities.filesystem import tmpchdir
 
@@ -30,6 +35,14 @@ async def variables(prefect_client: PrefectClient):
     )
 
 
+@pytest.fixture(autouse=True)
+def clear_step_functions():
+    # Steps are resolved once per process; tests mock their imports differently
+    _STEP_FUNCTIONS.clear()
+    yield
+    _STEP_FUNCTIONS.clear()
+
+
 @pytest.fixture(scope="session")
 def set_dummy_env_var():
     import os
@@ -135,7 +148,9 @@ class TestRunStep:
 
         monkeypatch.setattr(subprocess, "check_call", MagicMock())
 
-        import_object_mock = MagicMock(side_effect=[ImportError, lambda x: x])
+        import_object_mock = MagicMock(
+            side_effect=[ImportError, ImportError, lambda x: x]
+        )
         monkeypatch.setattr(
             "prefect.deployments.steps.core.import_object", import_object_mock
         )
@@ -144,10 +159,9 @@ class TestRunStep:
             {"test_module.test_function": {"requires": "test-package>=1.0.0", "x": 1}}
         )
 
-        import_module_mock.assert_called_once_with("test_package")
-        assert (
-            import_object_mock.call_count == 2
-        )  # once before and once after installation
+        # before installing, after waiting for the lock, and after installing
+        assert import_module_mock.call_args_list == [call("test_package")] * 2
+        assert import_object_mock.call_count == 3
         subprocess.check_call.assert_called_once_with(
             [sys.executable, "-m", "pip", "install", "test-package>=1.0.0"]
         )
@@ -172,17 +186,20 @@ class TestRunStep:
 
         monkeypatch.setattr(subprocess, "check_call", MagicMock())
 
-        import_object_mock = MagicMock(side_effect=[ImportError, lambda x: x])
+        import_object_mock = MagicMock(
+            side_effect=[ImportError, ImportError, lambda x: x]
+        )
         monkeypatch.setattr(
             "prefect.deployments.steps.core.import_object", import_object_mock
         )
 
         await run_step({"test_module.test_function": {"requires": package, "x": 1}})
 
-        import_module_mock.assert_called_once_with(package.replace("-", "_"))
+        # before installing, after waiting for the lock, and after installing
         assert (
-            import_object_mock.call_count == 2
-        )  # once before and once after installation
+            import_module_mock.call_args_list == [call(package.replace("-", "_"))] * 2
+        )
+        assert import_object_mock.call_count == 3
         subprocess.check_call.assert_called_once_with(
             [sys.executable, "-m", "pip", "install", expected]
         )
@@ -191,7 +208,7 @@ class TestRunStep:
         """
         Test that passing multiple requirements installs all of them.
         """
-        import_module_mock = MagicMock(side_effect=[None, ImportError])
+        import_module_mock = MagicMock(side_effect=[None, ImportError] * 2)
         monkeypatch.setattr(
             "prefect.deployments.steps.core.import_module", import_module_mock
         )
@@ -255,6 +272,85 @@ class TestRunStep:
         assert record is not None, "No warning was logged"
         assert record.levelname == "WARNING"
 
+    async def test_step_functions_are_resolved_once(self, monkeypatch):
+        import_module_mock = MagicMock()
+        monkeypatch.setattr(
+            "prefect.deployments.steps.core.import_module", import_module_mock
+        )
+        monkeypatch.setattr(subprocess, "check_call", MagicMock())
+
+        import_object_mock = MagicMock(
+            side_effect=[ImportError, ImportError, lambda x: x]
+        )
+        monkeypatch.setattr(
+            "prefect.deployments.steps.core.import_object", import_object_mock
+        )
+
+        for _ in range(3):
+            output = await run_step(
+                {"test_module.test_function": {"requires": "test-package", "x": 1}}
+            )
+            assert output == 1
+
+        assert import_module_mock.call_args_list == [call("test_package")] * 2
+        assert import_object_mock.call_count == 3
+        subprocess.check_call.assert_called_once()
+
+    async def test_step_functions_are_resolved_by_requirements(self, monkeypatch):
+        import_module_mock = MagicMock()
+        monkeypatch.setattr(
+            "prefect.deployments.steps.core.import_module", import_module_mock
+        )
+        monkeypatch.setattr(
+            "prefect.deployments.steps.core.import_object",
+            MagicMock(return_value=lambda x: x),
+        )
+
+        await run_step({"test_module.test_function": {"requires": "a", "x": 1}})
+        await run_step({"test_module.test_function": {"requires": "b", "x": 1}})
+
+        import_module_mock.assert_has_calls([call("a"), call("b")])
+
+    async def test_requirements_are_installed_under_a_lock(self, monkeypatch):
+        from prefect.utilities.filesystem import _try_lock
+
+        monkeypatch.setattr("prefect.deployments.steps.core.import_module", MagicMock())
+        monkeypatch.setattr(
+            "prefect.deployments.steps.core.import_object",
+            MagicMock(side_effect=[ImportError, ImportError, lambda x: x]),
+        )
+
+        lock_path = PREFECT_HOME.value() / "step-requirements.lock"
+
+        held = []
+
+        def check_call(args):
+            # the lock is held while pip runs
+            with open(lock_path, "a") as f:
+                held.append(not _try_lock(f))
+
+        monkeypatch.setattr(subprocess, "check_call", check_call)
+
+        await run_step({"test_module.test_function": {"requires": "test", "x": 1}})
+        assert held == [True]
+
+    async def test_requirements_installed_while_waiting_for_the_lock_are_used(
+        self, monkeypatch
+    ):
+        monkeypatch.setattr("prefect.deployments.steps.core.import_module", MagicMock())
+        monkeypatch.setattr(
+            "prefect.deployments.steps.core.import_object",
+            MagicMock(side_effect=[ImportError, lambda x: x]),
+        )
+        monkeypatch.setattr(subprocess, "check_call", MagicMock())
+
+        output = await run_step(
+            {"test_module.test_function": {"requires": "test", "x": 1}}
+        )
+
+        assert output == 1
+        subprocess.check_call.assert_not_called()
+
 
 class TestRunSteps:
     async def test_run_steps_runs_multiple_steps(self):
@@ -544,7 +640,8 @@ class TestPullFromRemoteStorage:
             }
         )
         assert output["directory"] == "bucket/folder"
-        import_module_mock.assert_called_once_with("s3fs")
+        # before installing and after waiting for the lock
+        assert import_module_mock.call_args_list == [call("s3fs")] * 2
         subprocess_mock.check_call.assert_called_once_with(
             [sys.executable, "-m", "pip", "install", "s3fs<3.0"]
         )
@@ -1,11 +1,15 @@
+import logging
 from typing import List
+from unittest import mock
 from uuid import UUID, uuid4
 
+import orjson
 import pendulum
 import pytest
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import prefect.server.events.storage.database
 from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.events.filters import (
     EventFilter,
@@ -15,9 +19,17 @@ from prefect.server.events.filters import (
 )
 from prefect.server.events.schemas.events import ReceivedEvent
 from prefect.server.events.storage.database import (
+    EVENT_COPY_COLUMNS,
+    EVENT_RESOURCE_COPY_COLUMNS,
+    Partition,
+    _event_copy_record,
+    _event_resource_copy_records,
+    create_event_partitions,
+    delete_old_events,
     get_max_query_parameters,
     get_number_of_event_fields,
     get_number_of_resource_fields,
+    partition_name,
     read_events,
     write_events,
 )
@@ -166,6 +178,40 @@ class TestWriteEvents:
                 assert len(list(results)) == len(event.related) + 1
 
 
+class TestBulkInsertRecords:
+    def test_event_copy_record_matches_database_row(self, event: ReceivedEvent):
+        row = event.as_database_row()
+        record = dict(
+            zip(EVENT_COPY_COLUMNS, _event_copy_record(event, row["recorded"]))
+        )
+
+        for column in ("resource", "related_resource_ids", "related", "payload"):
+            assert orjson.loads(record.pop(column)) == row[column]
+
+        assert record == {column: row[column] for column in record}
+
+    def test_event_resource_copy_records_match_database_rows(
+        self, event: ReceivedEvent
+    ):
+        rows = event.as_database_resource_rows()
+        records = [
+            dict(zip(EVENT_RESOURCE_COPY_COLUMNS, record))
+            for record in _event_resource_copy_records(event)
+        ]
+
+        for record in records:
+            record["resource"] = orjson.loads(record["resource"])
+
+        assert records == rows
+
+    def test_event_copy_record_stores_nan_as_null(self, event: ReceivedEvent):
+        event.payload = {"value": float("nan")}
+        record = dict(
+            zip(EVENT_COPY_COLUMNS, _event_copy_record(event, pendulum.now("UTC")))
+        )
+        assert orjson.loads(record["payload"]) == {"value": None}
+
+
 class TestReadEvents:
     @pytest.fixture
     async def event_1(self, session: AsyncSession) -> ReceivedEvent:
@@ -246,3 +292,132 @@ class TestReadEvents:
                 ),
             )
             assert len(events) == 0
+
+
+class TestRetention:
+    @pytest.fixture
+    async def old_and_new_events(
+        self, session: AsyncSession, event: ReceivedEvent
+    ) -> List[ReceivedEvent]:
+        events = [
+            event.model_copy(
+                update={
+                    "id": uuid4(),
+                    "occurred": pendulum.now("UTC").subtract(days=i),
+                }
+            )
+            for i in range(10)
+        ]
+        await write_events(session, events)
+        await session.commit()
+        return events
+
+    async def test_delete_old_events_deletes_in_chunks(
+        self,
+        session: AsyncSession,
+        db: PrefectDBInterface,
+        old_and_new_events: List[ReceivedEvent],
+    ):
+        five_days_ago = pendulum.now("UTC").subtract(days=5)
+
+        deleted = await delete_old_events(session, five_days_ago, limit=3)
+        await session.commit()
+
+        assert deleted == {"events": 3, "event_resources": 3}
+
+        deleted = await delete_old_events(session, five_days_ago, limit=100)
+        await session.commit()
+
+        assert deleted == {"events": 2, "event_resources": 17}
+
+        remaining = (await session.scalars(sa.select(db.Event.occurred))).all()
+        assert len(remaining) == 5
+        assert all(occurred >= five_days_ago for occurred in remaining)
+
+        resources = (await session.scalars(sa.select(db.EventResource.occurred))).all()
+        assert len(resources) == 5 * 4
+        assert all(occurred >= five_days_ago for occurred in resources)
+
+    def test_partition_names(self):
+        start = pendulum.datetime(2024, 6, 1, 13, tz="UTC")
+        assert partition_name("events", start, "day") == "events_p20240601"
+        assert partition_name("events", start, "hour") == "events_p2024060113"
+
+    def test_partition_overlaps(self):
+        june_first = pendulum.datetime(2024, 6, 1, tz="UTC")
+        june_second = june_first.add(days=1)
+        partition = Partition("events_p20240601", june_first, june_second)
+
+        assert partition.overlaps(june_first, june_second)
+        assert partition.overlaps(june_first.add(hours=3), june_first.add(hours=4))
+        assert not partition.overlaps(june_second, june_second.add(days=1))
+        assert not partition.overlaps(june_first.subtract(days=1), june_first)
+
+        legacy = Partition("events_legacy", None, june_first)
+        assert legacy.overlaps(june_first.subtract(days=100), june_first)
+        assert not legacy.overlaps(june_first, june_second)
+
+        default = Partition("events_default", None, None)
+        assert default.is_default
+        assert not default.overlaps(june_first, june_second)
+
+    def test_primary_keys_include_the_partition_key(self, db: PrefectDBInterface):
+        for model in (db.Event, db.EventResource):
+            assert [column.name for column in model.__table__.primary_key] == [
+                "id",
+                "occurred",
+            ]
+
+    @staticmethod
+    def failing_session(
+        monkeypatch: pytest.MonkeyPatch, message: str, sqlstate: str
+    ) -> mock.MagicMock:
+        async def read_partitions(session, table):
+            return []
+
+        monkeypatch.setattr(
+            prefect.server.events.storage.database, "read_partitions", read_partitions
+        )
+
+        error = Exception(message)
+        error.sqlstate = sqlstate
+
+        session = mock.MagicMock()
+        session.begin_nested.return_value.__aexit__.return_value = False
+        session.execute = mock.AsyncMock(
+            side_effect=sa.exc.ProgrammingError(
+                "ALTER TABLE events ATTACH PARTITION", {}, error
+            )
+        )
+        return session
+
+    async def test_partitions_attached_by_another_server_are_skipped(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ):
+        session = self.failing_session(
+            monkeypatch, '"events_p20240601" is already a partition', "42809"
+        )
+
+        created = await create_event_partitions(
+            session, now=pendulum.datetime(2024, 6, 1, tz="UTC")
+        )
+
+        assert created == []
+        assert session.begin_nested.call_count == session.execute.await_count > 0
+        assert not [r for r in caplog.records if r.levelno >= logging.WARNING]
+
+    async def test_other_partition_failures_are_logged_as_warnings(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ):
+        session = self.failing_session(
+            monkeypatch, "permission denied for table events", "42501"
+        )
+
+        created = await create_event_partitions(
+            session, now=pendulum.datetime(2024, 6, 1, tz="UTC")
+        )
+
+        assert created == []
+        warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+        assert warnings
+        assert "Failed to create partition events_p20240601" in warnings[0].getMessage()
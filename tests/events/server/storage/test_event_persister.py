@@ -333,3 +333,207 @@ async def test_trims_messages_periodically(
     assert len(remaining_events) == 5
 
     assert all(event.occurred >= five_days_ago for event in remaining_events)
+
+
+class TestAdaptiveBatchSize:
+    def test_grows_after_fast_full_batches(self):
+        sizer = event_persister.AdaptiveBatchSize(
+            minimum=10, maximum=35, target_latency=timedelta(seconds=1)
+        )
+        assert sizer.size == 10
+
+        sizer.record(10, 0.1)
+        assert sizer.size == 20
+
+        sizer.record(20, 0.1)
+        assert sizer.size == 35
+
+        sizer.record(35, 0.1)
+        assert sizer.size == 35
+
+    def test_does_not_grow_after_partial_batches(self):
+        sizer = event_persister.AdaptiveBatchSize(
+            minimum=10, maximum=100, target_latency=timedelta(seconds=1)
+        )
+        sizer.record(3, 0.1)
+        assert sizer.size == 10
+
+    def test_shrinks_after_slow_batches(self):
+        sizer = event_persister.AdaptiveBatchSize(
+            minimum=10, maximum=100, target_latency=timedelta(seconds=1)
+        )
+        sizer.size = 80
+
+        sizer.record(80, 2.0)
+        assert sizer.size == 40
+
+        sizer.record(40, 0.75)
+        assert sizer.size == 40
+
+        sizer.shrink()
+        sizer.shrink()
+        sizer.shrink()
+        assert sizer.size == 10
+
+
+async def test_adaptive_batches_flush_all_events(
+    event: ReceivedEvent,
+    session: AsyncSession,
+):
+    async with event_persister.create_handler(
+        batch_size=2,
+        max_batch_size=16,
+        flush_every=timedelta(seconds=0.001),
+    ) as handler:
+        for _ in range(50):
+            event.id = uuid4()
+            message = CapturedMessage(
+                data=event.model_dump_json().encode(),
+                attributes={},
+            )
+            await handler(message)
+
+        await asyncio.sleep(0.1)
+
+        assert (await get_event_count(session)) == 50
+
+
+def event_message(event: ReceivedEvent) -> CapturedMessage:
+    event.id = uuid4()
+    return CapturedMessage(data=event.model_dump_json().encode(), attributes={})
+
+
+async def test_full_queue_holds_back_the_consumer(
+    event: ReceivedEvent,
+    session: AsyncSession,
+):
+    metrics = event_persister.EventPersisterMetrics()
+    async with event_persister.create_handler(
+        batch_size=10,
+        flush_every=timedelta(days=100),
+        max_queue_size=3,
+        metrics=metrics,
+    ) as handler:
+        for _ in range(3):
+            await handler(event_message(event))
+
+        assert metrics.queue_depth == 3
+        assert metrics.max_queue_size == 3
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(handler(event_message(event)), timeout=0.1)
+
+        assert metrics.queue_depth == 3
+
+    assert (await get_event_count(session)) == 3
+    assert metrics.queue_depth == 0
+    assert metrics.persisted == 3
+
+
+@pytest.fixture
+def failing_writes(monkeypatch: pytest.MonkeyPatch):
+    """Fails the given number of writes before writing events normally"""
+    failures = {"remaining": 0}
+
+    async def flaky_write_events(session: AsyncSession, events):
+        if failures["remaining"]:
+            failures["remaining"] -= 1
+            raise ValueError("database is unavailable")
+        await write_events(session=session, events=events)
+
+    monkeypatch.setattr(event_persister, "write_events", flaky_write_events)
+    return failures
+
+
+async def test_retries_failed_batches_with_backoff(
+    event: ReceivedEvent,
+    session: AsyncSession,
+    failing_writes,
+):
+    failing_writes["remaining"] = 2
+    metrics = event_persister.EventPersisterMetrics()
+    async with event_persister.create_handler(
+        batch_size=4,
+        flush_every=timedelta(days=100),
+        retry_delay=timedelta(seconds=0.001),
+        metrics=metrics,
+    ) as handler:
+        for _ in range(8):
+            await handler(event_message(event))
+
+        assert (await get_event_count(session)) == 8
+
+    assert metrics.retries == 2
+    assert metrics.failed_rows == 0
+    assert metrics.batches == 2
+    assert metrics.persisted == 8
+    assert metrics.max_flush_latency >= metrics.mean_flush_latency > 0
+
+
+async def test_splits_batches_that_fail_all_retries(
+    event: ReceivedEvent,
+    session: AsyncSession,
+    failing_writes,
+):
+    failing_writes["remaining"] = 2
+    metrics = event_persister.EventPersisterMetrics()
+    async with event_persister.create_handler(
+        batch_size=2,
+        flush_every=timedelta(days=100),
+        max_retries=1,
+        retry_delay=timedelta(seconds=0.001),
+        metrics=metrics,
+    ) as handler:
+        await handler(event_message(event))
+        await handler(event_message(event))
+
+        # each half of the batch is written on its own
+        assert (await get_event_count(session)) == 2
+        assert metrics.queue_depth == 0
+        assert metrics.batches == 2
+        assert metrics.failed_rows == 0
+
+
+async def test_drops_events_that_cannot_be_written(
+    event: ReceivedEvent,
+    session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    poison = event_message(event)
+    poison_id = event.id
+    attempts = []
+
+    async def write_events_except_poison(session: AsyncSession, events):
+        attempts.append(len(events))
+        if any(e.id == poison_id for e in events):
+            raise ValueError("value too long for type character varying")
+        await write_events(session=session, events=events)
+
+    monkeypatch.setattr(event_persister, "write_events", write_events_except_poison)
+
+    metrics = event_persister.EventPersisterMetrics()
+    async with event_persister.create_handler(
+        batch_size=4,
+        flush_every=timedelta(days=100),
+        max_retries=1,
+        retry_delay=timedelta(seconds=0.001),
+        metrics=metrics,
+    ) as handler:
+        await handler(event_message(event))
+        await handler(poison)
+        await handler(event_message(event))
+        await handler(event_message(event))
+
+        assert (await get_event_count(session)) == 3
+        assert metrics.queue_depth == 0
+        assert metrics.failed_rows == 1
+
+        for _ in range(4):
+            await handler(event_message(event))
+
+        assert (await get_event_count(session)) == 7
+        assert metrics.failed_rows == 1
+
+    # the batch and the half holding the poisoned event are each tried twice, then
+    # the quarters of that half, the other half, and the next batch
+    assert attempts == [4, 4, 2, 2, 1, 1, 1, 2, 4]
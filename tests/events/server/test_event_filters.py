@@ -0,0 +1,115 @@
+from typing import List
+from uuid import uuid4
+
+import pendulum
+import pytest
+
+from prefect.server.events.filters import (
+    EventAnyResourceFilter,
+    EventFilter,
+    EventIDFilter,
+    EventNameFilter,
+    EventOccurredFilter,
+    EventRelatedFilter,
+    EventResourceFilter,
+)
+from prefect.server.events.schemas.events import ReceivedEvent, ResourceSpecification
+
+NOW = pendulum.now("UTC")
+
+
+@pytest.fixture
+def events() -> List[ReceivedEvent]:
+    return [
+        ReceivedEvent(
+            occurred=NOW.subtract(minutes=i),
+            event=f"prefect.{kind}.{state}",
+            resource={
+                "prefect.resource.id": f"prefect.{kind}.{i}",
+                "prefect.resource.name": f"run-{i % 3}",
+            },
+            related=[
+                {
+                    "prefect.resource.id": f"prefect.flow.{i % 2}",
+                    "prefect.resource.role": "flow",
+                },
+                {
+                    "prefect.resource.id": f"prefect.tag.{'db' if i % 4 else 'api'}",
+                    "prefect.resource.role": "tag",
+                },
+            ],
+            id=uuid4(),
+        )
+        for i, (kind, state) in enumerate(
+            (kind, state)
+            for kind in ["flow-run", "task-run"]
+            for state in ["Pending", "Running", "Completed", "Failed"]
+            for _ in range(3)
+        )
+    ]
+
+
+@pytest.mark.parametrize(
+    "filter",
+    [
+        EventFilter(),
+        EventFilter(occurred=EventOccurredFilter(since=NOW.subtract(minutes=10))),
+        EventFilter(event=EventNameFilter(prefix=["prefect.flow-run."])),
+        EventFilter(
+            event=EventNameFilter(
+                prefix=["prefect."], exclude_prefix=["prefect.task-run."]
+            )
+        ),
+        EventFilter(
+            event=EventNameFilter(
+                name=["prefect.flow-run.Failed", "prefect.task-run.Failed"],
+                exclude_name=["prefect.task-run.Failed"],
+            )
+        ),
+        EventFilter(resource=EventResourceFilter(id=["prefect.flow-run.1"])),
+        EventFilter(resource=EventResourceFilter(id_prefix=["prefect.task-run."])),
+        EventFilter(
+            resource=EventResourceFilter(
+                labels=ResourceSpecification(
+                    {
+                        "prefect.resource.id": "prefect.flow-run.*",
+                        "prefect.resource.name": ["run-1", "!run-2"],
+                    }
+                )
+            )
+        ),
+        EventFilter(
+            any_resource=EventAnyResourceFilter(
+                id=["prefect.flow.1", "prefect.tag.api"]
+            )
+        ),
+        EventFilter(
+            any_resource=EventAnyResourceFilter(
+                id_prefix=["prefect.tag."],
+                labels=ResourceSpecification({"prefect.resource.id": "!*.db"}),
+            )
+        ),
+        EventFilter(
+            related=EventRelatedFilter(labels=ResourceSpecification({"a": "b"})),
+            event=EventNameFilter(prefix=["prefect.task-run."]),
+        ),
+    ],
+)
+def test_compiled_filter_agrees_with_filter(
+    events: List[ReceivedEvent], filter: EventFilter
+):
+    compiled = filter.compile()
+    expected = [event for event in events if filter.includes(event)]
+
+    assert [event for event in events if compiled.includes(event)] == expected
+    assert compiled.filter(events) == expected
+    assert all(compiled.excludes(event) for event in events if event not in expected)
+
+
+def test_compiled_filter_matches_ids(events: List[ReceivedEvent]):
+    compiled = EventFilter(id=EventIDFilter(id=[events[3].id, events[7].id])).compile()
+    assert compiled.filter(events) == [events[3], events[7]]
+
+
+def test_compiled_filter_of_empty_batch():
+    assert EventFilter().compile().filter([]) == []
@@ -843,3 +843,43 @@ def test_resource_specification_multiple_negative_label_values_excludes(
 ):
     resource = Resource.model_validate(resource_labels)
     assert not specification_with_multiple_labels.includes([resource])
+
+
+@pytest.mark.parametrize(
+    "expected",
+    [
+        ("a",),
+        ("a", "b"),
+        ("a*",),
+        ("a.b*", "c"),
+        ("*",),
+        ("",),
+        ("!a",),
+        ("!a*",),
+        ("!a", "!b"),
+        ("!a*", "b"),
+        ("!*",),
+        ("a.*+?",),
+        (),
+    ],
+)
+@pytest.mark.parametrize(
+    "value", [None, "", "a", "b", "c", "ab", "a.b", "a.bc", "a\nb", "a.*+?", "x"]
+)
+def test_compiled_matches_agrees_with_matches(expected, value):
+    from prefect.server.events.schemas.events import compile_matches, matches
+
+    assert compile_matches(expected)(value) == any(
+        matches(candidate, value) for candidate in expected
+    )
+
+
+def test_resource_specification_recompiles_after_pop():
+    specification = ResourceSpecification(
+        {"prefect.resource.id": "my.resource", "label": "nope"}
+    )
+    resource = Resource({"prefect.resource.id": "my.resource", "label": "yep"})
+    assert not specification.matches(resource)
+
+    specification.pop("label")
+    assert specification.matches(resource)
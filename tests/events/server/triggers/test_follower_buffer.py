@@ -0,0 +1,215 @@
+import random
+from datetime import timedelta
+from typing import List
+from uuid import UUID, uuid4
+
+import pendulum
+import pytest
+import sqlalchemy as sa
+from pendulum.datetime import DateTime
+
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.events import triggers
+from prefect.server.events.schemas.events import ReceivedEvent
+from prefect.settings import PREFECT_EVENTS_FOLLOWER_BUFFER_SIZE, temporary_settings
+
+
+def chain(length: int, start: DateTime) -> List[ReceivedEvent]:
+    """A chain of events for one resource, where each follows the one before it"""
+    resource_id = f"prefect.flow-run.{uuid4()}"
+    events: List[ReceivedEvent] = []
+    for i in range(length):
+        events.append(
+            ReceivedEvent(
+                occurred=start + timedelta(seconds=i),
+                event=f"prefect.flow-run.step-{i}",
+                resource={"prefect.resource.id": resource_id},
+                received=start + timedelta(seconds=i),
+                id=uuid4(),
+                follows=events[-1].id if events else None,
+            )
+        )
+    return events
+
+
+@pytest.fixture
+def shard() -> triggers.TriggerShard:
+    shard = triggers.TriggerShard()
+    shard.followers.in_database = False
+    return shard
+
+
+@pytest.fixture
+def leader() -> ReceivedEvent:
+    return chain(1, pendulum.now("UTC"))[0]
+
+
+def follower_of(leader: ReceivedEvent, seconds: int = 1) -> ReceivedEvent:
+    return leader.model_copy(
+        update={
+            "id": uuid4(),
+            "follows": leader.id,
+            "occurred": leader.occurred + timedelta(seconds=seconds),
+        }
+    )
+
+
+async def stored_followers(db: PrefectDBInterface, leader_id: UUID) -> List[UUID]:
+    async with db.session_context() as session:
+        result = await session.execute(
+            sa.select(db.AutomationEventFollower.follower_event_id).where(
+                db.AutomationEventFollower.leader_event_id == leader_id
+            )
+        )
+        return list(result.scalars().all())
+
+
+def test_buffer_tracks_followers_by_leader(leader: ReceivedEvent):
+    buffer = triggers.FollowerBuffer(capacity=10)
+    first, second = follower_of(leader, 2), follower_of(leader, 1)
+
+    assert buffer.add(first)
+    assert buffer.add(second)
+    assert len(buffer) == 2
+    assert {e.id for e in buffer.followers_of(leader.id)} == {first.id, second.id}
+
+    buffer.remove(first)
+    assert buffer.followers_of(leader.id) == [second]
+
+    buffer.remove(second)
+    assert buffer.followers_of(leader.id) == []
+    assert len(buffer) == 0
+
+
+def test_buffer_refuses_events_beyond_its_capacity(leader: ReceivedEvent):
+    buffer = triggers.FollowerBuffer(capacity=1)
+    first, second = follower_of(leader), follower_of(leader)
+
+    assert buffer.add(first)
+    assert not buffer.add(second)
+
+    # re-adding an event that is already buffered is fine
+    assert buffer.add(first)
+    assert len(buffer) == 1
+
+
+def test_buffer_pops_followers_received_before_a_time(leader: ReceivedEvent):
+    buffer = triggers.FollowerBuffer(capacity=10)
+    old = follower_of(leader)
+    new = old.model_copy(
+        update={"id": uuid4(), "received": old.received + timedelta(minutes=10)}
+    )
+    buffer.add(old)
+    buffer.add(new)
+
+    assert buffer.pop_received_before(old.received + timedelta(minutes=1)) == [old]
+    assert buffer.followers_of(leader.id) == [new]
+
+
+async def test_followers_are_held_in_memory(
+    shard: triggers.TriggerShard, leader: ReceivedEvent, db: PrefectDBInterface
+):
+    later, earlier = follower_of(leader, 2), follower_of(leader, 1)
+
+    with triggers.evaluating_shard(shard):
+        await triggers.record_follower(later)
+        await triggers.record_follower(earlier)
+
+        assert await triggers.get_followers(leader) == [earlier, later]
+        assert await stored_followers(db, leader.id) == []
+
+        await triggers.forget_follower(earlier)
+        assert await triggers.get_followers(leader) == [later]
+
+
+async def test_followers_overflow_into_the_database(
+    shard: triggers.TriggerShard, leader: ReceivedEvent, db: PrefectDBInterface
+):
+    first, second, third = (follower_of(leader, i) for i in range(1, 4))
+
+    with temporary_settings({PREFECT_EVENTS_FOLLOWER_BUFFER_SIZE: 1}):
+        with triggers.evaluating_shard(shard):
+            for follower in [first, second, third]:
+                await triggers.record_follower(follower)
+
+            assert len(shard.followers) == 1
+            assert shard.followers.in_database
+            assert set(await stored_followers(db, leader.id)) == {second.id, third.id}
+
+            assert await triggers.get_followers(leader) == [first, second, third]
+
+            await triggers.forget_follower(second)
+            assert await stored_followers(db, leader.id) == [third.id]
+
+
+@pytest.mark.clear_db
+async def test_lost_followers_come_from_memory_and_the_database(
+    shard: triggers.TriggerShard, db: PrefectDBInterface
+):
+    base_date = pendulum.now("UTC") - timedelta(minutes=30)
+    leader = chain(1, base_date)[0]
+    first, second = follower_of(leader, 1), follower_of(leader, 2)
+
+    with temporary_settings({PREFECT_EVENTS_FOLLOWER_BUFFER_SIZE: 1}):
+        with triggers.evaluating_shard(shard):
+            await triggers.record_follower(first)
+            await triggers.record_follower(second)
+
+            assert await triggers.get_lost_followers() == [first, second]
+
+            assert len(shard.followers) == 0
+            assert await stored_followers(db, leader.id) == []
+
+            # with nothing left in the database, it's no longer consulted
+            assert not shard.followers.in_database
+
+
+async def test_flushing_followers_saves_them_for_the_next_run(
+    shard: triggers.TriggerShard, leader: ReceivedEvent, db: PrefectDBInterface
+):
+    follower = follower_of(leader)
+
+    with triggers.evaluating_shard(shard):
+        await triggers.record_follower(follower)
+        await triggers.flush_followers()
+
+    assert len(shard.followers) == 0
+    assert await stored_followers(db, leader.id) == [follower.id]
+
+    with triggers.evaluating_shard(triggers.TriggerShard()):
+        assert await triggers.get_followers(leader) == [follower]
+
+
+@pytest.mark.parametrize("buffer_size", [1, 10_000])
+async def test_shuffled_events_are_processed_in_order(
+    shard: triggers.TriggerShard, db: PrefectDBInterface, buffer_size: int
+):
+    chains = [chain(5, pendulum.now("UTC")) for _ in range(10)]
+    events = [event for each in chains for event in each]
+    random.Random(42).shuffle(events)
+
+    evaluated: List[UUID] = []
+    record_event_as_seen = triggers.record_event_as_seen
+
+    async def recording_event_as_seen(event: ReceivedEvent):
+        evaluated.append(event.id)
+        await record_event_as_seen(event)
+
+    with temporary_settings({PREFECT_EVENTS_FOLLOWER_BUFFER_SIZE: buffer_size}):
+        with triggers.evaluating_shard(shard):
+            with pytest.MonkeyPatch.context() as monkeypatch:
+                monkeypatch.setattr(
+                    triggers, "record_event_as_seen", recording_event_as_seen
+                )
+                for event in events:
+                    try:
+                        await triggers.reactive_evaluation(event)
+                    except triggers.EventArrivedEarly:
+                        pass
+
+    assert len(shard.followers) == 0
+    for each in chains:
+        ids = {event.id for event in each}
+        assert [id for id in evaluated if id in ids] == [event.id for event in each]
+        for event in each:
+            assert await stored_followers(db, event.id) == []
@@ -0,0 +1,199 @@
+from datetime import timedelta
+from typing import List
+from unittest import mock
+from uuid import uuid4
+
+import pendulum
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.events import actions, triggers
+from prefect.server.events.models import automations
+from prefect.server.events.schemas.automations import (
+    Automation,
+    EventTrigger,
+    Posture,
+)
+
+
+def automation(posture: Posture, within: timedelta = timedelta(seconds=30)):
+    return Automation(
+        id=uuid4(),
+        name=f"{posture.value} automation",
+        enabled=True,
+        trigger=EventTrigger(
+            expect={"things.happened"},
+            posture=posture,
+            threshold=1,
+            within=within,
+        ),
+        actions=[actions.DoNothing()],
+    )
+
+
+@pytest.fixture
+def proactive() -> List[Automation]:
+    return [automation(Posture.Proactive) for _ in range(3)]
+
+
+@pytest.fixture
+def reactive() -> Automation:
+    return automation(Posture.Reactive)
+
+
+@pytest.fixture
+def loaded(proactive: List[Automation], reactive: Automation) -> None:
+    for each in [*proactive, reactive]:
+        triggers.load_automation(each)
+
+
+def test_loading_schedules_proactive_triggers_immediately(
+    loaded: None, proactive: List[Automation]
+):
+    shard = triggers.current_shard()
+    due = shard.due_proactive_triggers(pendulum.now("UTC"))
+
+    assert {trigger.id for trigger in due} == {each.trigger.id for each in proactive}
+    assert shard.due_proactive_triggers(pendulum.now("UTC")) == []
+
+
+def test_only_the_latest_schedule_of_a_trigger_counts(
+    loaded: None, proactive: List[Automation]
+):
+    shard = triggers.current_shard()
+    now = pendulum.now("UTC")
+    shard.due_proactive_triggers(now)
+
+    first, second, third = (each.trigger for each in proactive)
+    shard.schedule_proactive(first.id, now.add(seconds=10))
+    shard.schedule_proactive(first.id, now.add(seconds=60))
+    shard.schedule_proactive(second.id, now.add(seconds=60))
+    shard.schedule_proactive(second.id, now.add(seconds=10))
+    shard.schedule_proactive(third.id, now.add(seconds=10))
+    triggers.forget_automation(proactive[2].id)
+
+    assert shard.due_proactive_triggers(now.add(seconds=10)) == [second]
+    assert shard.due_proactive_triggers(now.add(seconds=60)) == [first]
+
+
+async def test_evaluates_only_due_triggers(
+    loaded: None, proactive: List[Automation], monkeypatch: pytest.MonkeyPatch
+):
+    later = pendulum.now("UTC").add(minutes=5)
+    proactive_evaluations = mock.AsyncMock(
+        side_effect=lambda due, as_of: {trigger.id: later for trigger in due}
+    )
+    monkeypatch.setattr(triggers, "proactive_evaluations", proactive_evaluations)
+
+    await triggers.evaluate_proactive_triggers()
+
+    proactive_evaluations.assert_awaited_once()
+    (due, _), _ = proactive_evaluations.await_args
+    assert {trigger.id for trigger in due} == {each.trigger.id for each in proactive}
+    assert triggers.next_proactive_runs == {
+        each.trigger.id: later for each in proactive
+    }
+
+    proactive_evaluations.reset_mock()
+    await triggers.evaluate_proactive_triggers()
+    proactive_evaluations.assert_not_awaited()
+
+
+async def test_failing_batches_are_evaluated_trigger_by_trigger(
+    loaded: None, proactive: List[Automation], monkeypatch: pytest.MonkeyPatch
+):
+    failing = proactive[0].trigger
+    later = pendulum.now("UTC").add(minutes=5)
+
+    async def proactive_evaluation(trigger, as_of):
+        if trigger.id == failing.id:
+            raise ValueError("broken")
+        return later
+
+    monkeypatch.setattr(
+        triggers, "proactive_evaluations", mock.AsyncMock(side_effect=ValueError)
+    )
+    monkeypatch.setattr(triggers, "proactive_evaluation", proactive_evaluation)
+
+    await triggers.evaluate_proactive_triggers()
+
+    assert set(triggers.next_proactive_runs) == {
+        each.trigger.id for each in proactive[1:]
+    }
+    # the failing trigger is tried again on the next loop
+    assert triggers.current_shard().due_proactive_triggers(pendulum.now("UTC")) == [
+        failing
+    ]
+
+
+async def test_evaluates_the_buckets_of_many_triggers_together(
+    cleared_buckets: None,
+    cleared_automations: None,
+    automations_session: AsyncSession,
+    db: PrefectDBInterface,
+    act: mock.AsyncMock,
+    proactive: List[Automation],
+):
+    for each in proactive:
+        await automations.create_automation(automations_session, each)
+    await automations_session.commit()
+
+    start = pendulum.now("UTC")
+    due = [each.trigger for each in proactive]
+
+    run_again_at = await triggers.proactive_evaluations(due, start)
+    assert run_again_at == {trigger.id: start.add(seconds=30) for trigger in due}
+
+    result = await automations_session.execute(sa.select(db.AutomationBucket))
+    assert {bucket.trigger_id for bucket in result.scalars()} == {
+        trigger.id for trigger in due
+    }
+    act.assert_not_awaited()
+
+    await triggers.proactive_evaluations(due, start.add(seconds=30))
+    assert {call.args[0].trigger.id for call in act.await_args_list} == {
+        trigger.id for trigger in due
+    }
+
+
+async def test_a_failing_evaluation_does_not_undo_the_others(
+    cleared_buckets: None,
+    cleared_automations: None,
+    automations_session: AsyncSession,
+    act: mock.AsyncMock,
+    proactive: List[Automation],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    for each in proactive:
+        await automations.create_automation(automations_session, each)
+    await automations_session.commit()
+
+    start = pendulum.now("UTC")
+    due = [each.trigger for each in proactive]
+    failing, *others = due
+    await triggers.proactive_evaluations(due, start)
+
+    evaluate = triggers.evaluate
+
+    async def failing_evaluate(session, trigger, *args, **kwargs):
+        if trigger.id == failing.id:
+            raise ValueError("broken")
+        return await evaluate(session, trigger, *args, **kwargs)
+
+    monkeypatch.setattr(triggers, "evaluate", failing_evaluate)
+
+    run_again_at = await triggers.proactive_evaluations(due, start.add(seconds=30))
+
+    # the failing trigger is left to be tried again on the next loop
+    assert set(run_again_at) == {trigger.id for trigger in others}
+    assert sorted(call.args[0].trigger.id for call in act.await_args_list) == sorted(
+        trigger.id for trigger in others
+    )
+
+    # the triggers that fired had their buckets committed, so they don't fire again
+    act.reset_mock()
+    monkeypatch.setattr(triggers, "evaluate", evaluate)
+    await triggers.proactive_evaluations(others, start.add(seconds=30))
+    act.assert_not_awaited()
@@ -0,0 +1,271 @@
+import asyncio
+from datetime import timedelta
+from typing import List, Optional
+from uuid import uuid4
+
+import pendulum
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import prefect.server.events.services.triggers
+from prefect.server.events import actions, triggers
+from prefect.server.events.models import automations
+from prefect.server.events.schemas.automations import (
+    Automation,
+    EventTrigger,
+    Posture,
+)
+from prefect.server.events.schemas.events import ReceivedEvent
+from prefect.server.events.services.triggers import ReactiveTriggers
+from prefect.settings import (
+    PREFECT_API_SERVICES_TRIGGERS_ENABLED,
+    PREFECT_API_SERVICES_TRIGGERS_SHARD,
+    PREFECT_API_SERVICES_TRIGGERS_SHARDS,
+    temporary_settings,
+)
+
+
+@pytest.fixture
+def shards() -> List[triggers.TriggerShard]:
+    return [triggers.TriggerShard(0, 2), triggers.TriggerShard(1, 2)]
+
+
+def automation(name: str) -> Automation:
+    return Automation(
+        id=uuid4(),
+        name=name,
+        enabled=True,
+        trigger=EventTrigger(
+            expect={"stuff.happened"},
+            posture=Posture.Reactive,
+            threshold=1,
+            within=timedelta(seconds=10),
+        ),
+        actions=[actions.DoNothing()],
+    )
+
+
+@pytest.fixture
+async def stored_automations(
+    cleared_buckets, cleared_automations, automations_session: AsyncSession
+) -> List[Automation]:
+    stored = [automation(f"automation {i}") for i in range(8)]
+    for each in stored:
+        await automations.create_automation(automations_session, each)
+    await automations_session.commit()
+    return stored
+
+
+def test_each_automation_belongs_to_exactly_one_shard(shards):
+    for _ in range(20):
+        automation_id = uuid4()
+        owners = [shard for shard in shards if shard.owns(automation_id)]
+        assert owners == [shards[triggers.shard_for(automation_id, 2)]]
+
+
+@pytest.mark.parametrize("index", [-1, 2])
+def test_shards_must_be_in_range(index: int):
+    with pytest.raises(ValueError, match="out of range"):
+        triggers.TriggerShard(index, 2)
+
+
+def test_unsharded_evaluation_runs_the_default_shard():
+    assert triggers.configured_shard() is triggers.current_shard()
+
+
+def test_sharded_evaluation_requires_choosing_a_shard():
+    with temporary_settings({PREFECT_API_SERVICES_TRIGGERS_SHARDS: 3}):
+        with pytest.raises(ValueError, match="must choose the one shard"):
+            triggers.configured_shard()
+
+
+def test_sharded_evaluation_requires_a_broker_shared_across_processes():
+    with temporary_settings(
+        {
+            PREFECT_API_SERVICES_TRIGGERS_SHARDS: 3,
+            PREFECT_API_SERVICES_TRIGGERS_SHARD: 1,
+        }
+    ):
+        with pytest.raises(ValueError, match="requires a messaging broker"):
+            triggers.configured_shard()
+
+
+def test_runs_the_configured_shard(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(triggers, "broker_delivers_across_processes", lambda: True)
+
+    with temporary_settings(
+        {
+            PREFECT_API_SERVICES_TRIGGERS_SHARDS: 3,
+            PREFECT_API_SERVICES_TRIGGERS_SHARD: 1,
+        }
+    ):
+        shard = triggers.configured_shard()
+
+    assert (shard.index, shard.count) == (1, 3)
+
+
+async def test_each_shard_consumes_events_as_its_own_group(
+    cleared_automations,
+    shards: List[triggers.TriggerShard],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    consumers = []
+
+    class Consumer:
+        async def run(self, handler):
+            pass
+
+    def create_consumer(topic: str, name: Optional[str] = None):
+        consumers.append((topic, name))
+        return Consumer()
+
+    monkeypatch.setattr(
+        prefect.server.events.services.triggers, "create_consumer", create_consumer
+    )
+
+    for shard in shards:
+        await ReactiveTriggers(shard=shard).start()
+
+    assert consumers == [
+        ("events", "reactive-triggers-0"),
+        ("events", "reactive-triggers-1"),
+    ]
+
+
+async def test_each_shard_loads_only_its_own_automations(
+    stored_automations: List[Automation], shards: List[triggers.TriggerShard]
+):
+    async with triggers.consumer(shard=shards[0]):
+        async with triggers.consumer(shard=shards[1]):
+            pass
+
+    for shard in shards:
+        assert set(shard.automations_by_id) == {
+            each.id for each in stored_automations if shard.owns(each.id)
+        }
+
+    assert set(shards[0].automations_by_id) | set(shards[1].automations_by_id) == {
+        each.id for each in stored_automations
+    }
+    assert not triggers.automations_by_id
+
+
+async def test_shards_keep_their_own_events_clock_and_seen_events(
+    shards: List[triggers.TriggerShard],
+):
+    event = ReceivedEvent(
+        occurred=pendulum.now("UTC").subtract(seconds=30),
+        event="stuff.happened",
+        resource={"prefect.resource.id": "foo"},
+        id=uuid4(),
+    )
+
+    with triggers.evaluating_shard(shards[0]):
+        await triggers.update_events_clock(event)
+        await triggers.record_event_as_seen(event)
+
+        assert await triggers.get_events_clock() == event.occurred.float_timestamp
+        assert await triggers.event_has_been_seen(event.id)
+
+    with triggers.evaluating_shard(shards[1]):
+        assert await triggers.get_events_clock() is None
+        assert not await triggers.event_has_been_seen(event.id)
+
+
+async def test_records_followers_for_each_shard(shards: List[triggers.TriggerShard]):
+    leader_id = uuid4()
+    follower = ReceivedEvent(
+        occurred=pendulum.now("UTC"),
+        event="stuff.happened",
+        resource={"prefect.resource.id": "foo"},
+        follows=leader_id,
+        id=uuid4(),
+    )
+    leader = follower.model_copy(update={"id": leader_id, "follows": None})
+
+    for shard in shards:
+        with triggers.evaluating_shard(shard):
+            with pytest.raises(triggers.EventArrivedEarly):
+                await triggers.reactive_evaluation(follower)
+
+    for shard in shards:
+        with triggers.evaluating_shard(shard):
+            assert [each.id for each in await triggers.get_followers(leader)] == [
+                follower.id
+            ]
+            await triggers.forget_follower(follower)
+
+    for shard in shards:
+        with triggers.evaluating_shard(shard):
+            assert await triggers.get_followers(leader) == []
+
+
+async def test_automation_changes_reach_the_owning_shard(
+    stored_automations: List[Automation],
+    automations_session: AsyncSession,
+    shards: List[triggers.TriggerShard],
+):
+    with temporary_settings({PREFECT_API_SERVICES_TRIGGERS_ENABLED: True}):
+        async with triggers.consumer(shard=shards[0]):
+            new_automation = await automations.create_automation(
+                automations_session, automation("A new one!")
+            )
+            await automations_session.commit()
+
+            # wait for the change notification to reach the consumer
+            await asyncio.sleep(0.1)
+
+    if shards[0].owns(new_automation.id):
+        assert new_automation.id in shards[0].automations_by_id
+    else:
+        assert new_automation.id not in shards[0].automations_by_id
+
+
+async def test_shards_reconcile_changes_made_through_other_servers(
+    stored_automations: List[Automation],
+    automations_session: AsyncSession,
+    shards: List[triggers.TriggerShard],
+):
+    for shard in shards:
+        with triggers.evaluating_shard(shard):
+            async with triggers.automations_session() as session:
+                await triggers.load_automations(session)
+
+    # with the triggers service disabled here, no change notifications are sent, as
+    # for changes made through another server
+    new_automation = await automations.create_automation(
+        automations_session, automation("A new one!")
+    )
+    deleted, disabled = stored_automations[:2]
+    await automations.delete_automation(automations_session, deleted.id)
+    await automations.disable_automation(automations_session, disabled.id)
+    await automations_session.commit()
+
+    for shard in shards:
+        with triggers.evaluating_shard(shard):
+            async with triggers.automations_session() as session:
+                await triggers.reconcile_automations(session)
+
+    expected = {new_automation.id} | {each.id for each in stored_automations[2:]}
+    for shard in shards:
+        assert set(shard.automations_by_id) == {
+            automation_id for automation_id in expected if shard.owns(automation_id)
+        }
+
+
+async def test_reconciling_unchanged_automations_reads_no_automations(
+    stored_automations: List[Automation],
+    shards: List[triggers.TriggerShard],
+):
+    with triggers.evaluating_shard(shards[0]):
+        async with triggers.automations_session() as session:
+            await triggers.load_automations(session)
+        loaded = dict(shards[0].automations_by_id)
+
+        async with triggers.automations_session() as session:
+            await triggers.reconcile_automations(session)
+
+    assert all(
+        shards[0].automations_by_id[automation_id] is automation
+        for automation_id, automation in loaded.items()
+    )
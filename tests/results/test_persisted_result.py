@@ -4,8 +4,14 @@ import uuid
 import pendulum
 import pytest
 
+from prefect.client.orchestration import PrefectClient
 from prefect.filesystems import LocalFileSystem
-from prefect.results import DEFAULT_STORAGE_KEY_FN, PersistedResult, PersistedResultBlob
+from prefect.results import (
+    DEFAULT_STORAGE_KEY_FN,
+    PersistedResult,
+    PersistedResultBlob,
+    prefetch_results,
+)
 from prefect.serializers import JSONSerializer, PickleSerializer
 
 
@@ -218,3 +224,90 @@ async def test_lifecycle_of_defer_persistence(storage_block):
     await result.write()
     blob = await result._read_blob()
     assert blob.load() == "test-defer"
+
+
+class TestPrefetchResults:
+    @pytest.fixture
+    async def results(self, storage_block):
+        results = []
+        for i in range(5):
+            result = await PersistedResult.create(
+                i,
+                storage_block_id=storage_block._block_document_id,
+                storage_block=storage_block,
+                storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+                serializer=JSONSerializer(),
+            )
+            # Results read from the API have no cached object or storage block
+            results.append(PersistedResult(**result.model_dump()))
+        return results
+
+    async def test_prefetch_caches_results(self, results):
+        loaded = await prefetch_results(results)
+
+        assert loaded == {id(result): i for i, result in enumerate(results)}
+        assert all(result.has_cached_object() for result in results)
+        assert [await result.get() for result in results] == list(range(5))
+
+    async def test_prefetch_loads_each_storage_block_once(self, results, monkeypatch):
+        read_block_document = PrefectClient.read_block_document
+        reads = []
+
+        async def counting_read(self, block_document_id, *args, **kwargs):
+            reads.append(block_document_id)
+            return await read_block_document(self, block_document_id, *args, **kwargs)
+
+        monkeypatch.setattr(PrefectClient, "read_block_document", counting_read)
+
+        await prefetch_results(results)
+
+        assert len(reads) == 1
+        assert all(result._storage_block is not None for result in results)
+
+    async def test_prefetch_uses_given_storage_blocks(
+        self, results, storage_block, monkeypatch
+    ):
+        monkeypatch.setattr(
+            PrefectClient,
+            "read_block_document",
+            pytest.fail,
+        )
+
+        await prefetch_results(
+            results,
+            storage_blocks={storage_block._block_document_id: storage_block},
+        )
+
+        assert all(result.has_cached_object() for result in results)
+
+    async def test_prefetch_skips_results_that_cannot_be_read(
+        self, results, storage_block
+    ):
+        missing = PersistedResult(
+            serializer_type="json",
+            storage_key="missing",
+            storage_block_id=storage_block._block_document_id,
+        )
+
+        loaded = await prefetch_results([*results, missing])
+
+        assert id(missing) not in loaded
+        assert not missing.has_cached_object()
+        assert all(result.has_cached_object() for result in results)
+        with pytest.raises(ValueError, match="does not exist"):
+            await missing.get()
+
+    async def test_prefetch_respects_disabled_object_caching(self, storage_block):
+        result = await PersistedResult.create(
+            "test",
+            storage_block_id=storage_block._block_document_id,
+            storage_block=storage_block,
+            storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+            serializer=JSONSerializer(),
+            cache_object=False,
+        )
+
+        loaded = await prefetch_results([result])
+
+        assert loaded == {id(result): "test"}
+        assert not result.has_cached_object()
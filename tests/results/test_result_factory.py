@@ -1,4 +1,5 @@
 import pytest
+from pydantic import ValidationError
 
 import prefect.exceptions
 import prefect.results
@@ -8,6 +9,7 @@ from prefect.filesystems import LocalFileSystem
 from prefect.results import (
     PersistedResult,
     ResultFactory,
+    UnpersistedResult,
 )
 from prefect.serializers import JSONSerializer, PickleSerializer
 from prefect.settings import (
@@ -55,6 +57,28 @@ async def test_create_result_reference_has_cached_object(factory):
     assert result.has_cached_object()
 
 
+async def test_read_results(factory):
+    created = [await factory.create_result({"foo": i}) for i in range(3)]
+    results = [PersistedResult(**result.model_dump()) for result in created]
+    results.append(await UnpersistedResult.create(None))
+
+    assert await factory.read_results(results) == [
+        {"foo": 0},
+        {"foo": 1},
+        {"foo": 2},
+        None,
+    ]
+
+
+async def test_read_results_raises_for_missing_results(factory):
+    result = await factory.create_result({"foo": "bar"})
+    await factory.storage_block.write_path(result.storage_key, b"")
+    stale = PersistedResult(**result.model_dump())
+
+    with pytest.raises(ValidationError):
+        await factory.read_results([stale])
+
+
 def test_root_flow_default_result_factory():
     @flow
     def foo():
@@ -0,0 +1,289 @@
+import os
+import stat
+import subprocess
+import threading
+from pathlib import Path
+
+import fsspec
+import pytest
+
+from prefect.runner.code_cache import CodeCache
+from prefect.runner.storage import GitRepository, RemoteStorage
+from prefect.settings import (
+    PREFECT_RUNNER_CODE_CACHE_ENABLED,
+    PREFECT_RUNNER_CODE_CACHE_PATH,
+    temporary_settings,
+)
+from prefect.utilities.filesystem import locked_sync
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> CodeCache:
+    return CodeCache(path=tmp_path / "cache")
+
+
+@pytest.fixture
+def remote():
+    filesystem = fsspec.filesystem("memory")
+    root = f"/code-{os.urandom(4).hex()}"
+    filesystem.pipe(
+        {
+            f"{root}/flows.py": b"print('hello')",
+            f"{root}/pkg/__init__.py": b"",
+            f"{root}/pkg/util.py": b"x = 1",
+        }
+    )
+    yield filesystem, root
+    filesystem.rm(root, recursive=True)
+
+
+class TestPull:
+    def test_first_pull_downloads_everything(self, cache, remote, tmp_path):
+        filesystem, root = remote
+        destination = tmp_path / "run-1"
+
+        result = cache.pull(filesystem, root, destination)
+
+        assert result.downloaded == 3
+        assert result.linked == 0
+        assert (destination / "flows.py").read_bytes() == b"print('hello')"
+        assert (destination / "pkg" / "util.py").read_bytes() == b"x = 1"
+
+    def test_later_pulls_link_unchanged_files(self, cache, remote, tmp_path):
+        filesystem, root = remote
+        cache.pull(filesystem, root, tmp_path / "run-1")
+
+        result = cache.pull(filesystem, root, tmp_path / "run-2")
+
+        assert result.downloaded == 0
+        assert result.linked == 3
+        assert os.path.samefile(
+            tmp_path / "run-1" / "flows.py", tmp_path / "run-2" / "flows.py"
+        )
+
+    def test_only_changed_files_are_downloaded(self, cache, remote, tmp_path):
+        filesystem, root = remote
+        cache.pull(filesystem, root, tmp_path / "run-1")
+
+        filesystem.pipe(f"{root}/pkg/util.py", b"x = 2")
+        result = cache.pull(filesystem, root, tmp_path / "run-2")
+
+        assert result.downloaded == 1
+        assert result.linked == 2
+        assert (tmp_path / "run-2" / "pkg" / "util.py").read_bytes() == b"x = 2"
+        assert (tmp_path / "run-1" / "pkg" / "util.py").read_bytes() == b"x = 1"
+
+    def test_identical_files_are_stored_once(self, cache, remote, tmp_path):
+        filesystem, root = remote
+        filesystem.pipe(f"{root}/copy.py", b"print('hello')")
+
+        cache.pull(filesystem, root, tmp_path / "run-1")
+
+        assert os.path.samefile(
+            tmp_path / "run-1" / "flows.py", tmp_path / "run-1" / "copy.py"
+        )
+
+    def test_evicted_files_are_downloaded_again(self, cache, remote, tmp_path):
+        filesystem, root = remote
+        cache.pull(filesystem, root, tmp_path / "run-1")
+
+        CodeCache(path=cache.path, max_size=1).evict()
+        result = cache.pull(filesystem, root, tmp_path / "run-2")
+
+        # only the empty file can remain in a cache of a single byte
+        assert result.downloaded >= 2
+        assert (tmp_path / "run-2" / "flows.py").read_bytes() == b"print('hello')"
+
+
+def test_cached_files_are_read_only(cache, remote, tmp_path):
+    filesystem, root = remote
+    cache.pull(filesystem, root, tmp_path / "run-1")
+
+    for path in [*cache.path.glob("objects/*/*"), tmp_path / "run-1" / "flows.py"]:
+        assert stat.S_IMODE(path.stat().st_mode) == 0o444
+
+
+def test_executable_files_keep_their_mode(cache, tmp_path):
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "run.sh").write_text("echo hello")
+    (source / "run.sh").chmod(0o755)
+    (source / "copy.sh").write_text("echo hello")
+
+    cache.pull(fsspec.filesystem("file"), str(source), tmp_path / "run-1")
+
+    assert stat.S_IMODE((tmp_path / "run-1" / "run.sh").stat().st_mode) == 0o555
+    assert stat.S_IMODE((tmp_path / "run-1" / "copy.sh").stat().st_mode) == 0o444
+    assert not os.path.samefile(
+        tmp_path / "run-1" / "run.sh", tmp_path / "run-1" / "copy.sh"
+    )
+
+
+def test_pulls_download_outside_of_the_cache_lock(cache, remote, tmp_path):
+    filesystem, root = remote
+    downloaded = threading.Event()
+    get_file = filesystem.get_file
+
+    def get_file_and_signal(*args, **kwargs):
+        get_file(*args, **kwargs)
+        downloaded.set()
+
+    filesystem.get_file = get_file_and_signal
+    try:
+        with locked_sync(cache.path / "cache.lock"):
+            pull = threading.Thread(
+                target=cache.pull, args=(filesystem, root, tmp_path / "run-1")
+            )
+            pull.start()
+            assert downloaded.wait(5)
+    finally:
+        del filesystem.get_file
+
+    pull.join(5)
+    assert (tmp_path / "run-1" / "flows.py").read_bytes() == b"print('hello')"
+
+
+def test_files_evicted_before_linking_are_downloaded_again(cache, remote, tmp_path):
+    filesystem, root = remote
+    cache.pull(filesystem, root, tmp_path / "run-1")
+
+    has_object = cache._has_object
+    checks = []
+
+    def evicted_once_listed(entry):
+        # the cached files are evicted after the listing checks them
+        checks.append(entry)
+        if len(checks) == 3:
+            CodeCache(path=cache.path, max_size=1).evict()
+        return has_object(entry)
+
+    cache._has_object = evicted_once_listed
+    result = cache.pull(filesystem, root, tmp_path / "run-2")
+
+    assert result.downloaded >= 2
+    assert (tmp_path / "run-2" / "flows.py").read_bytes() == b"print('hello')"
+    assert (tmp_path / "run-2" / "pkg" / "util.py").read_bytes() == b"x = 1"
+
+
+def test_pulls_wait_for_the_cache_lock(cache, remote, tmp_path):
+    filesystem, root = remote
+
+    with locked_sync(cache.path / "cache.lock"):
+        pull = threading.Thread(
+            target=cache.pull, args=(filesystem, root, tmp_path / "run-1")
+        )
+        pull.start()
+        pull.join(0.5)
+
+        assert pull.is_alive()
+        assert not (tmp_path / "run-1" / "flows.py").exists()
+
+    pull.join(5)
+    assert (tmp_path / "run-1" / "flows.py").read_bytes() == b"print('hello')"
+
+
+def test_eviction_removes_least_recently_used_files(cache, remote, tmp_path):
+    filesystem, root = remote
+    cache.pull(filesystem, root, tmp_path / "run-1")
+
+    util = next(
+        path for path in cache.path.glob("objects/*/*") if path.read_bytes() == b"x = 1"
+    )
+    os.utime(util, (0, 0))
+
+    # flows.py (14 bytes) fits, but not alongside pkg/util.py (5 bytes)
+    CodeCache(path=cache.path, max_size=15).evict()
+
+    remaining = {path.read_bytes() for path in cache.path.glob("objects/*/*")}
+    assert remaining == {b"print('hello')", b""}
+
+
+async def test_remote_storage_pulls_through_the_cache(remote, tmp_path):
+    filesystem, root = remote
+    storage = RemoteStorage(f"memory:/{root}")
+    storage.set_base_path(tmp_path / "run-1")
+
+    with temporary_settings(
+        {
+            PREFECT_RUNNER_CODE_CACHE_ENABLED: True,
+            PREFECT_RUNNER_CODE_CACHE_PATH: tmp_path / "cache",
+        }
+    ):
+        await storage.pull_code()
+        first = storage.destination
+
+        storage.set_base_path(tmp_path / "run-2")
+        await storage.pull_code()
+
+    assert (storage.destination / "pkg" / "util.py").read_bytes() == b"x = 1"
+    assert os.path.samefile(first / "flows.py", storage.destination / "flows.py")
+
+
+@pytest.fixture
+def git_repository(tmp_path: Path) -> Path:
+    repository = tmp_path / "origin" / "repo"
+    repository.mkdir(parents=True)
+
+    def git(*args: str):
+        subprocess.run(["git", *args], cwd=repository, check=True, capture_output=True)
+
+    git("init", "--initial-branch", "main")
+    (repository / "flows.py").write_text("print('hello')")
+    git("add", ".")
+    git(
+        "-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-m", "1"
+    )
+    return repository
+
+
+def commit(repository: Path, filename: str, contents: str):
+    (repository / filename).write_text(contents)
+    subprocess.run(["git", "add", "."], cwd=repository, check=True)
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=test",
+            "-c",
+            "user.email=test@example.com",
+            "commit",
+            "-m",
+            filename,
+        ],
+        cwd=repository,
+        check=True,
+        capture_output=True,
+    )
+
+
+async def test_git_repository_clones_from_a_shared_mirror(git_repository, tmp_path):
+    storage = GitRepository(url=f"file://{git_repository}")
+
+    with temporary_settings(
+        {
+            PREFECT_RUNNER_CODE_CACHE_ENABLED: True,
+            PREFECT_RUNNER_CODE_CACHE_PATH: tmp_path / "cache",
+        }
+    ):
+        storage.set_base_path(tmp_path / "run-1")
+        await storage.pull_code()
+
+        commit(git_repository, "more.py", "print('more')")
+
+        storage.set_base_path(tmp_path / "run-2")
+        await storage.pull_code()
+
+    mirror = CodeCache(path=tmp_path / "cache").git_mirror(f"file://{git_repository}")
+    assert (mirror / "HEAD").exists()
+
+    assert not (tmp_path / "run-1" / "repo" / "more.py").exists()
+    assert (tmp_path / "run-2" / "repo" / "more.py").read_text() == "print('more')"
+
+    # the clones point at the repository itself rather than the mirror
+    origin = subprocess.run(
+        ["git", "config", "--get", "remote.origin.url"],
+        cwd=tmp_path / "run-2" / "repo",
+        check=True,
+        capture_output=True,
+    )
+    assert origin.stdout.decode().strip() == f"file://{git_repository}"
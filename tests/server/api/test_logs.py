@@ -22,6 +22,7 @@ from prefect.server.schemas.filters import LogFilter
 NOW = pendulum.now("UTC")
 CREATE_LOGS_URL = "/logs/"
 READ_LOGS_URL = "/logs/filter"
+EXPORT_LOGS_URL = "/logs/export"
 
 
 @pytest.fixture
@@ -175,3 +176,101 @@ class TestReadLogs:
         api_logs = [Log(**log_data) for log_data in response.json()]
         assert api_logs[0].timestamp > api_logs[1].timestamp
         assert api_logs[0].message == "Black flag ahead, captain!"
+
+    @pytest.fixture()
+    async def many_logs(self, client, flow_run_id):
+        # several logs share each timestamp, so pages must break ties by id
+        log_data = [
+            LogCreate(
+                name="prefect.flow_run",
+                level=20,
+                message=f"Log {i}",
+                timestamp=NOW + timedelta(seconds=i // 3),
+                flow_run_id=flow_run_id,
+            ).model_dump(mode="json")
+            for i in range(10)
+        ]
+        await client.post(CREATE_LOGS_URL, json=log_data)
+
+    @pytest.mark.parametrize("sort", ["TIMESTAMP_ASC", "TIMESTAMP_DESC"])
+    async def test_read_logs_after_cursor(self, client, many_logs, sort):
+        response = await client.post(READ_LOGS_URL, json={"sort": sort})
+        expected = [log["id"] for log in response.json()]
+        assert len(expected) == 10
+
+        ids = []
+        after = None
+        while True:
+            response = await client.post(
+                READ_LOGS_URL, json={"sort": sort, "limit": 4, "after": after}
+            )
+            assert response.status_code == 200
+            page = response.json()
+            if not page:
+                break
+            ids.extend(log["id"] for log in page)
+            after = {"timestamp": page[-1]["timestamp"], "id": page[-1]["id"]}
+
+        assert ids == expected
+
+    async def test_read_logs_after_cursor_rejects_offset(self, client, logs):
+        response = await client.post(
+            READ_LOGS_URL,
+            json={
+                "offset": 1,
+                "after": {"timestamp": NOW.isoformat(), "id": str(uuid1())},
+            },
+        )
+        assert response.status_code == 422
+
+
+class TestExportLogs:
+    @pytest.fixture()
+    async def logs(self, client, flow_run_id):
+        log_data = [
+            LogCreate(
+                name="prefect.flow_run",
+                level=20,
+                message=f"Log {i}",
+                timestamp=NOW + timedelta(seconds=i // 2),
+                flow_run_id=flow_run_id,
+            ).model_dump(mode="json")
+            for i in range(7)
+        ]
+        await client.post(CREATE_LOGS_URL, json=log_data)
+
+    @pytest.fixture(autouse=True)
+    def small_pages(self, monkeypatch):
+        monkeypatch.setattr("prefect.server.api.pagination.EXPORT_PAGE_SIZE", 3)
+
+    async def test_export_logs_streams_ndjson(self, client, logs):
+        response = await client.post(EXPORT_LOGS_URL)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        exported = [Log.model_validate_json(line) for line in response.iter_lines()]
+        assert sorted(log.message for log in exported) == [f"Log {i}" for i in range(7)]
+
+        expected = (await client.post(READ_LOGS_URL)).json()
+        assert [str(log.id) for log in exported] == [log["id"] for log in expected]
+
+    async def test_export_logs_applies_filter_and_limit(
+        self, client, logs, flow_run_id
+    ):
+        response = await client.post(
+            EXPORT_LOGS_URL,
+            json={
+                "sort": "TIMESTAMP_DESC",
+                "limit": 4,
+                "logs": {"flow_run_id": {"any_": [str(flow_run_id)]}},
+            },
+        )
+        exported = [Log.model_validate_json(line) for line in response.iter_lines()]
+        assert len(exported) == 4
+        assert exported[0].message == "Log 6"
+        assert exported == sorted(exported, key=lambda log: log.timestamp, reverse=True)
+
+    async def test_export_logs_returns_nothing_when_empty(self, client):
+        response = await client.post(EXPORT_LOGS_URL)
+        assert response.status_code == 200
+        assert response.text == ""
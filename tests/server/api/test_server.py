@@ -183,6 +183,7 @@ class TestCreateOrionAPI:
 
         # These are displayed in a non-deterministic order
         assert exc.match("POST /logs/filter")
+        assert exc.match("POST /logs/export")
         assert exc.match("POST /logs/")
 
     def test_checks_for_changed_prefix_during_override(self):
@@ -210,6 +211,10 @@ class TestCreateOrionAPI:
         def foo():
             pass
 
+        @router.post("/export")
+        def export():
+            pass
+
         with pytest.raises(
             ValueError,
             match="override for '/logs' is missing paths.* {'POST /logs/filter'}",
@@ -227,6 +232,7 @@ class TestCreateOrionAPI:
 
         logs_filter = MagicMock()
         router.post("/filter")(logs_filter)
+        router.post("/export")(MagicMock())
 
         app = create_api_app(router_overrides={"/logs": router})
         client = testclient.TestClient(app)
@@ -250,6 +256,10 @@ class TestCreateOrionAPI:
         def bar():
             return logs_filter()
 
+        @router.post("/export")
+        def baz():
+            return logs_filter()
+
         @router.get("/")
         def foobar():
             return logs_get()
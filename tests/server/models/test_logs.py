@@ -1,4 +1,5 @@
 from datetime import timedelta
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pendulum
@@ -10,6 +11,10 @@ from prefect.server.schemas.actions import LogCreate
 from prefect.server.schemas.core import Log
 from prefect.server.schemas.filters import LogFilter
 from prefect.server.schemas.sorting import LogSort
+from prefect.settings import (
+    PREFECT_API_SERVICES_LOG_COMPACTOR_ENABLED,
+    temporary_settings,
+)
 
 NOW = pendulum.now("UTC")
 
@@ -117,3 +122,19 @@ class TestReadLogs:
 
         assert len(logs) == 1
         assert all([log.task_run_id == task_run_id for log in logs])
+
+    async def test_read_logs_skips_segments_until_any_are_written(
+        self, session, logs, log_data, monkeypatch
+    ):
+        monkeypatch.setattr(models.log_segments, "_segments_written", None)
+        read_log_segments = AsyncMock(return_value=[])
+        monkeypatch.setattr(models.log_segments, "read_log_segments", read_log_segments)
+
+        for _ in range(2):
+            read = await models.logs.read_logs(session=session, log_filter=None)
+            assert len(read) == len(log_data)
+        read_log_segments.assert_not_awaited()
+
+        with temporary_settings({PREFECT_API_SERVICES_LOG_COMPACTOR_ENABLED: True}):
+            await models.logs.read_logs(session=session, log_filter=None)
+        read_log_segments.assert_awaited_once()
@@ -8,6 +8,7 @@ from starlette import status
 
 from prefect.blocks.core import Block
 from prefect.server import models, schemas
+from prefect.server.events.clients import AssertingEventsClient
 from prefect.server.schemas.actions import BlockDocumentCreate, BlockDocumentUpdate
 from prefect.server.schemas.core import BlockDocument
 from prefect.types import SecretDict
@@ -769,9 +770,33 @@ class TestDeleteBlockDocument:
         response = await client.get(f"/block_documents/{result.id}")
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    async def test_delete_block_emits_an_event(self, session, client, block_schemas):
+        response = await client.post(
+            "/block_documents/",
+            json=BlockDocumentCreate(
+                name="deleted-with-event",
+                data=dict(y=1),
+                block_schema_id=block_schemas[0].id,
+                block_type_id=block_schemas[0].block_type_id,
+            ).model_dump(mode="json"),
+        )
+        result = BlockDocument.model_validate(response.json())
+
+        response = await client.delete(f"/block_documents/{result.id}")
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        AssertingEventsClient.assert_emitted_event_with(
+            event="prefect.block-document.deleted",
+            resource={
+                "prefect.resource.id": f"prefect.block-document.{result.id}",
+                "prefect.resource.name": "deleted-with-event",
+            },
+        )
+
     async def test_delete_missing_block(self, session, client, block_schemas):
         response = await client.delete(f"/block_documents/{uuid4()}")
         assert response.status_code == status.HTTP_404_NOT_FOUND
+        AssertingEventsClient.assert_emitted_event_count(0)
 
     async def test_delete_nonsense_block_document(self, client, block_schemas):
         """Regression test for an issue we observed in Cloud where a client made
@@ -808,6 +833,14 @@ class TestUpdateBlockDocument:
         )
         assert updated_block_document.data == dict(x=2)
 
+        AssertingEventsClient.assert_emitted_event_with(
+            event="prefect.block-document.updated",
+            resource={
+                "prefect.resource.id": f"prefect.block-document.{block_document.id}",
+                "prefect.resource.name": "test-update-data",
+            },
+        )
+
     @pytest.mark.parametrize("new_data", [{"x": 4}, {}])
     async def test_update_block_document_data_without_merging_existing_data(
         self, session, client, block_schemas, new_data
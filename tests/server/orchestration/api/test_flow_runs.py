@@ -1097,6 +1097,130 @@ class TestReadFlowRuns:
         assert len(flow_runs) == 1
         assert flow_runs[0].id == pending_run.id
 
+    @pytest.fixture
+    async def flow_runs_to_paginate(self, flow, session):
+        now = pendulum.now("UTC").start_of("minute")
+        # runs share expected start times and some have none, so pages must break
+        # ties by id and place null start times consistently
+        flow_runs = []
+        for minutes in [0, 0, 1, 1, 1, 2, None, None]:
+            flow_runs.append(
+                await models.flow_runs.create_flow_run(
+                    session=session,
+                    flow_run=schemas.core.FlowRun(
+                        flow_id=flow.id,
+                        expected_start_time=(
+                            now.add(minutes=minutes) if minutes is not None else None
+                        ),
+                    ),
+                )
+            )
+        await session.commit()
+        return flow_runs
+
+    @pytest.mark.parametrize(
+        "sort", ["ID_DESC", "EXPECTED_START_TIME_ASC", "EXPECTED_START_TIME_DESC"]
+    )
+    async def test_read_flow_runs_after_cursor(
+        self, flow_runs_to_paginate, client, sort
+    ):
+        response = await client.post("/flow_runs/filter", json=dict(sort=sort))
+        expected = [flow_run["id"] for flow_run in response.json()]
+        assert len(expected) == len(flow_runs_to_paginate)
+
+        ids = []
+        after = None
+        while True:
+            response = await client.post(
+                "/flow_runs/filter", json=dict(sort=sort, limit=3, after=after)
+            )
+            assert response.status_code == status.HTTP_200_OK, response.text
+            page = response.json()
+            if not page:
+                break
+            ids.extend(flow_run["id"] for flow_run in page)
+            after = {
+                "timestamp": page[-1]["expected_start_time"],
+                "id": page[-1]["id"],
+            }
+
+        assert ids == expected
+
+    async def test_read_flow_runs_after_cursor_requires_keyset_sort(self, client):
+        response = await client.post(
+            "/flow_runs/filter",
+            json=dict(sort="NAME_ASC", after={"id": str(uuid4())}),
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    async def test_read_flow_runs_after_cursor_rejects_offset(self, client):
+        response = await client.post(
+            "/flow_runs/filter", json=dict(offset=2, after={"id": str(uuid4())})
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class TestExportFlowRuns:
+    @pytest.fixture(autouse=True)
+    def small_pages(self, monkeypatch):
+        monkeypatch.setattr("prefect.server.api.pagination.EXPORT_PAGE_SIZE", 2)
+
+    @pytest.fixture
+    async def flow_runs(self, flow, session):
+        now = pendulum.now("UTC")
+        flow_runs = []
+        for minutes in [3, 1, 4, 1, 5]:
+            flow_runs.append(
+                await models.flow_runs.create_flow_run(
+                    session=session,
+                    flow_run=schemas.core.FlowRun(
+                        flow_id=flow.id,
+                        expected_start_time=now.add(minutes=minutes),
+                        tags=["odd"] if minutes % 2 else ["even"],
+                    ),
+                )
+            )
+        await session.commit()
+        return flow_runs
+
+    async def test_export_flow_runs(self, flow_runs, client):
+        response = await client.post(
+            "/flow_runs/export", json=dict(sort="EXPECTED_START_TIME_ASC")
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        exported = [
+            FlowRunResponse.model_validate_json(line) for line in response.iter_lines()
+        ]
+        expected = await client.post(
+            "/flow_runs/filter", json=dict(sort="EXPECTED_START_TIME_ASC")
+        )
+        assert [str(flow_run.id) for flow_run in exported] == [
+            flow_run["id"] for flow_run in expected.json()
+        ]
+
+    async def test_export_flow_runs_applies_filters_and_limit(self, flow_runs, client):
+        response = await client.post(
+            "/flow_runs/export",
+            json=dict(
+                sort="EXPECTED_START_TIME_DESC",
+                limit=3,
+                flow_runs={"tags": {"all_": ["odd"]}},
+            ),
+        )
+        exported = [
+            FlowRunResponse.model_validate_json(line) for line in response.iter_lines()
+        ]
+        assert len(exported) == 3
+        assert exported[0].id == flow_runs[4].id
+        assert exported[1].id == flow_runs[0].id
+        assert exported[2].id in {flow_runs[1].id, flow_runs[3].id}
+
+    async def test_export_flow_runs_requires_keyset_sort(self, client):
+        response = await client.post("/flow_runs/export", json=dict(sort="NAME_ASC"))
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
 
 class TestReadFlowRunGraph:
     @pytest.fixture
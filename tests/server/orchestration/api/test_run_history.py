@@ -1,5 +1,6 @@
 from datetime import timedelta
 from typing import Any, Dict, List
+from unittest import mock
 
 import pendulum
 import pytest
@@ -10,8 +11,14 @@ from packaging import version
 from pydantic import TypeAdapter
 
 from prefect.server import models
-from prefect.server.schemas import actions, core, responses, states
+from prefect.server.api.run_history import _run_history_from_rollups, run_history
+from prefect.server.schemas import actions, core, filters, responses, states
 from prefect.server.schemas.states import StateType
+from prefect.server.services.run_history_rollups import RunHistoryRollups
+from prefect.settings import (
+    PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED,
+    temporary_settings,
+)
 
 dt = pendulum.datetime(2021, 7, 1)
 
@@ -840,6 +847,184 @@ async def test_last_bin_contains_end_date(client, route):
     assert parsed[1].interval_end == dt.add(days=2)
 
 
+@pytest.fixture(scope="module")
+async def rollups(data):
+    await RunHistoryRollups().start(loops=1)
+
+
+def counts_by_state(history: List[responses.HistoryResponse]):
+    return [
+        (
+            h.interval_start,
+            h.interval_end,
+            sorted((s.state_type, s.state_name, s.count_runs) for s in h.states),
+        )
+        for h in history
+    ]
+
+
+@pytest.mark.parametrize("run_type", ["flow_run", "task_run"])
+@pytest.mark.parametrize(
+    "start,end,interval",
+    [
+        (dt.subtract(days=14), dt.add(days=3), timedelta(days=1)),
+        (dt.subtract(days=16), dt.add(days=6), timedelta(days=7)),
+        (dt.subtract(days=1), dt.add(days=1), timedelta(hours=6)),
+        (dt.subtract(minutes=5), dt.add(minutes=30), timedelta(minutes=5)),
+        (dt, dt.add(days=10), timedelta(minutes=1)),
+    ],
+)
+@pytest.mark.parametrize(
+    "criteria",
+    [
+        {},
+        {"state": {"type": {"any_": ["COMPLETED", "RUNNING"]}}},
+        {"expected_start_time": {"after_": str(dt.subtract(days=30))}},
+    ],
+)
+async def test_history_from_rollups_matches_runs(
+    session, rollups, run_type, start, end, interval, criteria
+):
+    if run_type == "flow_run":
+        run_filters = dict(
+            flow_runs=filters.FlowRunFilter(**criteria) if criteria else None
+        )
+    else:
+        run_filters = dict(
+            task_runs=filters.TaskRunFilter(**criteria) if criteria else None
+        )
+
+    from_rollups = await _run_history_from_rollups(
+        session=session,
+        run_type=run_type,
+        history_start=start,
+        history_end=end,
+        history_interval=interval,
+        **run_filters,
+    )
+    assert from_rollups is not None
+
+    with temporary_settings({PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED: False}):
+        from_runs = await run_history(
+            session=session,
+            run_type=run_type,
+            history_start=start,
+            history_end=end,
+            history_interval=interval,
+            **run_filters,
+        )
+
+    assert counts_by_state(from_rollups) == counts_by_state(from_runs)
+
+
+@pytest.mark.parametrize("run_type", ["flow_run", "task_run"])
+async def test_history_from_rollups_estimates_match_runs(session, rollups, run_type):
+    kwargs = dict(
+        history_start=dt.subtract(days=14),
+        history_end=dt.add(days=3),
+        history_interval=timedelta(days=1),
+    )
+    from_rollups = await _run_history_from_rollups(
+        session=session, run_type=run_type, **kwargs
+    )
+    with temporary_settings({PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED: False}):
+        from_runs = await run_history(session=session, run_type=run_type, **kwargs)
+
+    def estimates(history: List[responses.HistoryResponse]):
+        return {
+            (h.interval_start, s.state_name): (
+                s.count_runs,
+                s.sum_estimated_run_time.total_seconds(),
+                s.sum_estimated_lateness.total_seconds(),
+            )
+            for h in history
+            for s in h.states
+        }
+
+    expected = estimates(from_runs)
+    assert estimates(from_rollups).keys() == expected.keys()
+    for key, (count, run_time, lateness) in estimates(from_rollups).items():
+        # the rollups are read after they were refreshed, and SQLite truncates
+        # the times each estimate grows from to the second
+        assert run_time == pytest.approx(expected[key][1], abs=2 * count)
+        assert lateness == pytest.approx(expected[key][2], abs=2 * count)
+
+
+@pytest.mark.parametrize("route", ["flow_runs", "task_runs"])
+async def test_history_endpoints_read_rollups(client, rollups, route):
+    request = dict(
+        history_start=str(dt.subtract(days=2)),
+        history_end=str(dt.add(days=1)),
+        history_interval_seconds=timedelta(hours=6).total_seconds(),
+    )
+    expected = validate_response(
+        await client.post(f"/{route}/history", json=request),
+        include={"state_type", "state_name", "count_runs"},
+    )
+
+    with temporary_settings({PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED: True}):
+        with mock.patch(
+            "prefect.server.api.run_history._run_history_from_rollups",
+            wraps=_run_history_from_rollups,
+        ) as from_rollups:
+            response = await client.post(f"/{route}/history", json=request)
+
+    from_rollups.assert_awaited_once()
+    assert (
+        validate_response(response, include={"state_type", "state_name", "count_runs"})
+        == expected
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        # intervals that don't line up with minutes
+        dict(history_interval=timedelta(seconds=90)),
+        dict(history_start=dt.add(seconds=30)),
+        # filters that the rollups can't answer
+        dict(flow_runs=filters.FlowRunFilter(tags=dict(all_=["completed"]))),
+        dict(flows=filters.FlowFilter(name=dict(any_=["f-1"]))),
+        dict(work_pools=filters.WorkPoolFilter(name=dict(any_=["test-work-pool"]))),
+        dict(
+            flow_runs=filters.FlowRunFilter(
+                expected_start_time=dict(after_=str(dt.add(hours=1)))
+            )
+        ),
+    ],
+)
+async def test_history_falls_back_to_runs(session, rollups, kwargs):
+    kwargs = {
+        "history_start": dt,
+        "history_end": dt.add(days=1),
+        "history_interval": timedelta(hours=1),
+        **kwargs,
+    }
+    assert (
+        await _run_history_from_rollups(session=session, run_type="flow_run", **kwargs)
+        is None
+    )
+
+
+async def test_history_falls_back_to_runs_when_rollups_are_behind(session, rollups):
+    await models.run_history_rollups.write_rollup_watermark(
+        session=session, watermark=pendulum.now("UTC").subtract(hours=1)
+    )
+
+    assert (
+        await _run_history_from_rollups(
+            session=session,
+            run_type="flow_run",
+            history_start=dt,
+            history_end=dt.add(days=1),
+            history_interval=timedelta(hours=1),
+        )
+        is None
+    )
+
+    await session.rollback()
+
+
 async def test_flow_run_lateness(client, session):
     await session.execute(sa.text("delete from flow where true;"))
 
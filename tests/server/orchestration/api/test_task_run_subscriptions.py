@@ -9,12 +9,18 @@ import pytest
 from fastapi import FastAPI
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.testclient import TestClient, WebSocketTestSession
+from starlette.websockets import WebSocketDisconnect
 
 from prefect.client.schemas import TaskRun
-from prefect.server import models
+from prefect.server import models, task_queue
 from prefect.server.api import task_runs
 from prefect.server.schemas import states as server_states
 from prefect.server.schemas.core import TaskRun as ServerTaskRun
+from prefect.settings import (
+    PREFECT_TASK_SCHEDULING_SPILL_PATH,
+    PREFECT_TASK_SCHEDULING_SPILL_TO_DISK,
+    temporary_settings,
+)
 
 
 @pytest.fixture
@@ -233,6 +239,86 @@ def test_server_redelivers_unacknowledged_runs(app: FastAPI, taskA_run1: TaskRun
         assert received.id == taskA_run1.id
 
 
+def test_prefetching_delivers_batches_of_runs(
+    app: FastAPI, ten_task_A_runs: List[TaskRun]
+):
+    with authenticated_socket(app) as socket:
+        socket.send_json(
+            {"type": "subscribe", "keys": ["mytasks.taskA"], "prefetch": 4}
+        )
+
+        batches = []
+        while sum(len(batch) for batch in batches) < len(ten_task_A_runs):
+            batches.append(socket.receive_json())
+            for _ in batches[-1]:
+                socket.send_json({"type": "ack"})
+
+        socket.send_json({"type": "quit"})
+
+    assert all(isinstance(batch, list) for batch in batches)
+    assert all(1 <= len(batch) <= 4 for batch in batches)
+    assert [TaskRun.model_validate(run).id for batch in batches for run in batch] == [
+        run.id for run in ten_task_A_runs
+    ]
+
+
+@pytest.mark.parametrize("prefetch", [0, -1, "2"])
+def test_prefetch_must_be_a_positive_integer(
+    app: FastAPI, taskA_run1: TaskRun, prefetch
+):
+    with authenticated_socket(app) as socket:
+        socket.send_json(
+            {"type": "subscribe", "keys": ["mytasks.taskA"], "prefetch": prefetch}
+        )
+
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            socket.receive_json()
+
+    assert exc_info.value.code == 4001
+
+
+def test_server_redelivers_unacknowledged_batches(
+    app: FastAPI, taskA_run1: TaskRun, taskA_run2: TaskRun
+):
+    with authenticated_socket(app) as socket:
+        socket.send_json(
+            {"type": "subscribe", "keys": ["mytasks.taskA"], "prefetch": 2}
+        )
+
+        received = socket.receive_json()
+        assert len(received) == 2
+
+        socket.close()
+
+    with authenticated_socket(app) as socket:
+        socket.send_json({"type": "subscribe", "keys": ["mytasks.taskA"]})
+
+        received = drain(socket, 2)
+        assert {r.id for r in received} == {taskA_run1.id, taskA_run2.id}
+
+
+def test_server_redelivers_the_unacknowledged_runs_of_a_batch(
+    app: FastAPI, taskA_run1: TaskRun, taskA_run2: TaskRun
+):
+    with authenticated_socket(app) as socket:
+        socket.send_json(
+            {"type": "subscribe", "keys": ["mytasks.taskA"], "prefetch": 2}
+        )
+
+        received = socket.receive_json()
+        assert len(received) == 2
+
+        # only the first run was started before the worker went away
+        socket.send_json({"type": "ack"})
+        socket.close()
+
+    with authenticated_socket(app) as socket:
+        socket.send_json({"type": "subscribe", "keys": ["mytasks.taskA"]})
+
+        (redelivered,) = drain(socket, 1)
+        assert redelivered.id == TaskRun.model_validate(received[1]).id
+
+
 @pytest.fixture
 async def preexisting_runs(session: AsyncSession, reset_task_queues) -> List[TaskRun]:
     stored_runA = ServerTaskRun.model_validate(
@@ -277,6 +363,11 @@ def test_server_restores_scheduled_task_runs_at_startup(
 
 
 class TestQueueLimit:
+    @pytest.fixture(autouse=True)
+    def disable_spilling(self):
+        with temporary_settings({PREFECT_TASK_SCHEDULING_SPILL_TO_DISK: False}):
+            yield
+
     async def test_task_queue_scheduled_size_limit(self):
         task_key = "test_limit"
         max_scheduled_size = 2
@@ -340,3 +431,123 @@ class TestQueueLimit:
         assert (
             queue._retry_queue.qsize() == max_retry_size
         ), "Retry queue size should be at its configured limit"
+
+
+class TestQueueSpilling:
+    @pytest.fixture(autouse=True)
+    def spill_path(self, tmp_path, reset_task_queues):
+        with temporary_settings(
+            {
+                PREFECT_TASK_SCHEDULING_SPILL_TO_DISK: True,
+                PREFECT_TASK_SCHEDULING_SPILL_PATH: tmp_path,
+            }
+        ):
+            yield tmp_path
+
+    def new_task_run(self, task_key: str, i: int) -> ServerTaskRun:
+        return ServerTaskRun(
+            id=uuid4(), flow_run_id=None, task_key=task_key, dynamic_key=f"{i}"
+        )
+
+    async def test_full_queue_spills_instead_of_blocking(self, spill_path):
+        task_key = "test_spill"
+        task_runs.TaskQueue.configure_task_key(task_key, scheduled_size=2)
+        queue = task_runs.TaskQueue.for_key(task_key)
+
+        runs = [self.new_task_run(task_key, i) for i in range(5)]
+        for run in runs:
+            await asyncio.wait_for(queue.put(run), timeout=1)
+
+        assert queue._scheduled_queue.qsize() == 2
+        assert queue.metrics().scheduled == 5
+        assert queue.metrics().spilled == 3
+        assert list(spill_path.rglob("*.jsonl"))
+
+        received = [await queue.get() for _ in runs]
+        assert [run.id for run in received] == [run.id for run in runs]
+
+        with pytest.raises(asyncio.QueueEmpty):
+            queue.get_nowait()
+
+        assert queue.metrics().spilled == 0
+        assert not list(spill_path.rglob("*.jsonl"))
+
+    async def test_puts_during_spill_stay_in_order(self):
+        task_key = "test_spill_order"
+        task_runs.TaskQueue.configure_task_key(task_key, scheduled_size=2)
+        queue = task_runs.TaskQueue.for_key(task_key)
+
+        runs = [self.new_task_run(task_key, i) for i in range(6)]
+        for run in runs[:4]:
+            await queue.put(run)
+
+        received = [queue.get_nowait()]
+        for run in runs[4:]:
+            await queue.put(run)
+        received += [await queue.get() for _ in range(5)]
+
+        assert [run.id for run in received] == [run.id for run in runs]
+
+    async def test_retries_spill(self):
+        task_key = "test_retry_spill"
+        task_runs.TaskQueue.configure_task_key(task_key, retry_size=1)
+        queue = task_runs.TaskQueue.for_key(task_key)
+
+        runs = [self.new_task_run(task_key, i) for i in range(3)]
+        for run in runs:
+            await asyncio.wait_for(queue.retry(run), timeout=1)
+
+        assert queue.metrics().retries == 3
+        received = [await queue.get() for _ in runs]
+        assert [run.id for run in received] == [run.id for run in runs]
+
+    async def test_spill_directory_is_removed_on_reset(self, spill_path):
+        task_key = "test_spill_directory"
+        task_runs.TaskQueue.configure_task_key(task_key, scheduled_size=1)
+        queue = task_runs.TaskQueue.for_key(task_key)
+
+        for i in range(2):
+            await queue.put(self.new_task_run(task_key, i))
+
+        (spill_directory,) = spill_path.iterdir()
+        assert (spill_directory / task_queue.SPILL_LOCK_FILE).exists()
+
+        task_runs.TaskQueue.reset()
+        assert not spill_directory.exists()
+
+    async def test_stale_spill_directories_are_removed(self, spill_path):
+        stale = spill_path / "stale"
+        stale.mkdir()
+        (stale / task_queue.SPILL_LOCK_FILE).touch()
+        (stale / "scheduled.jsonl").touch()
+
+        task_key = "test_stale_spill_directory"
+        task_runs.TaskQueue.configure_task_key(task_key, scheduled_size=1)
+        queue = task_runs.TaskQueue.for_key(task_key)
+        for i in range(2):
+            await queue.put(self.new_task_run(task_key, i))
+
+        assert not stale.exists()
+        assert len(list(spill_path.iterdir())) == 1
+
+    async def test_queue_metrics(self):
+        task_key = "test_metrics"
+        queue = task_runs.TaskQueue.for_key(task_key)
+
+        await queue.put(self.new_task_run(task_key, 0))
+        await queue.put(self.new_task_run(task_key, 1))
+        await queue.retry(self.new_task_run(task_key, 2))
+
+        metrics = queue.metrics()
+        assert metrics.task_key == task_key
+        assert metrics.scheduled == 2
+        assert metrics.retries == 1
+        assert metrics.delivered == 0
+        assert metrics.oldest_wait > 0
+
+        queue.get_nowait()
+
+        metrics = task_runs.TaskQueue.all_metrics()[task_key]
+        assert metrics.retries == 0
+        assert metrics.delivered == 1
+        assert metrics.max_wait >= metrics.mean_wait > 0
@@ -353,6 +353,81 @@ class TestReadTaskRuns:
         assert len(response.json()) == 1
         assert response.json()[0]["id"] == str(task_run.id)
 
+    @pytest.fixture
+    async def task_runs_to_paginate(self, flow_run, session):
+        now = pendulum.now("UTC").start_of("minute")
+        task_runs = []
+        for i, minutes in enumerate([0, 0, 1, None, 1, None, 2]):
+            task_runs.append(
+                await models.task_runs.create_task_run(
+                    session=session,
+                    task_run=schemas.core.TaskRun(
+                        flow_run_id=flow_run.id,
+                        task_key="my-key",
+                        dynamic_key=str(i),
+                        expected_start_time=(
+                            now.add(minutes=minutes) if minutes is not None else None
+                        ),
+                    ),
+                )
+            )
+        await session.commit()
+        return task_runs
+
+    @pytest.mark.parametrize(
+        "sort", ["ID_DESC", "EXPECTED_START_TIME_ASC", "EXPECTED_START_TIME_DESC"]
+    )
+    async def test_read_task_runs_after_cursor(
+        self, task_runs_to_paginate, client, sort
+    ):
+        response = await client.post("/task_runs/filter", json=dict(sort=sort))
+        expected = [task_run["id"] for task_run in response.json()]
+        assert len(expected) == len(task_runs_to_paginate)
+
+        ids = []
+        after = None
+        while True:
+            response = await client.post(
+                "/task_runs/filter", json=dict(sort=sort, limit=2, after=after)
+            )
+            assert response.status_code == status.HTTP_200_OK, response.text
+            page = response.json()
+            if not page:
+                break
+            ids.extend(task_run["id"] for task_run in page)
+            after = {
+                "timestamp": page[-1]["expected_start_time"],
+                "id": page[-1]["id"],
+            }
+
+        assert ids == expected
+
+    async def test_read_task_runs_after_cursor_requires_keyset_sort(self, client):
+        response = await client.post(
+            "/task_runs/filter",
+            json=dict(sort="NAME_DESC", after={"id": str(uuid4())}),
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    async def test_export_task_runs(self, task_runs_to_paginate, client, monkeypatch):
+        monkeypatch.setattr("prefect.server.api.pagination.EXPORT_PAGE_SIZE", 3)
+
+        response = await client.post(
+            "/task_runs/export", json=dict(sort="EXPECTED_START_TIME_DESC")
+        )
+        assert response.status_code == status.HTTP_200_OK
+        exported = [
+            schemas.core.TaskRun.model_validate_json(line)
+            for line in response.iter_lines()
+        ]
+
+        expected = await client.post(
+            "/task_runs/filter", json=dict(sort="EXPECTED_START_TIME_DESC")
+        )
+        assert [str(task_run.id) for task_run in exported] == [
+            task_run["id"] for task_run in expected.json()
+        ]
+
 
 class TestDeleteTaskRuns:
     async def test_delete_task_runs(self, task_run, client, session):
@@ -0,0 +1,309 @@
+from datetime import timedelta
+from uuid import uuid4
+
+import pendulum
+import pytest
+import sqlalchemy as sa
+
+from prefect.server import models
+from prefect.server.models.log_segments import decode_segment, encode_segment
+from prefect.server.schemas.actions import LogCreate
+from prefect.server.schemas.filters import LogFilter
+from prefect.server.schemas.sorting import KeysetCursor, LogSort
+from prefect.server.services.log_compactor import LogCompactor
+from prefect.settings import (
+    PREFECT_API_SERVICES_LOG_COMPACTOR_RETENTION_PERIOD,
+    PREFECT_API_SERVICES_LOG_COMPACTOR_SEGMENT_SIZE,
+    PREFECT_API_SERVICES_LOG_COMPACTOR_STORAGE_PATH,
+    temporary_settings,
+)
+
+NOW = pendulum.now("UTC")
+
+
+@pytest.fixture
+def flow_run_ids():
+    return [uuid4(), uuid4()]
+
+
+@pytest.fixture
+def task_run_id():
+    return uuid4()
+
+
+@pytest.fixture
+async def logs(session, flow_run_ids, task_run_id):
+    logs = [
+        LogCreate(
+            name="prefect.task_run" if i % 3 == 0 else "prefect.flow_run",
+            level=10 * (i % 5 + 1),
+            message=f"Log {i}",
+            # pairs of logs share each timestamp, and the last pair is too recent
+            # to be compacted
+            timestamp=(
+                NOW - timedelta(hours=3) + timedelta(minutes=10 * (i // 2))
+                if i < 18
+                else NOW
+            ),
+            flow_run_id=flow_run_ids[i % 2],
+            task_run_id=task_run_id if i % 3 == 0 else None,
+        )
+        for i in range(20)
+    ]
+    await models.logs.create_logs(session=session, logs=logs)
+    await session.commit()
+
+
+async def read_log_rows(db):
+    async with db.session_context() as session:
+        result = await session.execute(sa.select(db.Log))
+        return result.scalars().all()
+
+
+async def read_segments(db):
+    async with db.session_context() as session:
+        result = await session.execute(sa.select(db.LogSegment))
+        return result.scalars().all()
+
+
+def as_dicts(logs):
+    return [
+        {
+            "id": log.id,
+            "name": log.name,
+            "level": log.level,
+            "message": log.message,
+            "timestamp": log.timestamp,
+            "flow_run_id": log.flow_run_id,
+            "task_run_id": log.task_run_id,
+        }
+        for log in logs
+    ]
+
+
+def test_segments_round_trip():
+    flow_run_id = uuid4()
+    logs = [
+        models.logs.orm_models.Log(
+            id=uuid4(),
+            created=NOW,
+            name=f"logger-{i % 2}",
+            level=20,
+            message=f"Log {i} ✨",
+            timestamp=NOW.add(microseconds=i * 1_001),
+            flow_run_id=flow_run_id,
+            task_run_id=uuid4() if i % 2 else None,
+        )
+        for i in range(5)
+    ]
+
+    decoded = decode_segment(encode_segment(logs), flow_run_id)
+
+    assert as_dicts(decoded) == as_dicts(logs)
+    assert [log.created for log in decoded] == [NOW] * 5
+
+
+async def test_compacts_old_logs(db, logs, flow_run_ids):
+    await LogCompactor().start(loops=1)
+
+    rows = await read_log_rows(db)
+    assert len(rows) == 2
+    assert all(row.timestamp >= NOW - timedelta(hours=1) for row in rows)
+
+    segments = await read_segments(db)
+    assert {segment.flow_run_id for segment in segments} == set(flow_run_ids)
+    assert sum(segment.count for segment in segments) == 18
+    assert all(segment.data and segment.path is None for segment in segments)
+
+
+async def test_compacts_into_segments_of_limited_size(db, logs):
+    with temporary_settings({PREFECT_API_SERVICES_LOG_COMPACTOR_SEGMENT_SIZE: 4}):
+        compactor = LogCompactor()
+    await compactor.start(loops=1)
+
+    segments = await read_segments(db)
+    assert sorted(segment.count for segment in segments) == [1, 1, 4, 4, 4, 4]
+    assert len(await read_log_rows(db)) == 2
+
+
+async def test_compacts_to_filesystem(db, logs, tmp_path):
+    with temporary_settings(
+        {PREFECT_API_SERVICES_LOG_COMPACTOR_STORAGE_PATH: tmp_path}
+    ):
+        compactor = LogCompactor()
+    await compactor.start(loops=1)
+
+    segments = await read_segments(db)
+    assert segments
+    for segment in segments:
+        assert segment.data is None
+        assert (tmp_path / f"{segment.id}.log.z").exists()
+
+    async with db.session_context() as session:
+        assert len(await models.logs.read_logs(session=session, log_filter=None)) == 20
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"sort": LogSort.TIMESTAMP_DESC},
+        {"limit": 5},
+        {"offset": 7, "limit": 5},
+        {"sort": LogSort.TIMESTAMP_DESC, "offset": 3, "limit": 4},
+        {"log_filter": LogFilter(level={"ge_": 30})},
+        {"log_filter": LogFilter(level={"ge_": 30}, operator="or_")},
+        {"log_filter": LogFilter(timestamp={"after_": NOW - timedelta(hours=2)})},
+        {
+            "log_filter": LogFilter(timestamp={"before_": NOW - timedelta(hours=2)}),
+            "sort": LogSort.TIMESTAMP_DESC,
+        },
+    ],
+)
+async def test_reads_compacted_logs_like_log_rows(db, logs, kwargs):
+    kwargs = {"log_filter": None, **kwargs}
+    async with db.session_context() as session:
+        expected = as_dicts(await models.logs.read_logs(session=session, **kwargs))
+
+    await LogCompactor().start(loops=1)
+    assert await read_segments(db)
+
+    async with db.session_context() as session:
+        merged = as_dicts(await models.logs.read_logs(session=session, **kwargs))
+    assert merged == expected
+
+
+@pytest.mark.parametrize("sort", [LogSort.TIMESTAMP_ASC, LogSort.TIMESTAMP_DESC])
+async def test_reads_compacted_logs_by_flow_run_and_task_run(
+    db, logs, flow_run_ids, task_run_id, sort
+):
+    log_filters = [
+        LogFilter(flow_run_id={"any_": [flow_run_ids[0]]}),
+        LogFilter(task_run_id={"any_": [task_run_id]}),
+    ]
+    async with db.session_context() as session:
+        expected = [
+            as_dicts(
+                await models.logs.read_logs(
+                    session=session, log_filter=log_filter, sort=sort
+                )
+            )
+            for log_filter in log_filters
+        ]
+
+    await LogCompactor().start(loops=1)
+
+    async with db.session_context() as session:
+        for log_filter, expected_logs in zip(log_filters, expected):
+            merged = await models.logs.read_logs(
+                session=session, log_filter=log_filter, sort=sort
+            )
+            assert as_dicts(merged) == expected_logs
+
+
+@pytest.mark.parametrize("sort", [LogSort.TIMESTAMP_ASC, LogSort.TIMESTAMP_DESC])
+async def test_paginates_compacted_logs_with_cursor(db, logs, sort):
+    async with db.session_context() as session:
+        expected = as_dicts(
+            await models.logs.read_logs(session=session, log_filter=None, sort=sort)
+        )
+
+    await LogCompactor().start(loops=1)
+
+    paginated = []
+    after = None
+    while True:
+        async with db.session_context() as session:
+            page = await models.logs.read_logs(
+                session=session, log_filter=None, sort=sort, limit=3, after=after
+            )
+        if not page:
+            break
+        paginated.extend(as_dicts(page))
+        after = KeysetCursor(timestamp=page[-1].timestamp, id=page[-1].id)
+
+    assert paginated == expected
+
+
+async def test_deletes_expired_segments(db, logs, tmp_path):
+    with temporary_settings(
+        {
+            PREFECT_API_SERVICES_LOG_COMPACTOR_RETENTION_PERIOD: timedelta(hours=2),
+            PREFECT_API_SERVICES_LOG_COMPACTOR_SEGMENT_SIZE: 2,
+            PREFECT_API_SERVICES_LOG_COMPACTOR_STORAGE_PATH: tmp_path,
+        }
+    ):
+        compactor = LogCompactor()
+    await compactor.start(loops=1)
+
+    segments = await read_segments(db)
+    assert segments
+    assert all(
+        segment.end_time >= NOW - timedelta(hours=2, minutes=1) for segment in segments
+    )
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        f"{segment.id}.log.z" for segment in segments
+    )
+
+
+async def test_removes_the_files_of_segments_that_are_rolled_back(
+    db, logs, flow_run_ids, tmp_path
+):
+    async with db.session_context() as session:
+        count = await models.log_segments.compact_flow_run_logs(
+            session=session,
+            flow_run_id=flow_run_ids[0],
+            before=NOW,
+            max_logs=100,
+            storage_path=tmp_path,
+        )
+        assert count == 9
+        assert len(list(tmp_path.iterdir())) == 1
+        await session.rollback()
+
+    assert list(tmp_path.iterdir()) == []
+    assert await read_segments(db) == []
+    assert len(await read_log_rows(db)) == 20
+
+
+async def test_deletes_the_files_of_expired_segments_after_commit(db, logs, tmp_path):
+    with temporary_settings(
+        {PREFECT_API_SERVICES_LOG_COMPACTOR_STORAGE_PATH: tmp_path}
+    ):
+        compactor = LogCompactor()
+    await compactor.start(loops=1)
+    files = sorted(tmp_path.iterdir())
+    assert files
+
+    async with db.session_context() as session:
+        assert await models.log_segments.delete_expired_log_segments(
+            session=session, before=NOW
+        ) == len(files)
+        await session.rollback()
+
+    assert sorted(tmp_path.iterdir()) == files
+
+    async with db.session_context(begin_transaction=True) as session:
+        await models.log_segments.delete_expired_log_segments(
+            session=session, before=NOW
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_reads_segments_with_missing_files_as_empty(db, logs, tmp_path):
+    with temporary_settings(
+        {
+            PREFECT_API_SERVICES_LOG_COMPACTOR_SEGMENT_SIZE: 2,
+            PREFECT_API_SERVICES_LOG_COMPACTOR_STORAGE_PATH: tmp_path,
+        }
+    ):
+        compactor = LogCompactor()
+    await compactor.start(loops=1)
+
+    segments = await read_segments(db)
+    (tmp_path / f"{segments[0].id}.log.z").unlink()
+
+    async with db.session_context() as session:
+        logs = await models.logs.read_logs(session=session, log_filter=None)
+    assert len(logs) == 20 - segments[0].count
@@ -0,0 +1,242 @@
+from unittest import mock
+
+import pendulum
+import pytest
+import sqlalchemy as sa
+
+from prefect.server import models, schemas
+from prefect.server.models.run_history_rollups import (
+    DAY,
+    HOUR,
+    MINUTE,
+    WATERMARK_OVERLAP,
+    hour_ranges,
+)
+from prefect.server.schemas.states import StateType
+from prefect.server.services.run_history_rollups import RunHistoryRollups
+
+dt = pendulum.datetime(2020, 1, 6, 10, 30)
+
+
+@pytest.fixture
+async def completed_runs(session, flow):
+    runs = []
+    for minutes in [0, 1, 1, 45, 95]:
+        runs.append(
+            await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    flow_id=flow.id,
+                    state=schemas.states.Completed(timestamp=dt.add(minutes=minutes)),
+                ),
+            )
+        )
+    await session.commit()
+    return runs
+
+
+async def read_counts(db, bucket_seconds, run_type="flow_run"):
+    rollups = db.RunHistoryRollup
+    async with db.session_context() as session:
+        result = await session.execute(
+            sa.select(rollups.bucket_start, sa.func.sum(rollups.count))
+            .where(
+                rollups.run_type == run_type,
+                rollups.bucket_seconds == bucket_seconds,
+            )
+            .group_by(rollups.bucket_start)
+            .order_by(rollups.bucket_start)
+        )
+        return {pendulum.instance(start): count for start, count in result}
+
+
+def test_hour_ranges_merge_contiguous_hours():
+    hours = [dt.start_of("hour").add(hours=h) for h in [0, 1, 2, 5, 6, 30]]
+    assert hour_ranges(hours) == [
+        (hours[0], hours[2].add(hours=1)),
+        (hours[3], hours[4].add(hours=1)),
+        (hours[5], hours[5].add(hours=1)),
+    ]
+
+
+def test_hour_ranges_are_capped():
+    start = dt.start_of("hour")
+    ranges = hour_ranges(start.add(hours=h) for h in range(30))
+    assert ranges == [
+        (start, start.add(hours=24)),
+        (start.add(hours=24), start.add(hours=30)),
+    ]
+
+
+async def test_backfills_rollups(db, completed_runs):
+    await RunHistoryRollups().start(loops=1)
+
+    assert await read_counts(db, MINUTE) == {
+        pendulum.datetime(2020, 1, 6, 10, 30): 1,
+        pendulum.datetime(2020, 1, 6, 10, 31): 2,
+        pendulum.datetime(2020, 1, 6, 11, 15): 1,
+        pendulum.datetime(2020, 1, 6, 12, 5): 1,
+    }
+    assert await read_counts(db, HOUR) == {
+        pendulum.datetime(2020, 1, 6, 10): 3,
+        pendulum.datetime(2020, 1, 6, 11): 1,
+        pendulum.datetime(2020, 1, 6, 12): 1,
+    }
+    assert await read_counts(db, DAY) == {pendulum.datetime(2020, 1, 6): 5}
+
+    async with db.session_context() as session:
+        watermark = await models.run_history_rollups.read_rollup_watermark(
+            session=session
+        )
+    assert watermark is not None
+    assert watermark <= pendulum.now("UTC")
+
+
+async def test_refreshes_updated_runs(db, session, completed_runs, flow):
+    await RunHistoryRollups().start(loops=1)
+
+    await models.flow_runs.create_flow_run(
+        session=session,
+        flow_run=schemas.core.FlowRun(
+            flow_id=flow.id,
+            state=schemas.states.Failed(timestamp=dt.add(minutes=46)),
+        ),
+    )
+    await session.commit()
+
+    await RunHistoryRollups().start(loops=1)
+
+    assert await read_counts(db, HOUR) == {
+        pendulum.datetime(2020, 1, 6, 10): 3,
+        pendulum.datetime(2020, 1, 6, 11): 2,
+        pendulum.datetime(2020, 1, 6, 12): 1,
+    }
+    assert await read_counts(db, DAY) == {pendulum.datetime(2020, 1, 6): 6}
+
+
+async def test_refreshes_deleted_runs(db, session, completed_runs):
+    await RunHistoryRollups().start(loops=1)
+
+    await models.flow_runs.delete_flow_run(
+        session=session, flow_run_id=completed_runs[1].id
+    )
+    await session.commit()
+
+    await RunHistoryRollups().start(loops=1)
+
+    assert await read_counts(db, MINUTE) == {
+        pendulum.datetime(2020, 1, 6, 10, 30): 1,
+        pendulum.datetime(2020, 1, 6, 10, 31): 1,
+        pendulum.datetime(2020, 1, 6, 11, 15): 1,
+        pendulum.datetime(2020, 1, 6, 12, 5): 1,
+    }
+    assert await read_counts(db, DAY) == {pendulum.datetime(2020, 1, 6): 4}
+
+
+async def test_refreshes_deleted_flows(db, session, completed_runs, flow):
+    await RunHistoryRollups().start(loops=1)
+
+    await models.flows.delete_flow(session=session, flow_id=flow.id)
+    await session.commit()
+
+    await RunHistoryRollups().start(loops=1)
+
+    assert await read_counts(db, MINUTE) == {}
+    assert await read_counts(db, DAY) == {}
+
+
+async def test_rolls_up_task_runs_by_flow(db, session, completed_runs, flow):
+    for minutes in [3, 4]:
+        await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=completed_runs[0].id,
+                task_key="my-task",
+                dynamic_key=str(minutes),
+                state=schemas.states.Completed(timestamp=dt.add(minutes=minutes)),
+            ),
+        )
+    await session.commit()
+
+    await RunHistoryRollups().start(loops=1)
+
+    assert await read_counts(db, HOUR, run_type="task_run") == {
+        pendulum.datetime(2020, 1, 6, 10): 2,
+    }
+
+    result = await session.execute(
+        sa.select(sa.distinct(db.RunHistoryRollup.flow_id)).where(
+            db.RunHistoryRollup.run_type == "task_run"
+        )
+    )
+    assert result.scalars().all() == [flow.id]
+
+
+async def test_only_refreshes_hours_the_clock_has_passed(db, session, flow):
+    # a late run that never started, and a running run
+    for state in [
+        schemas.states.Scheduled(scheduled_time=dt),
+        schemas.states.Running(timestamp=dt.add(minutes=1)),
+    ]:
+        await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(flow_id=flow.id, state=state),
+        )
+    await session.commit()
+
+    await RunHistoryRollups().start(loops=1)
+
+    async with db.session_context() as session:
+        since = await models.run_history_rollups.read_rollup_watermark(session=session)
+        # as if the next refresh were past the overlap with this one
+        since += WATERMARK_OVERLAP
+        assert (
+            await models.run_history_rollups.read_dirty_hours(
+                session=session, since=since
+            )
+            == []
+        )
+
+        result = await session.execute(
+            sa.select(
+                db.RunHistoryRollup.state_type,
+                db.RunHistoryRollup.count_running,
+                db.RunHistoryRollup.sum_running_since,
+                db.RunHistoryRollup.count_late,
+                db.RunHistoryRollup.sum_late_since,
+            ).where(db.RunHistoryRollup.bucket_seconds == DAY)
+        )
+        assert set(result.all()) == {
+            (StateType.SCHEDULED, 0, 0, 1, dt.timestamp()),
+            (StateType.RUNNING, 1, dt.add(minutes=1).timestamp(), 0, 0),
+        }
+
+
+async def test_refreshes_runs_that_became_late(db, session, flow):
+    soon = pendulum.now("UTC").add(seconds=2)
+    await models.flow_runs.create_flow_run(
+        session=session,
+        flow_run=schemas.core.FlowRun(
+            flow_id=flow.id, state=schemas.states.Scheduled(scheduled_time=soon)
+        ),
+    )
+    await session.commit()
+
+    await RunHistoryRollups().start(loops=1)
+
+    async with db.session_context() as session:
+        since = await models.run_history_rollups.read_rollup_watermark(session=session)
+        since += WATERMARK_OVERLAP
+        assert (
+            await models.run_history_rollups.read_dirty_hours(
+                session=session, since=since
+            )
+            == []
+        )
+
+    async with db.session_context() as session:
+        with mock.patch("pendulum.now", return_value=soon.add(seconds=1)):
+            hours = await models.run_history_rollups.read_dirty_hours(
+                session=session, since=since
+            )
+    assert hours == [soon.start_of("hour")]
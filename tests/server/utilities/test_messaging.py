@@ -153,6 +153,23 @@ async def test_publishing_and_consuming_a_single_message(
     assert not remaining_message
 
 
+async def test_each_named_consumer_group_receives_every_message(
+    broker: str, clear_topics: None, publisher: Publisher
+) -> None:
+    consumers = [
+        create_consumer("my-topic", name="group-0"),
+        create_consumer("my-topic", name="group-1"),
+    ]
+
+    async with publisher as p:
+        await p.publish_data(b"hello, world", {"howdy": "partner"})
+
+    for consumer in consumers:
+        message = await drain_one(consumer)
+        assert message is not None
+        assert message.data == b"hello, world"
+
+
 async def test_stopping_consumer_without_acking(
     publisher: Publisher, consumer: Consumer
 ) -> None:
@@ -281,6 +281,30 @@ async def test_scheduled_tasks_are_restored_at_server_startup(
     assert enqueued.id == task_run.id
 
 
+async def test_scheduled_tasks_are_restored_in_batches(
+    foo_task_with_result_storage: Task,
+    prefect_client: "PrefectClient",
+    enabled_task_scheduling_pending_task_timeout: None,
+):
+    task_run_ids = [
+        foo_task_with_result_storage.apply_async((i,)).task_run_id for i in range(5)
+    ]
+
+    # emulate a restarted server with empty queues
+    TaskQueue.reset()
+
+    service = TaskSchedulingTimeouts()
+    service.restore_batch_size = 2
+    await service.start(loops=1)
+
+    queue = TaskQueue.for_key(foo_task_with_result_storage.task_key)
+    restored = [queue.get_nowait() for _ in task_run_ids]
+    assert {task_run.id for task_run in restored} == set(task_run_ids)
+
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
+
+
 async def test_stuck_pending_tasks_are_reenqueued(
     foo_task_with_result_storage: Task,
     prefect_client: "PrefectClient",
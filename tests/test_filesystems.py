@@ -6,6 +6,7 @@ from typing import Tuple
 import pytest
 
 import prefect
+import prefect.filesystems
 from prefect.filesystems import (
     LocalFileSystem,
     RemoteFileSystem,
@@ -221,6 +222,31 @@ class TestLocalFileSystem:
             assert set(os.listdir(tmp_dst)) == set(expected_parent_contents)
             assert set(os.listdir(Path(tmp_dst) / sub_dir_name)) == set(child_contents)
 
+    async def test_put_directory_skips_unchanged_files(self, tmp_path, monkeypatch):
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "same.txt").write_text("same")
+        (source / "changed.txt").write_text("before")
+
+        fs = LocalFileSystem(basepath=str(tmp_path))
+        await fs.put_directory(local_path=source, to_path="destination")
+
+        (source / "changed.txt").write_text("after!!")
+
+        copied = []
+        copy2 = prefect.filesystems.shutil.copy2
+        monkeypatch.setattr(
+            prefect.filesystems.shutil,
+            "copy2",
+            lambda src, dst: copied.append(src.name) or copy2(src, dst),
+        )
+        await fs.put_directory(
+            local_path=source, to_path="destination", skip_unchanged=True
+        )
+
+        assert copied == ["changed.txt"]
+        assert (tmp_path / "destination" / "changed.txt").read_text() == "after!!"
+
 
 class TestRemoteFileSystem:
     def test_must_contain_scheme(self):
@@ -275,6 +301,38 @@ class TestRemoteFileSystem:
         with pytest.raises(FileNotFoundError):
             await fs.read_path("foo/bar")
 
+    async def test_read_paths(self):
+        fs = RemoteFileSystem(basepath="memory://read-paths")
+        for i in range(3):
+            await fs.write_path(f"file-{i}.txt", content=f"hello {i}".encode())
+
+        contents = await fs.read_paths(["file-2.txt", "file-0.txt", "file-1.txt"])
+
+        assert contents == [b"hello 2", b"hello 0", b"hello 1"]
+
+    async def test_read_paths_fails_if_any_does_not_exist(self):
+        fs = RemoteFileSystem(basepath="memory://read-paths-missing")
+        await fs.write_path("exists.txt", content=b"hello")
+
+        with pytest.raises(FileNotFoundError):
+            await fs.read_paths(["exists.txt", "missing.txt"])
+
+    async def test_read_paths_batches_reads_on_async_filesystems(self):
+        fs = RemoteFileSystem(basepath="memory://read-paths-async")
+        fs._filesystem = MagicMock(async_impl=True)
+        fs._filesystem.cat_ranges.return_value = [b"a", b"b"]
+
+        assert await fs.read_paths(["a.txt", "b.txt"]) == [b"a", b"b"]
+        fs._filesystem.cat_ranges.assert_called_once_with(
+            [
+                "memory://read-paths-async/a.txt",
+                "memory://read-paths-async/b.txt",
+            ],
+            None,
+            None,
+            on_error="raise",
+        )
+
     async def test_resolve_path(self):
         base = "memory://root"
         fs = RemoteFileSystem(basepath=base)
@@ -377,7 +435,60 @@ class TestRemoteFileSystem:
         fs._filesystem = MagicMock()
         await fs.get_directory(from_path="memory://root/folder", local_path=None)
 
-        assert fs.filesystem.get.call_args[0][0] == "memory://root/folder/"
+        assert fs.filesystem.find.call_args[0][0] == "memory://root/folder/"
+
+    async def test_get_directory_copies_nested_files(self, tmp_path: Path):
+        fs = RemoteFileSystem(basepath="memory://get-nested")
+        await fs.write_path("top.txt", content=b"top")
+        await fs.write_path("a/b/nested.txt", content=b"nested")
+
+        await fs.get_directory(local_path=str(tmp_path))
+
+        assert (tmp_path / "top.txt").read_bytes() == b"top"
+        assert (tmp_path / "a" / "b" / "nested.txt").read_bytes() == b"nested"
+
+    async def test_get_directory_skips_unchanged_files(
+        self, tmp_path: Path, monkeypatch
+    ):
+        fs = RemoteFileSystem(basepath="memory://get-unchanged")
+        await fs.write_path("same.txt", content=b"same")
+        await fs.write_path("changed.txt", content=b"before")
+        await fs.get_directory(local_path=str(tmp_path))
+
+        await fs.write_path("changed.txt", content=b"after!!")
+
+        downloaded = []
+        get_file = fs.filesystem.get_file
+        monkeypatch.setattr(
+            fs.filesystem,
+            "get_file",
+            lambda rpath, lpath: downloaded.append(rpath) or get_file(rpath, lpath),
+        )
+        await fs.get_directory(local_path=str(tmp_path), skip_unchanged=True)
+
+        assert downloaded == ["/get-unchanged/changed.txt"]
+        assert (tmp_path / "changed.txt").read_bytes() == b"after!!"
+
+    async def test_put_directory_skips_unchanged_files(self, tmp_path: Path):
+        (tmp_path / "same.txt").write_text("same")
+        (tmp_path / "changed.txt").write_text("before")
+
+        fs = RemoteFileSystem(basepath="memory://put-unchanged")
+        assert await fs.put_directory(str(tmp_path), skip_unchanged=True) == 2
+        assert await fs.put_directory(str(tmp_path), skip_unchanged=True) == 0
+
+        (tmp_path / "changed.txt").write_text("after!!")
+        assert await fs.put_directory(str(tmp_path), skip_unchanged=True) == 1
+        assert await fs.read_path("changed.txt") == b"after!!"
+
+    async def test_put_directory_uploads_many_files(self, tmp_path: Path):
+        for i in range(50):
+            (tmp_path / f"dir-{i % 5}").mkdir(exist_ok=True)
+            (tmp_path / f"dir-{i % 5}" / f"file-{i}.txt").write_text(str(i))
+
+        fs = RemoteFileSystem(basepath="memory://put-many")
+        assert await fs.put_directory(str(tmp_path)) == 50
+        assert await fs.read_path("dir-3/file-13.txt") == b"13"
 
     @pytest.mark.parametrize("null_value", {None, ""})
     async def test_get_directory_empty_from_path_uses_basepath(
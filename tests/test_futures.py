@@ -10,12 +10,16 @@ import pytest
 from prefect import task
 from prefect.exceptions import FailedRun, MissingResult
 from prefect.futures import (
+    FIRST_COMPLETED,
     PrefectConcurrentFuture,
     PrefectDistributedFuture,
     PrefectFuture,
     PrefectFutureList,
+    PrefectFutureStream,
     PrefectWrappedFuture,
+    as_completed,
     resolve_futures_to_states,
+    wait,
 )
 from prefect.states import Completed, Failed
 from prefect.task_engine import run_task_async, run_task_sync
@@ -81,6 +85,19 @@ class TestPrefectConcurrentFuture:
         with pytest.raises(ValueError, match="oops"):
             future.result(raise_on_failure=True)
 
+    def test_add_done_callback(self):
+        wrapped_future = Future()
+        future = PrefectConcurrentFuture(uuid.uuid4(), wrapped_future)
+        called_with = []
+        future.add_done_callback(called_with.append)
+
+        assert called_with == []
+
+        wrapped_future.set_result(Completed(data=42))
+
+        assert called_with == [future]
+        assert future._final_state.is_completed()
+
     def test_warns_if_not_resolved_when_garbage_collected(self, caplog):
         PrefectConcurrentFuture(uuid.uuid4(), Future())
 
@@ -277,6 +294,107 @@ class TestPrefectDistributedFuture:
             future.result()
 
 
+class TestAsCompleted:
+    def test_yields_futures_as_they_complete(self):
+        wrapped_futures = [Future() for _ in range(3)]
+        futures = [PrefectConcurrentFuture(uuid.uuid4(), f) for f in wrapped_futures]
+
+        wrapped_futures[2].set_result(Completed(data=2))
+        completed = as_completed(futures)
+        assert next(completed) is futures[2]
+
+        wrapped_futures[0].set_result(Completed(data=0))
+        assert next(completed) is futures[0]
+
+        wrapped_futures[1].set_result(Completed(data=1))
+        assert next(completed) is futures[1]
+        assert futures[1].state.is_completed()
+
+        with pytest.raises(StopIteration):
+            next(completed)
+
+    def test_yields_each_future_once(self):
+        future = MockFuture()
+
+        assert list(as_completed([future, future])) == [future]
+
+    def test_raises_on_timeout(self):
+        futures = [MockFuture(), PrefectConcurrentFuture(uuid.uuid4(), Future())]
+        completed = as_completed(futures, timeout=0.1)
+
+        assert next(completed) is futures[0]
+        with pytest.raises(TimeoutError, match="1 \\(of 2\\) futures unfinished"):
+            next(completed)
+
+    async def test_reads_finished_distributed_futures_in_bulk(self, monkeypatch):
+        import prefect.futures
+
+        @task(persist_result=True)
+        def my_task(x):
+            return x
+
+        futures = []
+        for i in range(3):
+            task_run = await my_task.create_run(parameters={"x": i})
+            run_task_sync(
+                task=my_task,
+                task_run_id=task_run.id,
+                task_run=task_run,
+                parameters={"x": i},
+                return_type="state",
+            )
+            futures.append(PrefectDistributedFuture(task_run_id=task_run.id))
+
+        reads = []
+        read_task_run_states = prefect.futures._read_task_run_states
+
+        def counting_read(task_run_ids):
+            reads.append(task_run_ids)
+            return read_task_run_states(task_run_ids)
+
+        monkeypatch.setattr(prefect.futures, "_read_task_run_states", counting_read)
+
+        completed = list(as_completed(futures, timeout=10))
+
+        assert len(reads) == 1
+        assert {future.task_run_id for future in completed} == {
+            future.task_run_id for future in futures
+        }
+        assert all(future._final_state.is_completed() for future in completed)
+        assert sorted(future.result() for future in completed) == [0, 1, 2]
+
+
+class TestWait:
+    def test_wait_for_all_futures(self):
+        futures = [MockFuture(data=i) for i in range(3)]
+
+        done, not_done = wait(futures)
+
+        assert done == set(futures)
+        assert not_done == set()
+
+    def test_wait_for_first_completed(self):
+        hanging = PrefectConcurrentFuture(uuid.uuid4(), Future())
+        finished = MockFuture()
+
+        done, not_done = wait([hanging, finished], return_when=FIRST_COMPLETED)
+
+        assert done == {finished}
+        assert not_done == {hanging}
+
+    def test_wait_with_timeout(self):
+        hanging = PrefectConcurrentFuture(uuid.uuid4(), Future())
+
+        done, not_done = wait([hanging], timeout=0.01)
+
+        assert done == set()
+        assert not_done == {hanging}
+
+    def test_wait_rejects_other_conditions(self):
+        with pytest.raises(ValueError, match="return_when"):
+            wait([MockFuture()], return_when="FIRST_EXCEPTION")
+
+
 class TestPrefectFutureList:
     def test_wait(self):
         mock_futures = [MockFuture(data=i) for i in range(5)]
@@ -351,3 +469,175 @@ class TestPrefectFutureList:
 
         with pytest.raises(TimeoutError, match="oops"):
             futures.result()
+
+    async def test_results_of_distributed_futures_are_read_in_bulk(self, monkeypatch):
+        import prefect.futures
+        from prefect.results import PersistedResult
+
+        @task(persist_result=True, cache_result_in_memory=False)
+        def my_task(x):
+            return x
+
+        futures = []
+        for i in range(3):
+            task_run = await my_task.create_run(parameters={"x": i})
+            run_task_sync(
+                task=my_task,
+                task_run_id=task_run.id,
+                task_run=task_run,
+                parameters={"x": i},
+                return_type="state",
+            )
+            futures.append(PrefectDistributedFuture(task_run_id=task_run.id))
+
+        prefetched = []
+        prefetch_results = prefect.futures.prefetch_results
+
+        async def recording_prefetch(results):
+            prefetched.append(results)
+            return await prefetch_results(results)
+
+        monkeypatch.setattr(prefect.futures, "prefetch_results", recording_prefetch)
+
+        assert PrefectFutureList(futures).result() == [0, 1, 2]
+        (results,) = prefetched
+        assert len(results) == 3
+        assert all(isinstance(result, PersistedResult) for result in results)
+        assert all(result.has_cached_object() for result in results)
+
+    def test_uncached_results_of_concurrent_futures_are_read_once(self, monkeypatch):
+        from prefect.filesystems import LocalFileSystem
+
+        @task(persist_result=True, cache_result_in_memory=False)
+        def my_task(x):
+            return x
+
+        futures = []
+        for i in range(3):
+            wrapped_future = Future()
+            wrapped_future.set_result(
+                run_task_sync(task=my_task, parameters={"x": i}, return_type="state")
+            )
+            futures.append(PrefectConcurrentFuture(uuid.uuid4(), wrapped_future))
+
+        reads = []
+        read_path = LocalFileSystem.read_path
+
+        async def counting_read_path(self, path):
+            reads.append(path)
+            return await read_path(self, path)
+
+        monkeypatch.setattr(LocalFileSystem, "read_path", counting_read_path)
+
+        assert PrefectFutureList(futures).result() == [0, 1, 2]
+        assert len(reads) == 3
+
+    def test_as_completed(self):
+        wrapped_future = Future()
+        hanging = PrefectConcurrentFuture(uuid.uuid4(), wrapped_future)
+        finished = MockFuture()
+        futures = PrefectFutureList([hanging, finished])
+
+        completed = futures.as_completed()
+        assert next(completed) is finished
+
+        wrapped_future.set_result(Completed())
+        assert next(completed) is hanging
+
+    def test_iter_results(self):
+        wrapped_future = Future()
+        futures = PrefectFutureList(
+            [PrefectConcurrentFuture(uuid.uuid4(), wrapped_future), MockFuture(data=1)]
+        )
+
+        results = futures.iter_results()
+        assert next(results) == 1
+
+        wrapped_future.set_result(Completed(data=0))
+        assert next(results) == 0
+
+
+class TestPrefectFutureStream:
+    def test_yields_futures_as_they_complete(self):
+        wrapped_futures = [Future() for _ in range(3)]
+        futures = [PrefectConcurrentFuture(uuid.uuid4(), f) for f in wrapped_futures]
+        stream = PrefectFutureStream(futures, max_in_flight=3)
+
+        for i in (2, 0, 1):
+            wrapped_futures[i].set_result(Completed(data=i))
+
+        assert [future.result() for future in stream] == [2, 0, 1]
+
+    def test_draws_at_most_max_in_flight_futures_ahead(self):
+        drawn = []
+
+        def futures():
+            for i in range(5):
+                wrapped_future = Future()
+                wrapped_future.set_result(Completed(data=i))
+                drawn.append(i)
+                yield PrefectConcurrentFuture(uuid.uuid4(), wrapped_future)
+
+        stream = PrefectFutureStream(futures(), max_in_flight=2)
+        assert drawn == [0, 1]
+
+        next(stream)
+        assert drawn == [0, 1, 2]
+
+        assert sorted(stream.iter_results()) == [1, 2, 3, 4]
+        assert drawn == [0, 1, 2, 3, 4]
+
+    def test_results(self):
+        stream = PrefectFutureStream(
+            (MockFuture(data=i) for i in range(5)), max_in_flight=2
+        )
+
+        assert sorted(stream.result()) == [0, 1, 2, 3, 4]
+
+    def test_results_with_raise_on_failure_false(self):
+        wrapped_future = Future()
+        wrapped_future.set_result(Failed(data=ValueError("oops")))
+        stream = PrefectFutureStream(
+            [PrefectConcurrentFuture(uuid.uuid4(), wrapped_future)], max_in_flight=1
+        )
+
+        (result,) = stream.result(raise_on_failure=False)
+        assert isinstance(result, ValueError)
+
+    @pytest.mark.timeout(method="thread")  # alarm-based pytest-timeout will interfere
+    def test_wait_with_timeout(self):
+        stream = PrefectFutureStream(
+            [PrefectConcurrentFuture(uuid.uuid4(), Future())], max_in_flight=1
+        )
+        # should not raise a TimeoutError or hang
+        stream.wait(timeout=0.01)
+
+    def test_max_in_flight_must_be_positive(self):
+        with pytest.raises(ValueError, match="at least 1"):
+            PrefectFutureStream([], max_in_flight=0)
+
+    def test_errors_drawing_futures_are_raised_after_the_yielded_future(self):
+        def futures():
+            for i in range(2):
+                wrapped_future = Future()
+                wrapped_future.set_result(Completed(data=i))
+                yield PrefectConcurrentFuture(uuid.uuid4(), wrapped_future)
+            raise ValueError("oops")
+
+        stream = PrefectFutureStream(futures(), max_in_flight=2)
+
+        # drawing the next future fails after the first is dequeued
+        assert next(stream).result() == 0
+        with pytest.raises(ValueError, match="oops"):
+            next(stream)
+
+        assert [future.result() for future in stream] == [1]
+        assert stream.consumed
+
+    def test_errors_drawing_the_first_futures_are_raised_immediately(self):
+        def futures():
+            raise ValueError("oops")
+            yield
+
+        with pytest.raises(ValueError, match="oops"):
+            PrefectFutureStream(futures(), max_in_flight=1)
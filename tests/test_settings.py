@@ -492,6 +492,82 @@ class TestSettingAccess:
                 PREFECT_CLIENT_RETRY_EXTRA_CODES.value()
 
 
+class TestResolvedSettings:
+    def test_resolved_values_match_value_of(self):
+        settings = get_current_settings()
+        for setting in SETTING_VARIABLES.values():
+            if setting.deprecated or setting is PREFECT_CLIENT_RETRY_EXTRA_CODES:
+                continue
+            assert getattr(settings.resolved, setting.name) == settings.value_of(
+                setting
+            )
+
+    def test_values_are_resolved_once(self, monkeypatch):
+        calls = []
+
+        def callback(settings, value):
+            calls.append(value)
+            return value
+
+        with temporary_settings({PREFECT_TEST_MODE: True}):
+            monkeypatch.setattr(PREFECT_TEST_SETTING, "value_callback", callback)
+            PREFECT_TEST_SETTING.value()
+            PREFECT_TEST_SETTING.value()
+
+        assert len(calls) == 1
+
+    def test_resolved_values_follow_the_current_settings(self):
+        with temporary_settings({PREFECT_API_URL: "http://one/api"}):
+            assert PREFECT_API_URL.value() == "http://one/api"
+            assert PREFECT_UI_URL.value() == "http://one"
+
+            with temporary_settings({PREFECT_API_URL: "http://two/api"}):
+                assert PREFECT_API_URL.value() == "http://two/api"
+                assert PREFECT_UI_URL.value() == "http://two"
+
+            assert PREFECT_UI_URL.value() == "http://one"
+
+    def test_resolved_settings_are_read_only(self):
+        resolved = get_current_settings().resolved
+        with pytest.raises(AttributeError, match="read-only"):
+            resolved.PREFECT_API_URL = "http://example.com"
+
+    def test_resolved_settings_only_include_settings(self):
+        with pytest.raises(AttributeError, match="not a Prefect setting"):
+            get_current_settings().resolved.NOT_A_SETTING
+
+    def test_settings_are_frozen(self):
+        settings = get_current_settings().copy_with_update(
+            updates={PREFECT_API_URL: "http://one/api"}
+        )
+        assert settings.resolved.PREFECT_UI_URL == "http://one"
+
+        with pytest.raises(pydantic.ValidationError, match="frozen"):
+            settings.PREFECT_API_URL = "http://two/api"
+
+        assert settings.resolved.PREFECT_API_URL == "http://one/api"
+
+    def test_mutable_values_are_copied(self):
+        settings = get_current_settings().copy_with_update(
+            updates={PREFECT_CLIENT_RETRY_EXTRA_CODES: "400,500"}
+        )
+        codes = settings.resolved.PREFECT_CLIENT_RETRY_EXTRA_CODES
+        codes.add(404)
+
+        assert settings.resolved.PREFECT_CLIENT_RETRY_EXTRA_CODES == {400, 500}
+        assert PREFECT_CLIENT_RETRY_EXTRA_CODES.value_from(settings) == {400, 500}
+
+    def test_copies_have_their_own_resolved_values(self):
+        settings = get_current_settings().copy_with_update(
+            updates={PREFECT_API_KEY: "secret"}
+        )
+        assert settings.resolved.PREFECT_API_KEY == "secret"
+
+        obfuscated = settings.with_obfuscated_secrets()
+        assert obfuscated.resolved.PREFECT_API_KEY == obfuscate("secret")
+        assert settings == settings.model_copy()
+
+
 class TestTemporarySettings:
     def test_temporary_settings(self):
         assert PREFECT_TEST_MODE.value() is True
@@ -31,7 +31,12 @@ from prefect.settings import (
     temporary_settings,
 )
 from prefect.states import Running, State
-from prefect.task_engine import TaskRunEngine, run_task_async, run_task_sync
+from prefect.task_engine import (
+    AsyncTaskRunEngine,
+    TaskRunEngine,
+    run_task_async,
+    run_task_sync,
+)
 from prefect.task_runners import ThreadPoolTaskRunner
 from prefect.testing.utilities import exceptions_equal
 from prefect.utilities.callables import get_call_parameters
@@ -989,7 +994,7 @@ class TestTaskCrashDetection:
         self, prefect_client, interrupt_type, monkeypatch
     ):
         monkeypatch.setattr(
-            TaskRunEngine, "begin_run", MagicMock(side_effect=interrupt_type)
+            AsyncTaskRunEngine, "begin_run", AsyncMock(side_effect=interrupt_type)
         )
 
         @task
@@ -1,4 +1,5 @@
 import asyncio
+import threading
 import time
 import uuid
 from concurrent.futures import Future
@@ -9,6 +10,7 @@ import pytest
 
 from prefect._internal.concurrency.api import create_call, from_async
 from prefect.context import TagsContext, tags
+from prefect.exceptions import MappingLengthMismatch, MappingMissingIterable
 from prefect.filesystems import LocalFileSystem
 from prefect.flows import flow
 from prefect.futures import PrefectFuture, PrefectWrappedFuture
@@ -19,9 +21,10 @@ from prefect.settings import (
     temporary_settings,
 )
 from prefect.states import Completed, Running
-from prefect.task_runners import PrefectTaskRunner, ThreadPoolTaskRunner
+from prefect.task_runners import MappingPlan, PrefectTaskRunner, ThreadPoolTaskRunner
 from prefect.task_worker import serve
 from prefect.tasks import task
+from prefect.utilities.annotations import allow_failure, quote, unmapped
 
 
 @task
@@ -66,7 +69,174 @@ class MockFuture(PrefectWrappedFuture):
         return self._state
 
 
+class TestMappingPlan:
+    def test_plan_combines_iterable_and_static_parameters(self):
+        def fn(x, y, z=3):
+            pass
+
+        plan = MappingPlan(fn, {"x": [1, 2], "y": unmapped([0])})
+
+        assert len(plan) == 2
+        assert list(plan) == [
+            {"x": 1, "y": [0], "z": 3},
+            {"x": 2, "y": [0], "z": 3},
+        ]
+
+    def test_plan_maps_over_generators(self):
+        def fn(x):
+            pass
+
+        plan = MappingPlan(fn, {"x": (i for i in range(3))})
+
+        assert [parameters["x"] for parameters in plan] == [0, 1, 2]
+
+    def test_plan_collapses_variadic_keyword_arguments(self):
+        def fn(x, **kwargs):
+            pass
+
+        plan = MappingPlan(fn, {"x": [1, 2], "kwargs": {"y": [3, 4], "z": 5}})
+
+        assert list(plan) == [
+            {"x": 1, "kwargs": {"y": 3, "z": 5}},
+            {"x": 2, "kwargs": {"y": 4, "z": 5}},
+        ]
+
+    def test_plan_rewraps_annotations(self):
+        def fn(x, y):
+            pass
+
+        plan = MappingPlan(fn, {"x": allow_failure([1, 2]), "y": quote("static")})
+
+        assert list(plan) == [
+            {"x": allow_failure(1), "y": quote("static")},
+            {"x": allow_failure(2), "y": quote("static")},
+        ]
+
+    def test_plan_does_not_share_parameters_between_runs(self):
+        def fn(x, **kwargs):
+            pass
+
+        first, second = MappingPlan(fn, {"x": [1, 2], "y": 0})
+        first["kwargs"]["y"] = 100
+
+        assert second == {"x": 2, "kwargs": {"y": 0}}
+
+    def test_plan_inspects_the_signature_once(self, monkeypatch):
+        import inspect
+
+        calls = []
+        signature = inspect.signature
+
+        def counting_signature(fn):
+            calls.append(fn)
+            return signature(fn)
+
+        def fn(x, y=1, **kwargs):
+            pass
+
+        monkeypatch.setattr(inspect, "signature", counting_signature)
+        plan = MappingPlan(fn, {"x": range(1000)})
+        inspections = len(calls)
+
+        assert len(list(plan)) == 1000
+        assert len(calls) == inspections
+
+    def test_streaming_plan_reads_iterables_lazily(self):
+        def fn(x, y):
+            pass
+
+        read = []
+
+        def generate_numbers():
+            for i in range(3):
+                read.append(i)
+                yield i
+
+        plan = MappingPlan(fn, {"x": generate_numbers(), "y": [4, 5, 6]}, stream=True)
+        assert plan.length is None
+        with pytest.raises(TypeError):
+            len(plan)
+
+        parameters = iter(plan)
+        assert next(parameters) == {"x": 0, "y": 4}
+        assert read == [0]
+        assert list(parameters) == [{"x": 1, "y": 5}, {"x": 2, "y": 6}]
+
+    def test_streaming_plan_maps_over_async_iterables(self):
+        def fn(x):
+            pass
+
+        async def generate_numbers():
+            for i in range(3):
+                yield i
+
+        plan = MappingPlan(fn, {"x": generate_numbers()}, stream=True)
+
+        assert [parameters["x"] for parameters in plan] == [0, 1, 2]
+
+    def test_streaming_plan_raises_once_an_iterable_is_exhausted_early(self):
+        def fn(x, y):
+            pass
+
+        plan = MappingPlan(fn, {"x": iter([1, 2]), "y": iter([1])}, stream=True)
+        parameters = iter(plan)
+
+        assert next(parameters) == {"x": 1, "y": 1}
+        with pytest.raises(MappingLengthMismatch, match="'y'"):
+            next(parameters)
+
+    def test_plan_requires_an_iterable(self):
+        def fn(x):
+            pass
+
+        with pytest.raises(MappingMissingIterable):
+            MappingPlan(fn, {"x": 1})
+
+    def test_plan_requires_iterables_of_the_same_length(self):
+        def fn(x, y):
+            pass
+
+        with pytest.raises(MappingLengthMismatch):
+            MappingPlan(fn, {"x": [1, 2], "y": [1]})
+
+
 class TestThreadPoolTaskRunner:
+    def test_map_stream(self):
+        @task
+        def square(x):
+            return x**2
+
+        with ThreadPoolTaskRunner() as runner:
+            stream = runner.map_stream(
+                square, {"x": (i for i in range(10))}, max_in_flight=2
+            )
+            assert sorted(stream.result()) == [i**2 for i in range(10)]
+
+    def test_warns_when_stopped_before_a_stream_is_consumed(self, caplog):
+        @task
+        def square(x):
+            return x**2
+
+        with ThreadPoolTaskRunner() as runner:
+            stream = runner.map_stream(
+                square, {"x": (i for i in range(10))}, max_in_flight=2
+            )
+            next(stream)
+
+        assert "before 1 stream(s) of mapped task runs were consumed" in caplog.text
+
+    def test_does_not_warn_about_consumed_streams(self, caplog):
+        @task
+        def square(x):
+            return x**2
+
+        with ThreadPoolTaskRunner() as runner:
+            runner.map_stream(
+                square, {"x": (i for i in range(10))}, max_in_flight=2
+            ).wait()
+
+        assert "stream(s) of mapped task runs" not in caplog.text
+
     @pytest.fixture(autouse=True)
     def default_storage_setting(self, tmp_path):
         name = str(uuid.uuid4())
@@ -95,6 +265,45 @@ class TestThreadPoolTaskRunner:
         with ThreadPoolTaskRunner(max_workers=2) as runner:
             assert runner._executor._max_workers == 2
 
+    def test_max_workers_limits_sync_and_async_tasks_together(self):
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+        # Each task waits for another to be running alongside it, so the limit must
+        # be reached for the tasks to finish
+        both_running = threading.Barrier(2)
+
+        def enter():
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+
+        def exit():
+            nonlocal running
+            with lock:
+                running -= 1
+
+        @task
+        def sync_task():
+            enter()
+            both_running.wait(timeout=10)
+            exit()
+
+        @task
+        async def async_task():
+            enter()
+            await asyncio.to_thread(both_running.wait, 10)
+            exit()
+
+        with ThreadPoolTaskRunner(max_workers=2) as runner:
+            futures = [runner.submit(sync_task, {}) for _ in range(3)]
+            futures += [runner.submit(async_task, {}) for _ in range(3)]
+            for future in futures:
+                future.result()
+
+        assert max_running == 2
+
     def test_submit_sync_task(self):
         with ThreadPoolTaskRunner() as runner:
             parameters = {"param1": 1, "param2": 2}
@@ -1,4 +1,5 @@
 import asyncio
+import threading
 import uuid
 
 import pytest
@@ -109,3 +110,40 @@ class TestTaskRunWaiter:
 
         assert task_run_1.state.is_completed()
         assert task_run_2.state.is_completed()
+
+    @pytest.mark.timeout(20)
+    @pytest.mark.usefixtures("use_hosted_api_server")
+    async def test_add_done_callback(self):
+        @task
+        async def test_task():
+            await asyncio.sleep(1)
+
+        task_run_id = uuid.uuid4()
+        finished = threading.Event()
+        TaskRunWaiter.add_done_callback(task_run_id, finished.set)
+
+        await run_task_async(task=test_task, task_run_id=task_run_id)
+
+        assert await asyncio.to_thread(finished.wait, 10)
+
+    def test_add_done_callback_for_finished_task_run(self):
+        task_run_id = uuid.uuid4()
+        TaskRunWaiter.instance()._observed_completed_task_runs[task_run_id] = True
+
+        called = []
+        TaskRunWaiter.add_done_callback(task_run_id, lambda: called.append(True))
+
+        assert called == [True]
+        assert task_run_id not in TaskRunWaiter.instance()._completion_callbacks
+
+    def test_remove_done_callback(self):
+        task_run_id = uuid.uuid4()
+
+        def callback():
+            pass
+
+        TaskRunWaiter.add_done_callback(task_run_id, callback)
+        assert TaskRunWaiter.instance()._completion_callbacks[task_run_id] == [callback]
+
+        TaskRunWaiter.remove_done_callback(task_run_id, callback)
+        assert task_run_id not in TaskRunWaiter.instance()._completion_callbacks
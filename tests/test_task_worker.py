@@ -793,9 +793,18 @@ class TestTaskWorkerLimit:
 
         mock_subscription.return_value = mock_iter()
 
+        async def wait_for_completion(task_run_id):
+            # the final state is proposed after the task body returns
+            with anyio.fail_after(5):
+                while True:
+                    task_run = await prefect_client.read_task_run(task_run_id)
+                    if task_run.state.is_completed():
+                        return task_run
+                    await asyncio.sleep(0.05)
+
         server_task = asyncio.create_task(task_worker.start())
         await event.wait()
-        updated_task_run_1 = await prefect_client.read_task_run(task_run_1.id)
+        updated_task_run_1 = await wait_for_completion(task_run_1.id)
         updated_task_run_2 = await prefect_client.read_task_run(task_run_2.id)
 
         assert updated_task_run_1.state.is_completed()
@@ -805,7 +814,7 @@ class TestTaskWorkerLimit:
         event.clear()
 
         await event.wait()
-        updated_task_run_2 = await prefect_client.read_task_run(task_run_2.id)
+        updated_task_run_2 = await wait_for_completion(task_run_2.id)
 
         assert updated_task_run_2.state.is_completed()
 
@@ -874,3 +883,85 @@ class TestTaskWorkerLimit:
 
         assert updated_task_run_1.state.is_completed()
         assert updated_task_run_2.state.is_scheduled()
+
+
+class TestTaskWorkerPrefetch:
+    @pytest.fixture(autouse=True)
+    async def register_localfilesystem(self):
+        """Register LocalFileSystem before running tests to avoid race conditions."""
+        await LocalFileSystem.register_type_and_schema()
+
+    async def test_task_worker_subscribes_with_prefetch(
+        self, foo_task, mock_subscription
+    ):
+        async def mock_iter():
+            await asyncio.sleep(1)
+            yield
+
+        mock_subscription.return_value = mock_iter()
+
+        task_worker = TaskWorker(foo_task, prefetch=5)
+
+        with anyio.move_on_after(0.1):
+            await task_worker.start()
+
+        assert mock_subscription.call_args.kwargs["prefetch"] == 5
+
+    async def test_parameters_are_read_while_waiting_for_capacity(
+        self, mock_subscription, prefect_client, monkeypatch
+    ):
+        @task
+        def slow_task(x):
+            import time
+
+            time.sleep(1)
+
+        task_worker = TaskWorker(slow_task, limit=1, prefetch=2)
+
+        task_run_future_1 = slow_task.apply_async((1,))
+        task_run_1 = await prefect_client.read_task_run(task_run_future_1.task_run_id)
+        task_run_future_2 = slow_task.apply_async((2,))
+        task_run_2 = await prefect_client.read_task_run(task_run_future_2.task_run_id)
+
+        async def mock_iter():
+            yield task_run_1
+            yield task_run_2
+            await asyncio.sleep(1)
+
+        mock_subscription.return_value = mock_iter()
+
+        from prefect.results import ResultFactory
+
+        from_autonomous_task = ResultFactory.from_autonomous_task
+        read_parameters = ResultFactory.read_parameters
+        factories_created = 0
+        parameters_read = []
+
+        async def counting_from_autonomous_task(task):
+            nonlocal factories_created
+            factories_created += 1
+            return await from_autonomous_task(task)
+
+        async def recording_read_parameters(self, identifier):
+            parameters = await read_parameters(self, identifier)
+            parameters_read.append(parameters["parameters"])
+            return parameters
+
+        monkeypatch.setattr(
+            ResultFactory, "from_autonomous_task", counting_from_autonomous_task
+        )
+        monkeypatch.setattr(ResultFactory, "read_parameters", recording_read_parameters)
+
+        # only the first task run has capacity to run, but the parameters of both
+        # should be read
+        with anyio.move_on_after(1):
+            await task_worker.start()
+
+        updated_task_run_1 = await prefect_client.read_task_run(task_run_1.id)
+        updated_task_run_2 = await prefect_client.read_task_run(task_run_2.id)
+
+        assert updated_task_run_1.state.is_completed()
+        assert updated_task_run_2.state.is_scheduled()
+
+        assert parameters_read == [{"x": 1}, {"x": 2}]
+        assert factories_created == 1
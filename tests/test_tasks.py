@@ -3767,6 +3767,67 @@ class TestTaskMap:
 
         my_flow()
 
+    async def test_streaming_map_reads_generators_as_runs_are_submitted(self):
+        read = []
+
+        def generate_numbers():
+            for i in range(10):
+                read.append(i)
+                yield i
+
+        @task
+        def add_one(x):
+            return x + 1
+
+        @flow
+        def my_flow():
+            stream = add_one.map(generate_numbers(), max_in_flight=3)
+            assert len(read) == 3
+
+            results = []
+            for future in stream:
+                assert future.state.is_completed()
+                results.append(future.result())
+                assert len(read) <= len(results) + 3
+            return results
+
+        assert sorted(my_flow()) == list(range(1, 11))
+
+    async def test_streaming_map_with_static_and_async_iterable_parameters(self):
+        async def generate_numbers():
+            for i in range(3):
+                yield i
+
+        @flow
+        def my_flow():
+            stream = TestTaskMap.add_together.map(
+                generate_numbers(), y=10, max_in_flight=2
+            )
+            return sorted(stream.iter_results())
+
+        assert my_flow() == [10, 11, 12]
+
+    async def test_streaming_map_raises_on_length_mismatch(self):
+        @flow
+        def my_flow():
+            stream = TestTaskMap.add_together.map(
+                iter([1, 2, 3]), iter([1, 2]), max_in_flight=1
+            )
+            stream.wait()
+
+        with pytest.raises(MappingLengthMismatch):
+            my_flow()
+
+    async def test_streaming_map_return_state_true(self):
+        @flow
+        def my_flow():
+            return TestTaskMap.add_together.map(
+                (i for i in range(3)), 1, max_in_flight=2, return_state=True
+            )
+
+        states = my_flow()
+        assert sorted([await state.result() for state in states]) == [1, 2, 3]
+
 
 class TestTaskConstructorValidation:
     async def test_task_cannot_configure_too_many_custom_retry_delays(self):
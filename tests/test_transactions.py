@@ -251,6 +251,80 @@ def test_overwrite_ignores_existing_record():
         assert not txn.is_committed()
 
 
+class TestAsyncTransaction:
+    async def test_async_txn_reads_and_writes_with_async_store_methods(self):
+        class Store(RecordStore):
+            def __init__(self):
+                self.records = {}
+
+            def exists(self, **kwargs):
+                raise AssertionError("sync exists should not be called")
+
+            def write(self, **kwargs):
+                raise AssertionError("sync write should not be called")
+
+            async def aexists(self, key):
+                return key in self.records
+
+            async def awrite(self, key, value):
+                self.records[key] = value
+
+        store = Store()
+        async with Transaction(key="test-async", store=store) as txn:
+            assert get_transaction() is txn
+            assert not txn.is_committed()
+            txn.stage("value")
+
+        assert get_transaction() is None
+        assert txn.is_committed()
+        assert store.records == {"test-async": "value"}
+
+        async with Transaction(key="test-async", store=store) as txn:
+            assert txn.is_committed()
+
+    async def test_async_txn_commits_children(self):
+        async with Transaction(key="outer") as outer:
+            with Transaction(key="inner") as inner:
+                pass
+            assert not inner.is_committed()
+
+        assert outer.is_committed()
+        assert inner.is_committed()
+
+    async def test_async_txn_rolls_back_on_exception(self):
+        with pytest.raises(ValueError, match="foo"):
+            async with Transaction() as txn:
+                raise ValueError("foo")
+
+        assert not txn.is_committed()
+        assert txn.is_rolled_back()
+
+    async def test_async_task_transaction_does_not_use_sync_store_methods(
+        self, monkeypatch
+    ):
+        def fail(*args, **kwargs):
+            raise AssertionError("sync store methods should not be called")
+
+        monkeypatch.setattr(ResultFactoryStore, "exists", fail)
+        monkeypatch.setattr(ResultFactoryStore, "write", fail)
+
+        count = 0
+        key = str(uuid.uuid4())
+
+        @task(cache_key_fn=lambda *args: key, persist_result=True)
+        async def add_one(x):
+            nonlocal count
+            count += 1
+            return x + 1
+
+        @flow
+        async def f():
+            return await add_one(1), await add_one(1)
+
+        assert await f() == (2, 2)
+        assert count == 1
+
+
 class TestDefaultTransactionStorage:
     @pytest.fixture(autouse=True)
     def default_storage_setting(self, tmp_path):
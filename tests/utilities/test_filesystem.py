@@ -2,11 +2,14 @@ import os
 import sys
 from pathlib import Path, PosixPath, WindowsPath
 
+import anyio
 import pytest
 
 from prefect.utilities.filesystem import (
+    compile_ignore_patterns,
     filter_files,
     get_open_file_limit,
+    locked,
     relative_path_to_current_platform,
 )
 
@@ -119,6 +122,24 @@ class TestFilterFiles:
         )
         assert {f for f in filtered if "pycache" in f} == expected
 
+    @pytest.mark.parametrize(
+        "ignore_patterns",
+        [
+            ["*.py"],
+            ["*.py", "!*__init__.py"],
+            ["utilities/*.md"],
+            ["venv/**"],
+            ["__pycache__/"],
+        ],
+    )
+    async def test_compiled_patterns_match_filter_files(
+        self, tmpdir, messy_dir, ignore_patterns
+    ):
+        is_ignored = compile_ignore_patterns(ignore_patterns)
+        assert {p for p in messy_dir if not is_ignored(p)} == filter_files(
+            tmpdir, ignore_patterns=ignore_patterns
+        )
+
 
 class TestPlatformSpecificRelpath:
     @pytest.mark.skipif(sys.platform == "win32", reason="This is a unix-specific test")
@@ -215,3 +236,20 @@ def test_get_open_file_limit_exception_windows(monkeypatch):
         ctypes.cdll.ucrtbase, "_getmaxstdio", mock_getmaxstdio_invalid_args
     )
     assert get_open_file_limit() == 200
+
+
+async def test_lock_is_exclusive(tmp_path):
+    events = []
+
+    async def hold(name: str):
+        async with locked(tmp_path / "lock"):
+            events.append(f"{name} acquired")
+            await anyio.sleep(0.2)
+            events.append(f"{name} released")
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(hold, "a")
+        tg.start_soon(hold, "b")
+
+    assert events[0].endswith("acquired")
+    assert events[1].endswith("released")